@@ -12,3 +12,10 @@
 from .level_1 import *
 from .level_2 import *
 from .level_3 import *
+
+from . import lazy, parallel, raw
+from .backend import (set_backend, get_backend, backends, calibrate, Backend, get_num_threads,
+                      set_num_threads, threads)
+from .memory import empty, zeros, is_aligned
+from .plan import plan, Plan
+from .pool import BufferPool, get_pool, set_pool
@@ -0,0 +1,271 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+    Awaitable versions of the level 2 and level 3 BLASpy functions, for use from asyncio code. This
+    module is not imported by 'import blaspy' (so that asyncio is only loaded when it is used).
+
+    Each function takes the same arguments as the BLASpy function of the same name, but runs it on
+    a dedicated blaspy.parallel.Executor instead of the event loop, so that other coroutines keep
+    running while the BLAS library computes. The default executor has a single worker which runs
+    each call with the number of BLAS threads in use when it is created, so that a large call is
+    still computed by every thread and the process-wide number of threads is left unchanged; it is
+    shut down by shutdown_executor(). A call which is cancelled while it is still queued
+    never runs. A call which has already started runs to completion (the GIL is not held, but the
+    BLAS library cannot be interrupted), and its result is discarded; any matrix or vector it
+    overwrites should not be used afterwards.
+
+    Example:
+        import blaspy.aio
+
+        async def handler(A, B):
+            return await blaspy.aio.gemm(A, B)
+
+"""
+
+from . import level_2, level_3
+from .backend import get_num_threads
+from .parallel import Executor
+from asyncio import CancelledError, wrap_future
+from functools import wraps
+from os import cpu_count
+from threading import Lock
+import time
+
+# the BLASpy functions with an awaitable version
+LEVEL_2_FUNCS = ('gemv', 'ger', 'hemv', 'her', 'her2', 'symv', 'syr', 'syr2', 'trmv', 'trsv',
+                 'gemv_batched', 'symv_batched', 'trmv_batched', 'trsv_batched')
+LEVEL_3_FUNCS = ('gemm', 'symm', 'syrk', 'syr2k', 'trmm', 'trsm', 'hemm', 'herk', 'her2k',
+                 'gemm_batched', 'symm_batched', 'syrk_batched', 'trmm_batched', 'trsm_batched',
+                 'gemm_grouped')
+
+_EXECUTOR = None
+_EXECUTOR_LOCK = Lock()
+
+
+class Metrics(object):
+    """
+    A snapshot of the calls made through blaspy.aio, as returned by get_metrics().
+
+    Attributes:
+        queued:       number of calls waiting for a worker
+        running:      number of calls running on a worker
+        completed:    number of calls which returned a result
+        failed:       number of calls which raised an error
+        cancelled:    number of calls cancelled before they started
+        total_wait:   total seconds finished calls spent queued
+        max_wait:     longest time in seconds a finished call spent queued
+        total_run:    total seconds finished calls spent running
+        max_run:      longest time in seconds a finished call spent running
+    """
+
+    def __init__(self):
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.total_wait = 0.
+        self.max_wait = 0.
+        self.total_run = 0.
+        self.max_run = 0.
+
+    @property
+    def mean_wait(self):
+        """ Mean time in seconds finished calls spent queued (0 if no call has finished). """
+        return self.total_wait / max(1, self.completed + self.failed)
+
+    @property
+    def mean_run(self):
+        """ Mean time in seconds finished calls spent running (0 if no call has finished). """
+        return self.total_run / max(1, self.completed + self.failed)
+
+    def copy(self):
+        """ Return a copy of these metrics. """
+        metrics = Metrics()
+        metrics.__dict__.update(self.__dict__)
+        return metrics
+
+    def __repr__(self):
+        return ("Metrics(queued=%d, running=%d, completed=%d, failed=%d, cancelled=%d, "
+                "mean_wait=%.6f, max_wait=%.6f, mean_run=%.6f, max_run=%.6f)"
+                % (self.queued, self.running, self.completed, self.failed, self.cancelled,
+                   self.mean_wait, self.max_wait, self.mean_run, self.max_run))
+
+
+_METRICS = Metrics()
+_METRICS_LOCK = Lock()
+
+
+def get_executor():
+    """
+    Return the executor which runs the calls made through blaspy.aio, creating a
+    blaspy.parallel.Executor with one worker and the current number of BLAS threads if none has
+    been set.
+    """
+
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = Executor(1, get_num_threads() or cpu_count() or 1)
+        return _EXECUTOR
+
+
+def set_executor(executor):
+    """
+    Run all subsequent calls made through blaspy.aio on the given executor. The previous executor
+    is not shut down, so calls already scheduled on it still run.
+
+    Example:
+        blaspy.aio.set_executor(blaspy.parallel.Executor(max_workers=2))
+
+    Args:
+        executor:    a blaspy.parallel.Executor (or any object with a compatible submit method),
+                     or None to create a default one on the next call
+
+    Returns:
+        The previous executor, or None if none had been created.
+    """
+
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        previous, _EXECUTOR = _EXECUTOR, executor
+        return previous
+
+
+def shutdown_executor(wait=True):
+    """
+    Shut down the executor of blaspy.aio (restoring the number of BLAS threads if it set it), so
+    that the next call creates a new default executor. Calls already scheduled still run.
+
+    Args:
+        --optional arguments--
+
+        wait:    True if this is to return only after every scheduled call has finished
+                     < default is True >
+    """
+
+    executor = set_executor(None)
+    if executor is not None:
+        executor.shutdown(wait)
+
+
+def get_metrics():
+    """
+    Return a snapshot of the queue depth and latencies of the calls made through blaspy.aio.
+
+    Returns:
+        A Metrics object.
+    """
+
+    with _METRICS_LOCK:
+        return _METRICS.copy()
+
+
+def reset_metrics():
+    """ Reset the counts and latencies of finished calls (queued and running calls are kept). """
+
+    global _METRICS
+    with _METRICS_LOCK:
+        metrics = Metrics()
+        metrics.queued, metrics.running = _METRICS.queued, _METRICS.running
+        _METRICS = metrics
+
+
+def call_timed(submitted, func, args, kwargs):
+    """ Run a call on a worker thread, recording how long it was queued and how long it ran. """
+
+    started = time.perf_counter()
+    with _METRICS_LOCK:
+        _METRICS.queued -= 1
+        _METRICS.running += 1
+
+    failed = True
+    try:
+        result = func(*args, **kwargs)
+        failed = False
+        return result
+
+    finally:
+        finished = time.perf_counter()
+        with _METRICS_LOCK:
+            _METRICS.running -= 1
+            if failed:
+                _METRICS.failed += 1
+            else:
+                _METRICS.completed += 1
+            _METRICS.total_wait += started - submitted
+            _METRICS.max_wait = max(_METRICS.max_wait, started - submitted)
+            _METRICS.total_run += finished - started
+            _METRICS.max_run = max(_METRICS.max_run, finished - started)
+
+
+def record_cancelled(future):
+    """ Count a call whose future was cancelled before the call started. """
+
+    if future.cancelled():
+        with _METRICS_LOCK:
+            _METRICS.queued -= 1
+            _METRICS.cancelled += 1
+
+
+async def run(func, *args, **kwargs):
+    """
+    Run any function (such as a BLASpy function) on the executor of blaspy.aio, and return its
+    result once it has finished.
+
+    If the awaiting task is cancelled while the call is still queued, the call is removed from the
+    queue and never runs.
+
+    Args:
+        func:      the function
+        args:      positional arguments of the call
+        kwargs:    keyword arguments of the call
+
+    Returns:
+        The result of the call.
+    """
+
+    with _METRICS_LOCK:
+        _METRICS.queued += 1
+
+    try:
+        future = get_executor().submit(call_timed, time.perf_counter(), func, args, kwargs)
+    except BaseException:
+        with _METRICS_LOCK:
+            _METRICS.queued -= 1
+        raise
+
+    future.add_done_callback(record_cancelled)
+    try:
+        return await wrap_future(future)
+    except CancelledError:
+        future.cancel()  # a call which has not started yet never runs
+        raise
+
+
+def awaitable(func):
+    """ Return an awaitable version of a BLASpy function which runs it with run. """
+
+    @wraps(func)
+    async def awaitable_func(*args, **kwargs):
+        return await run(func, *args, **kwargs)
+
+    awaitable_func.__doc__ = ("Awaitable version of blaspy.%s, run on the executor of blaspy.aio."
+                              "\n\n    The arguments and result are as follows.\n%s"
+                              % (func.__name__, func.__doc__))
+    return awaitable_func
+
+
+for name in LEVEL_2_FUNCS:
+    globals()[name] = awaitable(getattr(level_2, name))
+
+for name in LEVEL_3_FUNCS:
+    globals()[name] = awaitable(getattr(level_3, name))
+
+del name
@@ -0,0 +1,411 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from .config import (get_libblas, load_blas, find_blas_paths, read_preferences,
+                     write_preferences)
+from .errors import (raise_not_cblas, raise_no_backends, raise_invalid_num_threads,
+                     raise_no_thread_control)
+from .helpers import (bind_cblas_func, set_cblas_library, FUNC_DICT, ROW_MAJOR, NO_TRANS,
+                      DTYPE_INDEX)
+from contextlib import contextmanager
+from ctypes import CFUNCTYPE, POINTER, byref, c_char_p, c_int, c_int64, create_string_buffer
+from numbers import Integral
+from numpy import dtype, random
+from os import path
+import time
+
+# sizes of the square operands of the representative gemm and gemv calls timed by calibrate
+GEMM_SIZE = 512
+GEMV_SIZE = 2048
+
+# names reported by OpenBLAS for the values returned by openblas_get_parallel
+OPENBLAS_THREADING = {0: 'sequential', 1: 'pthreads', 2: 'openmp'}
+
+# the functions each BLAS library exports to get and set the number of threads it uses, and the C
+# type of that number (BLIS uses its 64-bit dim_t)
+THREAD_CONTROLS = (("openblas_get_num_threads", "openblas_set_num_threads", c_int),
+                   ("MKL_Get_Max_Threads", "MKL_Set_Num_Threads", c_int),
+                   ("bli_thread_get_num_threads", "bli_thread_set_num_threads", c_int64),
+                   ("flexiblas_get_num_threads", "flexiblas_set_num_threads", c_int))
+
+# the functions some BLAS libraries export to set the number of threads used by the calls made from
+# the calling thread only
+LOCAL_THREAD_CONTROLS = (("mkl_set_num_threads_local", c_int),)
+
+
+class Backend(object):
+    """
+    A BLAS library available on this system, as reported by blaspy.backends().
+
+    Attributes:
+        path:           path (or name) of the library
+        vendor:         'OpenBLAS', 'MKL', 'BLIS', 'FlexiBLAS', or 'unknown'
+        version:        version reported by the library, or None if it does not report one
+        threading:      'sequential', 'pthreads', or 'openmp', or None if unknown
+        num_threads:    number of threads the library uses, or None if unknown
+        symbols:        number of the CBLAS subroutines used by BLASpy that the library exports
+        missing:        names of the CBLAS subroutines used by BLASpy that the library does not
+                        export
+        active:         True if BLASpy is currently using the library
+    """
+
+    def __init__(self, blas_path, vendor, version, threading, num_threads, symbols, missing,
+                 active):
+        self.path = blas_path
+        self.vendor = vendor
+        self.version = version
+        self.threading = threading
+        self.num_threads = num_threads
+        self.symbols = symbols
+        self.missing = missing
+        self.active = active
+
+    def __repr__(self):
+        return ("Backend(path=%r, vendor=%r, version=%r, threading=%r, num_threads=%r, "
+                "symbols=%d/%d, active=%r)"
+                % (self.path, self.vendor, self.version, self.threading, self.num_threads,
+                   self.symbols, self.symbols + len(self.missing), self.active))
+
+
+def set_backend(blas_path):
+    """
+    Use the BLAS library at the given path for all subsequent BLASpy calls.
+
+    The library is loaded immediately, so that an invalid path is reported here rather than on the
+    next BLAS call. Plans created before the backend is changed continue to use the previous
+    library.
+
+    Args:
+        blas_path:    path (or name) of a BLAS library with a CBLAS interface
+
+    Raises:
+        OSError:    if the library cannot be loaded
+        ValueError: if the library does not export the CBLAS subroutines
+    """
+
+    libblas = load_blas(blas_path)
+
+    if not hasattr(libblas, 'cblas_dgemm'):
+        raise_not_cblas(blas_path)
+
+    set_cblas_library(libblas)
+
+
+def get_backend():
+    """
+    Return the path (or name) of the BLAS library in use, loading the default library if no BLAS
+    call has been made yet.
+
+    Returns:
+        A string holding the path or name of the BLAS library.
+    """
+
+    return get_libblas()._name
+
+
+def get_num_threads():
+    """
+    Return the number of threads the BLAS library in use runs each call with.
+
+    Returns:
+        The number of threads, or None if the library has no thread control BLASpy knows of.
+    """
+
+    control = get_thread_control(get_libblas())
+    if control is None:
+        return None
+
+    get_name, set_name, c_type = control
+    return call_int(get_libblas(), get_name, c_type)
+
+
+def set_num_threads(num_threads):
+    """
+    Set the number of threads the BLAS library in use runs each call with, using the library's own
+    thread control (such as openblas_set_num_threads or MKL_Set_Num_Threads).
+
+    The setting applies to the whole process, including calls made from other Python threads, and
+    is not carried over if the backend is changed with set_backend.
+
+    Args:
+        num_threads:    number of threads (must be >= 1)
+
+    Raises:
+        ValueError:   if num_threads is not an integer >= 1
+        RuntimeError: if the library has no thread control BLASpy knows of
+    """
+
+    if not isinstance(num_threads, Integral) or num_threads < 1:
+        raise_invalid_num_threads(num_threads)
+
+    libblas = get_libblas()
+    control = get_thread_control(libblas)
+    if control is None:
+        raise_no_thread_control(libblas._name)
+
+    get_name, set_name, c_type = control
+    CFUNCTYPE(None, c_type)((set_name, libblas))(num_threads)
+
+
+@contextmanager
+def threads(num_threads):
+    """
+    Context manager which runs the BLAS library in use with the given number of threads, and
+    restores the previous number of threads on exit.
+
+    As with set_num_threads, the setting applies to the whole process while the context is active.
+
+    Example:
+        with blaspy.threads(1):
+            C = blaspy.gemm(A, B)
+
+    Args:
+        num_threads:    number of threads (must be >= 1)
+
+    Raises:
+        ValueError:   if num_threads is not an integer >= 1
+        RuntimeError: if the library has no thread control BLASpy knows of
+    """
+
+    previous = get_num_threads()
+    set_num_threads(num_threads)
+    try:
+        yield
+    finally:
+        set_num_threads(previous)
+
+
+def get_thread_control(libblas):
+    """
+    Return the entry of THREAD_CONTROLS for a BLAS library, or None if it exports none of them.
+    """
+
+    for control in THREAD_CONTROLS:
+        if hasattr(libblas, control[0]) and hasattr(libblas, control[1]):
+            return control
+
+    return None
+
+
+def get_local_thread_control(libblas):
+    """
+    Return the entry of LOCAL_THREAD_CONTROLS for a BLAS library, or None if it exports none of
+    them.
+    """
+
+    for control in LOCAL_THREAD_CONTROLS:
+        if hasattr(libblas, control[0]):
+            return control
+
+    return None
+
+
+def set_local_num_threads(num_threads):
+    """
+    Set the number of threads the BLAS library in use runs the calls made from the calling thread
+    with, if the library has a per-thread control (such as mkl_set_num_threads_local).
+
+    Args:
+        num_threads:    number of threads (must be >= 1)
+
+    Returns:
+        True if the number of threads was set, or False if the library has no per-thread control.
+    """
+
+    libblas = get_libblas()
+    control = get_local_thread_control(libblas)
+    if control is None:
+        return False
+
+    set_name, c_type = control
+    CFUNCTYPE(c_type, c_type)((set_name, libblas))(num_threads)
+    return True
+
+
+def backends():
+    """
+    Return an inventory of the BLAS libraries available on this system.
+
+    Libraries are found with ctypes.util.find_library and in common installation directories (see
+    blaspy.config.find_blas_paths), and each is loaded to report its vendor, version, threading,
+    and coverage of the CBLAS subroutines used by BLASpy. Libraries that cannot be loaded are
+    omitted.
+
+    Returns:
+        A list of Backend objects, beginning with the library currently in use.
+    """
+
+    active_path = get_backend()
+    blas_paths = [active_path] + [blas_path for blas_path in find_blas_paths()
+                                  if not same_library(blas_path, active_path)]
+    inventory = []
+
+    for blas_path in blas_paths:
+        try:
+            libblas = load_blas(blas_path)
+        except OSError:
+            continue
+
+        vendor, version, threading, num_threads = describe_blas(libblas)
+        names = [name for names in FUNC_DICT.values() for name in names if name is not None]
+        missing = tuple(sorted(name for name in names if not hasattr(libblas, name)))
+        inventory.append(Backend(blas_path, vendor, version, threading, num_threads,
+                                 len(names) - len(missing), missing, blas_path is active_path))
+
+    return inventory
+
+
+def calibrate(blas_paths=None, trials=3, persist=True):
+    """
+    Time a representative gemm and gemv workload with each BLAS library, switch to the fastest
+    library, and (optionally) persist that choice for future sessions.
+
+    The workload is a double-precision gemm of GEMM_SIZE x GEMM_SIZE matrices and a
+    double-precision gemv of a GEMV_SIZE x GEMV_SIZE matrix, each using the library's own threading
+    defaults. Libraries are ranked by the geometric mean of their gemm and gemv GFLOP/s. A persisted
+    choice is used as the default library by future sessions unless the BLASPY_BLAS environment
+    variable is set or config.BLAS_NAME has been modified.
+
+    Args:
+        --optional arguments--
+
+        blas_paths:    paths (or names) of the BLAS libraries to calibrate
+                           < default is every library reported by backends() that exports
+                             cblas_dgemm and cblas_dgemv >
+        trials:        number of times to time each call (the best time is kept)
+                           < default is 3 >
+        persist:       True to persist the choice for future sessions, False otherwise
+                           < default is True >
+
+    Returns:
+        A list of tuples, fastest library first, where each tuple holds the path of a library and
+        its gemm and gemv GFLOP/s.
+
+    Raises:
+        ValueError: if there is no library to calibrate
+    """
+
+    if blas_paths is None:
+        blas_paths = [backend.path for backend in backends()
+                      if 'cblas_dgemm' not in backend.missing
+                      and 'cblas_dgemv' not in backend.missing]
+
+    if not blas_paths:
+        raise_no_backends()
+
+    rng = random.RandomState(0)
+    A, B, C = [rng.uniform(-1, 1, (GEMM_SIZE, GEMM_SIZE)) for i in range(3)]
+    M = rng.uniform(-1, 1, (GEMV_SIZE, GEMV_SIZE))
+    x, y = [rng.uniform(-1, 1, (GEMV_SIZE, 1)) for i in range(2)]
+    index = DTYPE_INDEX[dtype('float64')]
+    results = []
+
+    for blas_path in blas_paths:
+        libblas = load_blas(blas_path)
+        gemm = bind_cblas_func(libblas, 'gemm', index)
+        gemv = bind_cblas_func(libblas, 'gemv', index)
+
+        gemm_time = timing_call(lambda: gemm(ROW_MAJOR, NO_TRANS, NO_TRANS, GEMM_SIZE, GEMM_SIZE,
+                                             GEMM_SIZE, 1.0, A.ctypes.data, GEMM_SIZE,
+                                             B.ctypes.data, GEMM_SIZE, 0.0, C.ctypes.data,
+                                             GEMM_SIZE), trials)
+        gemv_time = timing_call(lambda: gemv(ROW_MAJOR, NO_TRANS, GEMV_SIZE, GEMV_SIZE, 1.0,
+                                             M.ctypes.data, GEMV_SIZE, x.ctypes.data, 1, 0.0,
+                                             y.ctypes.data, 1), trials)
+
+        results.append((blas_path, 2e-9 * GEMM_SIZE ** 3 / gemm_time,
+                        2e-9 * GEMV_SIZE ** 2 / gemv_time))
+
+    results.sort(key=lambda result: result[1] * result[2], reverse=True)
+    set_backend(results[0][0])
+
+    if persist:
+        preferences = read_preferences()
+        preferences['backend'] = results[0][0]
+        preferences['calibration'] = dict((blas_path, {'gemm': gemm_rate, 'gemv': gemv_rate})
+                                          for blas_path, gemm_rate, gemv_rate in results)
+        write_preferences(preferences)
+
+    return results
+
+
+def timing_call(call, trials):
+    """ Return the best time taken by 'call' over the given number of trials, after a warm-up. """
+
+    call()
+    best = float('inf')
+
+    for i in range(trials):
+        start = time.time()
+        call()
+        best = min(best, time.time() - start)
+
+    return max(best, 1e-9)
+
+
+def same_library(blas_path_1, blas_path_2):
+    """ Return True if the two paths refer to the same library file. """
+    return path.realpath(blas_path_1) == path.realpath(blas_path_2)
+
+
+def describe_blas(libblas):
+    """
+    Return the vendor, version, threading, and number of threads of a BLAS library, using the
+    vendor-specific query functions the library exports.
+
+    Args:
+        libblas:    a loaded ctypes CDLL
+
+    Returns:
+        A tuple of four elements where each element is described in order below:
+
+        - 'OpenBLAS', 'MKL', 'BLIS', 'FlexiBLAS', or 'unknown'
+        - version reported by the library, or None
+        - 'sequential', 'pthreads', or 'openmp', or None if unknown
+        - number of threads the library uses, or None if unknown
+    """
+
+    if hasattr(libblas, 'openblas_get_config'):
+        # the configuration begins with the version in all but the oldest versions of OpenBLAS
+        config = CFUNCTYPE(c_char_p)(('openblas_get_config', libblas))().decode()
+        words = config.split()
+        version = words[1] if len(words) > 1 and words[0] == 'OpenBLAS' else None
+        threading = (OPENBLAS_THREADING.get(call_int(libblas, 'openblas_get_parallel'))
+                     if hasattr(libblas, 'openblas_get_parallel') else None)
+        return 'OpenBLAS', version, threading, call_int(libblas, 'openblas_get_num_threads')
+
+    elif hasattr(libblas, 'MKL_Get_Version_String'):
+        buffer = create_string_buffer(256)
+        CFUNCTYPE(None, c_char_p, c_int)(('MKL_Get_Version_String', libblas))(buffer, 256)
+        return 'MKL', buffer.value.decode().strip(), None, call_int(libblas, 'MKL_Get_Max_Threads')
+
+    elif hasattr(libblas, 'bli_info_get_version_str'):
+        version = CFUNCTYPE(c_char_p)(('bli_info_get_version_str', libblas))().decode()
+        if call_int(libblas, 'bli_info_get_enable_openmp'):
+            threading = 'openmp'
+        elif call_int(libblas, 'bli_info_get_enable_pthreads'):
+            threading = 'pthreads'
+        else:
+            threading = 'sequential'
+        return 'BLIS', version, threading, call_int(libblas, 'bli_thread_get_num_threads', c_int64)
+
+    elif hasattr(libblas, 'flexiblas_get_version'):
+        numbers = [c_int() for i in range(3)]
+        CFUNCTYPE(None, *[POINTER(c_int)] * 3)(('flexiblas_get_version', libblas))(
+            *[byref(number) for number in numbers])
+        return 'FlexiBLAS', '.'.join(str(number.value) for number in numbers), None, None
+
+    return 'unknown', None, None, None
+
+
+def call_int(libblas, name, c_type=c_int):
+    """ Call a function of a BLAS library that takes no arguments and returns an integer. """
+    return CFUNCTYPE(c_type)((name, libblas))()
@@ -10,14 +10,21 @@
 """
 
 from .errors import raise_blas_os_error
-from ctypes import cdll
-from os import chdir, path
+from ctypes import CDLL
+from ctypes.util import find_library
+from glob import glob
+from json import dump, load
+from os import environ, path, pathsep
 from platform import system
 from struct import calcsize
+from sys import prefix
+from threading import Lock
 
 # The name of the BLAS .so or .dll file. By default this is the OpenBLAS reference
 # implementation bundled with BLASpy. Only modify if you wish to use a different version of BLAS
-# or if your operating system is not supported by BLASpy out of the box.
+# or if your operating system is not supported by BLASpy out of the box. The BLAS library can also
+# be chosen without editing this file through the BLASPY_BLAS environment variable or by calling
+# blaspy.set_backend(path), either of which takes precedence over BLAS_NAME.
 BLAS_NAME = ""  # default is ""
 
 # True if the BLAS .so or .dll file is in the blaspy/lib subdirectory,
@@ -28,28 +35,214 @@ IN_BLASPY_SUBDIRECTORY = True  # default is True
 # DO NOT EDIT BELOW THIS LINE #
 ###############################
 
-# find the appropriate BLAS to use
-if BLAS_NAME == "":  # try to use included OpenBLAS
-    PREPEND = str(path.dirname(__file__))[:-6] + "lib/"
-    if system() == "Windows":
-        if calcsize("P") == 8:  # 64-bit
-            BLAS_NAME = "libopenblas-0.2.13-win64-int32.dll"
-            chdir(PREPEND + "win64")
-        else:  # 32-bit
-            BLAS_NAME = "libopenblas-0.2.13-win32.dll"
-            chdir(PREPEND + "win32")
-        PREPEND = ""
-    elif system() == "Linux":
-        if calcsize("P") == 8:  # 64-bit
-            BLAS_NAME = "libopenblas-0.2.13-linux64.so"
-            PREPEND += "linux64/"
-        else:  # 32-bit
-            BLAS_NAME = "libopenblas-0.2.13-linux32.so"
-            PREPEND += "linux32/"
-    else:  # no appropriate OpenBLAS included, BLAS_NAME_OVERRIDE must be used
+# the environment variable which, if set, holds the path or name of the BLAS library to load
+ENVIRONMENT_VARIABLE = "BLASPY_BLAS"
+
+# the file in which the BLAS library chosen by blaspy.calibrate is persisted, and the environment
+# variable which, if set, holds the path of that file instead
+PREFERENCES_PATH = path.join(path.expanduser("~"), ".blaspy.json")
+PREFERENCES_VARIABLE = "BLASPY_PREFERENCES"
+
+# the names of BLAS libraries to search for (in order of preference), the file name patterns of a
+# library with a given name, and the directories to search besides those searched by
+# ctypes.util.find_library ('*' matches multiarch and alternative subdirectories)
+BLAS_NAMES = ("openblas", "mkl_rt", "blis", "flexiblas", "tatlas", "satlas", "cblas", "blas")
+BLAS_PATTERNS = ("lib%s.so*", "lib%s.dylib", "lib%s.dll", "%s.dll")
+BLAS_DIRECTORIES = (path.join(prefix, "lib"), path.join(prefix, "Library", "bin"),
+                    "/usr/local/lib", "/usr/local/lib64", "/usr/lib", "/usr/lib64",
+                    "/usr/lib/*-linux-gnu", "/usr/lib/*-linux-gnu/*", "/usr/lib64/*",
+                    "/opt/OpenBLAS/lib", "/opt/intel/mkl/lib/intel64",
+                    "/opt/intel/oneapi/mkl/latest/lib/intel64", "/opt/homebrew/opt/*/lib",
+                    "/usr/local/opt/*/lib")
+
+# the directory of the OpenBLAS libraries bundled with BLASpy, and the subdirectory and name of the
+# library to use for each operating system and pointer size (in bits)
+LIB_DIRECTORY = path.join(path.dirname(path.dirname(path.abspath(__file__))), "lib")
+BUNDLED_BLAS = {("Windows", 64): ("win64", "libopenblas-0.2.13-win64-int32.dll"),
+                ("Windows", 32): ("win32", "libopenblas-0.2.13-win32.dll"),
+                ("Linux", 64):   ("linux64", "libopenblas-0.2.13-linux64.so"),
+                ("Linux", 32):   ("linux32", "libopenblas-0.2.13-linux32.so")}
+
+# the loaded BLAS library, which is None until the first BLAS call (or call to set_libblas)
+_libblas = None
+_libblas_lock = Lock()
+
+
+def get_default_blas_path():
+    """
+    Return the path (or name) of the BLAS library to load when none has been set explicitly.
+
+    The library named by the BLASPY_BLAS environment variable is used if that variable is set,
+    followed by BLAS_NAME if it has been modified, followed by the library chosen by
+    blaspy.calibrate, followed by the OpenBLAS library bundled with BLASpy for the current operating
+    system, followed by the first BLAS library found on the system.
+
+    Returns:
+        A string holding the path or name of the BLAS library.
+
+    Raises:
+        RuntimeError: if none of the above is available
+    """
+
+    if environ.get(ENVIRONMENT_VARIABLE, ""):
+        return environ[ENVIRONMENT_VARIABLE]
+
+    if BLAS_NAME != "":
+        return BLAS_NAME
+
+    preferred = read_preferences().get("backend")
+    if preferred is not None and path.exists(preferred):
+        return preferred
+
+    bundled = get_bundled_blas_path()
+    if bundled is not None:
+        return bundled
+
+    blas_paths = find_blas_paths()
+    if not blas_paths:
         raise_blas_os_error()
-else:
-   PREPEND = ""
 
-# Change the directory and load the library
-_libblas = cdll.LoadLibrary(PREPEND + BLAS_NAME)
\ No newline at end of file
+    return blas_paths[0]
+
+
+def get_bundled_blas_path():
+    """
+    Return the path of the OpenBLAS library bundled with BLASpy for the current operating system,
+    or None if there is no such library.
+    """
+
+    bundled = BUNDLED_BLAS.get((system(), calcsize("P") * 8))
+    if bundled is None or not path.exists(path.join(LIB_DIRECTORY, *bundled)):
+        return None
+
+    return path.join(LIB_DIRECTORY, *bundled)
+
+
+def find_blas_paths():
+    """
+    Return the paths of the BLAS libraries available on this system, without loading them.
+
+    The OpenBLAS library bundled with BLASpy comes first (if there is one for the current operating
+    system), followed by the libraries found by ctypes.util.find_library and in common installation
+    directories for each name in BLAS_NAMES. Libraries that are links to the same file are only
+    included once. A library found by ctypes.util.find_library that is not in any of the common
+    directories is included by name.
+
+    Returns:
+        A list of strings holding the path or name of each BLAS library.
+    """
+
+    directories = [directory for pattern in BLAS_DIRECTORIES for directory in sorted(glob(pattern))
+                   if path.isdir(directory)]
+    blas_paths = []
+    real_paths = set()
+
+    def add(blas_path):
+        real_path = path.realpath(blas_path)
+        if real_path not in real_paths:
+            real_paths.add(real_path)
+            blas_paths.append(blas_path)
+
+    bundled = get_bundled_blas_path()
+    if bundled is not None:
+        add(bundled)
+
+    for name in BLAS_NAMES:
+        # find_library may only return the file name of the library, so look for it in the common
+        # directories before falling back to that name
+        library = find_library(name)
+        if library is not None:
+            matches = [path.join(directory, library) for directory in directories
+                       if path.exists(path.join(directory, library))]
+            add(matches[0] if matches else library)
+
+        for directory in directories:
+            for pattern in BLAS_PATTERNS:
+                for blas_path in sorted(glob(path.join(directory, pattern % name))):
+                    add(blas_path)
+
+    return blas_paths
+
+
+def read_preferences():
+    """
+    Return the preferences persisted by blaspy.calibrate, or an empty dict if there are none.
+    """
+
+    try:
+        with open(environ.get(PREFERENCES_VARIABLE, PREFERENCES_PATH)) as preferences_file:
+            preferences = load(preferences_file)
+        return preferences if isinstance(preferences, dict) else {}
+    except (IOError, OSError, ValueError):
+        return {}
+
+
+def write_preferences(preferences):
+    """
+    Persist the given preferences (a dict which can be serialized as JSON) for future sessions.
+    """
+
+    with open(environ.get(PREFERENCES_VARIABLE, PREFERENCES_PATH), "w") as preferences_file:
+        dump(preferences, preferences_file, indent=4, sort_keys=True)
+
+
+def load_blas(blas_path):
+    """
+    Load the BLAS library at the given path without changing the working directory.
+
+    Args:
+        blas_path:    path (or name) of the BLAS library
+
+    Returns:
+        The library as a ctypes CDLL.
+
+    Raises:
+        OSError: if the library cannot be loaded
+    """
+
+    # let Windows find the DLLs the library depends on, which are kept in the same directory
+    directory = path.dirname(blas_path)
+    if system() == "Windows" and directory:
+        try:
+            from os import add_dll_directory
+            add_dll_directory(directory)
+        except ImportError:
+            environ["PATH"] = directory + pathsep + environ.get("PATH", "")
+
+    return CDLL(blas_path)
+
+
+def get_libblas():
+    """
+    Return the BLAS library, loading the default library on first use.
+
+    Returns:
+        The library as a ctypes CDLL.
+
+    Raises:
+        OSError:      if the library cannot be loaded
+        RuntimeError: if no BLAS library is available for the current operating system
+    """
+
+    global _libblas
+
+    if _libblas is None:
+        with _libblas_lock:
+            if _libblas is None:
+                _libblas = load_blas(get_default_blas_path())
+
+    return _libblas
+
+
+def set_libblas(libblas):
+    """
+    Replace the BLAS library used by subsequent calls to get_libblas.
+
+    Args:
+        libblas:    a loaded ctypes CDLL
+    """
+
+    global _libblas
+
+    with _libblas_lock:
+        _libblas = libblas
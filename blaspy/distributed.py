@@ -0,0 +1,726 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+    A gemm which is split among worker processes on one or more machines, connected by TCP sockets,
+    with the SUMMA algorithm. This module is not imported by 'import blaspy'.
+
+    The workers are arranged in a grid of p_r rows by p_c columns, and worker (i, j) computes block
+    (i, j) of C. The driver splits op(A) into p_r blocks of rows by p_c blocks of columns, op(B)
+    into p_r blocks of rows by p_c blocks of columns, and sends each worker its block of each. The
+    inner dimension is then swept in panels: the worker holding each panel of op(A) sends it to the
+    other workers in its row of the grid, the worker holding each panel of op(B) sends it to the
+    other workers in its column, and every worker updates its block of C with blaspy.gemm. Each
+    worker sends its panels on a background thread as soon as it has its blocks, and receives the
+    panels of each peer on a thread of its own, so that communication overlaps with the gemm calls.
+    After each operation, Cluster.timings holds the time every worker spent computing, waiting for
+    panels, and sending panels, and the time the driver spent sending and receiving its blocks.
+
+    Messages are a JSON header followed by the raw bytes of arrays. A worker carries out the
+    commands of any driver which connects to it, so workers should only listen on trusted networks.
+
+    Example:
+        # on each machine
+        python -c "import blaspy.distributed; blaspy.distributed.serve('0.0.0.0', 5000)"
+
+        # on the driver
+        with blaspy.distributed.Cluster([('host1', 5000), ('host2', 5000)]) as cluster:
+            C = cluster.gemm(A, B)
+            print(cluster.timings)
+
+        # or, with worker processes on this machine
+        with blaspy.distributed.LocalCluster(4) as cluster:
+            C = cluster.gemm(A, B)
+
+"""
+
+from .backend import set_num_threads
+from .errors import (raise_invalid_num_workers, raise_invalid_num_threads, raise_invalid_grid,
+                     raise_invalid_panel_size, raise_worker_error)
+from .helpers import (get_matrix_dimensions, check_equal_sizes, convert_trans, create_zero_matrix,
+                      get_cblas_info, TRANS, CONJ_TRANS)
+from .level_3 import gemm
+from concurrent.futures import ThreadPoolExecutor
+from json import dumps, loads
+from multiprocessing import get_context
+from numbers import Integral
+from numpy import ascontiguousarray, empty, zeros
+from os import cpu_count, urandom
+from queue import Queue
+from socket import create_connection, create_server, IPPROTO_TCP, SHUT_RDWR, TCP_NODELAY
+from struct import Struct
+from threading import Condition, Thread
+import time
+
+# default number of columns of op(A) (and rows of op(B)) in each panel
+PANEL_SIZE = 256
+
+# the length of the JSON header which starts each message
+HEADER_LENGTH = Struct('!Q')
+
+
+class NodeTimings(object):
+    """
+    The time in seconds one worker spent on each part of the last operation of a Cluster.
+
+    Attributes:
+        rank:             position of the worker in the grid, counted along rows
+        address:          (host, port) of the worker
+        scatter:          time the driver spent sending the worker its blocks
+        compute:          time the worker spent in gemm
+        wait:             time the worker spent waiting for panels from its peers
+        send:             time the worker spent sending its panels to its peers (in the background)
+        gather:           time the driver spent receiving the worker's block of C
+        bytes_sent:       number of bytes of panels the worker sent to its peers
+        bytes_received:   number of bytes of panels the worker received from its peers
+    """
+
+    def __init__(self, rank, address, scatter, compute, wait, send, gather, bytes_sent,
+                 bytes_received):
+        self.rank = rank
+        self.address = address
+        self.scatter = scatter
+        self.compute = compute
+        self.wait = wait
+        self.send = send
+        self.gather = gather
+        self.bytes_sent = bytes_sent
+        self.bytes_received = bytes_received
+
+    def __repr__(self):
+        return ("NodeTimings(rank=%d, address=%s:%s, scatter=%.6f, compute=%.6f, wait=%.6f, "
+                "send=%.6f, gather=%.6f, bytes_sent=%d, bytes_received=%d)"
+                % (self.rank, self.address[0], self.address[1], self.scatter, self.compute,
+                   self.wait, self.send, self.gather, self.bytes_sent, self.bytes_received))
+
+
+class Cluster(object):
+    """
+    A driver for a grid of workers (each started with serve) which perform gemm operations
+    together.
+
+    Attributes:
+        addresses:    (host, port) of each worker, in order of rank
+        grid:         (p_r, p_c), the numbers of rows and columns of workers in the grid
+        timings:      list of the NodeTimings of each worker in the last operation
+    """
+
+    def __init__(self, addresses, grid=None):
+        """
+        Connect to the workers, and connect each worker to the others in its row and column of the
+        grid.
+
+        Args:
+            addresses:    list of the (host, port) of each worker, in order of rank along the rows
+                          of the grid; each host must be reachable from the other workers
+
+            --optional arguments--
+
+            grid:         (p_r, p_c), the numbers of rows and columns of workers in the grid
+                              < default is the most nearly square grid >
+
+        Raises:
+            ValueError:   if there are no addresses, or grid does not hold that many workers
+            OSError:      if a worker cannot be reached
+            RuntimeError: if a worker cannot reach its peers
+        """
+
+        self.addresses = [tuple(address) for address in addresses]
+        if not self.addresses:
+            raise_invalid_num_workers(0)
+        if grid is None:
+            grid = get_grid(len(self.addresses))
+        if (len(grid) != 2 or not all(isinstance(size, Integral) and size >= 1 for size in grid) or
+                grid[0] * grid[1] != len(self.addresses)):
+            raise_invalid_grid(grid, len(self.addresses))
+
+        self.grid = tuple(grid)
+        self.timings = []
+        self._sockets = []
+
+        try:
+            for address in self.addresses:
+                sock = create_connection(address)
+                sock.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
+                self._sockets.append(sock)
+                send_message(sock, {'role': 'driver'})
+
+            # every worker waits for its peers, so set them all up before waiting for any
+            session = urandom(8).hex()
+            addresses = [list(address) for address in self.addresses]
+            for rank, sock in enumerate(self._sockets):
+                send_message(sock, {'command': 'setup', 'session': session, 'rank': rank,
+                                    'grid': list(self.grid), 'addresses': addresses})
+            for rank in range(len(self._sockets)):
+                self.receive(rank)
+
+        except BaseException:
+            Cluster.close(self)
+            raise
+
+    def gemm(self, A, B, C=None, trans_a='n', trans_b='n', alpha=1.0, beta=1.0, panel_size=None):
+        """
+        Perform a general matrix-matrix multiplication operation on the workers.
+
+        C := beta * C + alpha * op(A) * op(B)
+
+        The arguments are as for blaspy.gemm, without the leading dimensions. op(A), op(B), and C
+        are split into blocks on the driver, so each may be stored in any order.
+
+        Args:
+            --optional arguments--
+
+            panel_size:    largest number of columns of op(A) (and rows of op(B)) in each panel
+                               < default is PANEL_SIZE >
+
+        Returns:
+            Matrix C (which is also overwritten)
+
+        Raises:
+            ValueError:   as for blaspy.gemm, or if panel_size is not an integer >= 1
+            RuntimeError: if a worker fails
+        """
+
+        # convert to appropriate CBLAS value
+        cblas_trans_a = convert_trans(trans_a)
+        cblas_trans_b = convert_trans(trans_b)
+
+        # get the dimensions of the parameters
+        m_A, n_A = get_matrix_dimensions('A', A)
+        m_B, n_B = get_matrix_dimensions('B', B)
+        op_A, op_B = apply_trans(A, cblas_trans_a), apply_trans(B, cblas_trans_b)
+        m, k = op_A.shape
+        check_equal_sizes('A', k, 'B', op_B.shape[0])
+        n = op_B.shape[1]
+        get_cblas_info('gemm', (A.dtype, B.dtype))
+
+        # if C is not given, create a zero matrix with the same type as A
+        if C is None:
+            C = create_zero_matrix(m, n, A.dtype, type(A))
+            beta = 0.
+
+        m_C, n_C = get_matrix_dimensions('C', C)
+        check_equal_sizes('A', m, 'C', m_C)
+        check_equal_sizes('B', n, 'C', n_C)
+        get_cblas_info('gemm', (A.dtype, B.dtype, C.dtype))
+
+        if panel_size is None:
+            panel_size = PANEL_SIZE
+        if not isinstance(panel_size, Integral) or panel_size < 1:
+            raise_invalid_panel_size(panel_size)
+
+        # split C by the grid, op(A) by rows of the grid and op(B) by columns of the grid, and the
+        # inner dimension into panels which each lie in one block of op(A) and one block of op(B)
+        rows, cols = self.grid
+        row_bounds, col_bounds = split_evenly(m, rows), split_evenly(n, cols)
+        A_depths, B_depths = split_evenly(k, cols), split_evenly(k, rows)
+        panels = get_panels(A_depths, B_depths, panel_size)
+        scalars = {'alpha': encode_scalar(alpha), 'beta': encode_scalar(beta)}
+
+        def run_node(rank):
+            i, j = divmod(rank, cols)
+            (row_start, row_stop), (col_start, col_stop) = row_bounds[i], col_bounds[j]
+            (A_start, A_stop), (B_start, B_stop) = A_depths[j], B_depths[i]
+
+            blocks = [op_A[row_start:row_stop, A_start:A_stop],
+                      op_B[B_start:B_stop, col_start:col_stop]]
+            if beta != 0:
+                blocks.append(C[row_start:row_stop, col_start:col_stop])
+
+            header = dict(scalars, command='gemm', m=row_stop - row_start, n=col_stop - col_start,
+                          A_offset=A_start, B_offset=B_start, panels=panels)
+            started = time.perf_counter()
+            send_message(self._sockets[rank], header, blocks)
+            scatter = time.perf_counter() - started
+
+            reply, (C_block,), gather = self.receive(rank)
+            C[row_start:row_stop, col_start:col_stop] = C_block
+            return NodeTimings(rank, self.addresses[rank], scatter, reply['compute'], reply['wait'],
+                               reply['send'], gather, reply['bytes_sent'], reply['bytes_received'])
+
+        with ThreadPoolExecutor(len(self._sockets), 'blaspy-distributed') as pool:
+            futures = [pool.submit(run_node, rank) for rank in range(len(self._sockets))]
+            self.timings = [future.result() for future in futures]
+
+        return C
+
+    def receive(self, rank):
+        """
+        Return the header and arrays of the next reply of a worker, and the time in seconds spent
+        receiving the arrays.
+
+        Raises:
+            RuntimeError: if the worker failed or closed the connection
+        """
+
+        message = receive_message(self._sockets[rank])
+        if message is None:
+            raise_worker_error(self.addresses[rank], "the connection was closed")
+        if 'error' in message[0]:
+            raise_worker_error(self.addresses[rank], message[0]['error'])
+        return message
+
+    def shutdown_workers(self):
+        """ Stop every worker process, then close the connections to them. """
+
+        for sock in self._sockets:
+            send_message(sock, {'command': 'shutdown'})
+        for rank in range(len(self._sockets)):
+            self.receive(rank)
+        self.close()
+
+    def close(self):
+        """ Close the connections to the workers, which keep running for other drivers. """
+
+        sockets, self._sockets = self._sockets, []
+        for sock in sockets:
+            sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+class LocalCluster(Cluster):
+    """
+    A Cluster of worker processes started on this machine, which are stopped when it is closed.
+
+    Attributes:
+        processes:    the multiprocessing.Process of each worker
+    """
+
+    def __init__(self, workers=None, grid=None, blas_threads=None):
+        """
+        Start the worker processes, each listening on a free port of 127.0.0.1, and connect to them.
+
+        Args:
+            --optional arguments--
+
+            workers:         number of worker processes (must be >= 1)
+                                 < default is the number of CPUs >
+            grid:            (p_r, p_c), the numbers of rows and columns of workers in the grid
+                                 < default is the most nearly square grid >
+            blas_threads:    number of threads the BLAS library runs each call with in each worker
+                             (must be >= 1)
+                                 < default is the number of CPUs // workers, at least 1 >
+
+        Raises:
+            ValueError: if workers or blas_threads is not an integer >= 1, or grid does not hold
+                        that many workers
+        """
+
+        num_cpus = cpu_count() or 1
+        if workers is None:
+            workers = num_cpus
+        if not isinstance(workers, Integral) or workers < 1:
+            raise_invalid_num_workers(workers)
+        if blas_threads is None:
+            blas_threads = max(1, num_cpus // workers)
+        if not isinstance(blas_threads, Integral) or blas_threads < 1:
+            raise_invalid_num_threads(blas_threads)
+
+        context = get_context()
+        self.processes = []
+        addresses = []
+        for index in range(workers):
+            receiver, sender = context.Pipe(False)
+            process = context.Process(target=serve, args=('127.0.0.1', 0, blas_threads, sender),
+                                      daemon=True)
+            process.start()
+            self.processes.append(process)
+            addresses.append(receiver.recv())
+
+        try:
+            Cluster.__init__(self, addresses, grid)
+        except BaseException:
+            self.stop_processes()
+            raise
+
+    def close(self):
+        """ Stop the worker processes. """
+
+        if self._sockets:
+            try:
+                self.shutdown_workers()
+            except (OSError, RuntimeError):
+                Cluster.close(self)
+        self.stop_processes()
+
+    def stop_processes(self):
+        """ Wait briefly for the worker processes to exit, then terminate any which have not. """
+
+        for process in self.processes:
+            process.join(1)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+
+class Worker(object):
+    """
+    A worker which listens for a driver (a Cluster) and its peers, and carries out the commands of
+    the driver. Use serve to run one.
+
+    Attributes:
+        address:    (host, port) the worker listens on
+    """
+
+    def __init__(self, host, port):
+        self.listener = create_server((host, port))
+        self.address = self.listener.getsockname()[:2]
+        self._peers = {}  # (socket, queue of received messages) of each peer, by (session, rank)
+        self._peers_changed = Condition()
+
+    def serve_forever(self):
+        """ Accept connections until a driver sends the shutdown command. """
+
+        while True:
+            try:
+                sock = self.listener.accept()[0]
+            except OSError:
+                return  # the listener was closed by the shutdown command
+            Thread(target=self.handle_connection, args=(sock,), daemon=True).start()
+
+    def stop(self):
+        """ Stop accepting connections, which ends serve_forever. """
+
+        try:
+            self.listener.shutdown(SHUT_RDWR)  # wakes the thread blocked in accept
+        except OSError:
+            pass
+        self.listener.close()
+
+    def handle_connection(self, sock):
+        """ Serve a new connection from a driver or from a peer. """
+
+        sock.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
+        try:
+            message = receive_message(sock)
+            if message is None:
+                sock.close()
+            elif message[0]['role'] == 'peer':
+                self.receive_panels(sock, message[0]['session'], message[0]['rank'])
+            else:
+                self.serve_driver(sock)
+        except OSError:
+            sock.close()
+
+    def receive_panels(self, sock, session, rank):
+        """
+        Queue every message received from a peer until the connection is closed. Messages are
+        always read at once (rather than as they are needed), so that a peer never blocks while
+        sending, and no worker can wait on another which is itself waiting.
+        """
+
+        panels = Queue()
+        with self._peers_changed:
+            self._peers[(session, rank)] = (sock, panels)
+            self._peers_changed.notify_all()
+
+        try:
+            message = receive_message(sock)
+            while message is not None:
+                panels.put(message)
+                message = receive_message(sock)
+        except OSError:
+            pass
+        panels.put(None)
+
+    def serve_driver(self, sock):
+        """ Carry out the commands of a driver until it closes the connection. """
+
+        session = None
+        try:
+            message = receive_message(sock)
+            while message is not None:
+                header, arrays, seconds = message
+                if header['command'] == 'setup':
+                    session = self.setup(header)
+                    send_message(sock, {})
+                elif header['command'] == 'gemm':
+                    try:
+                        reply, blocks = self.summa(session, header, arrays)
+                    except Exception as error:
+                        reply, blocks = {'error': '%s: %s' % (type(error).__name__, error)}, ()
+                    send_message(sock, reply, blocks)
+                elif header['command'] == 'shutdown':
+                    send_message(sock, {})
+                    self.stop()
+                    break
+                message = receive_message(sock)
+
+        except OSError:
+            pass
+
+        finally:
+            sock.close()
+            if session is not None:
+                self.close_session(session['session'])
+
+    def setup(self, header):
+        """
+        Connect to the peers of higher rank in the worker's row and column of the grid, and wait
+        for those of lower rank to connect.
+
+        Returns:
+            A dict of the session, rank, and grid of the worker.
+        """
+
+        session, rank, (rows, cols) = header['session'], header['rank'], header['grid']
+        peers = [peer for peer in range(rows * cols) if peer != rank and
+                 (peer // cols == rank // cols or peer % cols == rank % cols)]
+
+        for peer in peers:
+            if peer > rank:
+                sock = create_connection(tuple(header['addresses'][peer]))
+                sock.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
+                send_message(sock, {'role': 'peer', 'session': session, 'rank': rank})
+                Thread(target=self.receive_panels, args=(sock, session, peer), daemon=True).start()
+
+        with self._peers_changed:
+            self._peers_changed.wait_for(lambda: all((session, peer) in self._peers
+                                                     for peer in peers))
+        return {'session': session, 'rank': rank, 'grid': (rows, cols)}
+
+    def close_session(self, session):
+        """ Close the connections to the peers of a session. """
+
+        with self._peers_changed:
+            keys = [key for key in self._peers if key[0] == session]
+            for key in keys:
+                self._peers.pop(key)[0].close()
+
+    def summa(self, session, header, arrays):
+        """
+        Compute the worker's block of C with the SUMMA algorithm.
+
+        Returns:
+            The header and arrays of the reply to the driver.
+        """
+
+        rows, cols = session['grid']
+        i, j = divmod(session['rank'], cols)
+        A, B = arrays[:2]
+        C = arrays[2] if len(arrays) > 2 else zeros((header['m'], header['n']), A.dtype)
+        alpha = decode_scalar(header['alpha'], C.dtype)
+        beta = decode_scalar(header['beta'], C.dtype)
+        A_offset, B_offset, panels = header['A_offset'], header['B_offset'], header['panels']
+        peers = dict((rank, self._peers[(session['session'], rank)])
+                     for rank in range(rows * cols) if (session['session'], rank) in self._peers)
+        timings = {'compute': 0., 'wait': 0., 'send': 0., 'bytes_sent': 0, 'bytes_received': 0}
+
+        def send_panels():
+            started = time.perf_counter()
+            for start, stop, A_owner, B_owner in panels:
+                if A_owner == j:
+                    for col in range(cols):
+                        if col != j:
+                            timings['bytes_sent'] += send_message(
+                                peers[i * cols + col][0], {},
+                                (A[:, start - A_offset:stop - A_offset],))
+                if B_owner == i:
+                    for row in range(rows):
+                        if row != i:
+                            timings['bytes_sent'] += send_message(
+                                peers[row * cols + j][0], {},
+                                (B[start - B_offset:stop - B_offset],))
+            timings['send'] = time.perf_counter() - started
+
+        def take_panel(rank):
+            started = time.perf_counter()
+            message = peers[rank][1].get()
+            timings['wait'] += time.perf_counter() - started
+            if message is None:
+                raise ConnectionError("the connection to worker %d was closed" % rank)
+            timings['bytes_received'] += message[1][0].nbytes
+            return message[1][0]
+
+        sender = Thread(target=send_panels, daemon=True)
+        sender.start()
+
+        first = True
+        index = 0
+        while index < len(panels):
+            start, stop, A_owner, B_owner = panels[index]
+            index += 1
+
+            # the panels the worker holds of both A and B need not wait for its peers, so each run
+            # of them is multiplied with one gemm
+            while (A_owner == j and B_owner == i and index < len(panels) and
+                   panels[index][2:] == [A_owner, B_owner]):
+                stop = panels[index][1]
+                index += 1
+
+            A_panel = (A[:, start - A_offset:stop - A_offset] if A_owner == j else
+                       take_panel(i * cols + A_owner))
+            B_panel = (B[start - B_offset:stop - B_offset] if B_owner == i else
+                       take_panel(B_owner * cols + j))
+            if C.size:
+                started = time.perf_counter()
+                gemm(A_panel, B_panel, C, alpha=alpha, beta=beta if first else 1.0)
+                timings['compute'] += time.perf_counter() - started
+            first = False
+
+        # with no inner dimension, C is only scaled
+        if first:
+            C *= beta
+
+        sender.join()
+        return timings, (C,)
+
+
+def serve(host='127.0.0.1', port=0, blas_threads=None, ready=None):
+    """
+    Run a worker in this process until a driver sends it the shutdown command.
+
+    Args:
+        --optional arguments--
+
+        host:            the host name or address to listen on ('0.0.0.0' for every interface)
+                             < default is '127.0.0.1' >
+        port:            the port to listen on (0 for any free port)
+                             < default is 0 >
+        blas_threads:    number of threads the BLAS library runs each call with
+                             < default is the library's own default >
+        ready:           a multiprocessing Connection to send the (host, port) the worker listens on
+                         once it is listening
+                             < default is None >
+    """
+
+    if blas_threads is not None:
+        try:
+            set_num_threads(blas_threads)
+        except RuntimeError:
+            pass  # the library has no thread control
+
+    worker = Worker(host, port)
+    if ready is not None:
+        ready.send(worker.address)
+        ready.close()
+    worker.serve_forever()
+
+
+def get_grid(num_workers):
+    """ Return the (rows, columns) of the most nearly square grid of a number of workers. """
+
+    rows = max(row for row in range(1, int(num_workers ** 0.5) + 1) if num_workers % row == 0)
+    return rows, num_workers // rows
+
+
+def split_evenly(length, parts):
+    """ Return the (start, stop) bounds of 'parts' blocks of about equal length (some empty). """
+
+    bounds = [length * part // parts for part in range(parts + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def get_panels(A_depths, B_depths, panel_size):
+    """
+    Return the [start, stop, A_owner, B_owner] of each panel of the inner dimension, where each
+    panel lies within block A_owner of the columns of op(A) and block B_owner of the rows of op(B),
+    and is at most panel_size long.
+    """
+
+    bounds = sorted(set(bound for depths in (A_depths, B_depths) for depth in depths
+                        for bound in depth))
+    panels = []
+    for segment_start, segment_stop in zip(bounds[:-1], bounds[1:]):
+        A_owner = [start <= segment_start < stop for start, stop in A_depths].index(True)
+        B_owner = [start <= segment_start < stop for start, stop in B_depths].index(True)
+        for start in range(segment_start, segment_stop, panel_size):
+            panels.append([start, min(start + panel_size, segment_stop), A_owner, B_owner])
+    return panels
+
+
+def apply_trans(matrix, cblas_trans):
+    """ Return a view of op(matrix) (or a copy, if it is conjugated). """
+
+    if cblas_trans == TRANS:
+        return matrix.T
+    elif cblas_trans == CONJ_TRANS:
+        return matrix.T.conj()
+    return matrix
+
+
+def encode_scalar(scalar):
+    """ Return a scalar as a [real, imaginary] pair which can be sent in a JSON header. """
+    return [complex(scalar).real, complex(scalar).imag]
+
+
+def decode_scalar(pair, np_dtype):
+    """ Return the scalar of a [real, imaginary] pair, complex only if np_dtype is. """
+    return complex(*pair) if np_dtype.kind == 'c' else pair[0]
+
+
+def send_message(sock, header, arrays=()):
+    """
+    Send a JSON header, followed by the raw bytes of some arrays.
+
+    Returns:
+        The number of bytes sent.
+    """
+
+    arrays = [ascontiguousarray(array) for array in arrays]
+    header = dict(header, arrays=[(array.shape, array.dtype.str) for array in arrays])
+    data = dumps(header).encode()
+    sock.sendall(HEADER_LENGTH.pack(len(data)) + data)
+    for array in arrays:
+        if array.size:
+            sock.sendall(memoryview(array).cast('B'))
+    return HEADER_LENGTH.size + len(data) + sum(array.nbytes for array in arrays)
+
+
+def receive_message(sock):
+    """
+    Receive a message sent with send_message.
+
+    Returns:
+        A tuple of the header, the list of arrays, and the time in seconds spent receiving the
+        arrays, or None if the connection was closed before the message.
+    """
+
+    length = bytearray(HEADER_LENGTH.size)
+    if not receive_into(sock, memoryview(length), True):
+        return None
+    data = bytearray(HEADER_LENGTH.unpack(length)[0])
+    receive_into(sock, memoryview(data))
+    header = loads(data.decode())
+
+    started = time.perf_counter()
+    arrays = []
+    for shape, dtype_str in header.pop('arrays'):
+        array = empty(shape, dtype_str)
+        if array.size:
+            receive_into(sock, memoryview(array).cast('B'))
+        arrays.append(array)
+    return header, arrays, time.perf_counter() - started
+
+
+def receive_into(sock, buffer, at_message_start=False):
+    """
+    Fill a buffer from a socket.
+
+    Returns:
+        False if the connection was closed at the start of a message, otherwise True.
+
+    Raises:
+        ConnectionError: if the connection was closed partway through
+    """
+
+    received = 0
+    while received < len(buffer):
+        count = sock.recv_into(buffer[received:])
+        if count == 0:
+            if at_message_start and received == 0:
+                return False
+            raise ConnectionError("the connection was closed partway through a message")
+        received += count
+    return True
@@ -10,9 +10,30 @@
 """
 
 def raise_not_2d_numpy(name):
-    raise ValueError("'%s' should be two-dimensional and of NumPy type ndarray or matrix. BLASpy "
-                     "expects vectors to be two-dimensional, so ensure you are not trying to pass "
-                     "in a one-dimensional ndarray as a vector." % name)
+    raise ValueError("'%s' should be two-dimensional and of NumPy type ndarray or matrix." % name)
+
+
+def raise_not_vector_numpy(name):
+    raise ValueError("'%s' should be a one-dimensional NumPy ndarray, or a two-dimensional NumPy "
+                     "ndarray or matrix with a single row or column." % name)
+
+
+def raise_not_3d_numpy(name):
+    raise ValueError("'%s' should be a three-dimensional NumPy ndarray holding a stack of matrices "
+                     "indexed as (matrix, row, column), or a two-dimensional NumPy ndarray or "
+                     "matrix shared by every problem of the batch. At least one operand of a "
+                     "batched function must be a stack." % name)
+
+
+def raise_not_2d_vector_stack(name):
+    raise ValueError("'%s' should be a two-dimensional NumPy ndarray holding a stack of vectors "
+                     "indexed as (vector, element), or a one-dimensional NumPy ndarray shared by "
+                     "every problem of the batch." % name)
+
+
+def raise_shared_output(name):
+    raise ValueError("Every problem of a batch should write its result into its own matrix or "
+                     "vector of '%s', but they overlap in memory." % name)
 
 
 def raise_not_vector(name, rows, cols):
@@ -26,6 +47,29 @@ def raise_not_square(name, rows, cols):
                      "columns. Number of rows: %i. Number of columns: %i" % (name, rows, cols))
 
 
+def raise_not_1d_or_2d_numpy(name):
+    raise ValueError("'%s' should be a one-dimensional NumPy ndarray representing a vector, or a "
+                     "two-dimensional NumPy ndarray or matrix representing a matrix." % name)
+
+
+def raise_shape_mismatch(name1, shape_1, name2, shape_2):
+    raise ValueError("There was a shape mismatch between '%s' %s and '%s' %s. Both should have "
+                     "the same shape." % (name1, shape_1, name2, shape_2))
+
+
+def raise_too_few_operands(name, smallest, count):
+    raise ValueError("'%s' needs at least %d operands, but %d were given."
+                     % (name, smallest, count))
+
+
+def raise_not_strided(name):
+    raise ValueError("The elements of '%s' should be evenly spaced in memory, and a matrix should "
+                     "be stored in either row-major or column-major order (its elements must be "
+                     "adjacent within each row or within each column). This error can be fixed by "
+                     "calling numpy.ascontiguousarray on the problem view before calling a BLASpy "
+                     "function with it as a parameter." % name)
+
+
 def raise_size_mismatch(name1, size_1, name2, size_2):
     raise ValueError("There was a size mismatch between '%s' (%d) and '%s' (%d). Double check that their "
                      "sizes conform in a manner appropriate for the BLASpy function being "
@@ -49,8 +93,73 @@ def raise_invalid_parameter(name, allowed, actual):
                      "%s" % (name, (allowed,), actual))
 
 
+def raise_num_shapes_mismatch(name, operands, num_shapes):
+    raise ValueError("A plan for '%s' needs the shapes of %d matrices and vectors (%s), but %d "
+                     "were given." % (name, len(operands), ", ".join(operands), num_shapes))
+
+
+def raise_negative_plan_increment(name, inc):
+    raise ValueError("A plan for '%s' needs a positive increment, since the index it returns for a "
+                     "negative one would not be reversed. Actual increment: %s" % (name, inc))
+
+
+def raise_not_cblas(blas_path):
+    raise ValueError("'%s' is not a BLAS library with a CBLAS interface. BLASpy requires a library "
+                     "that exports the CBLAS subroutines, such as cblas_dgemm." % blas_path)
+
+
+def raise_no_backends():
+    raise ValueError("There are no BLAS libraries to calibrate. blaspy.calibrate needs at least one "
+                     "library that exports cblas_dgemm and cblas_dgemv; see blaspy.backends() for "
+                     "the libraries found on this system.")
+
+
+def raise_invalid_num_threads(num_threads):
+    raise ValueError("The number of threads should be an integer >= 1. Actual value: %s"
+                     % (num_threads,))
+
+
+def raise_invalid_num_workers(num_workers):
+    raise ValueError("The number of workers should be an integer >= 1. Actual value: %s"
+                     % (num_workers,))
+
+
+def raise_invalid_memory(memory, smallest):
+    raise ValueError("The memory budget should be an integer number of bytes >= %d. Actual value: "
+                     "%s" % (smallest, memory))
+
+
+def raise_invalid_alignment(alignment):
+    raise ValueError("The alignment should be a power of two number of bytes. Actual value: %s"
+                     % (alignment,))
+
+
+def raise_invalid_grid(grid, num_workers):
+    raise ValueError("The grid should be a pair of integers >= 1 whose product is the number of "
+                     "workers (%d). Actual value: %s" % (num_workers, grid))
+
+
+def raise_invalid_panel_size(panel_size):
+    raise ValueError("The panel size should be an integer >= 1. Actual value: %s" % (panel_size,))
+
+
+def raise_worker_error(address, message):
+    raise RuntimeError("The worker at %s:%s failed: %s" % (address[0], address[1], message))
+
+
+def raise_executor_shut_down():
+    raise RuntimeError("Cannot submit calls to an executor after it has been shut down.")
+
+
+def raise_no_thread_control(blas_path):
+    raise RuntimeError("'%s' does not export a thread control known to BLASpy (such as "
+                       "openblas_set_num_threads or MKL_Set_Num_Threads), so its number of threads "
+                       "cannot be changed from BLASpy." % blas_path)
+
+
 def raise_blas_os_error():
     raise RuntimeError("BLASpy does not have a bundled BLAS implementation appropriate for "
                        "your operating system. Please download and compile one, "
-                       "such as OpenBLAS, then modify config.py to point to that BLAS "
-                       "implementation.")
\ No newline at end of file
+                       "such as OpenBLAS, then point BLASpy to that BLAS implementation by "
+                       "setting the BLASPY_BLAS environment variable, calling "
+                       "blaspy.set_backend, or modifying config.py.")
\ No newline at end of file
@@ -9,12 +9,21 @@
 
 """
 
-from .config import _libblas as lib
+from .config import get_libblas, set_libblas
 from .errors import (raise_invalid_dtypes, raise_not_vector, raise_not_2d_numpy, raise_not_square,
-                     raise_size_mismatch, raise_strides_not_one, raise_invalid_parameter)
-from ctypes import c_double, c_float
-from numpy import asmatrix, zeros
+                     raise_not_vector_numpy, raise_not_3d_numpy, raise_not_2d_vector_stack,
+                     raise_shared_output,
+                     raise_size_mismatch, raise_strides_not_one, raise_invalid_parameter,
+                     raise_not_strided, raise_invalid_num_threads)
+from .pool import empty as pool_empty, zeros as pool_zeros
+from ctypes import (CFUNCTYPE, Structure, addressof, byref, c_char, c_double, c_float, c_int,
+                    c_void_p)
+from concurrent.futures import ThreadPoolExecutor
+from numbers import Integral
+from numpy import array, asarray, asmatrix, dtype, intc, tril, triu, uintp
 from numpy import matrix as np_matrix
+from os import cpu_count
+from threading import Lock
 
 # CBLAS_ORDER
 ROW_MAJOR = 101
@@ -38,39 +47,183 @@ UNIT = 132
 LEFT = 141
 RIGHT = 142
 
-# dictionary of BLASpy functions mapping to CBLAS subroutines
-# - first entry in value pair is for double precision reals
-# - second entry in value pair is for single precision reals
-# - sdot is omitted as a special case
-FUNC_DICT = {'amax':  (lib.cblas_idamax, lib.cblas_isamax),  # level 1
-             'asum':  (lib.cblas_dasum,  lib.cblas_sasum),
-             'axpy':  (lib.cblas_daxpy,  lib.cblas_saxpy),
-             'copy':  (lib.cblas_dcopy,  lib.cblas_scopy),
-             'dot':   (lib.cblas_ddot,   lib.cblas_sdot),
-             'nrm2':  (lib.cblas_dnrm2,  lib.cblas_snrm2),
-             'scal':  (lib.cblas_dscal,  lib.cblas_sscal),
-             'swap':  (lib.cblas_dswap,  lib.cblas_sswap),
-             'gemv':  (lib.cblas_dgemv,  lib.cblas_sgemv),   # level 2
-             'ger':   (lib.cblas_dger,   lib.cblas_sger),
-             'symv':  (lib.cblas_dsymv,  lib.cblas_ssymv),
-             'syr':   (lib.cblas_dsyr,   lib.cblas_ssyr),
-             'syr2':  (lib.cblas_dsyr2,  lib.cblas_ssyr2),
-             'trmv':  (lib.cblas_dtrmv,  lib.cblas_strmv),
-             'trsv':  (lib.cblas_dtrsv,  lib.cblas_strsv),
-             'gemm':  (lib.cblas_dgemm,  lib.cblas_sgemm),   # level 3
-             'symm':  (lib.cblas_dsymm,  lib.cblas_ssymm),
-             'syrk':  (lib.cblas_dsyrk,  lib.cblas_ssyrk),
-             'syr2k': (lib.cblas_dsyr2k, lib.cblas_ssyr2k),
-             'trmm':  (lib.cblas_dtrmm,  lib.cblas_strmm),
-             'trsm':  (lib.cblas_dtrsm,  lib.cblas_strsm)
+# dictionaries mapping BLASpy parameter values to CBLAS values (used when arguments are not checked)
+UPLO_DICT = {'u': UPPER, 'U': UPPER, 'l': LOWER, 'L': LOWER}
+TRANS_DICT = {'n': NO_TRANS, 'N': NO_TRANS, 't': TRANS, 'T': TRANS,
+              'c': CONJ_TRANS, 'C': CONJ_TRANS}
+DIAG_DICT = {'n': NON_UNIT, 'N': NON_UNIT, 'u': UNIT, 'U': UNIT}
+SIDE_DICT = {'l': LEFT, 'L': LEFT, 'r': RIGHT, 'R': RIGHT}
+
+# dictionary of BLASpy functions mapping to the names of CBLAS subroutines
+# - first entry in value tuple is for double precision reals
+# - second entry in value tuple is for single precision reals
+# - third entry in value tuple is for double precision complex numbers
+# - fourth entry in value tuple is for single precision complex numbers
+# - None indicates that no CBLAS subroutine exists for that data type
+FUNC_DICT = {'amax':   ('cblas_idamax', 'cblas_isamax', 'cblas_izamax',    'cblas_icamax'),  # level 1
+             'asum':   ('cblas_dasum',  'cblas_sasum',  'cblas_dzasum',    'cblas_scasum'),
+             'axpy':   ('cblas_daxpy',  'cblas_saxpy',  'cblas_zaxpy',     'cblas_caxpy'),
+             'copy':   ('cblas_dcopy',  'cblas_scopy',  'cblas_zcopy',     'cblas_ccopy'),
+             'dot':    ('cblas_ddot',   'cblas_sdot',   'cblas_zdotu_sub', 'cblas_cdotu_sub'),
+             'dotc':   ('cblas_ddot',   'cblas_sdot',   'cblas_zdotc_sub', 'cblas_cdotc_sub'),
+             'dsdot':  (None,           'cblas_dsdot',  None,              None),
+             'sdsdot': (None,           'cblas_sdsdot', None,              None),
+             'nrm2':   ('cblas_dnrm2',  'cblas_snrm2',  'cblas_dznrm2',    'cblas_scnrm2'),
+             'scal':   ('cblas_dscal',  'cblas_sscal',  'cblas_zscal',     'cblas_cscal'),
+             'swap':   ('cblas_dswap',  'cblas_sswap',  'cblas_zswap',     'cblas_cswap'),
+             'gemv':   ('cblas_dgemv',  'cblas_sgemv',  'cblas_zgemv',     'cblas_cgemv'),  # level 2
+             'ger':    ('cblas_dger',   'cblas_sger',   'cblas_zgeru',     'cblas_cgeru'),
+             'symv':   ('cblas_dsymv',  'cblas_ssymv',  None,              None),
+             'syr':    ('cblas_dsyr',   'cblas_ssyr',   None,              None),
+             'syr2':   ('cblas_dsyr2',  'cblas_ssyr2',  None,              None),
+             'trmv':   ('cblas_dtrmv',  'cblas_strmv',  'cblas_ztrmv',     'cblas_ctrmv'),
+             'trsv':   ('cblas_dtrsv',  'cblas_strsv',  'cblas_ztrsv',     'cblas_ctrsv'),
+             'hemv':   (None,           None,           'cblas_zhemv',     'cblas_chemv'),
+             'her':    (None,           None,           'cblas_zher',      'cblas_cher'),
+             'her2':   (None,           None,           'cblas_zher2',     'cblas_cher2'),
+             'gemm':   ('cblas_dgemm',  'cblas_sgemm',  'cblas_zgemm',     'cblas_cgemm'),  # level 3
+             'symm':   ('cblas_dsymm',  'cblas_ssymm',  'cblas_zsymm',     'cblas_csymm'),
+             'syrk':   ('cblas_dsyrk',  'cblas_ssyrk',  'cblas_zsyrk',     'cblas_csyrk'),
+             'syr2k':  ('cblas_dsyr2k', 'cblas_ssyr2k', 'cblas_zsyr2k',    'cblas_csyr2k'),
+             'trmm':   ('cblas_dtrmm',  'cblas_strmm',  'cblas_ztrmm',     'cblas_ctrmm'),
+             'trsm':   ('cblas_dtrsm',  'cblas_strsm',  'cblas_ztrsm',     'cblas_ctrsm'),
+             'hemm':   (None,           None,           'cblas_zhemm',     'cblas_chemm'),
+             'herk':   (None,           None,           'cblas_zherk',     'cblas_cherk'),
+             'her2k':  (None,           None,           'cblas_zher2k',    'cblas_cher2k')
             }
 
 
+class c_double_complex(Structure):
+    """ A double precision complex scalar, which CBLAS takes by reference. """
+
+    _fields_ = [('real', c_double), ('imag', c_double)]
+
+    @classmethod
+    def from_param(cls, value):
+        return byref(cls(value.real, value.imag))
+
+
+class c_float_complex(Structure):
+    """ A single precision complex scalar, which CBLAS takes by reference. """
+
+    _fields_ = [('real', c_float), ('imag', c_float)]
+
+    @classmethod
+    def from_param(cls, value):
+        return byref(cls(value.real, value.imag))
+
+
+# NumPy dtypes, ctypes data types, and ctypes data types of the real parts in the same order as
+# the entries of FUNC_DICT
+DTYPES = (dtype('float64'), dtype('float32'), dtype('complex128'), dtype('complex64'))
+CTYPES = (c_double, c_float, c_double_complex, c_float_complex)
+REAL_CTYPES = (c_double, c_float, c_double, c_float)
+DTYPE_INDEX = dict((np_dtype, index) for index, np_dtype in enumerate(DTYPES))
+
+# placeholders for the parts of a CBLAS prototype that depend on the data type
+SCALAR = 'scalar'  # a scalar of the appropriate ctypes data type (passed by reference if complex)
+REAL = 'real'      # a real scalar of the precision of the appropriate ctypes data type
+ARRAY = 'array'    # the address of the first element of a matrix or vector
+
+# dictionary of BLASpy functions mapping to the prototypes of their CBLAS subroutines
+# - first entry in value pair is the return type
+# - second entry in value pair is the tuple of argument types
+# - a complex SCALAR return value is returned by the '_sub' CBLAS subroutine through a pointer
+#   passed as an extra last argument instead
+PROTOTYPE_DICT = {'amax':   (c_int,    (c_int, ARRAY, c_int)),  # level 1
+                  'asum':   (REAL,     (c_int, ARRAY, c_int)),
+                  'axpy':   (None,     (c_int, SCALAR, ARRAY, c_int, ARRAY, c_int)),
+                  'copy':   (None,     (c_int, ARRAY, c_int, ARRAY, c_int)),
+                  'dot':    (SCALAR,   (c_int, ARRAY, c_int, ARRAY, c_int)),
+                  'dotc':   (SCALAR,   (c_int, ARRAY, c_int, ARRAY, c_int)),
+                  'dsdot':  (c_double, (c_int, ARRAY, c_int, ARRAY, c_int)),
+                  'sdsdot': (SCALAR,   (c_int, SCALAR, ARRAY, c_int, ARRAY, c_int)),
+                  'nrm2':   (REAL,     (c_int, ARRAY, c_int)),
+                  'scal':   (None,     (c_int, SCALAR, ARRAY, c_int)),
+                  'swap':   (None,     (c_int, ARRAY, c_int, ARRAY, c_int)),
+                  'gemv':   (None,     (c_int, c_int, c_int, c_int, SCALAR, ARRAY, c_int,  # level 2
+                                        ARRAY, c_int, SCALAR, ARRAY, c_int)),
+                  'ger':    (None,     (c_int, c_int, c_int, SCALAR, ARRAY, c_int, ARRAY, c_int,
+                                        ARRAY, c_int)),
+                  'symv':   (None,     (c_int, c_int, c_int, SCALAR, ARRAY, c_int, ARRAY, c_int,
+                                        SCALAR, ARRAY, c_int)),
+                  'syr':    (None,     (c_int, c_int, c_int, SCALAR, ARRAY, c_int, ARRAY, c_int)),
+                  'syr2':   (None,     (c_int, c_int, c_int, SCALAR, ARRAY, c_int, ARRAY, c_int,
+                                        ARRAY, c_int)),
+                  'trmv':   (None,     (c_int, c_int, c_int, c_int, c_int, ARRAY, c_int, ARRAY,
+                                        c_int)),
+                  'trsv':   (None,     (c_int, c_int, c_int, c_int, c_int, ARRAY, c_int, ARRAY,
+                                        c_int)),
+                  'hemv':   (None,     (c_int, c_int, c_int, SCALAR, ARRAY, c_int, ARRAY, c_int,
+                                        SCALAR, ARRAY, c_int)),
+                  'her':    (None,     (c_int, c_int, c_int, REAL, ARRAY, c_int, ARRAY, c_int)),
+                  'her2':   (None,     (c_int, c_int, c_int, SCALAR, ARRAY, c_int, ARRAY, c_int,
+                                        ARRAY, c_int)),
+                  'gemm':   (None,     (c_int, c_int, c_int, c_int, c_int, c_int, SCALAR,  # level 3
+                                        ARRAY, c_int, ARRAY, c_int, SCALAR, ARRAY, c_int)),
+                  'symm':   (None,     (c_int, c_int, c_int, c_int, c_int, SCALAR, ARRAY, c_int,
+                                        ARRAY, c_int, SCALAR, ARRAY, c_int)),
+                  'syrk':   (None,     (c_int, c_int, c_int, c_int, c_int, SCALAR, ARRAY, c_int,
+                                        SCALAR, ARRAY, c_int)),
+                  'syr2k':  (None,     (c_int, c_int, c_int, c_int, c_int, SCALAR, ARRAY, c_int,
+                                        ARRAY, c_int, SCALAR, ARRAY, c_int)),
+                  'trmm':   (None,     (c_int, c_int, c_int, c_int, c_int, c_int, c_int, SCALAR,
+                                        ARRAY, c_int, ARRAY, c_int)),
+                  'trsm':   (None,     (c_int, c_int, c_int, c_int, c_int, c_int, c_int, SCALAR,
+                                        ARRAY, c_int, ARRAY, c_int)),
+                  'hemm':   (None,     (c_int, c_int, c_int, c_int, c_int, SCALAR, ARRAY, c_int,
+                                        ARRAY, c_int, SCALAR, ARRAY, c_int)),
+                  'herk':   (None,     (c_int, c_int, c_int, c_int, c_int, REAL, ARRAY, c_int,
+                                        REAL, ARRAY, c_int)),
+                  'her2k':  (None,     (c_int, c_int, c_int, c_int, c_int, SCALAR, ARRAY, c_int,
+                                        ARRAY, c_int, REAL, ARRAY, c_int))
+                 }
+
+# BLASpy functions whose CBLAS subroutines have a strided batched variant in some BLAS libraries
+# (e.g. cblas_dgemm_batch_strided in MKL), which takes the distance in elements between
+# consecutive matrices (or vectors) after the leading dimension of each matrix (or the increment of
+# each vector), and the batch size last
+BATCHED_SUFFIX = '_batch_strided'
+BATCHED_FUNCS = ('gemm', 'syrk', 'trsm', 'gemv')
+
+# BLASpy functions whose CBLAS subroutines have a grouped batched variant in some BLAS libraries
+# (e.g. cblas_dgemm_batch in MKL and recent versions of OpenBLAS), which takes the order followed by
+# an array for each other argument with one entry per group of problems (one entry per problem
+# for the addresses of matrices), the number of groups, and an array of the sizes of the groups
+GROUPED_SUFFIX = '_batch'
+GROUPED_FUNCS = ('gemm',)
+
+# largest dimension of the problems of each batched level 2 function that are performed by
+# vectorized NumPy operations over the whole batch rather than by one CBLAS call per problem (below
+# which the overhead of the calls outweighs the extra work done by NumPy)
+NUMPY_BATCHED_SIZES = {'gemv': 64, 'symv': 32, 'trmv': 32, 'trsv': 32}
+
+# shortest columns for which the multi-vector level 1 functions call CBLAS once per column rather
+# than reducing every column at once with vectorized NumPy operations
+CBLAS_COLUMN_LENGTH = 1024
+
+# number of rows (or columns) symmetrize copies at a time
+SYMMETRIZE_BLOCK = 256
+
+# default number of bytes of memory gemm_out_of_core holds tiles of its operands in
+OUT_OF_CORE_MEMORY = 1 << 28
+
+# CBLAS subroutines that have already been bound, keyed by BLASpy function and dtype index
+_CBLAS_CACHE = {}
+_CBLAS_LOCK = Lock()
+
+
 def get_cblas_info(calling_func, dtypes):
     """
     Return the appropriate CBLAS subroutine and ctype data type based on the calling function and
     dtypes of args.
 
+    Each CBLAS subroutine is bound from the BLAS library only once, the first time it is requested,
+    using its own CFUNCTYPE prototype. The shared function objects of the library are never
+    modified, so the returned subroutine may be called from any number of threads at once (the GIL
+    is released for the duration of the call). Matrices and vectors are passed to the subroutine
+    as the integer address of their first element (e.g. A.ctypes.data).
+
     Args:
         calling_func:    a string representation of the calling function
         dtypes:          a tuple of the dtypes of all of the matrices or vectors passed into the
@@ -86,24 +239,150 @@ def get_cblas_info(calling_func, dtypes):
         ValueError: if all matrices and/or vectors do not have the same dtype
     """
 
-    if all(dtype == 'float64' for dtype in dtypes):
-        return FUNC_DICT[calling_func][0], c_double
+    # ensure all of the matrices and vectors have the same supported dtype
+    index = DTYPE_INDEX.get(dtypes[0])
+    funcs = FUNC_DICT[calling_func]
+    if index is None or funcs[index] is None or any(np_dtype != dtypes[0] for np_dtype in dtypes):
+        raise_invalid_dtypes(tuple(str(np_dtype) for np_dtype, func_name in zip(DTYPES, funcs)
+                                   if func_name is not None))
+
+    try:
+        return _CBLAS_CACHE[calling_func, index]
+
+    except KeyError:
+        with _CBLAS_LOCK:
+            cblas_info = _CBLAS_CACHE.get((calling_func, index))
+            if cblas_info is None:
+                # bind the CBLAS subroutine once for this data type, loading BLAS if necessary
+                cblas_info = (bind_cblas_func(get_libblas(), calling_func, index), CTYPES[index])
+                _CBLAS_CACHE[calling_func, index] = cblas_info
+
+        return cblas_info
+
+
+def bind_cblas_func(libblas, calling_func, index):
+    """
+    Bind a CBLAS subroutine from a BLAS library using its own CFUNCTYPE prototype.
+
+    Args:
+        libblas:         a loaded ctypes CDLL
+        calling_func:    a string representation of the calling function
+        index:           index of the data type of the subroutine in DTYPES
+
+    Returns:
+        The CBLAS function.
+
+    Raises:
+        AttributeError: if the library does not export the CBLAS subroutine
+    """
+
+    restype, argtypes = PROTOTYPE_DICT[calling_func]
+    argtypes = [convert_prototype_type(argtype, index) for argtype in argtypes]
+
+    if restype == SCALAR and DTYPES[index].kind == 'c':
+        # the complex result is written through a pointer passed as an extra last argument
+        sub_func = CFUNCTYPE(None, *(argtypes + [c_void_p]))((FUNC_DICT[calling_func][index],
+                                                              libblas))
+        ctype_dtype = CTYPES[index]
+
+        def cblas_func(*args):
+            result = ctype_dtype()
+            sub_func(*(args + (addressof(result),)))
+            return complex(result.real, result.imag)
+
+        return cblas_func
+
+    prototype = CFUNCTYPE(convert_prototype_type(restype, index), *argtypes)
+    return prototype((FUNC_DICT[calling_func][index], libblas))
+
+
+def set_cblas_library(libblas):
+    """
+    Bind all CBLAS subroutines from the given BLAS library from now on, discarding every CBLAS
+    subroutine already bound from the previous library.
+
+    Args:
+        libblas:    a loaded ctypes CDLL
+    """
 
-    elif all(dtype == 'float32' for dtype in dtypes):
-        return FUNC_DICT[calling_func][1], c_float
+    with _CBLAS_LOCK:
+        set_libblas(libblas)
+        _CBLAS_CACHE.clear()
 
+
+def get_unchecked_cblas_func(calling_func, np_dtype):
+    """
+    Return the appropriate CBLAS subroutine based on the calling function and the dtype of its
+    first matrix or vector, without checking the dtypes of any other args.
+
+    Args:
+        calling_func:    a string representation of the calling function
+        np_dtype:        the dtype of the first matrix or vector passed into the calling function
+
+    Returns:
+        The appropriate CBLAS function.
+
+    Raises:
+        ValueError: if np_dtype is not supported by the calling function
+    """
+
+    try:
+        return _CBLAS_CACHE[calling_func, DTYPE_INDEX[np_dtype]][0]
+    except KeyError:
+        return get_cblas_info(calling_func, (np_dtype,))[0]
+
+
+def get_address(array):
+    """
+    Return the address of the first element of a NumPy matrix or ndarray.
+
+    This is equivalent to array.ctypes.data, but is faster for the writable, C-contiguous arrays
+    that are normally passed to BLASpy.
+
+    Args:
+        array:     NumPy matrix or ndarray
+
+    Returns:
+        The integer address of the first element of array.
+    """
+
+    try:
+        return addressof(c_char.from_buffer(array))
+    except (TypeError, ValueError, BufferError):
+        return array.ctypes.data
+
+
+def convert_prototype_type(prototype_type, index):
+    """
+    Convert a type from PROTOTYPE_DICT into the ctypes type used for the given data type.
+
+    Args:
+        prototype_type:    a ctypes type, None, or one of the placeholders SCALAR, REAL, and ARRAY
+        index:             index of the data type of the CBLAS subroutine being prototyped in DTYPES
+
+    Returns:
+        The ctypes data type for SCALAR, the ctypes data type of its real part for REAL, c_void_p
+        for ARRAY, and prototype_type otherwise.
+    """
+
+    if prototype_type == SCALAR:
+        return CTYPES[index]
+    elif prototype_type == REAL:
+        return REAL_CTYPES[index]
+    elif prototype_type == ARRAY:
+        return c_void_p
     else:
-        raise_invalid_dtypes(('float64', 'float32'))
+        return prototype_type
 
 
 def get_vector_dimensions(name, vector, stride):
     """
     Return the number of rows, number of columns, and length of a vector taking into account
-    the stride of the vector.
+    the stride of the vector. A 1D ndarray is treated as a column vector.
 
     Args:
         name:      string to print as the vector's name if an error occurs
-        vector:    numpy 2D ndarray or matrix representing a vector
+        vector:    numpy 1D ndarray, or 2D ndarray or matrix, representing a vector
         stride:    stride of the vector (increment for the elements of the vector)
 
     Returns:
@@ -114,23 +393,27 @@ def get_vector_dimensions(name, vector, stride):
         - length of vector after accounting for stride
 
     Raises:
-        TypeError: if vector is not a vector represented by a 2D NumPy ndarray or matrix
+        ValueError: if vector is not a vector represented by a 1D NumPy ndarray or by a 2D NumPy
+                    ndarray or matrix
     """
 
     try:
-        rows, cols = vector.shape
+        if vector.ndim == 1:
+            rows, cols = vector.shape[0], 1
+        else:
+            rows, cols = vector.shape
 
         if not (rows == 1 or cols == 1):
             raise_not_vector(name, rows, cols)
 
-        length = max(rows, cols)
-        if stride > 1:
-            length = (length / stride) + (length % stride > 0)
+        length = rows * cols  # the other dimension is 1, unless the vector is empty
+        if abs(stride) > 1:
+            length = (length // abs(stride)) + (length % abs(stride) > 0)
 
         return rows, cols, length
 
     except (AttributeError, TypeError):
-        raise_not_2d_numpy(name)
+        raise_not_vector_numpy(name)
 
 
 def get_matrix_dimensions(name, matrix):
@@ -188,6 +471,124 @@ def get_square_matrix_dimension(name, matrix):
         raise_not_2d_numpy(name)
 
 
+def get_vector_layout(name, vector, length, stride):
+    """
+    Return the address and CBLAS increment of a vector, taking into account both the stride of the
+    vector and the NumPy strides of the ndarray or matrix representing it.
+
+    Any vector whose elements are evenly spaced in memory can be passed to CBLAS without a copy,
+    such as a column or row sliced out of a larger matrix, or a reversed view. CBLAS expects the
+    address of the element with the lowest address when the increment is negative, so that is the
+    address returned for such a vector.
+
+    Args:
+        name:      string to print as the vector's name if an error occurs
+        vector:    numpy 1D ndarray, or 2D ndarray or matrix, representing a vector
+        length:    length of vector after accounting for stride
+        stride:    stride of the vector (increment for the elements of the vector)
+
+    Returns:
+        A tuple of two elements where each element is described in order below:
+
+        - address of the vector to pass to CBLAS
+        - increment of the vector to pass to CBLAS
+
+    Raises:
+        ValueError: if the elements of the vector are not evenly spaced in memory by a nonzero
+                    whole number of elements
+    """
+
+    if length <= 1:
+        return vector.ctypes.data, stride
+
+    itemsize = vector.itemsize
+    item_stride, remainder = divmod(vector.strides[-1 if vector.shape[0] == 1 else 0], itemsize)
+    if remainder != 0 or item_stride == 0:
+        raise_not_strided(name)
+
+    offset = min(0, (length - 1) * abs(stride) * item_stride) * itemsize
+    return vector.ctypes.data + offset, stride * item_stride
+
+
+def get_matrix_layout(name, matrix, order=ROW_MAJOR):
+    """
+    Return the CBLAS order in which a matrix is stored, and its leading dimension in that order.
+
+    A matrix is stored in row-major order if its elements are adjacent within each row and its rows
+    are evenly spaced, such as a C-contiguous matrix or a block sliced out of one. A matrix is
+    stored in column-major order if the same holds for its columns, such as an F-contiguous matrix
+    or the transpose of a row-major matrix. Either can be passed to CBLAS without a copy, with the
+    spacing of its rows or columns as the leading dimension.
+
+    Args:
+        name:      string to print as the matrix's name if an error occurs
+        matrix:    numpy 2D ndarray or matrix
+
+        --optional arguments--
+
+        order:     the CBLAS order to prefer when the matrix is stored in both orders (i.e. when it
+                   has a single row or column)
+                        < default is ROW_MAJOR >
+
+    Returns:
+        A tuple of two elements where each element is described in order below:
+
+        - ROW_MAJOR or COL_MAJOR
+        - the leading dimension of the matrix in that order
+
+    Raises:
+        ValueError: if the matrix is stored in neither row-major nor column-major order
+    """
+
+    rows, cols = matrix.shape
+
+    # a matrix with no elements (whose strides NumPy may set to 0) is stored in either order
+    if rows == 0 or cols == 0:
+        return order, max(1, cols if order == ROW_MAJOR else rows)
+
+    itemsize = matrix.itemsize
+    row_stride, col_stride = [stride // itemsize if stride % itemsize == 0 else 0
+                              for stride in matrix.strides]
+
+    row_major = (cols <= 1 or col_stride == 1) and (rows <= 1 or row_stride >= max(cols, 1))
+    col_major = (rows <= 1 or row_stride == 1) and (cols <= 1 or col_stride >= max(rows, 1))
+
+    if col_major and (order == COL_MAJOR or not row_major):
+        return COL_MAJOR, col_stride if cols > 1 else max(rows, 1)
+    elif row_major:
+        return ROW_MAJOR, row_stride if rows > 1 else max(cols, 1)
+    else:
+        raise_not_strided(name)
+
+
+def convert_matrix_layout(name, matrix, order):
+    """
+    Return the matrix itself if it is stored in the given CBLAS order, otherwise a copy of the
+    matrix that is stored in the given order.
+
+    Args:
+        name:      string to print as the matrix's name if an error occurs
+        matrix:    numpy 2D ndarray or matrix
+        order:     ROW_MAJOR or COL_MAJOR
+
+    Returns:
+        A tuple of two elements where each element is described in order below:
+
+        - the matrix or its copy
+        - the leading dimension of the matrix or its copy in the given order
+    """
+
+    try:
+        matrix_order, ld = get_matrix_layout(name, matrix, order)
+        if matrix_order == order:
+            return matrix, ld
+    except ValueError:
+        pass
+
+    matrix = asarray(matrix, order='C' if order == ROW_MAJOR else 'F')
+    return matrix, get_matrix_layout(name, matrix, order)[1]
+
+
 def check_equal_sizes(name_1, size_1, name_2, size_2):
     """
     Check that size_1 and size_2 are equal.
@@ -214,6 +615,7 @@ def check_strides_equal_one(*args):
 def create_similar_zero_vector(other_vector, length=None):
     """
     Create and return a zero vector with the same dtype, length, and orientation as other_vector.
+    If other_vector is a 1D ndarray, so is the zero vector.
 
     Args:
         other_vector:   vector whose dtype, length, and orientation to copy
@@ -227,12 +629,36 @@ def create_similar_zero_vector(other_vector, length=None):
         other_vector.
     """
 
-    if other_vector.shape[0] == 1:
+    new_vector = create_similar_empty_vector(other_vector, length)
+    new_vector.fill(0)
+    return new_vector
+
+
+def create_similar_empty_vector(other_vector, length=None):
+    """
+    Create and return a vector with the same dtype, length, and orientation as other_vector, whose
+    elements are not initialized, from the pool of BLASpy (for an output computed with beta 0).
+
+    Args:
+        other_vector:   vector whose dtype, length, and orientation to copy
+
+        --optional arguments--
+
+        length:         length of new vector, default is length of other_vector
+
+    Returns:
+        A new NumPy ndarray or matrix with the same characteristics as other_vector.
+    """
+
+    if other_vector.ndim == 1:
+        length = other_vector.shape[0] if length is None else length
+        new_vector = pool_empty(length, other_vector.dtype)
+    elif other_vector.shape[0] == 1:
         length = other_vector.shape[1] if length is None else length
-        new_vector = zeros((1, length), dtype=other_vector.dtype)
+        new_vector = pool_empty((1, length), other_vector.dtype)
     else:
         length = other_vector.shape[0] if length is None else length
-        new_vector = zeros((length, 1), dtype=other_vector.dtype)
+        new_vector = pool_empty((length, 1), other_vector.dtype)
 
     if type(other_vector) is np_matrix:
         new_vector = asmatrix(new_vector)
@@ -255,7 +681,28 @@ def create_zero_matrix(rows, cols, dtype, matrix_type):
         A new NumPy ndarray or matrix filled with zeros of specified dimensions and dtype.
     """
 
-    new_matrix = zeros((rows, cols), dtype=dtype)
+    new_matrix = create_empty_matrix(rows, cols, dtype, matrix_type)
+    new_matrix.fill(0)
+    return new_matrix
+
+
+def create_empty_matrix(rows, cols, dtype, matrix_type):
+    """
+    Create and return a matrix with the given number of rows and columns, and of the appropriate
+    dtype and matrix type, whose elements are not initialized, from the pool of BLASpy (for an
+    output computed with beta 0).
+
+    Args:
+        rows:         number of rows in the new matrix
+        cols:         number of columns in the new matrix
+        dtype:        NumPy dtype for the elements of the new matrix
+        matrix_type:  either NumPy ndarray or matrix; the new matrix will be of the same type
+
+    Returns:
+        A new NumPy ndarray or matrix of specified dimensions and dtype.
+    """
+
+    new_matrix = pool_empty((rows, cols), dtype)
 
     if matrix_type == np_matrix:
         return asmatrix(new_matrix)
@@ -263,6 +710,36 @@ def create_zero_matrix(rows, cols, dtype, matrix_type):
         return new_matrix
 
 
+def symmetrize(matrix, cblas_uplo):
+    """
+    Copy the triangle of a square matrix which the given CBLAS value indicates into the other
+    triangle (without conjugating), in place. The copy proceeds a block of SYMMETRIZE_BLOCK rows
+    (or columns) at a time, so that the elements read and written stay in cache.
+
+    Args:
+        matrix:        numpy 2D ndarray or matrix
+        cblas_uplo:    UPPER or LOWER, the triangle to copy
+    """
+
+    dim = matrix.shape[0]
+    for start in range(0, dim, SYMMETRIZE_BLOCK):
+        stop = min(start + SYMMETRIZE_BLOCK, dim)
+        diagonal = matrix[start:stop, start:stop]
+        if cblas_uplo == UPPER:
+            matrix[stop:, start:stop] = matrix[start:stop, stop:].T
+            diagonal[...] = triu(diagonal) + triu(diagonal, 1).T
+        else:
+            matrix[start:stop, stop:] = matrix[stop:, start:stop].T
+            diagonal[...] = tril(diagonal) + tril(diagonal, -1).T
+
+
+def is_same_array(array, other):
+    """ Return True if two ndarrays view exactly the same elements in the same way. """
+
+    return (array.shape == other.shape and array.strides == other.strides and
+            array.dtype == other.dtype and array.ctypes.data == other.ctypes.data)
+
+
 def convert_uplo(uplo):
     if uplo == 'u' or uplo == 'U':
         return UPPER
@@ -273,6 +750,17 @@ def convert_uplo(uplo):
 
 
 def convert_trans(trans):
+    if trans == 'n' or trans == 'N':
+        return NO_TRANS
+    elif trans == 't' or trans == 'T':
+        return TRANS
+    elif trans == 'c' or trans == 'C':
+        return CONJ_TRANS
+    else:
+        raise_invalid_parameter('trans', ('n', 'N', 't', 'T', 'c', 'C'), trans)
+
+
+def convert_sym_trans(trans):
     if trans == 'n' or trans == 'N':
         return NO_TRANS
     elif trans == 't' or trans == 'T':
@@ -281,6 +769,64 @@ def convert_trans(trans):
         raise_invalid_parameter('trans', ('n', 'N', 't', 'T'), trans)
 
 
+def convert_herm_trans(trans):
+    if trans == 'n' or trans == 'N':
+        return NO_TRANS
+    elif trans == 'c' or trans == 'C':
+        return CONJ_TRANS
+    else:
+        raise_invalid_parameter('trans', ('n', 'N', 'c', 'C'), trans)
+
+
+def flip_trans(cblas_trans):
+    """ Return the CBLAS transpose value for the opposite of cblas_trans (NO_TRANS or TRANS). """
+    return TRANS if cblas_trans == NO_TRANS else NO_TRANS
+
+
+def flip_uplo(cblas_uplo):
+    """ Return the CBLAS uplo value for the opposite triangle of cblas_uplo. """
+    return LOWER if cblas_uplo == UPPER else UPPER
+
+
+def match_matrix_layout(name, matrix, ld, order, cblas_trans):
+    """
+    Return a matrix, its leading dimension, and the CBLAS transpose value with which to pass it to
+    CBLAS in the given order.
+
+    A matrix stored in the other order is passed as its transpose with the opposite transpose
+    value, without a copy. CBLAS has no transpose value for conjugation alone, so a matrix stored
+    in the other order that is to be conjugate transposed is copied into the given order instead.
+
+    Args:
+        name:            string to print as the matrix's name if an error occurs
+        matrix:          numpy 2D ndarray or matrix
+        ld:              leading dimension of the matrix, or None for the spacing in memory of its
+                         rows (or columns)
+        order:           ROW_MAJOR or COL_MAJOR
+        cblas_trans:     NO_TRANS, TRANS, or CONJ_TRANS
+
+    Returns:
+        A tuple of three elements where each element is described in order below:
+
+        - the matrix or its copy
+        - the leading dimension to pass to CBLAS
+        - the CBLAS transpose value to pass to CBLAS
+
+    Raises:
+        ValueError: if the matrix is stored in neither row-major nor column-major order
+    """
+
+    matrix_order, default_ld = get_matrix_layout(name, matrix, order)
+
+    if matrix_order != order:
+        if cblas_trans == CONJ_TRANS:
+            matrix, ld = convert_matrix_layout(name, matrix, order)
+            return matrix, ld, cblas_trans
+        cblas_trans = flip_trans(cblas_trans)
+
+    return matrix, default_ld if ld is None else ld, cblas_trans
+
+
 def convert_diag(diag):
     if diag == 'n' or diag == 'N':
         return NON_UNIT
@@ -296,4 +842,688 @@ def convert_side(side):
     elif side == 'r' or side == 'R':
         return RIGHT
     else:
-        raise_invalid_parameter('side', ('l', 'L', 'r', 'R'), side)
\ No newline at end of file
+        raise_invalid_parameter('side', ('l', 'L', 'r', 'R'), side)
+
+
+def get_batched_cblas_func(calling_func, np_dtype):
+    """
+    Return the strided batched variant of the CBLAS subroutine of the calling function for the
+    given dtype, or None if the BLAS library does not export one.
+
+    The batched variant takes the same arguments as the CBLAS subroutine, except that the leading
+    dimension of each matrix is followed by the distance in elements between consecutive matrices
+    of the batch, and the number of matrices in the batch is passed last.
+
+    Args:
+        calling_func:    a string representation of the calling function
+        np_dtype:        the dtype of the matrices passed into the calling function
+
+    Returns:
+        The batched CBLAS function, or None.
+    """
+
+    if calling_func not in BATCHED_FUNCS:
+        return None
+
+    index = DTYPE_INDEX[np_dtype]
+    batched_func = calling_func + BATCHED_SUFFIX
+
+    try:
+        return _CBLAS_CACHE[batched_func, index]
+
+    except KeyError:
+        with _CBLAS_LOCK:
+            if (batched_func, index) not in _CBLAS_CACHE:
+                restype, argtypes = PROTOTYPE_DICT[calling_func]
+                batched_argtypes = []
+                for position, argtype in enumerate(argtypes):
+                    batched_argtypes.append(convert_prototype_type(argtype, index))
+                    if position > 0 and argtypes[position - 1] == ARRAY:
+                        batched_argtypes.append(c_int)  # distance between matrices follows ld
+                batched_argtypes.append(c_int)  # number of matrices in the batch
+
+                try:
+                    prototype = CFUNCTYPE(None, *batched_argtypes)
+                    cblas_func = prototype((FUNC_DICT[calling_func][index] + BATCHED_SUFFIX,
+                                            get_libblas()))
+                except AttributeError:
+                    cblas_func = None
+                _CBLAS_CACHE[batched_func, index] = cblas_func
+
+        return _CBLAS_CACHE[batched_func, index]
+
+
+def get_stack_dimensions(name, stack):
+    """
+    Return the number of matrices, number of rows, and number of columns of a stack of matrices.
+
+    A stack of matrices is a 3D ndarray indexed as (matrix, row, column). A 2D ndarray or matrix is
+    treated as a single matrix shared by every problem of a batch.
+
+    Args:
+        name:     string to print as the stack's name if an error occurs
+        stack:    numpy 3D ndarray, or 2D ndarray or matrix
+
+    Returns:
+        A tuple of three elements where each element is described in order below:
+
+        - number of matrices in the stack (None if the matrix is shared)
+        - number of rows in each matrix
+        - number of columns in each matrix
+
+    Raises:
+        ValueError: if stack is not a 3D NumPy ndarray or a 2D NumPy ndarray or matrix
+    """
+
+    try:
+        if stack.ndim == 2:
+            rows, cols = stack.shape
+            return None, rows, cols
+
+        batch, rows, cols = stack.shape
+        return batch, rows, cols
+
+    except (AttributeError, TypeError, ValueError):
+        raise_not_3d_numpy(name)
+
+
+def get_square_stack_dimension(name, stack):
+    """
+    Return the number of matrices and the dimension of the square matrices of a stack.
+
+    Args:
+        name:     string to print as the stack's name if an error occurs
+        stack:    numpy 3D ndarray, or 2D ndarray or matrix
+
+    Returns:
+        A tuple of two elements where each element is described in order below:
+
+        - number of matrices in the stack (None if the matrix is shared)
+        - number of rows and of columns in each matrix
+
+    Raises:
+        ValueError: if stack is not a 3D NumPy ndarray or a 2D NumPy ndarray or matrix, or if its
+                    matrices are not square
+    """
+
+    batch, rows, cols = get_stack_dimensions(name, stack)
+    if rows != cols:
+        raise_not_square(name, rows, cols)
+
+    return batch, rows
+
+
+def get_batch_size(*args):
+    """
+    Return the number of problems in a batch from the names and numbers of matrices of its stacks.
+
+    Args:
+        args:    pairs of the name of a stack and its number of matrices (None if it is shared)
+
+    Returns:
+        The number of matrices shared by all of the stacks that are not shared.
+
+    Raises:
+        ValueError: if the stacks do not have the same number of matrices, or if every stack is
+                    shared
+    """
+
+    names, sizes = args[0::2], args[1::2]
+    batch_name, batch = None, None
+    for name, size in zip(names, sizes):
+        if size is None:
+            continue
+        if batch is None:
+            batch_name, batch = name, size
+        else:
+            check_equal_sizes(batch_name, batch, name, size)
+
+    if batch is None:
+        raise_not_3d_numpy(names[0])
+
+    return batch
+
+
+def get_stack_layout(name, stack, order=ROW_MAJOR):
+    """
+    Return the CBLAS order in which the matrices of a stack are stored, their leading dimension in
+    that order, and the distance in bytes between consecutive matrices of the stack.
+
+    Args:
+        name:      string to print as the stack's name if an error occurs
+        stack:     numpy 3D ndarray with at least one matrix, or 2D ndarray or matrix
+
+        --optional arguments--
+
+        order:     the CBLAS order to prefer when the matrices are stored in both orders
+                        < default is ROW_MAJOR >
+
+    Returns:
+        A tuple of three elements where each element is described in order below:
+
+        - ROW_MAJOR or COL_MAJOR
+        - the leading dimension of the matrices in that order
+        - the distance in bytes between consecutive matrices (0 if the matrix is shared)
+
+    Raises:
+        ValueError: if the matrices are stored in neither row-major nor column-major order
+    """
+
+    if stack.ndim == 2:
+        return get_matrix_layout(name, stack, order) + (0,)
+
+    return get_matrix_layout(name, stack[0], order) + (stack.strides[0],)
+
+
+def convert_stack_layout(name, stack, order):
+    """
+    Return the stack itself if its matrices are stored in the given CBLAS order, otherwise a copy
+    of the stack whose matrices are stored in the given order.
+
+    Args:
+        name:      string to print as the stack's name if an error occurs
+        stack:     numpy 3D ndarray with at least one matrix, or 2D ndarray or matrix
+        order:     ROW_MAJOR or COL_MAJOR
+
+    Returns:
+        A tuple of three elements where each element is described in order below:
+
+        - the stack or its copy
+        - the leading dimension of the matrices of the stack or its copy in the given order
+        - the distance in bytes between consecutive matrices of the stack or its copy
+    """
+
+    if stack.ndim == 2:
+        return convert_matrix_layout(name, stack, order) + (0,)
+
+    try:
+        stack_order, ld, stride = get_stack_layout(name, stack, order)
+        if stack_order == order:
+            return stack, ld, stride
+    except ValueError:
+        pass
+
+    if order == ROW_MAJOR:
+        stack = asarray(stack, order='C')
+    else:
+        stack = asarray(stack.transpose(0, 2, 1), order='C').transpose(0, 2, 1)
+    return (stack,) + get_stack_layout(name, stack, order)[1:]
+
+
+def check_unshared_output(name, stack, batch, stride):
+    """
+    Check that every problem of a batch writes its result into its own matrix of a stack. Problems
+    whose matrices have no elements write nothing, so they may share one (NumPy gives a stack with
+    no elements strides of 0).
+
+    Args:
+        name:      string to print as the stack's name if an error occurs
+        stack:     numpy ndarray of the matrices (or vectors) of the stack
+        batch:     number of problems in the batch
+        stride:    distance in bytes between consecutive matrices of the stack
+    """
+
+    if batch > 1 and stride == 0 and stack.size > 0:
+        raise_shared_output(name)
+
+
+def create_zero_stack(batch, rows, cols, dtype):
+    """
+    Create and return a stack of zero matrices of the given size and dtype.
+
+    Args:
+        batch:    number of matrices in the stack
+        rows:     number of rows in each matrix
+        cols:     number of columns in each matrix
+        dtype:    dtype of the stack
+
+    Returns:
+        A new 3D NumPy ndarray filled with zeros.
+    """
+
+    return pool_zeros((batch, rows, cols), dtype)
+
+
+def create_empty_stack(batch, rows, cols, dtype):
+    """
+    Create and return a stack of matrices of the given size and dtype, whose elements are not
+    initialized, from the pool of BLASpy (for an output computed with beta 0).
+
+    Args:
+        batch:    number of matrices in the stack
+        rows:     number of rows in each matrix
+        cols:     number of columns in each matrix
+        dtype:    dtype of the stack
+
+    Returns:
+        A new 3D NumPy ndarray.
+    """
+
+    return pool_empty((batch, rows, cols), dtype)
+
+
+def get_vector_stack_dimensions(name, stack):
+    """
+    Return the number of vectors and the length of the vectors of a stack of vectors.
+
+    A stack of vectors is a 2D ndarray indexed as (vector, element). A 1D ndarray is treated as a
+    single vector shared by every problem of a batch.
+
+    Args:
+        name:     string to print as the stack's name if an error occurs
+        stack:    numpy 2D ndarray, or 1D ndarray
+
+    Returns:
+        A tuple of two elements where each element is described in order below:
+
+        - number of vectors in the stack (None if the vector is shared)
+        - length of each vector
+
+    Raises:
+        ValueError: if stack is not a 2D NumPy ndarray or a 1D NumPy ndarray
+    """
+
+    try:
+        if stack.ndim == 1:
+            return None, stack.shape[0]
+
+        batch, length = stack.shape
+        return batch, length
+
+    except (AttributeError, TypeError, ValueError):
+        raise_not_2d_vector_stack(name)
+
+
+def get_vector_stack_layout(name, stack, length):
+    """
+    Return the address and CBLAS increment of the first vector of a stack, and the distance in
+    bytes between consecutive vectors of the stack.
+
+    Args:
+        name:      string to print as the stack's name if an error occurs
+        stack:     numpy 2D ndarray with at least one vector, or 1D ndarray
+        length:    length of each vector
+
+    Returns:
+        A tuple of three elements where each element is described in order below:
+
+        - address of the first vector to pass to CBLAS
+        - increment of the vectors to pass to CBLAS
+        - the distance in bytes between consecutive vectors (0 if the vector is shared)
+
+    Raises:
+        ValueError: if the elements of the vectors are not evenly spaced in memory
+    """
+
+    if stack.ndim == 1:
+        return get_vector_layout(name, stack, length, 1) + (0,)
+
+    return get_vector_layout(name, stack[0], length, 1) + (stack.strides[0],)
+
+
+def create_zero_vector_stack(batch, length, dtype):
+    """
+    Create and return a stack of zero vectors of the given length and dtype.
+
+    Args:
+        batch:     number of vectors in the stack
+        length:    number of elements in each vector
+        dtype:     dtype of the stack
+
+    Returns:
+        A new 2D NumPy ndarray filled with zeros.
+    """
+
+    return pool_zeros((batch, length), dtype)
+
+
+def create_empty_vector_stack(batch, length, dtype):
+    """
+    Create and return a stack of vectors of the given length and dtype, whose elements are not
+    initialized, from the pool of BLASpy (for an output computed with beta 0).
+
+    Args:
+        batch:     number of vectors in the stack
+        length:    number of elements in each vector
+        dtype:     dtype of the stack
+
+    Returns:
+        A new 2D NumPy ndarray.
+    """
+
+    return pool_empty((batch, length), dtype)
+
+
+def apply_trans_stack(stack, cblas_trans):
+    """
+    Return a view of a stack of matrices (or of a single matrix) as an ndarray whose matrices are
+    transposed or conjugate transposed as the given CBLAS value indicates, for use by NumPy
+    operations over a whole batch.
+
+    Args:
+        stack:          numpy 3D ndarray, or 2D ndarray or matrix
+        cblas_trans:    NO_TRANS, TRANS, or CONJ_TRANS
+
+    Returns:
+        The ndarray view (or conjugated copy if cblas_trans is CONJ_TRANS).
+    """
+
+    stack = asarray(stack)
+    if cblas_trans == CONJ_TRANS:
+        stack = stack.conj()
+    if cblas_trans != NO_TRANS:
+        stack = stack.swapaxes(-1, -2)
+    return stack
+
+
+# the shared threads which run the problems of a batch when BLAS has no batched subroutine
+_BATCH_EXECUTOR = None
+_BATCH_EXECUTOR_LOCK = Lock()
+
+
+def get_batch_executor():
+    """ Return the shared thread pool which runs the problems of a batch, creating it if needed. """
+
+    global _BATCH_EXECUTOR
+    with _BATCH_EXECUTOR_LOCK:
+        if _BATCH_EXECUTOR is None:
+            _BATCH_EXECUTOR = ThreadPoolExecutor(cpu_count() or 1)
+        return _BATCH_EXECUTOR
+
+
+def call_cblas_range(cblas_func, args, stacks, start, stop):
+    """ Call a CBLAS subroutine for the problems of a batch from start up to (but not) stop. """
+
+    args = list(args)
+    for index in range(start, stop):
+        for position, address, stride in stacks:
+            args[position] = address + index * stride
+        cblas_func(*args)
+
+
+def call_cblas_batched(calling_func, np_dtype, cblas_func, args, stacks, batch, num_threads=None):
+    """
+    Perform a batch of independent problems that differ only in the addresses of their matrices.
+
+    The strided batched variant of the CBLAS subroutine is called once for the whole batch if the
+    BLAS library exports one. Otherwise the batch is split into contiguous ranges of problems which
+    are run by separate threads, each calling the CBLAS subroutine once per problem (the GIL is
+    released for the duration of each call, so the threads run in parallel).
+
+    Args:
+        calling_func:    a string representation of the calling function
+        np_dtype:        the dtype of the stacks
+        cblas_func:      the CBLAS subroutine for a single problem
+        args:            list of the arguments of the CBLAS subroutine for the first problem, with
+                         None in place of the addresses of the matrices
+        stacks:          tuple of triples of the position of a matrix address in args, the address
+                         of the first matrix of its stack, and the distance in bytes between
+                         consecutive matrices of the stack
+        batch:           number of problems in the batch
+
+        --optional arguments--
+
+        num_threads:     the largest number of threads among which to split the batch
+                             < default is the number of CPUs >
+
+    Raises:
+        ValueError: if 'num_threads' is not an integer >= 1
+    """
+
+    check_num_threads(num_threads)
+    if batch == 0:
+        return
+
+    itemsize = np_dtype.itemsize
+    batched_func = get_batched_cblas_func(calling_func, np_dtype)
+    if batched_func is not None and all(stride >= 0 and stride % itemsize == 0
+                                        for position, address, stride in stacks):
+        batched_args = list(args)
+        for position, address, stride in sorted(stacks, reverse=True):
+            batched_args[position] = address
+            batched_args.insert(position + 2, stride // itemsize)
+        batched_func(*(batched_args + [batch]))
+        return
+
+    num_threads = min(batch, num_threads or cpu_count() or 1)
+    if num_threads <= 1:
+        call_cblas_range(cblas_func, args, stacks, 0, batch)
+        return
+
+    executor = get_batch_executor()
+    bounds = [batch * thread // num_threads for thread in range(num_threads + 1)]
+    futures = [executor.submit(call_cblas_range, cblas_func, args, stacks, start, stop)
+               for start, stop in zip(bounds[:-1], bounds[1:])]
+    for future in futures:
+        future.result()
+
+
+def get_column_stride(matrix):
+    """
+    Return the distance in bytes between consecutive columns of a matrix if the elements of each
+    column are adjacent in memory, otherwise None.
+
+    Args:
+        matrix:    numpy 2D ndarray or matrix
+
+    Returns:
+        The distance in bytes between consecutive columns, or None.
+    """
+
+    if matrix.shape[0] > 1 and matrix.strides[0] != matrix.itemsize:
+        return None
+
+    return matrix.strides[1]
+
+
+def check_num_threads(num_threads):
+    """
+    Raise a ValueError if a number of threads is given (is not None) and is not an integer >= 1.
+
+    Args:
+        num_threads:    the number of threads to check, or None for the default
+    """
+
+    if num_threads is not None and (not isinstance(num_threads, Integral) or num_threads < 1):
+        raise_invalid_num_threads(num_threads)
+
+
+def call_cblas_reduction_range(cblas_func, args, vectors, out, start, stop):
+    """ Store the results of a CBLAS subroutine for the vectors from start up to (but not) stop. """
+
+    args = list(args)
+    for index in range(start, stop):
+        for position, address, stride in vectors:
+            args[position] = address + index * stride
+        out[index] = cblas_func(*args)
+
+
+def call_cblas_reduction(cblas_func, args, vectors, out, num_threads=None):
+    """
+    Store the result of a CBLAS subroutine that returns a value (such as nrm2 or dot) for each of
+    a number of vectors evenly spaced in memory, such as the columns of a matrix.
+
+    The vectors are split into contiguous ranges which are run by separate threads, each calling
+    the CBLAS subroutine once per vector (the GIL is released for the duration of each call, so the
+    threads run in parallel).
+
+    Args:
+        cblas_func:      the CBLAS subroutine for a single vector
+        args:            list of the arguments of the CBLAS subroutine for the first vector, with
+                         None in place of the addresses of the vectors
+        vectors:         tuple of triples of the position of a vector address in args, the address
+                         of the first vector, and the distance in bytes between consecutive vectors
+        out:             1D NumPy ndarray in which to store the result for each vector
+
+        --optional arguments--
+
+        num_threads:     the largest number of threads among which to split the vectors
+                             < default is the number of CPUs >
+    """
+
+    count = len(out)
+    num_threads = min(count, num_threads or cpu_count() or 1)
+    if num_threads <= 1:
+        call_cblas_reduction_range(cblas_func, args, vectors, out, 0, count)
+        return
+
+    executor = get_batch_executor()
+    bounds = [count * thread // num_threads for thread in range(num_threads + 1)]
+    futures = [executor.submit(call_cblas_reduction_range, cblas_func, args, vectors, out, start,
+                               stop)
+               for start, stop in zip(bounds[:-1], bounds[1:])]
+    for future in futures:
+        future.result()
+
+
+def get_grouped_cblas_func(calling_func, np_dtype):
+    """
+    Return the grouped batched variant of the CBLAS subroutine of the calling function for the
+    given dtype, or None if the BLAS library does not export one.
+
+    Args:
+        calling_func:    a string representation of the calling function
+        np_dtype:        the dtype of the matrices passed into the calling function
+
+    Returns:
+        The grouped CBLAS function, or None.
+    """
+
+    if calling_func not in GROUPED_FUNCS:
+        return None
+
+    index = DTYPE_INDEX[np_dtype]
+    grouped_func = calling_func + GROUPED_SUFFIX
+
+    try:
+        return _CBLAS_CACHE[grouped_func, index]
+
+    except KeyError:
+        with _CBLAS_LOCK:
+            if (grouped_func, index) not in _CBLAS_CACHE:
+                num_args = len(PROTOTYPE_DICT[calling_func][1])
+                try:
+                    prototype = CFUNCTYPE(None, c_int, *([c_void_p] * (num_args - 1) +
+                                                         [c_int, c_void_p]))
+                    cblas_func = prototype((FUNC_DICT[calling_func][index] + GROUPED_SUFFIX,
+                                            get_libblas()))
+                except AttributeError:
+                    cblas_func = None
+                _CBLAS_CACHE[grouped_func, index] = cblas_func
+
+        return _CBLAS_CACHE[grouped_func, index]
+
+
+def call_cblas_list(cblas_func, problems):
+    """ Call a CBLAS subroutine once for the arguments of each of a list of problems. """
+
+    for args in problems:
+        cblas_func(*args)
+
+
+def schedule_problems(keys, costs, num_threads):
+    """
+    Assign independent problems of different costs to threads so that the threads finish at about
+    the same time.
+
+    The problems are assigned from the most to the least costly, each to the thread with the least
+    total cost so far (the longest processing time first rule). The problems of each thread are
+    then sorted by their keys, so that a thread performs problems of the same size one after
+    another.
+
+    Args:
+        keys:           list of the keys of the problems, which are equal for problems of the same
+                        size
+        costs:          list of the costs of the problems (e.g. their numbers of operations)
+        num_threads:    number of threads
+
+    Returns:
+        A list of lists of the indices of the problems assigned to each thread.
+    """
+
+    loads = [0] * num_threads
+    assigned = [[] for thread in range(num_threads)]
+    for index in sorted(range(len(costs)), key=lambda index: -costs[index]):
+        thread = loads.index(min(loads))
+        loads[thread] += costs[index]
+        assigned[thread].append(index)
+
+    return [sorted(indices, key=lambda index: keys[index]) for indices in assigned if indices]
+
+
+def call_cblas_grouped(calling_func, np_dtype, cblas_func, problems, costs, num_threads=None):
+    """
+    Perform a list of independent problems of different sizes.
+
+    The problems are binned into groups which have the same arguments except for the addresses of
+    their matrices. If the BLAS library exports a grouped batched variant of the CBLAS subroutine
+    and every problem proceeds in the same order, all of the groups are performed by a single call
+    to it. Otherwise, the problems are balanced by cost among separate threads (see
+    schedule_problems), each calling the CBLAS subroutine once per problem (the GIL is released for
+    the duration of each call, so the threads run in parallel).
+
+    Args:
+        calling_func:    a string representation of the calling function
+        np_dtype:        the dtype of the matrices
+        cblas_func:      the CBLAS subroutine for a single problem
+        problems:        list of the arguments of the CBLAS subroutine for each problem, starting
+                         with the CBLAS order
+        costs:           list of the costs of the problems (e.g. their numbers of operations)
+
+        --optional arguments--
+
+        num_threads:     the largest number of threads among which to split the problems
+                             < default is the number of CPUs >
+
+    Raises:
+        ValueError: if 'num_threads' is not an integer >= 1
+    """
+
+    check_num_threads(num_threads)
+    if len(problems) == 0:
+        return
+
+    argtypes = PROTOTYPE_DICT[calling_func][1]
+    arrays = [position for position, argtype in enumerate(argtypes) if argtype == ARRAY]
+    keys = [tuple(arg for position, arg in enumerate(args) if position not in arrays)
+            for args in problems]
+
+    grouped_func = get_grouped_cblas_func(calling_func, np_dtype)
+    if grouped_func is not None and len(set(args[0] for args in problems)) == 1:
+        groups = {}
+        for index, key in enumerate(keys):
+            groups.setdefault(key, []).append(index)
+        groups = sorted(groups.values())
+
+        # one array per argument after the order, which must stay alive until the call returns
+        grouped_args = []
+        for position in range(1, len(argtypes)):
+            if argtypes[position] == ARRAY:
+                grouped_args.append(array([problems[index][position] for indices in groups
+                                           for index in indices], dtype=uintp))
+            else:
+                if argtypes[position] == SCALAR:
+                    arg_dtype = np_dtype
+                elif argtypes[position] == REAL:
+                    arg_dtype = dtype(np_dtype.char.lower())
+                else:
+                    arg_dtype = intc
+                grouped_args.append(array([problems[indices[0]][position] for indices in groups],
+                                          dtype=arg_dtype))
+        group_sizes = array([len(indices) for indices in groups], dtype=intc)
+
+        grouped_func(problems[0][0], *([grouped_arg.ctypes.data for grouped_arg in grouped_args] +
+                                       [len(groups), group_sizes.ctypes.data]))
+        return
+
+    num_threads = min(len(problems), num_threads or cpu_count() or 1)
+    assigned = schedule_problems(keys, costs, num_threads)
+    if len(assigned) == 1:
+        call_cblas_list(cblas_func, [problems[index] for index in assigned[0]])
+        return
+
+    executor = get_batch_executor()
+    futures = [executor.submit(call_cblas_list, cblas_func, [problems[index] for index in indices])
+               for indices in assigned]
+    for future in futures:
+        future.result()
@@ -0,0 +1,484 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+    Lazy expressions of matrices and vectors, which are evaluated with as few BLASpy calls and
+    temporary matrices as possible.
+
+    Arithmetic on operands wrapped with array (sums, differences, negation, multiplication and
+    division by scalars, matrix products with @ or dot, and transposes with .T) builds an
+    expression rather than computing anything. Evaluating the expression rewrites it as a sum of
+    scaled terms, each a single operand or the product of two, and computes it into the output with
+    one call per term: each product becomes a gemm, gemv, syrk, symm, or trmm call with its scalar
+    and transposes folded in (the first taking any multiple of the output as its beta), and each
+    other operand becomes an axpy (or a copy and a scal). For example,
+
+        (beta * array(C) + alpha * (array(A) @ array(B))).evaluate(out=C)
+
+    is a single gemm call which overwrites C, where the same expression on NumPy arrays creates
+    two temporary matrices.
+
+    A product of an operand with its own transpose becomes syrk (when no other multiple of the
+    output is added, or the output is declared symmetric), a product with an operand declared
+    symmetric becomes symm, and a product with an operand declared triangular becomes trmm (when no
+    other multiple of the output is added). Each declaration promises that the whole operand has
+    that structure, so gemm computes the same product. An operand of a product which is itself a
+    sum or product is computed into a temporary first.
+
+"""
+
+from .errors import raise_not_1d_or_2d_numpy, raise_shape_mismatch, raise_invalid_parameter
+from .helpers import (check_equal_sizes, get_square_matrix_dimension, convert_uplo, convert_diag,
+                      is_same_array, symmetrize, UPPER)
+from .level_1 import axpy, dot as bp_dot, scal
+from .level_2 import gemv
+from .level_3 import gemm, symm, syrk, trmm
+from .pool import empty
+from numbers import Number
+from numpy import asarray, copyto, may_share_memory, ndarray
+
+# the structures an operand can be declared to have
+STRUCTURES = (None, 'symmetric', 'triangular')
+
+
+class Expression(object):
+    """
+    A lazy expression of matrices and vectors. Arithmetic on an expression builds a larger one, and
+    nothing is computed until it is evaluated.
+
+    Attributes:
+        shape:    shape of the result
+        dtype:    dtype of the result
+    """
+
+    __array_ufunc__ = None  # so that NumPy arithmetic with an expression defers to the expression
+
+    def __add__(self, other):
+        other = as_expression(other)
+        return NotImplemented if other is None else Sum(self, other)
+
+    def __radd__(self, other):
+        other = as_expression(other)
+        return NotImplemented if other is None else Sum(other, self)
+
+    def __sub__(self, other):
+        other = as_expression(other)
+        return NotImplemented if other is None else Sum(self, Scaled(-1, other))
+
+    def __rsub__(self, other):
+        other = as_expression(other)
+        return NotImplemented if other is None else Sum(other, Scaled(-1, self))
+
+    def __neg__(self):
+        return Scaled(-1, self)
+
+    def __pos__(self):
+        return self
+
+    def __mul__(self, scalar):
+        return Scaled(scalar, self) if isinstance(scalar, Number) else NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, scalar):
+        return Scaled(1. / scalar, self) if isinstance(scalar, Number) else NotImplemented
+
+    def __matmul__(self, other):
+        other = as_expression(other)
+        return NotImplemented if other is None else Product(self, other)
+
+    def __rmatmul__(self, other):
+        other = as_expression(other)
+        return NotImplemented if other is None else Product(other, self)
+
+    def dot(self, other):
+        """ Return the lazy matrix product of this expression and another. """
+        return dot(self, other)
+
+    @property
+    def T(self):
+        """ The lazy transpose of this expression. """
+        return Transposed(self)
+
+    def evaluate(self, out=None, calls=None):
+        """ Evaluate this expression (see evaluate). """
+        return evaluate(self, out, calls)
+
+
+class Leaf(Expression):
+    """
+    An operand of a lazy expression. Create one with array.
+
+    Attributes:
+        array:        the 1D or 2D NumPy ndarray of the operand
+        structure:    None, 'symmetric', or 'triangular'
+        uplo:         the triangle referenced if the operand is symmetric or triangular
+        diag:         'n' or 'u', whether the diagonal is assumed to be all ones if the operand is
+                      triangular
+    """
+
+    def __init__(self, array, structure=None, uplo='u', diag='n'):
+        array = asarray(array)
+        if array.ndim not in (1, 2):
+            raise_not_1d_or_2d_numpy('array')
+        if structure not in STRUCTURES:
+            raise_invalid_parameter('structure', STRUCTURES, structure)
+        if structure is not None:
+            get_square_matrix_dimension('array', array)
+        convert_uplo(uplo)
+        convert_diag(diag)
+
+        self.array = array
+        self.structure = structure
+        self.uplo = uplo
+        self.diag = diag
+        self.shape = array.shape
+        self.dtype = array.dtype
+
+    def terms(self, coef, trans, calls):
+        return [(coef, self, trans and self.array.ndim == 2, None, False)]
+
+
+class Transposed(Expression):
+    """ The lazy transpose of an expression. """
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.shape = expression.shape[::-1]
+        self.dtype = expression.dtype
+
+    def terms(self, coef, trans, calls):
+        return self.expression.terms(coef, not trans, calls)
+
+
+class Scaled(Expression):
+    """ The lazy product of a scalar and an expression. """
+
+    def __init__(self, scalar, expression):
+        self.scalar = scalar
+        self.expression = expression
+        self.shape = expression.shape
+        self.dtype = expression.dtype
+
+    def terms(self, coef, trans, calls):
+        return self.expression.terms(coef * self.scalar, trans, calls)
+
+
+class Sum(Expression):
+    """ The lazy sum of two expressions of the same shape. """
+
+    def __init__(self, left, right):
+        if left.shape != right.shape:
+            raise_shape_mismatch('left operand', left.shape, 'right operand', right.shape)
+        self.left = left
+        self.right = right
+        self.shape = left.shape
+        self.dtype = left.dtype
+
+    def terms(self, coef, trans, calls):
+        return self.left.terms(coef, trans, calls) + self.right.terms(coef, trans, calls)
+
+
+class Product(Expression):
+    """ The lazy matrix (or matrix-vector) product of two expressions. """
+
+    def __init__(self, left, right):
+        check_equal_sizes('left operand', left.shape[-1], 'right operand', right.shape[0])
+        self.left = left
+        self.right = right
+        self.shape = left.shape[:-1] + right.shape[1:]
+        self.dtype = left.dtype
+
+    def terms(self, coef, trans, calls):
+        # the transpose of a product is the product of the transposes in reverse order
+        left, right = (self.right, self.left) if trans else (self.left, self.right)
+        left_coef, left, left_trans = get_operand(left, trans, calls)
+        right_coef, right, right_trans = get_operand(right, trans, calls)
+        return [(coef * left_coef * right_coef, left, left_trans, right, right_trans)]
+
+
+def array(operand, structure=None, uplo='u', diag='n'):
+    """
+    Wrap a matrix or vector as an operand of lazy expressions.
+
+    Args:
+        operand:      1D NumPy ndarray representing a vector, or 2D NumPy ndarray or matrix
+                      representing a matrix
+
+        --optional arguments--
+
+        structure:    None if the operand is a general matrix or vector
+                      'symmetric'   if the operand is a symmetric matrix
+                      'triangular'  if the operand is a triangular matrix (its other triangle is
+                                    all zeros)
+                          < default is None >
+        uplo:         'u'  if the upper triangle of a symmetric or triangular operand is referenced
+                      'l'  if the lower triangle is referenced
+                          < default is 'u' >
+        diag:         'n'  if the diagonal of a triangular operand is referenced
+                      'u'  if the diagonal of a triangular operand is all ones
+                          < default is 'n' >
+
+    Returns:
+        A lazy expression of the operand.
+
+    Raises:
+        ValueError: if any of the following conditions occur:
+                    - operand is not a 1D or 2D NumPy ndarray or NumPy matrix
+                    - structure is not None, 'symmetric', or 'triangular'
+                    - structure is given and the operand is not a square matrix
+                    - 'uplo' or 'diag' is not one of their allowed values
+    """
+
+    return Leaf(operand, structure, uplo, diag)
+
+
+def dot(left, right):
+    """
+    Return the lazy matrix (or matrix-vector) product of two expressions, matrices, or vectors.
+
+    Raises:
+        ValueError: if the dimensions of the operands do not conform
+    """
+
+    return Product(as_expression(left), as_expression(right))
+
+
+def evaluate(expression, out=None, calls=None):
+    """
+    Evaluate a lazy expression.
+
+    Args:
+        expression:    lazy expression (or matrix or vector) to evaluate
+
+        --optional arguments--
+
+        out:           NumPy ndarray or matrix of the shape of the result to overwrite with the
+                       result; the expression may include it (in which case its first multiple
+                       becomes the beta of a BLASpy call), or any view of it (in which case the
+                       result is computed into a temporary and copied into out)
+                           < default is a new ndarray >
+        calls:         list to which the name of each BLASpy function called (or 'copy' or 'numpy'
+                       for the few operations done by NumPy) is appended
+                           < default is None >
+
+    Returns:
+        out (a new ndarray if it is not given), or a scalar if the expression is the product of two
+        vectors.
+
+    Raises:
+        ValueError: if out has a different shape than the expression, or any BLASpy function called
+                    raises one
+    """
+
+    expression = as_expression(expression)
+    terms = combine_terms(expression.terms(1, False, calls))
+    return evaluate_terms(terms, expression.shape, expression.dtype, out, calls)
+
+
+def as_expression(operand):
+    """ Return an expression itself, a matrix or vector as a Leaf, or None otherwise. """
+
+    if isinstance(operand, Expression):
+        return operand
+    elif isinstance(operand, ndarray):
+        return Leaf(operand)
+    return None
+
+
+def get_operand(expression, trans, calls):
+    """
+    Return the scalar, Leaf, and transposition of an operand of a product, computing it into a
+    temporary if it is not a single scaled operand.
+    """
+
+    terms = combine_terms(expression.terms(1, trans, calls))
+    if len(terms) == 1 and terms[0][3] is None:
+        return terms[0][:3]
+
+    shape = expression.shape[::-1] if trans else expression.shape
+    return 1, Leaf(evaluate_terms(terms, shape, expression.dtype, None, calls)), False
+
+
+def combine_terms(terms):
+    """ Return a list of scaled terms in which the terms of operands viewed alike are merged. """
+
+    combined = []
+    for term in terms:
+        for index, other in enumerate(combined):
+            if (term[3] is None and other[3] is None and
+                    is_same_array(get_view(term[1], term[2]), get_view(other[1], other[2]))):
+                combined[index] = (other[0] + term[0],) + other[1:]
+                break
+        else:
+            combined.append(term)
+    return combined
+
+
+def evaluate_terms(terms, shape, dtype, out, calls):
+    """
+    Compute a sum of scaled terms into out, folding any multiple of out itself into the first call.
+
+    Returns:
+        out, a new ndarray if out is None, or a scalar if the shape is ().
+    """
+
+    # the sum of products of two vectors is a scalar
+    if shape == ():
+        result = 0
+        for coef, left, left_trans, right, right_trans in terms:
+            record(calls, 'dot')
+            result += coef * bp_dot(left.array, right.array)
+        return result
+
+    if out is None:
+        out = empty(shape, dtype)
+    else:
+        if out.ndim != len(shape):
+            raise_shape_mismatch('expression', shape, 'out', out.shape)
+        for size, out_size in zip(shape, out.shape):
+            check_equal_sizes('expression', size, 'out', out_size)
+
+    # the result is beta * out + the sum of the other terms; out cannot otherwise be read while it
+    # is overwritten, so a result which depends on any other view of out is computed separately
+    beta = 0
+    out_leaf = None
+    others = []
+    for term in terms:
+        coef, left, left_trans, right, right_trans = term
+        if right is None and is_same_array(get_view(left, left_trans), out):
+            beta += coef
+            out_leaf = left
+        else:
+            others.append(term)
+
+    if any(may_share_memory(operand.array, out) for term in others
+           for operand in (term[1], term[3]) if operand is not None):
+        result = evaluate_terms(terms, shape, dtype, None, calls)
+        record(calls, 'copy')
+        copyto(out, result)
+        return out
+
+    symmetric_out = out_leaf is not None and out_leaf.structure == 'symmetric'
+
+    # each product takes the multiple of out as its beta, then adds to the result
+    for coef, left, left_trans, right, right_trans in others:
+        if right is not None:
+            multiply(out, coef, left, left_trans, right, right_trans, beta, symmetric_out, calls)
+            beta = 1
+
+    # each other operand is added to the result, or copied into out if there is no result yet
+    for coef, left, left_trans, right, right_trans in others:
+        if right is None:
+            operand = get_view(left, left_trans)
+            if beta == 0:
+                record(calls, 'copy')
+                copyto(out, operand)
+                beta = coef
+            else:
+                if beta != 1:
+                    scale(out, beta, calls)
+                    beta = 1
+                add(out, coef, operand, calls)
+
+    if beta != 1:
+        scale(out, beta, calls)
+    return out
+
+
+def multiply(out, alpha, left, left_trans, right, right_trans, beta, symmetric_out, calls):
+    """ Compute out := beta * out + alpha * op(left) * op(right) with a single BLASpy call. """
+
+    A, B = left.array, right.array
+    trans_a, trans_b = 't' if left_trans else 'n', 't' if right_trans else 'n'
+
+    if B.ndim == 1:
+        record(calls, 'gemv')
+        gemv(A, B, out, trans_a, alpha, beta)
+
+    elif A.ndim == 1:
+        record(calls, 'gemv')
+        gemv(B, A, out, 'n' if right_trans else 't', alpha, beta)
+
+    elif is_same_array(A, B) and left_trans != right_trans and (beta == 0 or symmetric_out):
+        record(calls, 'syrk')
+        syrk(A, out, 'u', trans_a, alpha, beta)
+        symmetrize(out, UPPER)
+
+    elif left.structure == 'symmetric' and not right_trans:
+        record(calls, 'symm')
+        symm(A, B, out, 'l', left.uplo, alpha, beta)
+
+    elif right.structure == 'symmetric' and not left_trans:
+        record(calls, 'symm')
+        symm(B, A, out, 'r', right.uplo, alpha, beta)
+
+    elif left.structure == 'triangular' and beta == 0:
+        record(calls, 'trmm')
+        copyto(out, get_view(right, right_trans))
+        trmm(A, out, 'l', left.uplo, trans_a, left.diag, alpha)
+
+    elif right.structure == 'triangular' and beta == 0:
+        record(calls, 'trmm')
+        copyto(out, get_view(left, left_trans))
+        trmm(B, out, 'r', right.uplo, trans_b, right.diag, alpha)
+
+    else:
+        record(calls, 'gemm')
+        gemm(A, B, out, trans_a, trans_b, alpha, beta)
+
+
+def scale(out, alpha, calls):
+    """ Compute out := alpha * out, with scal if out is a vector or is contiguous. """
+
+    vector = get_flat_view(out, out)
+    if vector is not None:
+        record(calls, 'scal')
+        scal(alpha, vector)
+    else:
+        record(calls, 'numpy')
+        out *= alpha
+
+
+def add(out, alpha, operand, calls):
+    """ Compute out := out + alpha * operand, with axpy if both are vectors or contiguous alike. """
+
+    x, y = get_flat_view(operand, out), get_flat_view(out, operand)
+    if x is not None and y is not None:
+        record(calls, 'axpy')
+        axpy(alpha, x, y)
+    else:
+        record(calls, 'numpy')
+        out += alpha * operand
+
+
+def get_flat_view(array, other):
+    """
+    Return a 1D view of the elements of a vector or matrix in the order in which they are stored,
+    if the other vector or matrix stores its elements in the same order, and otherwise None.
+    """
+
+    if array.ndim == 1:
+        return array
+    elif array.flags.c_contiguous and other.flags.c_contiguous:
+        return array.reshape(-1)
+    elif array.flags.f_contiguous and other.flags.f_contiguous:
+        return array.T.reshape(-1)
+    return None
+
+
+def get_view(leaf, trans):
+    """ Return the ndarray of a Leaf, transposed if 'trans' is True. """
+    return leaf.array.T if trans else leaf.array
+
+
+def record(calls, name):
+    """ Append the name of a call to a list of calls, if one is given. """
+
+    if calls is not None:
+        calls.append(name)
@@ -14,7 +14,13 @@ from .asum import asum
 from .axpy import axpy
 from .copy import copy
 from .dot  import dot
+from .dotc import dotc
 from .nrm2 import nrm2
 from .scal import scal
 from .sdot import sdot
-from .swap import swap
\ No newline at end of file
+from .swap import swap
+
+from .amax_columns import amax_columns
+from .asum_columns import asum_columns
+from .dot_pairs    import dot_pairs
+from .nrm2_columns import nrm2_columns
@@ -0,0 +1,73 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from ..helpers import (get_matrix_dimensions, get_column_stride, get_cblas_info,
+                       call_cblas_reduction, check_num_threads, CBLAS_COLUMN_LENGTH)
+from numpy import asarray, empty, intp, iscomplexobj, zeros
+
+
+def amax_columns(A, num_threads=None):
+    """Find the index of the element of every column of a matrix which has the maximum absolute
+    value.
+
+    If more than one element of a column has the maximum absolute value, the smallest of their
+    indices is found. As for amax, the absolute value of a complex element is the sum of the
+    absolute values of its real and imaginary parts.
+
+    Matrix A may be stored in any order and is never copied. If its columns are long (at least
+    CBLAS_COLUMN_LENGTH elements) and each is adjacent in memory, the columns are split among up to
+    'num_threads' threads, each of which calls CBLAS once per column. Otherwise every column is
+    searched at once with vectorized NumPy operations.
+
+    Args:
+        A:              2D NumPy ndarray or matrix representing matrix A
+
+        --optional arguments--
+
+        num_threads:    largest number of threads among which to split the columns
+                            < default is the number of CPUs >
+
+    Returns:
+        1D NumPy ndarray of the row indices of the elements with the maximum absolute values in the
+        columns of A.
+
+    Raises:
+        ValueError: if any of the following conditions occur:
+                        - A is not a 2D NumPy ndarray or NumPy matrix
+                        - A has a dtype that is not supported
+                        - 'num_threads' is not an integer >= 1
+    """
+
+    # ensure the number of threads is valid
+    check_num_threads(num_threads)
+
+    # get the dimensions of the parameters
+    m_A, n_A = get_matrix_dimensions('A', A)
+
+    # determine which CBLAS subroutine to call and which ctypes data type to use
+    cblas_func, ctype_dtype = get_cblas_info('amax', (A.dtype,))
+
+    A = asarray(A)
+    column_stride = get_column_stride(A)
+
+    # call CBLAS using ctypes for every long column adjacent in memory
+    if m_A >= CBLAS_COLUMN_LENGTH and column_stride is not None:
+        indices = empty(n_A, dtype=intp)
+        call_cblas_reduction(cblas_func, [m_A, None, 1], ((1, A.ctypes.data, column_stride),),
+                             indices, num_threads)
+        return indices
+
+    # otherwise search every column at once (CBLAS finds index 0 in an empty vector)
+    if m_A == 0:
+        return zeros(n_A, dtype=intp)
+    if iscomplexobj(A):
+        return (abs(A.real) + abs(A.imag)).argmax(axis=0)
+    return abs(A).argmax(axis=0)
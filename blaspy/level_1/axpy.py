@@ -9,8 +9,7 @@
 
 """
 
-from ..helpers import get_vector_dimensions, get_cblas_info, check_equal_sizes
-from ctypes import c_int, POINTER
+from ..helpers import get_vector_dimensions, get_vector_layout, get_cblas_info, check_equal_sizes
 
 
 def axpy(alpha, x, y, inc_x=1, inc_y=1):
@@ -26,8 +25,8 @@ def axpy(alpha, x, y, inc_x=1, inc_y=1):
 
     Args:
         alpha:  scalar alpha
-        x:      2D NumPy matrix or ndarray representing vector x
-        y:      2D NumPy matrix or ndarray representing vector y
+        x:      1D or 2D NumPy ndarray or matrix representing vector x
+        y:      1D or 2D NumPy ndarray or matrix representing vector y
 
         --optional arguments--
 
@@ -41,7 +40,7 @@ def axpy(alpha, x, y, inc_x=1, inc_y=1):
 
     Raises:
         ValueError: if any of the following conditions occur:
-                        - x or y is not a 2D NumPy matrix or ndarray
+                        - x or y is not a 1D NumPy ndarray or a 2D NumPy ndarray or matrix
                         - x and y do not have the same dtype or that dtype is not supported
                         - x or y is not a vector
                         - x and y do not have the same length
@@ -54,17 +53,14 @@ def axpy(alpha, x, y, inc_x=1, inc_y=1):
     # ensure the parameters are appropriate for the operation
     check_equal_sizes('x', x_length, 'y', y_length)
 
+    # get the address and CBLAS increment of x and y from their NumPy strides
+    x_address, inc_x = get_vector_layout('x', x, x_length, inc_x)
+    y_address, inc_y = get_vector_layout('y', y, y_length, inc_y)
+
     # determine which CBLAS subroutine to call and which ctypes data type to use
     cblas_func, ctype_dtype = get_cblas_info('axpy', (x.dtype, y.dtype))
 
-    # create a ctypes POINTER for each vector
-    ctype_x = POINTER(ctype_dtype * n_x * m_x)
-    ctype_y = POINTER(ctype_dtype * n_y * m_y)
-
     # call CBLAS using ctypes
-    cblas_func.argtypes = [c_int, ctype_dtype, ctype_x, c_int, ctype_y, c_int]
-    cblas_func.restype = None
-    cblas_func(x_length, alpha, x.ctypes.data_as(ctype_x), inc_x,
-               y.ctypes.data_as(ctype_y), inc_y)
+    cblas_func(x_length, alpha, x_address, inc_x, y_address, inc_y)
 
     return y  # y is also overwritten
\ No newline at end of file
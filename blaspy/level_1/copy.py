@@ -9,9 +9,8 @@
 
 """
 
-from ..helpers import (get_vector_dimensions, check_equal_sizes, get_cblas_info,
-                       create_similar_zero_vector, check_strides_equal_one)
-from ctypes import c_int, POINTER
+from ..helpers import (get_vector_dimensions, get_vector_layout, check_equal_sizes, get_cblas_info,
+                       create_similar_empty_vector, check_strides_equal_one)
 
 
 def copy(x, y=None, inc_x=1, inc_y=1):
@@ -19,11 +18,11 @@ def copy(x, y=None, inc_x=1, inc_y=1):
     Copy the numerical contents of vector x to vector y.
 
     Args:
-        x:      2D NumPy matrix or ndarray representing vector x
+        x:      1D or 2D NumPy ndarray or matrix representing vector x
 
         --optional arguments--
 
-        y:      2D NumPy matrix or ndarray representing vector y
+        y:      1D or 2D NumPy ndarray or matrix representing vector y
                     < default is a newly created zero vector of the same dtype and effective length >
         inc_x:  stride of x (increment for the elements of x)
                     < default is 1 >
@@ -35,7 +34,7 @@ def copy(x, y=None, inc_x=1, inc_y=1):
 
     Raises:
         ValueError: if any of the following conditions occur:
-                        - x or y is not a 2D NumPy matrix or ndarray
+                        - x or y is not a 1D NumPy ndarray or a 2D NumPy ndarray or matrix
                         - x and y do not have the same dtype or that dtype is not supported
                         - x or y is not a vector
                         - x and y do not have the same length
@@ -47,23 +46,21 @@ def copy(x, y=None, inc_x=1, inc_y=1):
     # if y is not given, create zero vector with same orientation and type as x
     if y is None:
         inc_y = 1
-        y = create_similar_zero_vector(x, x_length)
+        y = create_similar_empty_vector(x, x_length)
 
     m_y, n_y, y_length = get_vector_dimensions('y', y, inc_y)
 
     # ensure the parameters are appropriate for the operation
     check_equal_sizes('x', x_length, 'y', y_length)
 
+    # get the address and CBLAS increment of x and y from their NumPy strides
+    x_address, inc_x = get_vector_layout('x', x, x_length, inc_x)
+    y_address, inc_y = get_vector_layout('y', y, y_length, inc_y)
+
     # determine which CBLAS subroutine to call and which ctypes data type to use
     cblas_func, ctype_dtype = get_cblas_info('copy', (x.dtype, y.dtype))
 
-    # create a ctypes POINTER for each vector
-    ctype_x = POINTER(ctype_dtype * n_x * m_x)
-    ctype_y = POINTER(ctype_dtype * n_y * m_y)
-
     # call CBLAS using ctypes
-    cblas_func.argtypes = [c_int, ctype_x, c_int, ctype_y, c_int]
-    cblas_func.restype = None
-    cblas_func(x_length, x.ctypes.data_as(ctype_x), inc_x, y.ctypes.data_as(ctype_y), inc_y)
+    cblas_func(x_length, x_address, inc_x, y_address, inc_y)
 
     return y  # y is also overwritten
\ No newline at end of file
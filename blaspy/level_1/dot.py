@@ -9,8 +9,7 @@
 
 """
 
-from ..helpers import get_vector_dimensions, get_cblas_info, check_equal_sizes
-from ctypes import c_int, POINTER
+from ..helpers import get_vector_dimensions, get_vector_layout, get_cblas_info, check_equal_sizes
 
 
 def dot(x, y, inc_x=1, inc_y=1):
@@ -19,14 +18,15 @@ def dot(x, y, inc_x=1, inc_y=1):
     rho := SUM(chi_i * psi_i) from i=0 to i=n-1
 
     where rho is a scalar, and chi_i and psi_i are the ith elements of vectors x and y,
-    respectively, where x and y are general vectors of length n.
+    respectively, where x and y are general vectors of length n. Complex vectors are not conjugated
+    (see dotc).
 
     Vectors x and y can be passed in as either row or column vectors. If necessary, an implicit
     transposition occurs.
 
     Args:
-        x:      2D NumPy matrix or ndarray representing vector x
-        y:      2D NumPy matrix or ndarray representing vector y
+        x:      1D or 2D NumPy ndarray or matrix representing vector x
+        y:      1D or 2D NumPy ndarray or matrix representing vector y
 
         --optional arguments--
 
@@ -40,7 +40,7 @@ def dot(x, y, inc_x=1, inc_y=1):
 
     Raises:
         ValueError: if any of the following conditions occur:
-                        - x or y is not a 2D NumPy matrix or ndarray
+                        - x or y is not a 1D NumPy ndarray or a 2D NumPy ndarray or matrix
                         - x and y do not have the same dtype or that dtype is not supported
                         - x or y is not a vector
                         - x and y do not have the same length
@@ -53,14 +53,12 @@ def dot(x, y, inc_x=1, inc_y=1):
     # ensure the parameters are appropriate for the operation
     check_equal_sizes('x', x_length, 'y', y_length)
 
+    # get the address and CBLAS increment of x and y from their NumPy strides
+    x_address, inc_x = get_vector_layout('x', x, x_length, inc_x)
+    y_address, inc_y = get_vector_layout('y', y, y_length, inc_y)
+
     # determine which CBLAS subroutine to call and which ctypes data type to use
     cblas_func, ctype_dtype = get_cblas_info('dot', (x.dtype, y.dtype))
 
-    # create a ctypes POINTER for each vector
-    ctype_x = POINTER(ctype_dtype * n_x * m_x)
-    ctype_y = POINTER(ctype_dtype * n_y * m_y)
-
     # call CBLAS using ctypes
-    cblas_func.argtypes = [c_int, ctype_x, c_int, ctype_y, c_int]
-    cblas_func.restype = ctype_dtype
-    return cblas_func(x_length, x.ctypes.data_as(ctype_x), inc_x, y.ctypes.data_as(ctype_y), inc_y)
\ No newline at end of file
+    return cblas_func(x_length, x_address, inc_x, y_address, inc_y)
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from ..helpers import (get_matrix_dimensions, check_equal_sizes, get_column_stride,
+                       get_cblas_info, call_cblas_reduction, check_num_threads,
+                       CBLAS_COLUMN_LENGTH)
+from numpy import asarray, einsum, empty
+
+
+def dot_pairs(X, Y, num_threads=None):
+    """
+    Perform a dot product operation between every pair of corresponding columns of two matrices.
+
+    rho_j := x_j_T * y_j
+
+    for each j, where x_j and y_j are the jth columns of the m by n general matrices X and Y, and
+    the vector of the n results is returned. As for dot, complex columns are not conjugated.
+
+    Matrices X and Y may be stored in any order and are never copied. If their columns are long (at
+    least CBLAS_COLUMN_LENGTH elements) and each is adjacent in memory, the pairs of columns are
+    split among up to 'num_threads' threads, each of which calls CBLAS once per pair. Otherwise
+    every pair is reduced at once with vectorized NumPy operations.
+
+    Args:
+        X:              2D NumPy ndarray or matrix representing matrix X
+        Y:              2D NumPy ndarray or matrix representing matrix Y
+
+        --optional arguments--
+
+        num_threads:    largest number of threads among which to split the pairs of columns
+                            < default is the number of CPUs >
+
+    Returns:
+        1D NumPy ndarray of the dot products of the pairs of columns of X and Y.
+
+    Raises:
+        ValueError: if any of the following conditions occur:
+                        - X or Y is not a 2D NumPy ndarray or NumPy matrix
+                        - X and Y do not have the same dtype or that dtype is not supported
+                        - X and Y do not have the same dimensions
+                        - 'num_threads' is not an integer >= 1
+    """
+
+    # ensure the number of threads is valid
+    check_num_threads(num_threads)
+
+    # get the dimensions of the parameters
+    m_X, n_X = get_matrix_dimensions('X', X)
+    m_Y, n_Y = get_matrix_dimensions('Y', Y)
+
+    # ensure the parameters are appropriate for the operation
+    check_equal_sizes('X', m_X, 'Y', m_Y)
+    check_equal_sizes('X', n_X, 'Y', n_Y)
+
+    # determine which CBLAS subroutine to call and which ctypes data type to use
+    cblas_func, ctype_dtype = get_cblas_info('dot', (X.dtype, Y.dtype))
+
+    X, Y = asarray(X), asarray(Y)
+    x_stride, y_stride = get_column_stride(X), get_column_stride(Y)
+
+    # call CBLAS using ctypes for every pair of long columns adjacent in memory
+    if m_X >= CBLAS_COLUMN_LENGTH and x_stride is not None and y_stride is not None:
+        products = empty(n_X, dtype=X.dtype)
+        call_cblas_reduction(cblas_func, [m_X, None, 1, None, 1],
+                             ((1, X.ctypes.data, x_stride), (3, Y.ctypes.data, y_stride)),
+                             products, num_threads)
+        return products
+
+    # otherwise reduce every pair at once
+    return einsum('ij,ij->j', X, Y)
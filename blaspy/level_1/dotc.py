@@ -0,0 +1,64 @@
+"""
+
+    Copyright (c) 2014-2015-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from ..helpers import get_vector_dimensions, get_vector_layout, get_cblas_info, check_equal_sizes
+
+
+def dotc(x, y, inc_x=1, inc_y=1):
+    """Perform a conjugated dot (inner) product operation between two vectors.
+
+    rho := SUM(conj(chi_i) * psi_i) from i=0 to i=n-1
+
+    where rho is a scalar, and chi_i and psi_i are the ith elements of vectors x and y,
+    respectively, where x and y are general vectors of length n. For real vectors, this is the same
+    operation as dot.
+
+    Vectors x and y can be passed in as either row or column vectors. If necessary, an implicit
+    transposition occurs.
+
+    Args:
+        x:      1D or 2D NumPy ndarray or matrix representing vector x
+        y:      1D or 2D NumPy ndarray or matrix representing vector y
+
+        --optional arguments--
+
+        inc_x:  stride of x (increment for the elements of x)
+                    < default is 1 >
+        inc_y:  stride of y (increment for the elements of y)
+                    < default is 1 >
+
+    Returns:
+        rho, the result of the conjugated dot product between x and y.
+
+    Raises:
+        ValueError: if any of the following conditions occur:
+                        - x or y is not a 1D NumPy ndarray or a 2D NumPy ndarray or matrix
+                        - x and y do not have the same dtype or that dtype is not supported
+                        - x or y is not a vector
+                        - x and y do not have the same length
+    """
+
+    # get the dimensions of the parameters
+    m_x, n_x, x_length = get_vector_dimensions('x', x, inc_x)
+    m_y, n_y, y_length = get_vector_dimensions('y', y, inc_y)
+
+    # ensure the parameters are appropriate for the operation
+    check_equal_sizes('x', x_length, 'y', y_length)
+
+    # get the address and CBLAS increment of x and y from their NumPy strides
+    x_address, inc_x = get_vector_layout('x', x, x_length, inc_x)
+    y_address, inc_y = get_vector_layout('y', y, y_length, inc_y)
+
+    # determine which CBLAS subroutine to call and which ctypes data type to use
+    cblas_func, ctype_dtype = get_cblas_info('dotc', (x.dtype, y.dtype))
+
+    # call CBLAS using ctypes
+    return cblas_func(x_length, x_address, inc_x, y_address, inc_y)
\ No newline at end of file
@@ -9,8 +9,7 @@
 
 """
 
-from ..helpers import get_vector_dimensions, get_cblas_info
-from ctypes import c_int, POINTER
+from ..helpers import get_vector_dimensions, get_vector_layout, get_cblas_info
 
 
 def nrm2(x, inc_x=1):
@@ -21,7 +20,7 @@ def nrm2(x, inc_x=1):
     where chi_i is the ith element of general vector x of length n and ||x||_2 is returned.
 
     Args:
-        x:              2D NumPy matrix or ndarray representing vector x
+        x:              1D or 2D NumPy ndarray or matrix representing vector x
 
         --optional arguments--
 
@@ -33,7 +32,7 @@ def nrm2(x, inc_x=1):
 
     Raises:
         ValueError: if any of the following conditions occur:
-                        - x is not a 2D NumPy matrix or ndarray
+                        - x is not a 1D NumPy ndarray or a 2D NumPy ndarray or matrix
                         - x has a dtype that is not supported
                         - x is not a vector
     """
@@ -41,13 +40,13 @@ def nrm2(x, inc_x=1):
     # get the dimensions of the parameters
     m_x, n_x, x_length = get_vector_dimensions('x', x, inc_x)
 
+    # get the address and CBLAS increment of x from its NumPy strides (CBLAS does not permit a
+    # negative increment here, but the result does not depend on the order of the elements)
+    x_address, inc_x = get_vector_layout('x', x, x_length, inc_x)
+    inc_x = abs(inc_x)
+
     # determine which CBLAS subroutine to call and which ctypes data type to use
     cblas_func, ctype_dtype = get_cblas_info('nrm2', (x.dtype,))
 
-    # create a ctypes POINTER for vector x
-    ctype_x = POINTER(ctype_dtype * n_x * m_x)
-
     # call CBLAS using ctypes
-    cblas_func.argtypes = [c_int, ctype_x, c_int]
-    cblas_func.restype = ctype_dtype
-    return cblas_func(x_length, x.ctypes.data_as(ctype_x), inc_x)
\ No newline at end of file
+    return cblas_func(x_length, x_address, inc_x)
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from ..helpers import (get_matrix_dimensions, get_column_stride, get_cblas_info,
+                       call_cblas_reduction, check_num_threads, CBLAS_COLUMN_LENGTH)
+from numpy import asarray, einsum, empty, finfo, iscomplexobj, isinf, sqrt
+
+
+def nrm2_columns(A, num_threads=None):
+    """Compute the 2-norm (Euclidean length) of every column of a matrix.
+
+    ||a_j||_2 = [SUM(|alpha_ij|^2)]^(1/2) from i=0 to i=m-1
+
+    for each j, where alpha_ij is the ith element of column a_j of the m by n general matrix A, and
+    the vector of the n norms is returned.
+
+    Matrix A may be stored in any order and is never copied. If its columns are long (at least
+    CBLAS_COLUMN_LENGTH elements) and each is adjacent in memory, the columns are split among up to
+    'num_threads' threads, each of which calls CBLAS once per column. Otherwise every column is
+    reduced at once with vectorized NumPy operations, and any column whose sum of squares overflows
+    or underflows is reduced again scaled by its largest magnitude, as CBLAS does.
+
+    Args:
+        A:              2D NumPy ndarray or matrix representing matrix A
+
+        --optional arguments--
+
+        num_threads:    largest number of threads among which to split the columns
+                            < default is the number of CPUs >
+
+    Returns:
+        1D NumPy ndarray of the 2-norms of the columns of A, with the real dtype of the same
+        precision as A.
+
+    Raises:
+        ValueError: if any of the following conditions occur:
+                        - A is not a 2D NumPy ndarray or NumPy matrix
+                        - A has a dtype that is not supported
+                        - 'num_threads' is not an integer >= 1
+    """
+
+    # ensure the number of threads is valid
+    check_num_threads(num_threads)
+
+    # get the dimensions of the parameters
+    m_A, n_A = get_matrix_dimensions('A', A)
+
+    # determine which CBLAS subroutine to call and which ctypes data type to use
+    cblas_func, ctype_dtype = get_cblas_info('nrm2', (A.dtype,))
+
+    A = asarray(A)
+    column_stride = get_column_stride(A)
+
+    # call CBLAS using ctypes for every long column adjacent in memory
+    if m_A >= CBLAS_COLUMN_LENGTH and column_stride is not None:
+        norms = empty(n_A, dtype=A.real.dtype)
+        call_cblas_reduction(cblas_func, [m_A, None, 1], ((1, A.ctypes.data, column_stride),),
+                             norms, num_threads)
+        return norms
+
+    # otherwise reduce every column at once
+    squares = einsum('ij,ij->j', A.real, A.real)
+    if iscomplexobj(A):
+        squares += einsum('ij,ij->j', A.imag, A.imag)
+    norms = sqrt(squares)
+
+    # reduce the columns whose sums of squares overflowed or underflowed again, scaling each column
+    # by its largest magnitude
+    unsafe = isinf(squares) | ~(squares >= finfo(squares.dtype).tiny)
+    if unsafe.any():
+        magnitudes = abs(A[:, unsafe])
+        scales = magnitudes.max(axis=0, initial=0)
+        scales[scales == 0] = 1
+        norms[unsafe] = sqrt(((magnitudes / scales) ** 2).sum(axis=0)) * scales
+
+    return norms
@@ -9,8 +9,7 @@
 
 """
 
-from ..helpers import get_vector_dimensions, get_cblas_info
-from ctypes import c_int, POINTER
+from ..helpers import get_vector_dimensions, get_vector_layout, get_cblas_info
 
 
 def scal(alpha, x, inc_x=1):
@@ -23,7 +22,7 @@ def scal(alpha, x, inc_x=1):
 
     Args:
         alpha:          scalar alpha
-        x:              2D NumPy matrix or ndarray representing vector x
+        x:              1D or 2D NumPy ndarray or matrix representing vector x
 
         --optional arguments--
 
@@ -35,7 +34,7 @@ def scal(alpha, x, inc_x=1):
 
     Raises:
         ValueError: if any of the following conditions occur:
-                        - x is not a 2D NumPy matrix or ndarray
+                        - x is not a 1D NumPy ndarray or a 2D NumPy ndarray or matrix
                         - if x has a dtype that is not supported
                         - x is not a vector
     """
@@ -43,15 +42,15 @@ def scal(alpha, x, inc_x=1):
     # get the dimensions of the parameters
     m_x, n_x, x_length = get_vector_dimensions('x', x, inc_x)
 
+    # get the address and CBLAS increment of x from its NumPy strides (CBLAS does not permit a
+    # negative increment here, but the result does not depend on the order of the elements)
+    x_address, inc_x = get_vector_layout('x', x, x_length, inc_x)
+    inc_x = abs(inc_x)
+
     # determine which CBLAS subroutine to call and which ctypes data type to use
     cblas_func, ctype_dtype = get_cblas_info('scal', (x.dtype,))
 
-    # create a ctypes POINTER for vector x
-    ctype_x = POINTER(ctype_dtype * n_x * m_x)
-
     # call CBLAS using ctypes
-    cblas_func.argtypes = [c_int, ctype_dtype, ctype_x, c_int]
-    cblas_func.restype = None
-    cblas_func(x_length, alpha, x.ctypes.data_as(ctype_x), inc_x)
+    cblas_func(x_length, alpha, x_address, inc_x)
 
     return x  # x is also overwritten
\ No newline at end of file
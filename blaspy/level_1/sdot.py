@@ -9,10 +9,8 @@
 
 """
 
-from ..config import _libblas
-from ..helpers import get_vector_dimensions, check_equal_sizes
-from ..errors import raise_invalid_dtypes, raise_invalid_parameter
-from ctypes import c_int, c_double, c_float, POINTER
+from ..helpers import get_vector_dimensions, get_vector_layout, check_equal_sizes, get_cblas_info
+from ..errors import raise_invalid_parameter
 
 
 def sdot(x, y, inc_x=1, inc_y=1, output='float64'):
@@ -28,8 +26,8 @@ def sdot(x, y, inc_x=1, inc_y=1, output='float64'):
     transposition occurs.
 
     Args:
-        x:         2D numpy matrix or ndarray representing vector x
-        y:         2D numpy matrix or ndarray representing vector y
+        x:         1D or 2D numpy ndarray or matrix representing vector x
+        y:         1D or 2D numpy ndarray or matrix representing vector y
 
         --optional arguments--
 
@@ -45,7 +43,7 @@ def sdot(x, y, inc_x=1, inc_y=1, output='float64'):
 
     Raises:
         ValueError: if any of the following conditions occur:
-                        - x or y is not a 2D NumPy matrix or ndarray
+                        - x or y is not a 1D NumPy ndarray or a 2D NumPy ndarray or matrix
                         - x or y is not of dtype 'float32'
                         - x or y is not a vector
                         - x and y do not have the same length
@@ -59,30 +57,17 @@ def sdot(x, y, inc_x=1, inc_y=1, output='float64'):
     # ensure the parameters are appropriate for the operation
     check_equal_sizes('x', x_length, 'y', y_length)
 
-    # get_cblas_info cannot be used for sdot due to the way input/output data types don't
-    # necessarily match. For now, this is handled in this function, but it may be moved into
-    # helpers.py if it occurs again when implementing other CBLAS subroutines.
+    # get the address and CBLAS increment of x and y from their NumPy strides
+    x_address, inc_x = get_vector_layout('x', x, x_length, inc_x)
+    y_address, inc_y = get_vector_layout('y', y, y_length, inc_y)
 
-    # check type of x and y
-    if not (x.dtype == 'float32' and y.dtype == 'float32'):
-        raise_invalid_dtypes('float32')
-
-    # determine which CBLAS routine to call based on data type, then call CBLAS using ctypes
+    # determine which CBLAS subroutine to call based on the output precision, then call CBLAS
+    # using ctypes (the subroutines for both output precisions only accept float32 vectors)
     if output == 'float64':
-        cblas_func = _libblas.cblas_dsdot
-        ctype_x = POINTER(c_float * n_x * m_x)
-        ctype_y = POINTER(c_float * n_y * m_y)
-        cblas_func.argtypes = [c_int, ctype_x, c_int, ctype_y, c_int]
-        cblas_func.restype = c_double
-        return cblas_func(x_length, x.ctypes.data_as(ctype_x), inc_x,
-                          y.ctypes.data_as(ctype_y), inc_y)
+        cblas_func, ctype_dtype = get_cblas_info('dsdot', (x.dtype, y.dtype))
+        return cblas_func(x_length, x_address, inc_x, y_address, inc_y)
     elif output == 'float32':
-        cblas_func = _libblas.cblas_sdsdot
-        ctype_x = POINTER(c_float * n_x * m_x)
-        ctype_y = POINTER(c_float * n_y * m_y)
-        cblas_func.argtypes = [c_int, c_float, ctype_x, c_int, ctype_y, c_int]
-        cblas_func.restype = c_float
-        return cblas_func(x_length, 0, x.ctypes.data_as(ctype_x), inc_x,
-                          y.ctypes.data_as(ctype_y), inc_y)
+        cblas_func, ctype_dtype = get_cblas_info('sdsdot', (x.dtype, y.dtype))
+        return cblas_func(x_length, 0, x_address, inc_x, y_address, inc_y)
     else:
-        raise_invalid_parameter('output', ('float32', 'float64'), output)
\ No newline at end of file
+        raise_invalid_parameter('output', ('float32', 'float64'), output)
@@ -11,8 +11,16 @@
 
 from .gemv import gemv
 from .ger  import ger
+from .hemv import hemv
+from .her  import her
+from .her2 import her2
 from .symv import symv
 from .syr  import syr
 from .syr2 import syr2
 from .trmv import trmv
-from .trsv import trsv
\ No newline at end of file
+from .trsv import trsv
+
+from .gemv_batched import gemv_batched
+from .symv_batched import symv_batched
+from .trmv_batched import trmv_batched
+from .trsv_batched import trsv_batched
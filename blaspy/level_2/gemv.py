@@ -9,10 +9,10 @@
 
 """
 
-from ..helpers import (get_matrix_dimensions, get_vector_dimensions, check_strides_equal_one,
+from ..helpers import (get_matrix_dimensions, get_vector_dimensions, get_vector_layout,
+                       check_strides_equal_one, create_similar_empty_vector,
                        create_similar_zero_vector, check_equal_sizes, convert_trans,
-                       get_cblas_info, ROW_MAJOR, TRANS)
-from ctypes import c_int, POINTER
+                       get_cblas_info, get_matrix_layout, NO_TRANS)
 
 
 def gemv(A, x, y=None, trans_a='n', alpha=1.0, beta=1.0, lda=None, inc_x=1, inc_y=1):
@@ -23,31 +23,39 @@ def gemv(A, x, y=None, trans_a='n', alpha=1.0, beta=1.0, lda=None, inc_x=1, inc_
 
     where alpha and beta are scalars, A is a general matrix, and x and y are general column vectors.
 
-    The 'trans' argument allows the operation to proceed as if A is transposed.
+    The 'trans' argument allows the operation to proceed as if A is transposed or conjugate
+    transposed.
 
     Vectors x and y can be passed in as either row or column vectors. If necessary, an implicit
     transposition occurs.
 
+    Matrix A may be stored in either row-major or column-major order, such as a block sliced out of
+    a larger matrix or a transposed view of one, and is never copied. Vectors may be any view whose
+    elements are evenly spaced in memory, such as a column sliced out of a matrix or a reversed
+    view, and are never copied either.
+
     Vector y defaults to the zero vector of the appropriate size, orientation, and type if vector y is not
     provided; however, the stride of y becomes fixed at 1 and the parameter inc_y is ignored.
 
     Args:
         A:          2D NumPy matrix or ndarray representing matrix A
-        x:          2D NumPy matrix or ndarray representing vector x
+        x:          1D or 2D NumPy ndarray or matrix representing vector x
 
         --optional arguments--
 
-        y:          2D NumPy matrix or ndarray representing vector y
+        y:          1D or 2D NumPy ndarray or matrix representing vector y
                         < default is the zero vector >
         trans_a:    'n'  if the operation is to proceed normally
                     't'  if the operation is to proceed as if A is transposed
+                    'c'  if the operation is to proceed as if A is conjugate transposed
                         < default is 'n' >
         alpha:      scalar alpha
                         < default is 1.0 >
         beta:       scalar beta
                         < default is 1.0 >
-        lda:        leading dimension of a (must be >= # of columns in A)
-                        < default is the number of columns in A >
+        lda:        leading dimension of A (must be >= # of cols in A, or >= # of rows in A if A is
+                    stored in column-major order)
+                        < default is the spacing in memory of the rows (or columns) of A >
         inc_x:      stride of x (increment for the elements of x)
                         < default is 1 >
         inc_y:      stride of y (increment for the elements of y)
@@ -58,7 +66,8 @@ def gemv(A, x, y=None, trans_a='n', alpha=1.0, beta=1.0, lda=None, inc_x=1, inc_
 
     Raises:
         ValueError: if any of the following conditions occur:
-                    - A, x, or y is not a 2D NumPy ndarray or NumPy matrix
+                    - A is not a 2D NumPy ndarray or NumPy matrix
+                    - x or y is not a 1D NumPy ndarray or a 2D NumPy ndarray or matrix
                     - A, x, and y do not have the same dtype or that dtype is not supported
                     - x or y is not a vector
                     - the effective length of either x or y does not conform to the dimensions of A
@@ -67,7 +76,7 @@ def gemv(A, x, y=None, trans_a='n', alpha=1.0, beta=1.0, lda=None, inc_x=1, inc_
 
     # convert to appropriate CBLAS value
     cblas_trans_a = convert_trans(trans_a)
-    transpose_A = cblas_trans_a == TRANS
+    transpose_A = cblas_trans_a != NO_TRANS
 
     # get the dimensions of the parameters
     m_A, n_A = get_matrix_dimensions('A', A)
@@ -77,33 +86,33 @@ def gemv(A, x, y=None, trans_a='n', alpha=1.0, beta=1.0, lda=None, inc_x=1, inc_
     if y is None:
         inc_y = 1  # stride of unprovided vector y is set to 1, there is currently no option for the user to provide this
         length = n_A if transpose_A else m_A
-        y = create_similar_zero_vector(x, length)
+        # CBLAS returns without setting y if the product is empty, so such a y is created zeroed
+        create = create_similar_empty_vector if x_length else create_similar_zero_vector
+        y = create(x, length)
+        beta = 0.
 
     # continue getting dimensions of the parameters
     m_y, n_y, y_length = get_vector_dimensions('y', y, inc_y)
 
-    # assign a default value to lda if necessary (assumes row-major order)
+    # determine the order in which A is stored and assign a default value to lda if necessary
+    order, default_lda = get_matrix_layout('A', A)
     if lda is None:
-        lda = n_A
+        lda = default_lda
 
     # ensure the parameters are appropriate for the desired operation
     x_check, y_check = (n_A, m_A) if not transpose_A else (m_A, n_A)
     check_equal_sizes('A', x_check, 'x', x_length)
     check_equal_sizes('A', y_check, 'y', y_length)
 
+    # get the address and CBLAS increment of x and y from their NumPy strides
+    x_address, inc_x = get_vector_layout('x', x, x_length, inc_x)
+    y_address, inc_y = get_vector_layout('y', y, y_length, inc_y)
+
     # determine which CBLAS subroutine to call and which ctypes data type to use
     cblas_func, ctype_dtype = get_cblas_info('gemv', (A.dtype, x.dtype, y.dtype))
 
-    # create a ctypes POINTER for each vector and matrix
-    ctype_x = POINTER(ctype_dtype * n_x * m_x)
-    ctype_y = POINTER(ctype_dtype * n_y * m_y)
-    ctype_A = POINTER(ctype_dtype * n_A * m_A)
-
     # call CBLAS using ctypes
-    cblas_func.argtypes = [c_int, c_int, c_int, c_int, ctype_dtype, ctype_A, c_int,
-                           ctype_x, c_int, ctype_dtype, ctype_y, c_int]
-    cblas_func.restype = None
-    cblas_func(ROW_MAJOR, cblas_trans_a, m_A, n_A, alpha, A.ctypes.data_as(ctype_A), lda,
-               x.ctypes.data_as(ctype_x), inc_x, beta, y.ctypes.data_as(ctype_y), inc_y)
+    cblas_func(order, cblas_trans_a, m_A, n_A, alpha, A.ctypes.data, lda,
+               x_address, inc_x, beta, y_address, inc_y)
 
     return y  # y is also overwritten
\ No newline at end of file
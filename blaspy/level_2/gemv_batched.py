@@ -0,0 +1,138 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from ..helpers import (get_stack_dimensions, get_vector_stack_dimensions, get_batch_size,
+                       get_stack_layout, get_vector_stack_layout, check_unshared_output,
+                       create_empty_vector_stack, create_zero_vector_stack, check_equal_sizes,
+                       convert_trans, apply_trans_stack, get_cblas_info, call_cblas_batched,
+                       check_num_threads, NO_TRANS, NUMPY_BATCHED_SIZES)
+from numpy import matmul
+
+
+def gemv_batched(A, x, y=None, trans_a='n', alpha=1.0, beta=1.0, num_threads=None):
+    """
+    Perform a batch of independent general matrix-vector multiplication operations.
+
+    y[i] := beta * y[i] + alpha * A[i] * x[i]
+
+    for each i, where alpha and beta are scalars, A[i] is a general matrix, and x[i] and y[i] are
+    general vectors.
+
+    A is a stack of matrices of the same size, i.e. a 3D ndarray indexed as (matrix, row, column),
+    and x and y are stacks of vectors of the same length, i.e. 2D ndarrays indexed as (vector,
+    element). A 2D ndarray or matrix may be passed for A, or a 1D ndarray for x, instead, in which
+    case that matrix or vector is shared by every operation of the batch. The 'trans_a' argument
+    has the same meaning as for gemv.
+
+    If y is not provided, a stack of zero vectors of the appropriate length and type is created and
+    returned.
+
+    The matrices of A may be stored in either row-major or column-major order and no operand is ever
+    copied. If the matrices are small (at most NUMPY_BATCHED_SIZES['gemv'] rows and columns), the
+    whole batch is performed by vectorized NumPy operations, which is much faster than calling CBLAS
+    once per operation for such small problems. Otherwise, if the BLAS library has a strided batched
+    gemv (such as MKL), the whole batch is performed by a single call to it, and if not the batch is
+    split among up to 'num_threads' threads, each of which calls CBLAS once per operation.
+
+    Args:
+        A:              3D NumPy ndarray representing the stack of matrices A[i], or 2D NumPy
+                        ndarray or matrix shared by every operation
+        x:              2D NumPy ndarray representing the stack of vectors x[i], or 1D NumPy
+                        ndarray shared by every operation
+
+        --optional arguments--
+
+        y:              2D NumPy ndarray representing the stack of vectors y[i]
+                            < default is a stack of zero vectors >
+        trans_a:        'n'  if the operation is to proceed as if each A[i] is not transposed
+                        't'  if the operation is to proceed as if each A[i] is transposed
+                        'c'  if the operation is to proceed as if each A[i] is conjugate transposed
+                            < default is 'n' >
+        alpha:          scalar alpha
+                            < default is 1.0 >
+        beta:           scalar beta
+                            < default is 1.0 >
+        num_threads:    largest number of threads among which to split the batch
+                            < default is the number of CPUs >
+
+    Returns:
+        Stack y (which is also overwritten)
+
+    Raises:
+        ValueError: if any of the following conditions occur:
+                    - A is not a 3D NumPy ndarray or a 2D NumPy ndarray or matrix
+                    - x or y is not a 2D NumPy ndarray or a 1D NumPy ndarray
+                    - the stacks do not hold the same number of matrices and vectors, or neither A
+                      nor x is a stack when y is not provided
+                    - A, x, and y do not have the same dtype or that dtype is not supported
+                    - the lengths of the vectors of x and y do not conform to the dimensions of the
+                      matrices of A
+                    - the matrices of A are stored in neither row-major nor column-major order,
+                      the elements of the vectors are not evenly spaced in memory, or the vectors
+                      of y overlap in memory
+                    - 'trans_a' is not equal to one of the following: 'n', 'N', 't', 'T', 'c', 'C'
+                    - 'num_threads' is not an integer >= 1
+    """
+
+    # ensure the number of threads is valid
+    check_num_threads(num_threads)
+
+    # convert to appropriate CBLAS value
+    cblas_trans_a = convert_trans(trans_a)
+    transpose_a = cblas_trans_a != NO_TRANS
+
+    # get the dimensions of the parameters
+    batch_A, m_A, n_A = get_stack_dimensions('A', A)
+    batch_x, x_length = get_vector_stack_dimensions('x', x)
+    x_check, y_check = (n_A, m_A) if not transpose_a else (m_A, n_A)
+
+    # if y is not given, create a stack of vectors with same type as A, computed with beta 0
+    if y is None:
+        beta = 0.
+        # CBLAS returns without setting y if the products are empty, so such a y is created zeroed
+        create = create_empty_vector_stack if x_check else create_zero_vector_stack
+        y = create(get_batch_size('A', batch_A, 'x', batch_x), y_check, A.dtype)
+
+    # continue getting dimensions of the parameters
+    batch_y, y_length = get_vector_stack_dimensions('y', y)
+    batch = get_batch_size('A', batch_A, 'x', batch_x, 'y', batch_y)
+
+    # ensure the parameters are appropriate for the desired operation
+    check_equal_sizes('A', x_check, 'x', x_length)
+    check_equal_sizes('A', y_check, 'y', y_length)
+
+    # determine which CBLAS subroutine to call and which ctypes data type to use
+    cblas_func, ctype_dtype = get_cblas_info('gemv', (A.dtype, x.dtype, y.dtype))
+
+    if batch == 0:
+        return y
+
+    # determine the order in which the matrices of A are stored and the layouts of the vectors
+    order, lda, stride_a = get_stack_layout('A', A)
+    x_address, inc_x, stride_x = get_vector_stack_layout('x', x, x_length)
+    y_address, inc_y, stride_y = get_vector_stack_layout('y', y, y_length)
+    check_unshared_output('y', y, batch, stride_y)
+
+    # perform small problems with NumPy over the whole batch
+    if max(m_A, n_A) <= NUMPY_BATCHED_SIZES['gemv']:
+        product = matmul(apply_trans_stack(A, cblas_trans_a), x[..., None])[..., 0]
+        y[...] = alpha * product if beta == 0 else beta * y + alpha * product
+        return y
+
+    # call CBLAS using ctypes for every matrix and vector of the stacks
+    call_cblas_batched('gemv', y.dtype, cblas_func,
+                       [order, cblas_trans_a, m_A, n_A, alpha, None, lda, None, inc_x, beta, None,
+                        inc_y],
+                       ((5, A.ctypes.data, stride_a), (7, x_address, stride_x),
+                        (10, y_address, stride_y)),
+                       batch, num_threads)
+
+    return y  # y is also overwritten
@@ -0,0 +1,110 @@
+"""
+
+    Copyright (c) 2014-2015-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from ..helpers import (get_vector_dimensions, get_vector_layout, get_square_matrix_dimension,
+                       get_cblas_info, check_equal_sizes, create_zero_matrix, convert_uplo,
+                       get_matrix_layout)
+
+
+def her2(x, y, A=None, uplo='u', alpha=1.0, lda=None, inc_x=1, inc_y=1):
+    """
+    Perform a Hermitian rank-2 update operation.
+
+    A := A + alpha * x * y_H + conj(alpha) * y * x_H
+
+    where alpha is a scalar, A is a Hermitian matrix, x and y are general column vectors, and x_H
+    and y_H are their conjugate transposes. Only complex dtypes are supported.
+
+    The uplo argument indicates whether the lower or upper triangle of A is to be referenced and
+    updated by the operation.
+
+    Vectors x and y can be passed in as either row or column vectors. If necessary, an implicit
+    transposition occurs.
+
+    If matrix A is not provided, a zero matrix of the appropriate size and type is created
+    and returned. In such a case, lda is automatically set to the number of columns in the
+    newly created matrix A.
+
+    Matrix A may be stored in either row-major or column-major order, such as a block sliced out of
+    a larger matrix or a transposed view of one, and is never copied. Vectors may be any view whose
+    elements are evenly spaced in memory, such as a column sliced out of a matrix or a reversed
+    view, and are never copied either.
+
+    Args:
+        x:        1D or 2D NumPy ndarray or matrix representing vector x
+        y:        1D or 2D NumPy ndarray or matrix representing vector y
+
+        --optional arguments--
+
+        A:        2D NumPy matrix or ndarray representing matrix A
+                      < default is the zero matrix >
+        uplo:     'u'  if the upper triangle of A is to be used
+                  'l'  if the lower triangle of A is to be used
+                      < default is 'u' >
+        alpha:    scalar alpha
+                      < default is 1.0 >
+        lda:      leading dimension of A (must be >= # of cols in A, or >= # of rows in A if A is
+                  stored in column-major order)
+                      < default is the spacing in memory of the rows (or columns) of A >
+        inc_x:    stride of x (increment for the elements of x)
+                      < default is 1 >
+        inc_y:    stride of y (increment for the elements of y)
+                      < default is 1 >
+
+    Returns:
+        Matrix A (which is also overwritten)
+
+    Raises:
+        ValueError: if any of the following conditions occur:
+                    - A is not a 2D NumPy ndarray or NumPy matrix
+                    - x or y is not a 1D NumPy ndarray or a 2D NumPy ndarray or matrix
+                    - A, x, and y do not have the same dtype or that dtype is not supported
+                    - x or y is not a vector
+                    - the effective length of either x or y does not conform to the dimensions of A
+                    - uplo is not equal to one of the following: 'u', 'U', 'l', 'L'
+    """
+
+    # get the dimensions of the parameters
+    m_x, n_x, x_length = get_vector_dimensions('x', x, inc_x)
+    m_y, n_y, y_length = get_vector_dimensions('y', y, inc_y)
+
+    # if no matrix A is given, create a zero matrix of appropriate size with the same dtype as x
+    if A is None:
+        A = create_zero_matrix(x_length, x_length, x.dtype, type(x))
+        lda = None
+
+    # continue getting dimensions of the parameters
+    dim_A = get_square_matrix_dimension('A', A)
+
+    # determine the order in which A is stored and assign a default value to lda if necessary
+    order, default_lda = get_matrix_layout('A', A)
+    if lda is None:
+        lda = default_lda
+
+    # ensure the parameters are appropriate for the operation
+    check_equal_sizes('A', dim_A, 'x', x_length)
+    check_equal_sizes('A', dim_A, 'y', y_length)
+
+    # convert to appropriate CBLAS value
+    cblas_uplo = convert_uplo(uplo)
+
+    # get the address and CBLAS increment of x and y from their NumPy strides
+    x_address, inc_x = get_vector_layout('x', x, x_length, inc_x)
+    y_address, inc_y = get_vector_layout('y', y, y_length, inc_y)
+
+    # determine which CBLAS subroutine to call and which ctypes data type to use
+    cblas_func, data_type = get_cblas_info('her2', (A.dtype, x.dtype, y.dtype))
+
+    # call CBLAS using ctypes
+    cblas_func(order, cblas_uplo, dim_A, alpha, x_address, inc_x,
+               y_address, inc_y, A.ctypes.data, lda)
+
+    return A  # A is also overwritten, so only useful if no A was provided
\ No newline at end of file
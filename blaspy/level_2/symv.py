@@ -9,9 +9,9 @@
 
 """
 
-from ..helpers import (get_square_matrix_dimension, get_vector_dimensions, create_similar_zero_vector,
-                       check_equal_sizes, convert_uplo, get_cblas_info, ROW_MAJOR)
-from ctypes import c_int, POINTER
+from ..helpers import (get_square_matrix_dimension, get_vector_dimensions, get_vector_layout,
+                       create_similar_empty_vector, check_equal_sizes, convert_uplo, get_cblas_info,
+                       get_matrix_layout)
 
 
 def symv(A, x, y=None, uplo='u', alpha=1.0, beta=1.0, lda=None, inc_x=1, inc_y=1):
@@ -32,13 +32,18 @@ def symv(A, x, y=None, uplo='u', alpha=1.0, beta=1.0, lda=None, inc_x=1, inc_y=1
     Vector y defaults to the zero vector of the appropriate size, orientation, and type if vector y is not
     provided; however, the stride of y becomes fixed at 1 and the parameter inc_y is ignored.
 
+    Matrix A may be stored in either row-major or column-major order, such as a block sliced out of
+    a larger matrix or a transposed view of one, and is never copied. Vectors may be any view whose
+    elements are evenly spaced in memory, such as a column sliced out of a matrix or a reversed
+    view, and are never copied either.
+
     Args:
         A:        2D NumPy matrix or ndarray representing matrix A
-        x:        2D NumPy matrix or ndarray representing vector x
+        x:        1D or 2D NumPy ndarray or matrix representing vector x
 
         --optional arguments--
 
-        y:        2D NumPy matrix or ndarray representing vector y
+        y:        1D or 2D NumPy ndarray or matrix representing vector y
                       < default is zero vector >
         uplo:     'u'  if the upper triangular part of A is to be used
                   'l'  if the lower triangular part of A is to be used
@@ -47,8 +52,9 @@ def symv(A, x, y=None, uplo='u', alpha=1.0, beta=1.0, lda=None, inc_x=1, inc_y=1
                       < default is 1.0 >
         beta:     scalar beta
                       < default is 1.0 >
-        lda:      leading dimension of A (must be >= # of columns in A)
-                      < default is the number of columns in A >
+        lda:      leading dimension of A (must be >= # of cols in A, or >= # of rows in A if A is
+                  stored in column-major order)
+                      < default is the spacing in memory of the rows (or columns) of A >
         inc_x:    stride of x (increment for the elements of x)
                       < default is 1 >
         inc_y:    stride of y (increment for the elements of y)
@@ -59,7 +65,8 @@ def symv(A, x, y=None, uplo='u', alpha=1.0, beta=1.0, lda=None, inc_x=1, inc_y=1
 
     Raises:
         ValueError: if any of the following conditions occur:
-                        - A, x, or y is not a 2D NumPy ndarray or NumPy matrix
+                        - A is not a 2D NumPy ndarray or NumPy matrix
+                        - x or y is not a 1D NumPy ndarray or a 2D NumPy ndarray or matrix
                         - A, x, and y do not have the same dtype or that dtype is not supported
                         - A is not a square matrix
                         - x or y is not a vector
@@ -75,14 +82,16 @@ def symv(A, x, y=None, uplo='u', alpha=1.0, beta=1.0, lda=None, inc_x=1, inc_y=1
     # if y is not given, create a zero vector with same orientation and type as x
     if y is None:
         inc_y = 1
-        y = create_similar_zero_vector(x, dim_A)
+        y = create_similar_empty_vector(x, dim_A)
+        beta = 0.
 
     # continue getting dimensions of the parameters
     m_y, n_y, y_length = get_vector_dimensions('y', y, inc_y)
 
-    # assign a default value to lda if necessary (assumes row-major order)
+    # determine the order in which A is stored and assign a default value to lda if necessary
+    order, default_lda = get_matrix_layout('A', A)
     if lda is None:
-        lda = dim_A
+        lda = default_lda
 
     # ensure the parameters are appropriate for the desired operation
     check_equal_sizes('A', dim_A, 'x', x_length)
@@ -91,19 +100,15 @@ def symv(A, x, y=None, uplo='u', alpha=1.0, beta=1.0, lda=None, inc_x=1, inc_y=1
     # convert to appropriate CBLAS value
     cblas_uplo = convert_uplo(uplo)
 
+    # get the address and CBLAS increment of x and y from their NumPy strides
+    x_address, inc_x = get_vector_layout('x', x, x_length, inc_x)
+    y_address, inc_y = get_vector_layout('y', y, y_length, inc_y)
+
     # determine which CBLAS subroutine to call and which ctypes data type to use
     cblas_func, ctype_dtype = get_cblas_info('symv', (A.dtype, x.dtype, y.dtype))
 
-    # create a ctypes POINTER for each vector and matrix
-    ctype_x = POINTER(ctype_dtype * n_x * m_x)
-    ctype_y = POINTER(ctype_dtype * n_y * m_y)
-    ctype_A = POINTER(ctype_dtype * dim_A * dim_A)
-
     # call CBLAS using ctypes
-    cblas_func.argtypes = [c_int, c_int, c_int, ctype_dtype, ctype_A, c_int, ctype_x, c_int,
-                           ctype_dtype, ctype_y, c_int]
-    cblas_func.restype = None
-    cblas_func(ROW_MAJOR, cblas_uplo, dim_A, alpha, A.ctypes.data_as(ctype_A), lda,
-               x.ctypes.data_as(ctype_x), inc_x, beta, y.ctypes.data_as(ctype_y), inc_y)
+    cblas_func(order, cblas_uplo, dim_A, alpha, A.ctypes.data, lda,
+               x_address, inc_x, beta, y_address, inc_y)
 
     return y  # y is also overwritten
\ No newline at end of file
@@ -0,0 +1,135 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from ..helpers import (get_square_stack_dimension, get_vector_stack_dimensions, get_batch_size,
+                       get_stack_layout, get_vector_stack_layout, check_unshared_output,
+                       create_empty_vector_stack, check_equal_sizes, convert_uplo, get_cblas_info,
+                       call_cblas_batched, check_num_threads, UPPER, NUMPY_BATCHED_SIZES)
+from numpy import arange, asarray, matmul, tril, triu
+
+
+def symv_batched(A, x, y=None, uplo='u', alpha=1.0, beta=1.0, num_threads=None):
+    """
+    Perform a batch of independent symmetric matrix-vector multiplication operations.
+
+    y[i] := beta * y[i] + alpha * A[i] * x[i]
+
+    for each i, where alpha and beta are scalars, A[i] is a symmetric matrix, and x[i] and y[i]
+    are general vectors.
+
+    A is a stack of matrices of the same size, i.e. a 3D ndarray indexed as (matrix, row, column),
+    and x and y are stacks of vectors of the same length, i.e. 2D ndarrays indexed as (vector,
+    element). A 2D ndarray or matrix may be passed for A, or a 1D ndarray for x, instead, in which
+    case that matrix or vector is shared by every operation of the batch. The 'uplo' argument has
+    the same meaning as for symv.
+
+    If y is not provided, a stack of zero vectors of the appropriate length and type is created and
+    returned.
+
+    The matrices of A may be stored in either row-major or column-major order and no operand is ever
+    copied. If the matrices are small (at most NUMPY_BATCHED_SIZES['symv'] rows and columns), the
+    whole batch is performed by vectorized NumPy operations. Otherwise the batch is split among up
+    to 'num_threads' threads, each of which calls CBLAS once per operation.
+
+    Args:
+        A:              3D NumPy ndarray representing the stack of matrices A[i], or 2D NumPy
+                        ndarray or matrix shared by every operation
+        x:              2D NumPy ndarray representing the stack of vectors x[i], or 1D NumPy
+                        ndarray shared by every operation
+
+        --optional arguments--
+
+        y:              2D NumPy ndarray representing the stack of vectors y[i]
+                            < default is a stack of zero vectors >
+        uplo:           'u'  if the upper triangular part of each A[i] is to be used
+                        'l'  if the lower triangular part of each A[i] is to be used
+                            < default is 'u' >
+        alpha:          scalar alpha
+                            < default is 1.0 >
+        beta:           scalar beta
+                            < default is 1.0 >
+        num_threads:    largest number of threads among which to split the batch
+                            < default is the number of CPUs >
+
+    Returns:
+        Stack y (which is also overwritten)
+
+    Raises:
+        ValueError: if any of the following conditions occur:
+                    - A is not a 3D NumPy ndarray or a 2D NumPy ndarray or matrix
+                    - x or y is not a 2D NumPy ndarray or a 1D NumPy ndarray
+                    - the stacks do not hold the same number of matrices and vectors, or neither A
+                      nor x is a stack when y is not provided
+                    - A, x, and y do not have the same dtype or that dtype is not supported
+                    - the matrices of A are not square
+                    - the lengths of the vectors of x and y do not conform to the dimension of the
+                      matrices of A
+                    - the matrices of A are stored in neither row-major nor column-major order,
+                      the elements of the vectors are not evenly spaced in memory, or the vectors
+                      of y overlap in memory
+                    - 'uplo' is not equal to one of the following: 'u', 'U', 'l', 'L'
+                    - 'num_threads' is not an integer >= 1
+    """
+
+    # ensure the number of threads is valid
+    check_num_threads(num_threads)
+
+    # convert to appropriate CBLAS value
+    cblas_uplo = convert_uplo(uplo)
+
+    # get the dimensions of the parameters
+    batch_A, dim_A = get_square_stack_dimension('A', A)
+    batch_x, x_length = get_vector_stack_dimensions('x', x)
+
+    # if y is not given, create a stack of vectors with same type as A, computed with beta 0
+    if y is None:
+        beta = 0.
+        y = create_empty_vector_stack(get_batch_size('A', batch_A, 'x', batch_x), dim_A, A.dtype)
+
+    # continue getting dimensions of the parameters
+    batch_y, y_length = get_vector_stack_dimensions('y', y)
+    batch = get_batch_size('A', batch_A, 'x', batch_x, 'y', batch_y)
+
+    # ensure the parameters are appropriate for the desired operation
+    check_equal_sizes('A', dim_A, 'x', x_length)
+    check_equal_sizes('A', dim_A, 'y', y_length)
+
+    # determine which CBLAS subroutine to call and which ctypes data type to use
+    cblas_func, ctype_dtype = get_cblas_info('symv', (A.dtype, x.dtype, y.dtype))
+
+    if batch == 0:
+        return y
+
+    # determine the order in which the matrices of A are stored and the layouts of the vectors
+    order, lda, stride_a = get_stack_layout('A', A)
+    x_address, inc_x, stride_x = get_vector_stack_layout('x', x, x_length)
+    y_address, inc_y, stride_y = get_vector_stack_layout('y', y, y_length)
+    check_unshared_output('y', y, batch, stride_y)
+
+    # perform small problems with NumPy over the whole batch, multiplying by the referenced
+    # triangle and by its transpose and subtracting the doubly counted diagonal
+    if dim_A <= NUMPY_BATCHED_SIZES['symv']:
+        A = asarray(A)
+        T = triu(A) if cblas_uplo == UPPER else tril(A)
+        product = (matmul(T, x[..., None]) + matmul(T.swapaxes(-1, -2), x[..., None]))[..., 0]
+        product -= A[..., arange(dim_A), arange(dim_A)] * x
+        y[...] = alpha * product if beta == 0 else beta * y + alpha * product
+        return y
+
+    # call CBLAS using ctypes for every matrix and vector of the stacks
+    call_cblas_batched('symv', y.dtype, cblas_func,
+                       [order, cblas_uplo, dim_A, alpha, None, lda, None, inc_x, beta, None,
+                        inc_y],
+                       ((4, A.ctypes.data, stride_a), (6, x_address, stride_x),
+                        (9, y_address, stride_y)),
+                       batch, num_threads)
+
+    return y  # y is also overwritten
@@ -9,9 +9,9 @@
 
 """
 
-from ..helpers import (get_vector_dimensions, get_square_matrix_dimension, get_cblas_info,
-                       check_equal_sizes, create_zero_matrix, convert_uplo, ROW_MAJOR)
-from ctypes import c_int, POINTER
+from ..helpers import (get_vector_dimensions, get_vector_layout, get_square_matrix_dimension,
+                       get_cblas_info, check_equal_sizes, create_zero_matrix, convert_uplo,
+                       get_matrix_layout)
 
 
 def syr(x, A=None, uplo='u', alpha=1.0, lda=None, inc_x=1):
@@ -32,8 +32,13 @@ def syr(x, A=None, uplo='u', alpha=1.0, lda=None, inc_x=1):
     and returned. In such a case, lda is automatically set to the number of columns in the
     newly created matrix A.
 
+    Matrix A may be stored in either row-major or column-major order, such as a block sliced out of
+    a larger matrix or a transposed view of one, and is never copied. Vectors may be any view whose
+    elements are evenly spaced in memory, such as a column sliced out of a matrix or a reversed
+    view, and are never copied either.
+
     Args:
-        x:        2D NumPy matrix or ndarray representing vector x
+        x:        1D or 2D NumPy ndarray or matrix representing vector x
 
         --optional arguments--
 
@@ -44,8 +49,9 @@ def syr(x, A=None, uplo='u', alpha=1.0, lda=None, inc_x=1):
                       < default is 'u' >
         alpha:    scalar alpha
                       < default is 1.0 >
-        lda:      leading dimension of A (must be >= # of cols in A)
-                      < default is the number of columns in A >
+        lda:      leading dimension of A (must be >= # of cols in A, or >= # of rows in A if A is
+                  stored in column-major order)
+                      < default is the spacing in memory of the rows (or columns) of A >
         inc_x:    stride of x (increment for the elements of x)
                       < default is 1 >
         inc_y:    stride of y (increment for the elements of y)
@@ -56,7 +62,8 @@ def syr(x, A=None, uplo='u', alpha=1.0, lda=None, inc_x=1):
 
     Raises:
         ValueError: if any of the following conditions occur:
-                    - A or x is not a 2D NumPy ndarray or NumPy matrix
+                    - A is not a 2D NumPy ndarray or NumPy matrix
+                    - x is not a 1D NumPy ndarray or a 2D NumPy ndarray or matrix
                     - A and x do not have the same dtype or that dtype is not supported
                     - x is not a vector
                     - the effective length of x does not conform to the dimensions of A
@@ -74,9 +81,10 @@ def syr(x, A=None, uplo='u', alpha=1.0, lda=None, inc_x=1):
     # continue getting dimensions of the parameters
     dim_A = get_square_matrix_dimension('A', A)
 
-    # assign a default value to lda if necessary (assumes row-major order)
+    # determine the order in which A is stored and assign a default value to lda if necessary
+    order, default_lda = get_matrix_layout('A', A)
     if lda is None:
-        lda = dim_A
+        lda = default_lda
 
     # ensure the parameters are appropriate for the operation
     check_equal_sizes('A', dim_A, 'x', x_length)
@@ -84,17 +92,14 @@ def syr(x, A=None, uplo='u', alpha=1.0, lda=None, inc_x=1):
     # convert to appropriate CBLAS value
     cblas_uplo = convert_uplo(uplo)
 
+    # get the address and CBLAS increment of x from its NumPy strides
+    x_address, inc_x = get_vector_layout('x', x, x_length, inc_x)
+
     # determine which CBLAS subroutine to call and which ctypes data type to use
     cblas_func, data_type = get_cblas_info('syr', (A.dtype, x.dtype))
 
-    # create a ctypes POINTER for each vector and matrix
-    ctype_x = POINTER(data_type * n_x * m_x)
-    ctype_A = POINTER(data_type * dim_A * dim_A)
-
     # call CBLAS using ctypes
-    cblas_func.argtypes = [c_int, c_int, c_int, data_type, ctype_x, c_int, ctype_A, c_int]
-    cblas_func.restype = None
-    cblas_func(ROW_MAJOR, cblas_uplo, dim_A, alpha, x.ctypes.data_as(ctype_x), inc_x,
-               A.ctypes.data_as(ctype_A), lda)
+    cblas_func(order, cblas_uplo, dim_A, alpha, x_address, inc_x,
+               A.ctypes.data, lda)
 
     return A  # A is also overwritten
\ No newline at end of file
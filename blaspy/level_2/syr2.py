@@ -9,9 +9,9 @@
 
 """
 
-from ..helpers import (get_vector_dimensions, get_square_matrix_dimension, get_cblas_info,
-                       check_equal_sizes, create_zero_matrix, convert_uplo, ROW_MAJOR)
-from ctypes import c_int, POINTER
+from ..helpers import (get_vector_dimensions, get_vector_layout, get_square_matrix_dimension,
+                       get_cblas_info, check_equal_sizes, create_zero_matrix, convert_uplo,
+                       get_matrix_layout)
 
 
 def syr2(x, y, A=None, uplo='u', alpha=1.0, lda=None, inc_x=1, inc_y=1):
@@ -32,9 +32,14 @@ def syr2(x, y, A=None, uplo='u', alpha=1.0, lda=None, inc_x=1, inc_y=1):
     and returned. In such a case, lda is automatically set to the number of columns in the
     newly created matrix A.
 
+    Matrix A may be stored in either row-major or column-major order, such as a block sliced out of
+    a larger matrix or a transposed view of one, and is never copied. Vectors may be any view whose
+    elements are evenly spaced in memory, such as a column sliced out of a matrix or a reversed
+    view, and are never copied either.
+
     Args:
-        x:        2D NumPy matrix or ndarray representing vector x
-        y:        2D NumPy matrix or ndarray representing vector y
+        x:        1D or 2D NumPy ndarray or matrix representing vector x
+        y:        1D or 2D NumPy ndarray or matrix representing vector y
 
         --optional arguments--
 
@@ -45,8 +50,9 @@ def syr2(x, y, A=None, uplo='u', alpha=1.0, lda=None, inc_x=1, inc_y=1):
                       < default is 'u' >
         alpha:    scalar alpha
                       < default is 1.0 >
-        lda:      leading dimension of A (must be >= # of cols in A)
-                      < default is the number of columns in A >
+        lda:      leading dimension of A (must be >= # of cols in A, or >= # of rows in A if A is
+                  stored in column-major order)
+                      < default is the spacing in memory of the rows (or columns) of A >
         inc_x:    stride of x (increment for the elements of x)
                       < default is 1 >
         inc_y:    stride of y (increment for the elements of y)
@@ -57,7 +63,8 @@ def syr2(x, y, A=None, uplo='u', alpha=1.0, lda=None, inc_x=1, inc_y=1):
 
     Raises:
         ValueError: if any of the following conditions occur:
-                    - A, x, or y is not a 2D NumPy ndarray or NumPy matrix
+                    - A is not a 2D NumPy ndarray or NumPy matrix
+                    - x or y is not a 1D NumPy ndarray or a 2D NumPy ndarray or matrix
                     - A, x, and y do not have the same dtype or that dtype is not supported
                     - x or y is not a vector
                     - the effective length of either x or y does not conform to the dimensions of A
@@ -76,9 +83,10 @@ def syr2(x, y, A=None, uplo='u', alpha=1.0, lda=None, inc_x=1, inc_y=1):
     # continue getting dimensions of the parameters
     dim_A = get_square_matrix_dimension('A', A)
 
-    # assign a default value to lda if necessary (assumes row-major order)
+    # determine the order in which A is stored and assign a default value to lda if necessary
+    order, default_lda = get_matrix_layout('A', A)
     if lda is None:
-        lda = dim_A
+        lda = default_lda
 
     # ensure the parameters are appropriate for the operation
     check_equal_sizes('A', dim_A, 'x', x_length)
@@ -87,19 +95,15 @@ def syr2(x, y, A=None, uplo='u', alpha=1.0, lda=None, inc_x=1, inc_y=1):
     # convert to appropriate CBLAS value
     cblas_uplo = convert_uplo(uplo)
 
+    # get the address and CBLAS increment of x and y from their NumPy strides
+    x_address, inc_x = get_vector_layout('x', x, x_length, inc_x)
+    y_address, inc_y = get_vector_layout('y', y, y_length, inc_y)
+
     # determine which CBLAS subroutine to call and which ctypes data type to use
     cblas_func, data_type = get_cblas_info('syr2', (A.dtype, x.dtype, y.dtype))
 
-    # create a ctypes POINTER for each vector and matrix
-    ctype_x = POINTER(data_type * n_x * m_x)
-    ctype_y = POINTER(data_type * n_y * m_y)
-    ctype_A = POINTER(data_type * dim_A * dim_A)
-
     # call CBLAS using ctypes
-    cblas_func.argtypes = [c_int, c_int, c_int, data_type, ctype_x, c_int, ctype_y, c_int,
-                           ctype_A, c_int]
-    cblas_func.restype = None
-    cblas_func(ROW_MAJOR, cblas_uplo, dim_A, alpha, x.ctypes.data_as(ctype_x), inc_x,
-               y.ctypes.data_as(ctype_y), inc_y, A.ctypes.data_as(ctype_A), lda)
+    cblas_func(order, cblas_uplo, dim_A, alpha, x_address, inc_x,
+               y_address, inc_y, A.ctypes.data, lda)
 
     return A  # A is also overwritten, so only useful if no A was provided
\ No newline at end of file
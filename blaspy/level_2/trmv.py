@@ -9,9 +9,9 @@
 
 """
 
-from ..helpers import (get_vector_dimensions, get_square_matrix_dimension, get_cblas_info,
-                       check_equal_sizes, convert_uplo, convert_trans, convert_diag, ROW_MAJOR)
-from ctypes import c_int, POINTER
+from ..helpers import (get_vector_dimensions, get_vector_layout, get_square_matrix_dimension,
+                       get_cblas_info, check_equal_sizes, convert_uplo, convert_trans, convert_diag,
+                       get_matrix_layout)
 
 
 def trmv(A, x, uplo='u', trans_a='n', diag='n', lda=None, inc_x=1):
@@ -24,13 +24,19 @@ def trmv(A, x, uplo='u', trans_a='n', diag='n', lda=None, inc_x=1):
 
     The 'uplo' argument indicates whether the lower or upper triangle of A is to be referenced and
     updated by the operation. The 'trans_a' argument allows the computation to proceed as if A is
-    transposed. The 'diag' argument indicates whether the diagonal of A is unit or non-unit.
+    transposed or conjugate transposed. The 'diag' argument indicates whether the diagonal of A is
+    unit or non-unit.
 
     Vector x can be passed in as either row or column vector. If necessary, an implicit
     transposition occurs.
 
+    Matrix A may be stored in either row-major or column-major order, such as a block sliced out of
+    a larger matrix or a transposed view of one, and is never copied. Vectors may be any view whose
+    elements are evenly spaced in memory, such as a column sliced out of a matrix or a reversed
+    view, and are never copied either.
+
     Args:
-        x:          2D NumPy matrix or ndarray representing vector x
+        x:          1D or 2D NumPy ndarray or matrix representing vector x
         A:          2D NumPy matrix or ndarray representing matrix A
 
         --optional arguments--
@@ -40,12 +46,14 @@ def trmv(A, x, uplo='u', trans_a='n', diag='n', lda=None, inc_x=1):
                         < default is 'u' >
         trans_a:    'n'  if the operation is to proceed normally
                     't'  if the operation is to proceed as if A is transposed
+                    'c'  if the operation is to proceed as if A is conjugate transposed
                         < default is 'n' >
         diag:       'n'  if the diagonal of A is non-unit
                     'u'  if the diagonal of A is unit
                         < default is 'n' >
-        lda:        leading dimension of A (must be >= # of cols in A)
-                        < default is the number of columns in A >
+        lda:        leading dimension of A (must be >= # of cols in A, or >= # of rows in A if A is
+                    stored in column-major order)
+                        < default is the spacing in memory of the rows (or columns) of A >
         inc_x:      stride of x (increment for the elements of x)
                         < default is 1 >
 
@@ -54,7 +62,8 @@ def trmv(A, x, uplo='u', trans_a='n', diag='n', lda=None, inc_x=1):
 
     Raises:
         ValueError: if any of the following conditions occur:
-                    - A or x is not a 2D NumPy ndarray or NumPy matrix
+                    - A is not a 2D NumPy ndarray or NumPy matrix
+                    - x is not a 1D NumPy ndarray or a 2D NumPy ndarray or matrix
                     - A and x do not have the same dtype or that dtype is not supported
                     - A is not a square matrix
                     - x is not a vector
@@ -68,9 +77,10 @@ def trmv(A, x, uplo='u', trans_a='n', diag='n', lda=None, inc_x=1):
     m_x, n_x, x_length = get_vector_dimensions('x', x, inc_x)
     dim_A = get_square_matrix_dimension('A', A)
 
-    # assign a default value to lda if necessary (assumes row-major order)
+    # determine the order in which A is stored and assign a default value to lda if necessary
+    order, default_lda = get_matrix_layout('A', A)
     if lda is None:
-        lda = dim_A
+        lda = default_lda
 
     # ensure the parameters are appropriate for the operation
     check_equal_sizes('A', dim_A, 'x', x_length)
@@ -80,17 +90,14 @@ def trmv(A, x, uplo='u', trans_a='n', diag='n', lda=None, inc_x=1):
     cblas_trans_a = convert_trans(trans_a)
     cblas_diag = convert_diag(diag)
 
+    # get the address and CBLAS increment of x from its NumPy strides
+    x_address, inc_x = get_vector_layout('x', x, x_length, inc_x)
+
     # determine which CBLAS subroutine to call and which ctypes data type to use
     cblas_func, data_type = get_cblas_info('trmv', (A.dtype, x.dtype))
 
-    # create a ctypes POINTER for each vector and matrix
-    ctype_x = POINTER(data_type * n_x * m_x)
-    ctype_A = POINTER(data_type * dim_A * dim_A)
-
     # call CBLAS using ctypes
-    cblas_func.argtypes = [c_int, c_int, c_int, c_int, c_int, ctype_A, c_int, ctype_x, c_int]
-    cblas_func.restype = None
-    cblas_func(ROW_MAJOR, cblas_uplo, cblas_trans_a, cblas_diag, dim_A,
-               A.ctypes.data_as(ctype_A), lda, x.ctypes.data_as(ctype_x), inc_x)
+    cblas_func(order, cblas_uplo, cblas_trans_a, cblas_diag, dim_A,
+               A.ctypes.data, lda, x_address, inc_x)
 
     return x  # x is also overwritten
\ No newline at end of file
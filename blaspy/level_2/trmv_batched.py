@@ -0,0 +1,123 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from ..helpers import (get_square_stack_dimension, get_vector_stack_dimensions, get_batch_size,
+                       get_stack_layout, get_vector_stack_layout, check_unshared_output,
+                       check_equal_sizes, convert_uplo, convert_trans, convert_diag,
+                       apply_trans_stack, get_cblas_info, call_cblas_batched, check_num_threads,
+                       UPPER, UNIT, NUMPY_BATCHED_SIZES)
+from numpy import arange, asarray, matmul, tril, triu
+
+
+def trmv_batched(A, x, uplo='u', trans_a='n', diag='n', num_threads=None):
+    """
+    Perform a batch of independent triangular matrix-vector multiplication operations.
+
+    x[i] := A[i] * x[i]
+
+    for each i, where A[i] is a triangular matrix and x[i] is a general vector.
+
+    A is a stack of matrices of the same size, i.e. a 3D ndarray indexed as (matrix, row, column),
+    and x is a stack of vectors of the same length, i.e. a 2D ndarray indexed as (vector, element).
+    A 2D ndarray or matrix may be passed for A instead, in which case that matrix is shared by every
+    operation of the batch. The 'uplo', 'trans_a', and 'diag' arguments have the same meaning as
+    for trmv.
+
+    The matrices of A may be stored in either row-major or column-major order and no operand is ever
+    copied. If the matrices are small (at most NUMPY_BATCHED_SIZES['trmv'] rows and columns), the
+    whole batch is performed by vectorized NumPy operations. Otherwise the batch is split among up
+    to 'num_threads' threads, each of which calls CBLAS once per operation.
+
+    Args:
+        A:              3D NumPy ndarray representing the stack of matrices A[i], or 2D NumPy
+                        ndarray or matrix shared by every operation
+        x:              2D NumPy ndarray representing the stack of vectors x[i]
+
+        --optional arguments--
+
+        uplo:           'u'  if the upper triangular part of each A[i] is to be used
+                        'l'  if the lower triangular part of each A[i] is to be used
+                            < default is 'u' >
+        trans_a:        'n'  if the operation is to proceed as if each A[i] is not transposed
+                        't'  if the operation is to proceed as if each A[i] is transposed
+                        'c'  if the operation is to proceed as if each A[i] is conjugate transposed
+                            < default is 'n' >
+        diag:           'n'  if the diagonal of each A[i] is non-unit
+                        'u'  if the diagonal of each A[i] is unit
+                            < default is 'n' >
+        num_threads:    largest number of threads among which to split the batch
+                            < default is the number of CPUs >
+
+    Returns:
+        Stack x (which is also overwritten)
+
+    Raises:
+        ValueError: if any of the following conditions occur:
+                    - A is not a 3D NumPy ndarray or a 2D NumPy ndarray or matrix
+                    - x is not a 2D NumPy ndarray
+                    - the stacks do not hold the same number of matrices and vectors
+                    - A and x do not have the same dtype or that dtype is not supported
+                    - the matrices of A are not square
+                    - the length of the vectors of x does not equal the dimension of the matrices
+                      of A
+                    - the matrices of A are stored in neither row-major nor column-major order,
+                      the elements of the vectors are not evenly spaced in memory, or the vectors
+                      of x overlap in memory
+                    - 'uplo' is not equal to one of the following: 'u', 'U', 'l', 'L'
+                    - 'trans_a' is not equal to one of the following: 'n', 'N', 't', 'T', 'c', 'C'
+                    - 'diag' is not equal to one of the following: 'n', 'N', 'u', 'U'
+                    - 'num_threads' is not an integer >= 1
+    """
+
+    # ensure the number of threads is valid
+    check_num_threads(num_threads)
+
+    # convert to appropriate CBLAS values
+    cblas_uplo = convert_uplo(uplo)
+    cblas_trans_a = convert_trans(trans_a)
+    cblas_diag = convert_diag(diag)
+
+    # get the dimensions of the parameters
+    batch_A, dim_A = get_square_stack_dimension('A', A)
+    batch_x, x_length = get_vector_stack_dimensions('x', x)
+    batch = get_batch_size('A', batch_A, 'x', batch_x)
+
+    # ensure the parameters are appropriate for the operation
+    check_equal_sizes('A', dim_A, 'x', x_length)
+
+    # determine which CBLAS subroutine to call and which ctypes data type to use
+    cblas_func, ctype_dtype = get_cblas_info('trmv', (A.dtype, x.dtype))
+
+    if batch == 0:
+        return x
+
+    # determine the order in which the matrices of A are stored and the layout of the vectors
+    order, lda, stride_a = get_stack_layout('A', A)
+    x_address, inc_x, stride_x = get_vector_stack_layout('x', x, x_length)
+    check_unshared_output('x', x, batch, stride_x)
+
+    # perform small problems with NumPy over the whole batch, using only the referenced triangle
+    # (and diagonal) of each matrix
+    if dim_A <= NUMPY_BATCHED_SIZES['trmv']:
+        T = triu(asarray(A)) if cblas_uplo == UPPER else tril(asarray(A))
+        if cblas_diag == UNIT:
+            T[..., arange(dim_A), arange(dim_A)] = 1
+        x[...] = matmul(apply_trans_stack(T, cblas_trans_a), x[..., None])[..., 0]
+        return x
+
+    # call CBLAS using ctypes for every matrix and vector of the stacks
+    call_cblas_batched('trmv', x.dtype, cblas_func,
+                       [order, cblas_uplo, cblas_trans_a, cblas_diag, dim_A, None, lda, None,
+                        inc_x],
+                       ((5, A.ctypes.data, stride_a), (7, x_address, stride_x)),
+                       batch, num_threads)
+
+    return x  # x is also overwritten
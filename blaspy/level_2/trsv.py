@@ -9,9 +9,9 @@
 
 """
 
-from ..helpers import (get_vector_dimensions, get_square_matrix_dimension, get_cblas_info,
-                       check_equal_sizes, convert_uplo, convert_trans, convert_diag, ROW_MAJOR)
-from ctypes import c_int, POINTER
+from ..helpers import (get_vector_dimensions, get_vector_layout, get_square_matrix_dimension,
+                       get_cblas_info, check_equal_sizes, convert_uplo, convert_trans, convert_diag,
+                       get_matrix_layout)
 
 
 def trsv(A, b, uplo='u', trans_a='n', diag='n', lda=None, inc_b=1):
@@ -28,7 +28,8 @@ def trsv(A, b, uplo='u', trans_a='n', diag='n', lda=None, inc_b=1):
 
     The 'uplo' argument indicates whether the lower or upper triangle of A is to be referenced and
     updated by the operation. The 'trans_a' argument allows the computation to proceed as if A is
-    transposed. The 'diag' argument indicates whether the diagonal of A is unit or non-unit.
+    transposed or conjugate transposed. The 'diag' argument indicates whether the diagonal of A is
+    unit or non-unit.
 
     Vector b can be passed in as either row or column vector. If necessary, an implicit
     transposition occurs.
@@ -36,9 +37,14 @@ def trsv(A, b, uplo='u', trans_a='n', diag='n', lda=None, inc_b=1):
     WARNING: This function does not test for singularity or near-singularity. Such tests should
              be performed prior to calling this function.
 
+    Matrix A may be stored in either row-major or column-major order, such as a block sliced out of
+    a larger matrix or a transposed view of one, and is never copied. Vectors may be any view whose
+    elements are evenly spaced in memory, such as a column sliced out of a matrix or a reversed
+    view, and are never copied either.
+
     Args:
         A:          2D NumPy matrix or ndarray representing matrix A
-        b:          2D NumPy matrix or ndarray representing vector b
+        b:          1D or 2D NumPy ndarray or matrix representing vector b
 
         --optional arguments--
 
@@ -47,18 +53,21 @@ def trsv(A, b, uplo='u', trans_a='n', diag='n', lda=None, inc_b=1):
                         < default is 'u' >
         trans_a:    'n'  if the operation is to proceed normally
                     't'  if the operation is to proceed as if A is transposed
+                    'c'  if the operation is to proceed as if A is conjugate transposed
                         < default is 'n' >
         diag:       'n'  if the diagonal of A is non-unit
                     'u'  if the diagonal of A is unit
                         < default is 'n' >
-        lda:        leading dimension of A (must be >= # of cols in A)
-                        < default is the number of columns in A >
+        lda:        leading dimension of A (must be >= # of cols in A, or >= # of rows in A if A is
+                    stored in column-major order)
+                        < default is the spacing in memory of the rows (or columns) of A >
         inc_b:      stride of b (increment for the elements of b)
                         < default is 1 >
 
     Raises:
         ValueError: if any of the following conditions occur:
-                    - A or b is not a 2D NumPy ndarray or NumPy matrix
+                    - A is not a 2D NumPy ndarray or NumPy matrix
+                    - b is not a 1D NumPy ndarray or a 2D NumPy ndarray or matrix
                     - A and b do not have the same dtype or that dtype is not supported
                     - A is not a square matrix
                     - b is not a vector
@@ -80,24 +89,22 @@ def trsv(A, b, uplo='u', trans_a='n', diag='n', lda=None, inc_b=1):
     m_b, n_b, b_length = get_vector_dimensions('b', b, inc_b)
     dim_A = get_square_matrix_dimension('A', A)
 
-    # assign a default value to lda if necessary (assumes row-major order)
+    # determine the order in which A is stored and assign a default value to lda if necessary
+    order, default_lda = get_matrix_layout('A', A)
     if lda is None:
-        lda = dim_A
+        lda = default_lda
 
     # ensure the parameters are appropriate for the operation
     check_equal_sizes('A', dim_A, 'b', b_length)
 
+    # get the address and CBLAS increment of b from its NumPy strides
+    b_address, inc_b = get_vector_layout('b', b, b_length, inc_b)
+
     # determine which CBLAS subroutine to call and which ctypes data type to use
     cblas_func, data_type = get_cblas_info('trsv', (A.dtype, b.dtype))
 
-    # create a ctypes POINTER for each vector and matrix
-    ctype_x = POINTER(data_type * n_b * m_b)
-    ctype_A = POINTER(data_type * dim_A * dim_A)
-
     # call CBLAS using ctypes
-    cblas_func.argtypes = [c_int, c_int, c_int, c_int, c_int, ctype_A, c_int, ctype_x, c_int]
-    cblas_func.restype = None
-    cblas_func(ROW_MAJOR, cblas_uplo, cblas_trans_a, cblas_diag, dim_A,
-               A.ctypes.data_as(ctype_A), lda, b.ctypes.data_as(ctype_x), inc_b)
+    cblas_func(order, cblas_uplo, cblas_trans_a, cblas_diag, dim_A,
+               A.ctypes.data, lda, b_address, inc_b)
 
     return b  # contains the value of x (also written to b)
\ No newline at end of file
@@ -0,0 +1,135 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from ..helpers import (get_square_stack_dimension, get_vector_stack_dimensions, get_batch_size,
+                       get_stack_layout, get_vector_stack_layout, check_unshared_output,
+                       check_equal_sizes, convert_uplo, convert_trans, convert_diag,
+                       apply_trans_stack, get_cblas_info, call_cblas_batched, check_num_threads,
+                       UPPER, NO_TRANS, UNIT, NUMPY_BATCHED_SIZES)
+
+
+def trsv_batched(A, b, uplo='u', trans_a='n', diag='n', num_threads=None):
+    """
+    Perform a batch of independent triangular solve operations.
+
+    A[i] * x[i] = b[i]
+
+    for each i, which is solved by overwriting b[i] with the contents of the solution vector x[i]
+    as follows:
+
+    b[i] := A[i]_inv * b[i]
+
+    where A[i] is a triangular matrix and x[i] and b[i] are general vectors.
+
+    A is a stack of matrices of the same size, i.e. a 3D ndarray indexed as (matrix, row, column),
+    and b is a stack of vectors of the same length, i.e. a 2D ndarray indexed as (vector, element).
+    A 2D ndarray or matrix may be passed for A instead, in which case that matrix is shared by every
+    operation of the batch. The 'uplo', 'trans_a', and 'diag' arguments have the same meaning as
+    for trsv.
+
+    The matrices of A may be stored in either row-major or column-major order and no operand is ever
+    copied. If the matrices are small (at most NUMPY_BATCHED_SIZES['trsv'] rows and columns), the
+    whole batch is solved by substitution with vectorized NumPy operations. Otherwise the batch is
+    split among up to 'num_threads' threads, each of which calls CBLAS once per operation.
+
+    Args:
+        A:              3D NumPy ndarray representing the stack of matrices A[i], or 2D NumPy
+                        ndarray or matrix shared by every operation
+        b:              2D NumPy ndarray representing the stack of vectors b[i]
+
+        --optional arguments--
+
+        uplo:           'u'  if the upper triangular part of each A[i] is to be used
+                        'l'  if the lower triangular part of each A[i] is to be used
+                            < default is 'u' >
+        trans_a:        'n'  if the operation is to proceed as if each A[i] is not transposed
+                        't'  if the operation is to proceed as if each A[i] is transposed
+                        'c'  if the operation is to proceed as if each A[i] is conjugate transposed
+                            < default is 'n' >
+        diag:           'n'  if the diagonal of each A[i] is non-unit
+                        'u'  if the diagonal of each A[i] is unit
+                            < default is 'n' >
+        num_threads:    largest number of threads among which to split the batch
+                            < default is the number of CPUs >
+
+    Returns:
+        Stack of vectors x[i] (which is also written to b)
+
+    Raises:
+        ValueError: if any of the following conditions occur:
+                    - A is not a 3D NumPy ndarray or a 2D NumPy ndarray or matrix
+                    - b is not a 2D NumPy ndarray
+                    - the stacks do not hold the same number of matrices and vectors
+                    - A and b do not have the same dtype or that dtype is not supported
+                    - the matrices of A are not square
+                    - the length of the vectors of b does not equal the dimension of the matrices
+                      of A
+                    - the matrices of A are stored in neither row-major nor column-major order,
+                      the elements of the vectors are not evenly spaced in memory, or the vectors
+                      of b overlap in memory
+                    - 'uplo' is not equal to one of the following: 'u', 'U', 'l', 'L'
+                    - 'trans_a' is not equal to one of the following: 'n', 'N', 't', 'T', 'c', 'C'
+                    - 'diag' is not equal to one of the following: 'n', 'N', 'u', 'U'
+                    - 'num_threads' is not an integer >= 1
+    """
+
+    # ensure the number of threads is valid
+    check_num_threads(num_threads)
+
+    # convert to appropriate CBLAS values
+    cblas_uplo = convert_uplo(uplo)
+    cblas_trans_a = convert_trans(trans_a)
+    cblas_diag = convert_diag(diag)
+
+    # get the dimensions of the parameters
+    batch_A, dim_A = get_square_stack_dimension('A', A)
+    batch_b, b_length = get_vector_stack_dimensions('b', b)
+    batch = get_batch_size('A', batch_A, 'b', batch_b)
+
+    # ensure the parameters are appropriate for the operation
+    check_equal_sizes('A', dim_A, 'b', b_length)
+
+    # determine which CBLAS subroutine to call and which ctypes data type to use
+    cblas_func, ctype_dtype = get_cblas_info('trsv', (A.dtype, b.dtype))
+
+    if batch == 0:
+        return b
+
+    # determine the order in which the matrices of A are stored and the layout of the vectors
+    order, lda, stride_a = get_stack_layout('A', A)
+    b_address, inc_b, stride_b = get_vector_stack_layout('b', b, b_length)
+    check_unshared_output('b', b, batch, stride_b)
+
+    # solve small problems by substitution with NumPy over the whole batch, one element of every
+    # vector at a time, using only the referenced triangle (and diagonal) of each matrix
+    if dim_A <= NUMPY_BATCHED_SIZES['trsv']:
+        M = apply_trans_stack(A, cblas_trans_a)
+        x = b if b.ndim == 2 else b[None]  # a 1D b is a single vector, solved in place
+        if (cblas_uplo == UPPER) == (cblas_trans_a == NO_TRANS):
+            for i in reversed(range(dim_A)):
+                x[:, i] -= (M[..., i, i + 1:] * x[:, i + 1:]).sum(-1)
+                if cblas_diag != UNIT:
+                    x[:, i] /= M[..., i, i]
+        else:
+            for i in range(dim_A):
+                x[:, i] -= (M[..., i, :i] * x[:, :i]).sum(-1)
+                if cblas_diag != UNIT:
+                    x[:, i] /= M[..., i, i]
+        return b
+
+    # call CBLAS using ctypes for every matrix and vector of the stacks
+    call_cblas_batched('trsv', b.dtype, cblas_func,
+                       [order, cblas_uplo, cblas_trans_a, cblas_diag, dim_A, None, lda, None,
+                        inc_b],
+                       ((5, A.ctypes.data, stride_a), (7, b_address, stride_b)),
+                       batch, num_threads)
+
+    return b  # contains the values of x (also written to b)
@@ -14,4 +14,16 @@ from .symm  import symm
 from .syrk  import syrk
 from .syr2k import syr2k
 from .trmm  import trmm
-from .trsm  import trsm
\ No newline at end of file
+from .trsm  import trsm
+from .hemm  import hemm
+from .herk  import herk
+from .her2k import her2k
+
+from .gemm_batched import gemm_batched
+from .symm_batched import symm_batched
+from .syrk_batched import syrk_batched
+from .trmm_batched import trmm_batched
+from .trsm_batched import trsm_batched
+from .gemm_grouped import gemm_grouped
+from .gemm_out_of_core import gemm_out_of_core
+from .multi_gemm import multi_gemm
@@ -9,12 +9,26 @@
 
 """
 
-from ..helpers import (get_matrix_dimensions, create_zero_matrix, check_equal_sizes, convert_trans,
-                       get_cblas_info, ROW_MAJOR, TRANS)
-from ctypes import c_int, POINTER
-
-
-def gemm(A, B, C=None, trans_a='n', trans_b='n', alpha=1.0, beta=1.0, lda=None, ldb=None, ldc=None):
+from ..errors import raise_invalid_parameter
+from ..helpers import (get_matrix_dimensions, create_empty_matrix, check_equal_sizes, convert_trans,
+                       get_cblas_info, get_matrix_layout, match_matrix_layout, convert_side,
+                       convert_uplo, is_same_array, symmetrize, NO_TRANS, TRANS, CONJ_TRANS, LEFT,
+                       UPPER)
+from ..pool import empty
+from .symm import symm
+from .syrk import syrk
+from .trmm import trmm
+from numpy import copyto, iscomplexobj
+
+# the structures a matrix can be declared to have
+STRUCTURES = (None, 'symmetric', 'triangular')
+
+# the trans arguments of the CBLAS values
+TRANS_CHARS = {NO_TRANS: 'n', TRANS: 't', CONJ_TRANS: 'c'}
+
+
+def gemm(A, B, C=None, trans_a='n', trans_b='n', alpha=1.0, beta=1.0, lda=None, ldb=None, ldc=None,
+         structure=None, side='l', uplo='u'):
     """
     Perform a general matrix-matrix multiplication operation.
 
@@ -23,12 +37,28 @@ def gemm(A, B, C=None, trans_a='n', trans_b='n', alpha=1.0, beta=1.0, lda=None,
     where alpha and beta are scalars and A, B, and C are general matrices.
 
     The 'trans_a' and 'trans_b' arguments allow the computation to proceed as if A and/or B is
-    transposed.
+    transposed or conjugate transposed.
 
     If matrix C is not provided, a zero matrix of the appropriate size and type is created
     and returned. In such a case, 'ldc' is automatically set to the number of columns in the
     newly created matrix C.
 
+    Each of A, B, and C may be stored in either row-major or column-major order, such as a block
+    sliced out of a larger matrix or a transposed view of one, and is never copied. The operation
+    proceeds in the order in which C is stored, and A or B stored in the other order is treated as
+    transposed (except that a complex A or B which is to be conjugate transposed is copied into the
+    order of C).
+
+    The product of a matrix with its own transpose (the same array passed as A and B, with one of
+    'trans_a' and 'trans_b' equal to 'n' and the other to 't') is computed by syrk, which performs
+    half of the floating point operations, and the other triangle of C is filled in by copying,
+    when beta is 0 or C is not provided. If 'structure' declares that A (or B if 'side' is 'r') is
+    symmetric, the product is computed by symm, or if it declares it triangular, by trmm (which
+    also needs a copy of the other operand, into C if beta is 0 or otherwise into a temporary
+    matrix). A declared matrix must have the structure as a whole, since the other triangle is
+    still read if the product is computed by gemm (as it is if 'lda', 'ldb', or 'ldc' is given, or
+    the declared or the other matrix is complex and to be conjugate transposed).
+
     Args:
         A:          2D NumPy matrix or ndarray representing matrix A
         B:          2D NumPy matrix or ndarray representing matrix B
@@ -39,20 +69,37 @@ def gemm(A, B, C=None, trans_a='n', trans_b='n', alpha=1.0, beta=1.0, lda=None,
                         < default is the zero matrix >
         trans_a:    'n'  if the operation is to proceed as if A is not transposed
                     't'  if the operation is to proceed as if A is transposed
+                    'c'  if the operation is to proceed as if A is conjugate transposed
                         < default is 'n' >
         trans_b:    'n'  if the operation is to proceed as if A is not transposed
                     't'  if the operation is to proceed as if b is transposed
+                    'c'  if the operation is to proceed as if B is conjugate transposed
                         < default is 'n' >
         alpha:      scalar alpha
                         < default is 1.0 >
         beta:       scalar beta
                         < default is 1.0 >
-        lda:        leading dimension of A (must be >= # of cols in A)
-                        < default is the number of columns in A >
-        ldb:        leading dimension of B (must be >= # of cols in B)
-                        < default is the number of columns in B >
-        ldc:        leading dimension of C (must be >= # of cols in C)
-                        < default is the number of columns in C >
+        lda:        leading dimension of A (must be >= # of cols in A, or >= # of rows in A if A is
+                    stored in column-major order)
+                        < default is the spacing in memory of the rows (or columns) of A >
+        ldb:        leading dimension of B (must be >= # of cols in B, or >= # of rows in B if B is
+                    stored in column-major order)
+                        < default is the spacing in memory of the rows (or columns) of B >
+        ldc:        leading dimension of C (must be >= # of cols in C, or >= # of rows in C if C is
+                    stored in column-major order)
+                        < default is the spacing in memory of the rows (or columns) of C >
+        structure:  None          if neither A nor B is declared to have a structure
+                    'symmetric'   if A (or B if 'side' is 'r') is symmetric
+                    'triangular'  if A (or B if 'side' is 'r') is triangular
+                        < default is None >
+        side:       'l'  if 'structure' describes A
+                    'r'  if 'structure' describes B
+                        < default is 'l' >
+        uplo:       'u'  if the declared matrix is upper triangular, or its upper triangle is to be
+                         referenced if it is symmetric
+                    'l'  if the declared matrix is lower triangular, or its lower triangle is to be
+                         referenced if it is symmetric
+                        < default is 'u' >
 
     Returns:
         Matrix C (which is also overwritten)
@@ -62,14 +109,24 @@ def gemm(A, B, C=None, trans_a='n', trans_b='n', alpha=1.0, beta=1.0, lda=None,
                     - A, B, or C is not a 2D NumPy ndarray or NumPy matrix
                     - A, B, and C do not have the same dtype or that dtype is not supported
                     - the dimensions of A, B, and C do not conform
-                    - either 'trans_a' or 'trans_b' is not equal to one of the following: 'n', 'N', 't', 'T'
+                    - either 'trans_a' or 'trans_b' is not equal to one of the following: 'n', 'N', 't', 'T',
+                      'c', 'C'
+                    - 'structure' is not equal to one of the following: None, 'symmetric',
+                      'triangular'
+                    - 'side' is not equal to one of the following: 'l', 'L', 'r', 'R'
+                    - 'uplo' is not equal to one of the following: 'u', 'U', 'l', 'L'
+                    - the declared matrix is not square
     """
 
     # convert to appropriate CBLAS value
     cblas_trans_a = convert_trans(trans_a)
     cblas_trans_b = convert_trans(trans_b)
-    transpose_a = cblas_trans_a == TRANS
-    transpose_b = cblas_trans_b == TRANS
+    transpose_a = cblas_trans_a != NO_TRANS
+    transpose_b = cblas_trans_b != NO_TRANS
+    if structure not in STRUCTURES:
+        raise_invalid_parameter('structure', STRUCTURES, structure)
+    cblas_side = convert_side(side)
+    convert_uplo(uplo)
 
     # get the dimensions of the parameters
     m_A, n_A = get_matrix_dimensions('A', A)
@@ -77,41 +134,95 @@ def gemm(A, B, C=None, trans_a='n', trans_b='n', alpha=1.0, beta=1.0, lda=None,
     m, k_A = (m_A, n_A) if not transpose_a else (n_A, m_A)
     n, k_B = (n_B, m_B) if not transpose_b else (m_B, n_B)
 
-    # if C is not given, create zero matrix with same type as A
+    # if C is not given, create a matrix with same type as A, which is computed with beta 0
+    leading_dims_given = lda is not None or ldb is not None or ldc is not None
     if C is None:
-        C = create_zero_matrix(m, n, A.dtype, type(A))
+        C = create_empty_matrix(m, n, A.dtype, type(A))
         ldc = None
+        beta = 0.
 
     # continue getting dimensions of the parameters
     m_C, n_C = get_matrix_dimensions('C', C)
 
-    # assign a default value to lda, ldb, and ldc if necessary (assumes row-major order)
-    if lda is None:
-        lda = n_A
-    if ldb is None:
-        ldb = n_B
-    if ldc is None:
-        ldc = n_C
-
     # ensure the matrix dimensions conform for the desired operation
     check_equal_sizes('A', k_A, 'B', k_B)
     check_equal_sizes('A', m, 'C', m_C)
     check_equal_sizes('B', n, 'C', n_C)
 
+    # compute a product with the transpose of the same matrix, or with a matrix declared to have a
+    # structure, with the routine for it
+    if (not leading_dims_given and (structure is not None or
+                                    beta == 0 and cblas_trans_a != cblas_trans_b) and
+            multiply_structured(A, B, C, cblas_trans_a, cblas_trans_b, alpha, beta, structure,
+                                cblas_side, uplo)):
+        return C
+
+    # determine the order of the operation from the order in which C is stored, and treat A and B
+    # as transposed if they are stored in the other order, assigning a default value to lda, ldb,
+    # and ldc if necessary
+    order, default_ldc = get_matrix_layout('C', C)
+    A, lda, cblas_trans_a = match_matrix_layout('A', A, lda, order, cblas_trans_a)
+    B, ldb, cblas_trans_b = match_matrix_layout('B', B, ldb, order, cblas_trans_b)
+    if ldc is None:
+        ldc = default_ldc
+
     # determine which CBLAS subroutine to call and which ctypes data type to use
     cblas_func, ctype_dtype = get_cblas_info('gemm', (A.dtype, B.dtype, C.dtype))
 
-    # create a ctypes POINTER for each matrix
-    ctype_A = POINTER(ctype_dtype * n_A * m_A)
-    ctype_B = POINTER(ctype_dtype * n_B * m_B)
-    ctype_C = POINTER(ctype_dtype * n_C * m_C)
-
     # call CBLAS using ctypes
-    cblas_func.argtypes = [c_int, c_int, c_int, c_int, c_int, c_int, ctype_dtype,
-                           ctype_A, c_int, ctype_B, c_int, ctype_dtype, ctype_C, c_int]
-    cblas_func.restype = None
-    cblas_func(ROW_MAJOR, cblas_trans_a, cblas_trans_b, m, n, k_A, alpha,
-               A.ctypes.data_as(ctype_A), lda, B.ctypes.data_as(ctype_B), ldb, beta,
-               C.ctypes.data_as(ctype_C), ldc)
-
-    return C  # C is also overwritten
\ No newline at end of file
+    cblas_func(order, cblas_trans_a, cblas_trans_b, m, n, k_A, alpha,
+               A.ctypes.data, lda, B.ctypes.data, ldb, beta,
+               C.ctypes.data, ldc)
+
+    return C  # C is also overwritten
+
+
+def multiply_structured(A, B, C, cblas_trans_a, cblas_trans_b, alpha, beta, structure, cblas_side,
+                        uplo):
+    """
+    Compute C := beta * C + alpha * op(A) * op(B) with syrk if B is the same matrix as A and the
+    product is with its transpose (and beta is 0), or with symm or trmm if A (or B) is declared
+    symmetric or triangular.
+
+    Returns:
+        True if the product was computed, or False if it is to be computed by gemm.
+    """
+
+    # a real matrix which is to be conjugate transposed is only transposed
+    complex_dtype = iscomplexobj(C)
+    if not complex_dtype:
+        cblas_trans_a = TRANS if cblas_trans_a == CONJ_TRANS else cblas_trans_a
+        cblas_trans_b = TRANS if cblas_trans_b == CONJ_TRANS else cblas_trans_b
+
+    if structure is None:
+        if (beta != 0 or not is_same_array(A, B) or
+                set((cblas_trans_a, cblas_trans_b)) != set((NO_TRANS, TRANS))):
+            return False
+        syrk(A, C, 'u', 'n' if cblas_trans_a == NO_TRANS else 't', alpha, 0.)
+        symmetrize(C, UPPER)
+        return True
+
+    # the declared matrix, how it is transposed, and the other operand as it is multiplied
+    if cblas_side == LEFT:
+        declared, declared_trans, other, other_trans = A, cblas_trans_a, B, cblas_trans_b
+    else:
+        declared, declared_trans, other, other_trans = B, cblas_trans_b, A, cblas_trans_a
+    if other_trans == CONJ_TRANS:
+        return False
+    other = other.T if other_trans == TRANS else other
+    side = 'l' if cblas_side == LEFT else 'r'
+
+    if structure == 'symmetric':
+        if declared_trans == CONJ_TRANS:
+            return False
+        symm(declared, other, C, side, uplo, alpha, beta)
+        return True
+
+    # trmm overwrites the other operand with the product, so it is computed in a copy
+    work = C if beta == 0 else empty(C.shape, C.dtype)
+    copyto(work, other)
+    trmm(declared, work, side, uplo, TRANS_CHARS[declared_trans], 'n', alpha)
+    if beta != 0:
+        C *= beta
+        C += work
+    return True
@@ -0,0 +1,141 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from ..helpers import (get_stack_dimensions, get_batch_size, get_stack_layout, convert_stack_layout,
+                       check_unshared_output, create_empty_stack, check_equal_sizes, convert_trans,
+                       flip_trans, get_cblas_info, call_cblas_batched, NO_TRANS, CONJ_TRANS)
+
+
+def gemm_batched(A, B, C=None, trans_a='n', trans_b='n', alpha=1.0, beta=1.0, num_threads=None):
+    """
+    Perform a batch of independent general matrix-matrix multiplication operations.
+
+    C[i] := beta * C[i] + alpha * A[i] * B[i]
+
+    for each i, where alpha and beta are scalars and A[i], B[i], and C[i] are general matrices.
+
+    A, B, and C are stacks of matrices of the same size, i.e. 3D ndarrays indexed as (matrix, row,
+    column), such as the arrays accepted by numpy.matmul. A 2D ndarray or matrix may be passed for
+    A or B instead, in which case that matrix is shared by every operation of the batch.
+
+    The 'trans_a' and 'trans_b' arguments allow the computation to proceed as if each A[i] and/or
+    B[i] is transposed or conjugate transposed.
+
+    If C is not provided, a stack of zero matrices of the appropriate size and type is created and
+    returned.
+
+    The matrices of each stack may be stored in either row-major or column-major order (such as a
+    transposed view of a stack, e.g. A.transpose(0, 2, 1)) and are never copied, except that a
+    complex stack which is to be conjugate transposed is copied into the order of C. If the BLAS
+    library has a strided batched gemm (such as MKL), the whole batch is performed by a single call
+    to it. Otherwise, the batch is split among up to 'num_threads' threads, each of which calls
+    CBLAS once per operation.
+
+    Args:
+        A:              3D NumPy ndarray representing the stack of matrices A[i], or 2D NumPy
+                        ndarray or matrix shared by every operation
+        B:              3D NumPy ndarray representing the stack of matrices B[i], or 2D NumPy
+                        ndarray or matrix shared by every operation
+
+        --optional arguments--
+
+        C:              3D NumPy ndarray representing the stack of matrices C[i]
+                            < default is a stack of zero matrices >
+        trans_a:        'n'  if the operation is to proceed as if each A[i] is not transposed
+                        't'  if the operation is to proceed as if each A[i] is transposed
+                        'c'  if the operation is to proceed as if each A[i] is conjugate transposed
+                            < default is 'n' >
+        trans_b:        'n'  if the operation is to proceed as if each B[i] is not transposed
+                        't'  if the operation is to proceed as if each B[i] is transposed
+                        'c'  if the operation is to proceed as if each B[i] is conjugate transposed
+                            < default is 'n' >
+        alpha:          scalar alpha
+                            < default is 1.0 >
+        beta:           scalar beta
+                            < default is 1.0 >
+        num_threads:    largest number of threads among which to split the batch
+                            < default is the number of CPUs >
+
+    Returns:
+        Stack C (which is also overwritten)
+
+    Raises:
+        ValueError: if any of the following conditions occur:
+                    - A or B is not a 3D NumPy ndarray or a 2D NumPy ndarray or matrix
+                    - C is not a 3D NumPy ndarray, or neither A nor B is one when C is not provided
+                    - the stacks do not hold the same number of matrices
+                    - A, B, and C do not have the same dtype or that dtype is not supported
+                    - the dimensions of the matrices of A, B, and C do not conform
+                    - the matrices of A, B, or C are stored in neither row-major nor column-major
+                      order, or the matrices of C overlap in memory
+                    - either 'trans_a' or 'trans_b' is not equal to one of the following: 'n', 'N',
+                      't', 'T', 'c', 'C'
+                    - 'num_threads' is not an integer >= 1
+    """
+
+    # convert to appropriate CBLAS value
+    cblas_trans_a = convert_trans(trans_a)
+    cblas_trans_b = convert_trans(trans_b)
+    transpose_a = cblas_trans_a != NO_TRANS
+    transpose_b = cblas_trans_b != NO_TRANS
+
+    # get the dimensions of the parameters
+    batch_A, m_A, n_A = get_stack_dimensions('A', A)
+    batch_B, m_B, n_B = get_stack_dimensions('B', B)
+    m, k_A = (m_A, n_A) if not transpose_a else (n_A, m_A)
+    n, k_B = (n_B, m_B) if not transpose_b else (m_B, n_B)
+
+    # if C is not given, create a stack of matrices with same type as A, computed with beta 0
+    if C is None:
+        beta = 0.
+        C = create_empty_stack(get_batch_size('A', batch_A, 'B', batch_B), m, n, A.dtype)
+
+    # continue getting dimensions of the parameters
+    batch_C, m_C, n_C = get_stack_dimensions('C', C)
+    batch = get_batch_size('C', batch_C, 'A', batch_A, 'B', batch_B)
+
+    # ensure the matrix dimensions conform for the desired operation
+    check_equal_sizes('A', k_A, 'B', k_B)
+    check_equal_sizes('A', m, 'C', m_C)
+    check_equal_sizes('B', n, 'C', n_C)
+
+    # determine which CBLAS subroutine to call and which ctypes data type to use
+    cblas_func, ctype_dtype = get_cblas_info('gemm', (A.dtype, B.dtype, C.dtype))
+
+    if batch == 0:
+        return C
+
+    # determine the order of the operations from the order in which the matrices of C are stored,
+    # and treat the matrices of A and B as transposed if they are stored in the other order
+    order, ldc, stride_c = get_stack_layout('C', C)
+    check_unshared_output('C', C, batch, stride_c)
+    order_A, lda, stride_a = get_stack_layout('A', A, order)
+    if order_A != order:
+        if cblas_trans_a == CONJ_TRANS:
+            A, lda, stride_a = convert_stack_layout('A', A, order)
+        else:
+            cblas_trans_a = flip_trans(cblas_trans_a)
+    order_B, ldb, stride_b = get_stack_layout('B', B, order)
+    if order_B != order:
+        if cblas_trans_b == CONJ_TRANS:
+            B, ldb, stride_b = convert_stack_layout('B', B, order)
+        else:
+            cblas_trans_b = flip_trans(cblas_trans_b)
+
+    # call CBLAS using ctypes for every matrix of the stacks
+    call_cblas_batched('gemm', C.dtype, cblas_func,
+                       [order, cblas_trans_a, cblas_trans_b, m, n, k_A, alpha,
+                        None, lda, None, ldb, beta, None, ldc],
+                       ((7, A.ctypes.data, stride_a), (9, B.ctypes.data, stride_b),
+                        (12, C.ctypes.data, stride_c)),
+                       batch, num_threads)
+
+    return C  # C is also overwritten
@@ -0,0 +1,138 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from ..helpers import (get_matrix_dimensions, create_zero_matrix, check_equal_sizes, convert_trans,
+                       get_cblas_info, get_matrix_layout, match_matrix_layout, call_cblas_grouped,
+                       NO_TRANS)
+
+
+def gemm_grouped(A_list, B_list, C_list=None, trans_a='n', trans_b='n', alpha=1.0, beta=1.0,
+                 num_threads=None):
+    """
+    Perform a list of independent general matrix-matrix multiplication operations of different
+    sizes.
+
+    C_list[i] := beta * C_list[i] + alpha * A_list[i] * B_list[i]
+
+    for each i, where alpha and beta are scalars and A_list[i], B_list[i], and C_list[i] are
+    general matrices. Unlike gemm_batched, every operation may have its own dimensions.
+
+    The 'trans_a' and 'trans_b' arguments allow the computations to proceed as if every A_list[i]
+    and/or B_list[i] is transposed or conjugate transposed.
+
+    If C_list is not provided, a list of zero matrices of the appropriate sizes and type is created
+    and returned.
+
+    Each matrix may be stored in either row-major or column-major order, as for gemm. The
+    operations are binned into groups of the same size. If the BLAS library has a grouped batched
+    gemm (such as MKL) and every C_list[i] is stored in the same order, all of the groups are
+    performed by a single call to it. Otherwise, the operations are balanced by their numbers of
+    floating point operations among up to 'num_threads' threads, each of which calls CBLAS once per
+    operation.
+
+    Args:
+        A_list:         list of 2D NumPy matrices or ndarrays representing the matrices A_list[i]
+        B_list:         list of 2D NumPy matrices or ndarrays representing the matrices B_list[i]
+
+        --optional arguments--
+
+        C_list:         list of 2D NumPy matrices or ndarrays representing the matrices C_list[i]
+                            < default is a list of zero matrices >
+        trans_a:        'n'  if the operations are to proceed as if each A_list[i] is not transposed
+                        't'  if the operations are to proceed as if each A_list[i] is transposed
+                        'c'  if the operations are to proceed as if each A_list[i] is conjugate
+                             transposed
+                            < default is 'n' >
+        trans_b:        'n'  if the operations are to proceed as if each B_list[i] is not transposed
+                        't'  if the operations are to proceed as if each B_list[i] is transposed
+                        'c'  if the operations are to proceed as if each B_list[i] is conjugate
+                             transposed
+                            < default is 'n' >
+        alpha:          scalar alpha
+                            < default is 1.0 >
+        beta:           scalar beta
+                            < default is 1.0 >
+        num_threads:    largest number of threads among which to split the operations
+                            < default is the number of CPUs >
+
+    Returns:
+        List C_list (whose matrices are also overwritten)
+
+    Raises:
+        ValueError: if any of the following conditions occur:
+                    - A_list, B_list, and C_list do not have the same length
+                    - any matrix is not a 2D NumPy ndarray or NumPy matrix
+                    - the matrices do not all have the same dtype or that dtype is not supported
+                    - the dimensions of A_list[i], B_list[i], and C_list[i] do not conform for
+                      some i
+                    - any matrix is stored in neither row-major nor column-major order
+                    - either 'trans_a' or 'trans_b' is not equal to one of the following: 'n', 'N',
+                      't', 'T', 'c', 'C'
+                    - 'num_threads' is not an integer >= 1
+    """
+
+    # convert to appropriate CBLAS value
+    cblas_trans_a = convert_trans(trans_a)
+    cblas_trans_b = convert_trans(trans_b)
+    transpose_a = cblas_trans_a != NO_TRANS
+    transpose_b = cblas_trans_b != NO_TRANS
+
+    A_list, B_list = list(A_list), list(B_list)
+    check_equal_sizes('A_list', len(A_list), 'B_list', len(B_list))
+
+    # if C_list is not given, create a zero matrix of the appropriate size with the same type as
+    # each A_list[i]
+    if C_list is None:
+        C_list = []
+        for A, B in zip(A_list, B_list):
+            m_A, n_A = get_matrix_dimensions('A', A)
+            m_B, n_B = get_matrix_dimensions('B', B)
+            C_list.append(create_zero_matrix(n_A if transpose_a else m_A,
+                                             m_B if transpose_b else n_B, A.dtype, type(A)))
+    else:
+        C_list = list(C_list)
+        check_equal_sizes('A_list', len(A_list), 'C_list', len(C_list))
+
+    if len(C_list) == 0:
+        return C_list
+
+    # determine which CBLAS subroutine to call and which ctypes data type to use
+    cblas_func, ctype_dtype = get_cblas_info('gemm', tuple(matrix.dtype for matrices in
+                                                           (A_list, B_list, C_list)
+                                                           for matrix in matrices))
+
+    # determine the arguments of each operation as gemm does, keeping any copy of A_list[i] or
+    # B_list[i] alive until CBLAS has been called
+    problems, costs, operands = [], [], []
+    for A, B, C in zip(A_list, B_list, C_list):
+        m_A, n_A = get_matrix_dimensions('A', A)
+        m_B, n_B = get_matrix_dimensions('B', B)
+        m_C, n_C = get_matrix_dimensions('C', C)
+        m, k_A = (m_A, n_A) if not transpose_a else (n_A, m_A)
+        n, k_B = (n_B, m_B) if not transpose_b else (m_B, n_B)
+
+        check_equal_sizes('A', k_A, 'B', k_B)
+        check_equal_sizes('A', m, 'C', m_C)
+        check_equal_sizes('B', n, 'C', n_C)
+
+        order, ldc = get_matrix_layout('C', C)
+        A, lda, cblas_trans_a_i = match_matrix_layout('A', A, None, order, cblas_trans_a)
+        B, ldb, cblas_trans_b_i = match_matrix_layout('B', B, None, order, cblas_trans_b)
+
+        problems.append((order, cblas_trans_a_i, cblas_trans_b_i, m, n, k_A, alpha,
+                         A.ctypes.data, lda, B.ctypes.data, ldb, beta, C.ctypes.data, ldc))
+        costs.append(2 * m * n * k_A + m * n)
+        operands.append((A, B))
+
+    # call CBLAS using ctypes for every operation
+    call_cblas_grouped('gemm', C_list[0].dtype, cblas_func, problems, costs, num_threads)
+
+    return C_list  # the matrices of C_list are also overwritten
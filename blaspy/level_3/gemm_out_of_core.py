@@ -0,0 +1,228 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from ..errors import raise_invalid_memory
+from ..helpers import (get_matrix_dimensions, create_zero_matrix, check_equal_sizes, convert_trans,
+                       get_cblas_info, NO_TRANS, OUT_OF_CORE_MEMORY)
+from ..pool import empty
+from .gemm import gemm
+from concurrent.futures import ThreadPoolExecutor
+from math import sqrt
+from numbers import Integral
+from numpy import copyto, load, memmap
+from numpy.lib.format import open_memmap
+from os import PathLike, path
+
+
+def gemm_out_of_core(A, B, C=None, trans_a='n', trans_b='n', alpha=1.0, beta=1.0, memory=None):
+    """
+    Perform a general matrix-matrix multiplication operation on matrices which may not fit in
+    memory.
+
+    C := beta * C + alpha * A * B
+
+    where alpha and beta are scalars and A, B, and C are general matrices.
+
+    The 'trans_a' and 'trans_b' arguments allow the computation to proceed as if A and/or B is
+    transposed or conjugate transposed.
+
+    Each of A, B, and C may be a NumPy memmap (or any other ndarray), or the path of a .npy file,
+    which is opened as a memmap. If C is the path of a file which does not exist, it is created
+    (and beta is ignored). If C is not provided, a zero matrix of the appropriate size and type is
+    created in memory and returned.
+
+    C is computed one tile at a time, each tile by a sequence of gemm calls on tiles of A and B,
+    and written back as soon as it is complete. The tiles are as large as fit in 'memory' bytes
+    with two of each held at once: while one set of tiles is multiplied, the next is read on a
+    background thread (and the last finished tile of C is written), so that reading and writing the
+    operands overlaps with the computation. A tile which is already held from the previous step is
+    not read again.
+
+    Args:
+        A:          2D NumPy memmap, matrix, or ndarray, or the path of a .npy file, representing
+                    matrix A
+        B:          2D NumPy memmap, matrix, or ndarray, or the path of a .npy file, representing
+                    matrix B
+
+        --optional arguments--
+
+        C:          2D NumPy memmap, matrix, or ndarray, or the path of a .npy file, representing
+                    matrix C
+                        < default is the zero matrix >
+        trans_a:    'n'  if the operation is to proceed as if A is not transposed
+                    't'  if the operation is to proceed as if A is transposed
+                    'c'  if the operation is to proceed as if A is conjugate transposed
+                        < default is 'n' >
+        trans_b:    'n'  if the operation is to proceed as if B is not transposed
+                    't'  if the operation is to proceed as if B is transposed
+                    'c'  if the operation is to proceed as if B is conjugate transposed
+                        < default is 'n' >
+        alpha:      scalar alpha
+                        < default is 1.0 >
+        beta:       scalar beta
+                        < default is 1.0 >
+        memory:     number of bytes of memory to hold the tiles of A, B, and C in
+                        < default is OUT_OF_CORE_MEMORY (256 MiB) >
+
+    Returns:
+        Matrix C (which is also overwritten, and flushed to its file if it is a memmap)
+
+    Raises:
+        ValueError: if any of the following conditions occur:
+                    - A, B, or C is not a 2D NumPy ndarray or NumPy matrix, or a .npy file
+                      holding one
+                    - A, B, and C do not have the same dtype or that dtype is not supported
+                    - the dimensions of A, B, and C do not conform
+                    - either 'trans_a' or 'trans_b' is not equal to one of the following: 'n', 'N',
+                      't', 'T', 'c', 'C'
+                    - 'memory' is too small to hold one element of each tile
+    """
+
+    # convert to appropriate CBLAS value
+    transpose_a = convert_trans(trans_a) != NO_TRANS
+    transpose_b = convert_trans(trans_b) != NO_TRANS
+
+    # open any operand given as the path of a file
+    A = open_operand(A, 'r')
+    B = open_operand(B, 'r')
+
+    # get the dimensions of the parameters
+    m_A, n_A = get_matrix_dimensions('A', A)
+    m_B, n_B = get_matrix_dimensions('B', B)
+    m, k_A = (n_A, m_A) if transpose_a else (m_A, n_A)
+    k_B, n = (n_B, m_B) if transpose_b else (m_B, n_B)
+    check_equal_sizes('A', k_A, 'B', k_B)
+    get_cblas_info('gemm', (A.dtype, B.dtype))
+
+    # if C is not given, create a zero matrix with the same type as A; if it is a path which does
+    # not exist, create a zero matrix in a new file
+    if C is None:
+        C = create_zero_matrix(m, n, A.dtype, type(A))
+        beta = 0.
+    elif isinstance(C, (str, PathLike)) and not path.exists(C):
+        C = open_memmap(C, 'w+', A.dtype, (m, n))
+        beta = 0.
+    else:
+        C = open_operand(C, 'r+')
+
+    m_C, n_C = get_matrix_dimensions('C', C)
+    check_equal_sizes('A', m, 'C', m_C)
+    check_equal_sizes('B', n, 'C', n_C)
+    get_cblas_info('gemm', (A.dtype, B.dtype, C.dtype))
+
+    # size the tiles to the memory budget
+    if memory is None:
+        memory = OUT_OF_CORE_MEMORY
+    itemsize = C.dtype.itemsize
+    if not isinstance(memory, Integral) or memory < 6 * itemsize:
+        raise_invalid_memory(memory, 6 * itemsize)
+    m_tile, n_tile, k_tile = get_tile_sizes(m, n, k_A, memory // (2 * itemsize))
+
+    # two buffers for the tiles of each operand, and the tiles each buffer of A and B holds
+    A_buffers = [empty(m_tile * k_tile, A.dtype) for slot in range(2)]
+    B_buffers = [empty(k_tile * n_tile, B.dtype) for slot in range(2)]
+    C_buffers = [empty(m_tile * n_tile, C.dtype) for slot in range(2)]
+    A_held = [None, None]
+    B_held = [None, None]
+
+    depths = split_tiles(k_A, k_tile)
+    steps = [(rows, cols, depth) for rows in split_tiles(m, m_tile)
+             for cols in split_tiles(n, n_tile) for depth in depths]
+
+    def load_step(index):
+        rows, cols, depth = steps[index]
+        slot = index % 2
+        A_tile = read_tile(A, (depth, rows) if transpose_a else (rows, depth), A_buffers[slot],
+                           A_held, slot)
+        B_tile = read_tile(B, (cols, depth) if transpose_b else (depth, cols), B_buffers[slot],
+                           B_held, slot)
+        C_tile = read_tile(C, (rows, cols), C_buffers[index // len(depths) % 2], None, 0,
+                           depth == depths[0] and beta != 0)
+        return A_tile, B_tile, C_tile
+
+    # multiply each set of tiles while the next is read on the background thread, which also
+    # writes back each tile of C once it is finished
+    with ThreadPoolExecutor(1, 'blaspy-out-of-core') as io:
+        writes = []
+        pending = io.submit(load_step, 0) if steps else None
+        for index, (rows, cols, depth) in enumerate(steps):
+            A_tile, B_tile, C_tile = pending.result()
+            if index + 1 < len(steps):
+                pending = io.submit(load_step, index + 1)
+
+            gemm(A_tile, B_tile, C_tile, trans_a, trans_b, alpha,
+                 beta if depth == depths[0] else 1.0)
+
+            if depth == depths[-1]:
+                writes.append(io.submit(write_tile, C, (rows, cols), C_tile))
+
+        for write in writes:
+            write.result()
+
+    # with no inner dimension, C is only scaled
+    if k_A == 0 and m > 0 and n > 0:
+        C *= beta
+
+    if isinstance(C, memmap):
+        C.flush()
+    return C
+
+
+def open_operand(operand, mode):
+    """ Return an operand itself, or a memmap of the .npy file at the path it gives. """
+
+    if isinstance(operand, (str, PathLike)):
+        return load(operand, mmap_mode=mode)
+    return operand
+
+
+def get_tile_sizes(m, n, k, elements):
+    """
+    Return the numbers of rows and columns of the tiles of C and of columns of the tiles of op(A),
+    such that one tile of each of A, B, and C holds at most 'elements' elements. The tiles are
+    square unless a dimension is smaller, in which case the tiles are deeper.
+    """
+
+    side = int(sqrt(elements // 3))
+    if k < side:
+        side = int(sqrt(k * k + elements)) - k
+    m_tile = max(1, min(m, side))
+    n_tile = max(1, min(n, side))
+    k_tile = max(1, min(k, (elements - m_tile * n_tile) // (m_tile + n_tile)))
+    return m_tile, n_tile, k_tile
+
+
+def split_tiles(length, size):
+    """ Return the (start, stop) bounds of the tiles of the given size which cover a length. """
+    return [(start, min(start + size, length)) for start in range(0, length, size)]
+
+
+def read_tile(operand, bounds, buffer, held, slot, copy=True):
+    """
+    Return a view of a buffer shaped as the tile of an operand with the given (row, column) bounds,
+    copying the tile into it unless 'copy' is False or held[slot] shows it is already there.
+    """
+
+    (row_start, row_stop), (col_start, col_stop) = bounds
+    tile = buffer[:(row_stop - row_start) * (col_stop - col_start)].reshape(row_stop - row_start,
+                                                                            col_stop - col_start)
+    if copy and (held is None or held[slot] != bounds):
+        copyto(tile, operand[row_start:row_stop, col_start:col_stop])
+        if held is not None:
+            held[slot] = bounds
+    return tile
+
+
+def write_tile(operand, bounds, tile):
+    """ Copy a tile back into the given (row, column) bounds of an operand. """
+
+    (row_start, row_stop), (col_start, col_stop) = bounds
+    operand[row_start:row_stop, col_start:col_stop] = tile
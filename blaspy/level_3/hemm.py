@@ -0,0 +1,132 @@
+"""
+
+    Copyright (c) 2014-2015-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from ..helpers import (get_matrix_dimensions, get_square_matrix_dimension, create_empty_matrix,
+                       check_equal_sizes, convert_uplo, convert_side, get_cblas_info,
+                       get_matrix_layout, convert_matrix_layout, LEFT)
+
+
+def hemm(A, B, C=None, side='l', uplo='u', alpha=1.0, beta=1.0, lda=None, ldb=None, ldc=None):
+    """
+    Perform a Hermitian matrix-matrix multiplication operation.
+
+    C := beta * C + alpha * A * B
+    or
+    C := beta * C + alpha * B * A
+
+    where alpha and beta are scalars, A is a Hermitian matrix, and B and C are general matrices. Only
+    complex dtypes are supported.
+
+    The 'side' argument indicates whether the Hermitian matrix A is multiplied on the left or the
+    right side of B. The 'uplo' argument indicates whether the lower or upper triangle of A is to be
+    referenced by the operation.
+
+    If matrix C is not provided, a zero matrix of the appropriate size and type is created
+    and returned. In such a case, 'ldc' is automatically set to the number of columns in the
+    newly created matrix C.
+
+    Each of A, B, and C may be stored in either row-major or column-major order, such as a block
+    sliced out of a larger matrix or a transposed view of one. The operation proceeds in the order
+    in which C is stored, and A or B is copied if it is stored in a different order than C.
+
+    Args:
+        A:        2D NumPy matrix or ndarray representing matrix A
+        B:        2D NumPy matrix or ndarray representing matrix A
+
+        --optional arguments--
+
+        C:        2D NumPy matrix or ndarray representing matrix C
+                      < default is the zero matrix >
+        side:     'l'  if the operation is to proceed as if A is to the left of B
+                  'r'  if the operation is to proceed as if A is to the right of B
+                      < default is 'l' >
+        uplo:     'u'  if the upper triangular part of A is to be used
+                  'l'  if the lower triangular part of A is to be used
+                      < default is 'u' >
+        alpha:    scalar alpha
+                      < default is 1.0 >
+        beta:     scalar beta
+                      < default is 1.0 >
+        lda:      leading dimension of A (must be >= # of cols in A, or >= # of rows in A if A is
+                  stored in column-major order)
+                      < default is the spacing in memory of the rows (or columns) of A >
+        ldb:      leading dimension of B (must be >= # of cols in B, or >= # of rows in B if B is
+                  stored in column-major order)
+                      < default is the spacing in memory of the rows (or columns) of B >
+        ldc:      leading dimension of C (must be >= # of cols in C, or >= # of rows in C if C is
+                  stored in column-major order)
+                      < default is the spacing in memory of the rows (or columns) of C >
+
+    Returns:
+        Matrix C (which is also overwritten)
+
+    Raises:
+        ValueError: if any of the following conditions occur:
+                    - A, B, or C is not a 2D NumPy ndarray or NumPy matrix
+                    - A, B, and C do not have the same dtype or that dtype is not supported
+                    - A is not a square matrix
+                    - the dimensions of A, B, and C do not conform
+                    - 'uplo' is not equal to one of the following: 'u', 'U', 'l', 'L'
+                    - 'side' is not equal to one of the following: 'l', 'L', 'r', 'R'
+    """
+
+    # convert to appropriate CBLAS value
+    cblas_uplo = convert_uplo(uplo)
+    cblas_side = convert_side(side)
+    side_is_left = cblas_side == LEFT
+
+    # get the dimensions of the parameters
+    dim_A = get_square_matrix_dimension('A', A)
+    m_B, n_B = get_matrix_dimensions('B', B)
+    m, n, k = (dim_A, n_B, m_B) if side_is_left else (m_B, dim_A, n_B)
+
+    # if C is not given, create a matrix with same type as A, which is computed with beta 0
+    if C is None:
+        C = create_empty_matrix(m, n, A.dtype, type(A))
+        ldc = None
+        beta = 0.
+
+    # continue getting dimensions of the parameters
+    m_C, n_C = get_matrix_dimensions('C', C)
+
+    # determine the order of the operation from the order in which C is stored, and ensure A and B
+    # are stored in the same order as C (the opposite triangle of a Hermitian matrix stored in the
+    # other order holds its conjugate, so unlike symm, A cannot be used in place)
+    order, default_ldc = get_matrix_layout('C', C)
+    order_A, default_lda = get_matrix_layout('A', A, order)
+    if order_A != order:
+        A, lda = convert_matrix_layout('A', A, order)
+    order_B, default_ldb = get_matrix_layout('B', B, order)
+    if order_B != order:
+        B, ldb = convert_matrix_layout('B', B, order)
+
+    # assign a default value to lda, ldb, and ldc if necessary
+    if lda is None:
+        lda = default_lda
+    if ldb is None:
+        ldb = default_ldb
+    if ldc is None:
+        ldc = default_ldc
+
+    # ensure the matrix dimensions conform for the desired operation
+    check_equal_sizes('A', dim_A, 'B', k)
+    check_equal_sizes('A' if side_is_left else 'B', m, 'C', m_C)
+    check_equal_sizes('B' if side_is_left else 'A', n, 'C', n_C)
+
+    # determine which CBLAS subroutine to call and which ctypes data type to use
+    cblas_func, ctype_dtype = get_cblas_info('hemm', (A.dtype, B.dtype, C.dtype))
+
+    # call CBLAS using ctypes
+    cblas_func(order, cblas_side, cblas_uplo, m, n, alpha,
+               A.ctypes.data, lda, B.ctypes.data, ldb, beta,
+               C.ctypes.data, ldc)
+
+    return C  # C is also overwritten
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""
+
+    Copyright (c) 2014-2015-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from ..helpers import (get_matrix_dimensions, get_square_matrix_dimension, create_zero_matrix,
+                       check_equal_sizes, convert_uplo, convert_herm_trans, get_cblas_info,
+                       get_matrix_layout, convert_matrix_layout, CONJ_TRANS)
+
+
+def herk(A, C=None, uplo='u', trans='n', alpha=1.0, beta=1.0, lda=None, ldc=None):
+    """
+    Perform a Hermitian rank-k update operation.
+
+    C := beta * C + alpha * A * A_H  [trans='n']
+    or
+    C := beta * C + alpha * A_H * A  [trans='c']
+
+    where alpha and beta are real scalars, A is a general matrix, A_H is the conjugate transpose of
+    A, and C is a Hermitian matrix. Only complex dtypes are supported.
+
+    The 'trans' argument allows the computation to proceed as if A is conjugate transposed,
+    resulting in the alternate rank-k product (second computation listed above). The 'uplo' argument
+    indicates whether the lower or upper triangle of C is to be referenced and updated by the
+    operation.
+
+    If matrix C is not provided, a zero matrix of the appropriate size and type is created
+    and returned. In such a case, 'ldc' is automatically set to the number of columns in the
+    newly created matrix C.
+
+    Both A and C may be stored in either row-major or column-major order, such as a block sliced out
+    of a larger matrix or a transposed view of one. The operation proceeds in the order in which C
+    is stored, and A is copied if it is stored in the other order.
+
+    Args:
+        A:       2D numpy matrix or ndarray representing matrix A
+
+        --optional arguments--
+
+        C:        2D numpy matrix or ndarray representing matrix C
+                      < default is the zero matrix >
+        uplo:     'u'  if the upper triangular part of C is to be used/overwritten
+                  'l'  if the lower triangular part of C is to be used/overwritten
+                      < default is 'u' >
+        trans:    'n'  if the operation is to proceed as if A is not transposed
+                  'c'  if the operation is to proceed as if A is conjugate transposed
+                      < default is 'n' >
+        alpha:    real scalar alpha
+                      < default is 1.0 >
+        beta:     real scalar beta
+                      < default is 1.0 >
+        lda:      leading dimension of A (must be >= # of cols in A, or >= # of rows in A if A is
+                  stored in column-major order)
+                      < default is the spacing in memory of the rows (or columns) of A >
+        ldc:      leading dimension of C (must be >= # of cols in C, or >= # of rows in C if C is
+                  stored in column-major order)
+                      < default is the spacing in memory of the rows (or columns) of C >
+
+    Returns:
+        matrix C (which is also overwritten)
+
+    Raises:
+        ValueError: if any of the following conditions occur:
+                    - A or C is not a 2D NumPy ndarray or NumPy matrix
+                    - A and C do not have the same dtype or that dtype is not supported
+                    - C is not a square matrix
+                    - the dimensions of A and C do not conform
+                    - 'uplo' is not equal to one of the following: 'u', 'U', 'l', 'L'
+                    - 'trans' is not equal to one of the following: 'n', 'N', 'c', 'C'
+    """
+
+    # convert to appropriate CBLAS value
+    cblas_uplo = convert_uplo(uplo)
+    cblas_trans = convert_herm_trans(trans)
+    transpose_a = cblas_trans == CONJ_TRANS
+
+    # get the dimensions of the parameters
+    m_A, n_A = get_matrix_dimensions('A', A)
+    n, k = (m_A, n_A) if not transpose_a else (n_A, m_A)
+
+    # if C is not given, create zero matrix with same type as A
+    if C is None:
+        C = create_zero_matrix(n, n, A.dtype, type(A))
+        ldc = None
+
+    # continue getting dimensions of the parameters
+    dim_C = get_square_matrix_dimension('C', C)
+
+    # determine the order of the operation from the order in which C is stored, and ensure A is
+    # stored in the same order
+    order, default_ldc = get_matrix_layout('C', C)
+    order_A, default_lda = get_matrix_layout('A', A, order)
+    if order_A != order:
+        A, lda = convert_matrix_layout('A', A, order)
+
+    # assign a default value to lda and ldc if necessary
+    if lda is None:
+        lda = default_lda
+    if ldc is None:
+        ldc = default_ldc
+
+    # ensure the matrix dimensions conform for the desired operation
+    check_equal_sizes('A', n, 'C', dim_C)
+
+    # determine which CBLAS subroutine to call and which ctypes data type to use
+    cblas_func, ctype_dtype = get_cblas_info('herk', (A.dtype, C.dtype))
+
+    # call CBLAS using ctypes
+    cblas_func(order, cblas_uplo, cblas_trans, n, k, alpha,
+               A.ctypes.data, lda, beta, C.ctypes.data, ldc)
+
+    return C  # C is also overwritten
\ No newline at end of file
@@ -0,0 +1,179 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from ..errors import (raise_not_2d_numpy, raise_not_1d_or_2d_numpy, raise_shape_mismatch,
+                      raise_too_few_operands)
+from ..helpers import check_equal_sizes, create_empty_matrix, get_cblas_info
+from ..level_1 import dot
+from ..level_2 import gemv
+from ..pool import empty
+from .gemm import gemm
+
+
+def multi_gemm(*operands, out=None):
+    """
+    Multiply a chain of matrices (and vectors) in the order of multiplications with the fewest
+    floating point operations.
+
+    result := operands[0] * operands[1] * ... * operands[-1]
+
+    The order is chosen by dynamic programming over the shapes of the operands, so that for
+    example A * B * x is computed as A * (B * x) with two gemv calls rather than a gemm and a gemv.
+    Each product is a single gemm call, or a gemv call if either factor is a vector (a product
+    with a row vector on the left becomes gemv with 'trans_a' equal to 't', so neither operand is
+    transposed in memory). Transposed views of operands are passed to CBLAS as they are.
+
+    The intermediate products are computed into as few temporary buffers as possible: a buffer
+    is returned to a free list as soon as the product which reads it is computed, and reused for
+    any later intermediate product which fits in it.
+
+    Args:
+        operands:   2D NumPy matrices or ndarrays representing the matrices of the chain; the first
+                    and last may be 1D NumPy ndarrays, treated as a row and a column vector
+                    respectively
+
+        --optional arguments--
+
+        out:        NumPy ndarray of the shape of the result to compute it into
+                        < default is a new ndarray >
+
+    Returns:
+        The product, which is a 2D ndarray (or a NumPy matrix if the first operand is one) if
+        neither the first nor the last operand is 1D, a 1D ndarray if one of them is, and a scalar
+        if both are. If 'out' is given, it is returned.
+
+    Raises:
+        ValueError: if any of the following conditions occur:
+                    - fewer than two operands are given
+                    - any operand other than the first and last is not a 2D NumPy ndarray or
+                      NumPy matrix, or the first or last is not a 1D or 2D one
+                    - the operands do not have the same dtype or that dtype is not supported
+                    - the dimensions of consecutive operands do not conform
+                    - 'out' does not have the shape of the result
+    """
+
+    if len(operands) < 2:
+        raise_too_few_operands('multi_gemm', 2, len(operands))
+
+    # get the dimensions of the chain, treating a 1D first operand as a row vector and a 1D last
+    # operand as a column vector
+    matrices = []
+    for index, operand in enumerate(operands):
+        name = 'operands[%d]' % index
+        ndim = getattr(operand, 'ndim', None)
+        if ndim == 1 and index == 0:
+            operand = operand.reshape(1, -1)
+        elif ndim == 1 and index == len(operands) - 1:
+            operand = operand.reshape(-1, 1)
+        elif ndim != 2:
+            if index in (0, len(operands) - 1):
+                raise_not_1d_or_2d_numpy(name)
+            raise_not_2d_numpy(name)
+        if matrices:
+            check_equal_sizes('operands[%d]' % (index - 1), matrices[-1].shape[1], name,
+                              operand.shape[0])
+        matrices.append(operand)
+    get_cblas_info('gemm', [operand.dtype for operand in operands])
+
+    dims = [matrices[0].shape[0]] + [matrix.shape[1] for matrix in matrices]
+    shape = ((dims[0],) if operands[0].ndim == 2 else ()) + \
+            ((dims[-1],) if operands[-1].ndim == 2 else ())
+
+    if out is None and len(shape) == 2:
+        out = create_empty_matrix(dims[0], dims[-1], operands[0].dtype, type(operands[0]))
+    elif out is None:
+        out = empty(shape, operands[0].dtype) if shape else None
+    elif out.shape != shape:
+        raise_shape_mismatch('result', shape, 'out', out.shape)
+
+    splits = get_chain_order(dims)
+    free = []
+    last = len(matrices) - 1
+    if shape == ():
+        # the product of a row vector and a column vector is a scalar
+        split = splits[0][last]
+        return dot(compute(matrices, dims, splits, free, 0, split)[0],
+                   compute(matrices, dims, splits, free, split + 1, last)[0])
+
+    compute(matrices, dims, splits, free, 0, last, out)
+    return out
+
+
+def compute(matrices, dims, splits, free, first, last, result=None):
+    """
+    Compute the product of matrices[first:last + 1] in the order given by splits into result, or
+    into a buffer from the free list if result is None, and return it with the buffer (None if
+    there is none). The buffers of its factors are added to the free list.
+    """
+
+    if first == last:
+        return matrices[first], None
+
+    split = splits[first][last]
+    left, left_buffer = compute(matrices, dims, splits, free, first, split)
+    right, right_buffer = compute(matrices, dims, splits, free, split + 1, last)
+    buffer = None
+    if result is None:
+        size = dims[first] * dims[last + 1]
+        buffer = take_buffer(free, size, left.dtype)
+        result = buffer[:size].reshape(dims[first], dims[last + 1])
+    multiply(left, right, result)
+
+    # the buffers of the factors can be reused once their product is computed
+    free.extend(factor for factor in (left_buffer, right_buffer) if factor is not None)
+    return result, buffer
+
+
+def take_buffer(free, size, dtype):
+    """
+    Remove and return the smallest buffer in the free list with at least 'size' elements, or a new
+    buffer if none is large enough.
+    """
+
+    fitting = [index for index, buffer in enumerate(free) if buffer.size >= size]
+    if not fitting:
+        return empty(size, dtype)
+    return free.pop(min(fitting, key=lambda index: free[index].size))
+
+
+def get_chain_order(dims):
+    """
+    Return the table of splits of the order of multiplications of a chain of matrices, where
+    matrix i has dims[i] rows and dims[i + 1] columns, with the fewest floating point operations.
+    The product of matrices first to last is that of first to splits[first][last] and of
+    splits[first][last] + 1 to last.
+    """
+
+    count = len(dims) - 1
+    costs = [[0] * count for first in range(count)]
+    splits = [[0] * count for first in range(count)]
+    for length in range(1, count):
+        for first in range(count - length):
+            last = first + length
+            costs[first][last] = None
+            for split in range(first, last):
+                cost = (costs[first][split] + costs[split + 1][last] +
+                        dims[first] * dims[split + 1] * dims[last + 1])
+                if costs[first][last] is None or cost < costs[first][last]:
+                    costs[first][last] = cost
+                    splits[first][last] = split
+    return splits
+
+
+def multiply(left, right, result):
+    """ Compute result := left * right with gemv if either factor is a vector, otherwise gemm. """
+
+    if right.shape[1] == 1:
+        gemv(left, right, result, beta=0.)
+    elif left.shape[0] == 1:
+        gemv(right, left, result, 't', beta=0.)
+    else:
+        gemm(left, right, result, beta=0.)
@@ -9,10 +9,9 @@
 
 """
 
-from ..helpers import (get_matrix_dimensions, get_square_matrix_dimension, create_zero_matrix,
-                       check_equal_sizes, convert_uplo, convert_side, get_cblas_info, ROW_MAJOR,
-                       LEFT)
-from ctypes import c_int, POINTER
+from ..helpers import (get_matrix_dimensions, get_square_matrix_dimension, create_empty_matrix,
+                       check_equal_sizes, convert_uplo, convert_side, get_cblas_info,
+                       get_matrix_layout, convert_matrix_layout, flip_uplo, LEFT)
 
 
 def symm(A, B, C=None, side='l', uplo='u', alpha=1.0, beta=1.0, lda=None, ldb=None, ldc=None):
@@ -33,6 +32,11 @@ def symm(A, B, C=None, side='l', uplo='u', alpha=1.0, beta=1.0, lda=None, ldb=No
     and returned. In such a case, 'ldc' is automatically set to the number of columns in the
     newly created matrix C.
 
+    Each of A, B, and C may be stored in either row-major or column-major order, such as a block
+    sliced out of a larger matrix or a transposed view of one. The operation proceeds in the order
+    in which C is stored. A is never copied, but B is copied if it is stored in a different order
+    than C.
+
     Args:
         A:        2D NumPy matrix or ndarray representing matrix A
         B:        2D NumPy matrix or ndarray representing matrix A
@@ -51,12 +55,15 @@ def symm(A, B, C=None, side='l', uplo='u', alpha=1.0, beta=1.0, lda=None, ldb=No
                       < default is 1.0 >
         beta:     scalar beta
                       < default is 1.0 >
-        lda:      leading dimension of A (must be >= # of cols in A)
-                      < default is the number of columns in A >
-        ldb:      leading dimension of B (must be >= # of cols in B)
-                      < default is the number of columns in B >
-        ldc:      leading dimension of C (must be >= # of cols in C)
-                      < default is the number of columns in C >
+        lda:      leading dimension of A (must be >= # of cols in A, or >= # of rows in A if A is
+                  stored in column-major order)
+                      < default is the spacing in memory of the rows (or columns) of A >
+        ldb:      leading dimension of B (must be >= # of cols in B, or >= # of rows in B if B is
+                  stored in column-major order)
+                      < default is the spacing in memory of the rows (or columns) of B >
+        ldc:      leading dimension of C (must be >= # of cols in C, or >= # of rows in C if C is
+                  stored in column-major order)
+                      < default is the spacing in memory of the rows (or columns) of C >
 
     Returns:
         Matrix C (which is also overwritten)
@@ -81,21 +88,33 @@ def symm(A, B, C=None, side='l', uplo='u', alpha=1.0, beta=1.0, lda=None, ldb=No
     m_B, n_B = get_matrix_dimensions('B', B)
     m, n, k = (dim_A, n_B, m_B) if side_is_left else (m_B, dim_A, n_B)
 
-    # if C is not given, create zero matrix with same type as A
+    # if C is not given, create a matrix with same type as A, which is computed with beta 0
     if C is None:
-        C = create_zero_matrix(m, n, A.dtype, type(A))
+        C = create_empty_matrix(m, n, A.dtype, type(A))
         ldc = None
+        beta = 0.
 
     # continue getting dimensions of the parameters
     m_C, n_C = get_matrix_dimensions('C', C)
 
-    # assign a default value to lda, ldb, and ldc if necessary (assumes row-major order)
+    # determine the order of the operation from the order in which C is stored, reference the
+    # opposite triangle of A if it is stored in the other order, and ensure B is stored in the same
+    # order as C
+    order, default_ldc = get_matrix_layout('C', C)
+    order_A, default_lda = get_matrix_layout('A', A, order)
+    if order_A != order:
+        cblas_uplo = flip_uplo(cblas_uplo)
+    order_B, default_ldb = get_matrix_layout('B', B, order)
+    if order_B != order:
+        B, ldb = convert_matrix_layout('B', B, order)
+
+    # assign a default value to lda, ldb, and ldc if necessary
     if lda is None:
-        lda = dim_A
+        lda = default_lda
     if ldb is None:
-        ldb = n_B
+        ldb = default_ldb
     if ldc is None:
-        ldc = n_C
+        ldc = default_ldc
 
     # ensure the matrix dimensions conform for the desired operation
     check_equal_sizes('A', dim_A, 'B', k)
@@ -105,17 +124,9 @@ def symm(A, B, C=None, side='l', uplo='u', alpha=1.0, beta=1.0, lda=None, ldb=No
     # determine which CBLAS subroutine to call and which ctypes data type to use
     cblas_func, ctype_dtype = get_cblas_info('symm', (A.dtype, B.dtype, C.dtype))
 
-    # create a ctypes POINTER for each matrix
-    ctype_A = POINTER(ctype_dtype * dim_A * dim_A)
-    ctype_B = POINTER(ctype_dtype * n_B * m_B)
-    ctype_C = POINTER(ctype_dtype * n_C * m_C)
-
     # call CBLAS using ctypes
-    cblas_func.argtypes = [c_int, c_int, c_int, c_int, c_int, ctype_dtype,
-                           ctype_A, c_int, ctype_B, c_int, ctype_dtype, ctype_C, c_int]
-    cblas_func.restype = None
-    cblas_func(ROW_MAJOR, cblas_side, cblas_uplo, m, n, alpha,
-               A.ctypes.data_as(ctype_A), lda, B.ctypes.data_as(ctype_B), ldb, beta,
-               C.ctypes.data_as(ctype_C), ldc)
+    cblas_func(order, cblas_side, cblas_uplo, m, n, alpha,
+               A.ctypes.data, lda, B.ctypes.data, ldb, beta,
+               C.ctypes.data, ldc)
 
     return C  # C is also overwritten
\ No newline at end of file
@@ -0,0 +1,130 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from ..helpers import (get_stack_dimensions, get_square_stack_dimension, get_batch_size,
+                       get_stack_layout, convert_stack_layout, check_unshared_output,
+                       create_empty_stack, check_equal_sizes, convert_side, convert_uplo, flip_uplo,
+                       get_cblas_info, call_cblas_batched, LEFT)
+
+
+def symm_batched(A, B, C=None, side='l', uplo='u', alpha=1.0, beta=1.0, num_threads=None):
+    """
+    Perform a batch of independent symmetric matrix-matrix multiplication operations.
+
+    C[i] := beta * C[i] + alpha * A[i] * B[i]  [side='l']
+    or
+    C[i] := beta * C[i] + alpha * B[i] * A[i]  [side='r']
+
+    for each i, where alpha and beta are scalars, A[i] is a symmetric matrix, and B[i] and C[i]
+    are general matrices.
+
+    A, B, and C are stacks of matrices of the same size, i.e. 3D ndarrays indexed as (matrix, row,
+    column). A 2D ndarray or matrix may be passed for A or B instead, in which case that matrix is
+    shared by every operation of the batch. The 'side' and 'uplo' arguments have the same meaning
+    as for symm.
+
+    If C is not provided, a stack of zero matrices of the appropriate size and type is created and
+    returned.
+
+    The matrices of each stack may be stored in either row-major or column-major order. A is never
+    copied, and B is copied only if its matrices are stored in the order other than that of C. The
+    batch is split among up to 'num_threads' threads, each of which calls CBLAS once per operation.
+
+    Args:
+        A:              3D NumPy ndarray representing the stack of matrices A[i], or 2D NumPy
+                        ndarray or matrix shared by every operation
+        B:              3D NumPy ndarray representing the stack of matrices B[i], or 2D NumPy
+                        ndarray or matrix shared by every operation
+
+        --optional arguments--
+
+        C:              3D NumPy ndarray representing the stack of matrices C[i]
+                            < default is a stack of zero matrices >
+        side:           'l'  if the operation is to proceed as if each A[i] is to the left of B[i]
+                        'r'  if the operation is to proceed as if each A[i] is to the right of B[i]
+                            < default is 'l' >
+        uplo:           'u'  if the upper triangular part of each A[i] is to be used
+                        'l'  if the lower triangular part of each A[i] is to be used
+                            < default is 'u' >
+        alpha:          scalar alpha
+                            < default is 1.0 >
+        beta:           scalar beta
+                            < default is 1.0 >
+        num_threads:    largest number of threads among which to split the batch
+                            < default is the number of CPUs >
+
+    Returns:
+        Stack C (which is also overwritten)
+
+    Raises:
+        ValueError: if any of the following conditions occur:
+                    - A or B is not a 3D NumPy ndarray or a 2D NumPy ndarray or matrix
+                    - C is not a 3D NumPy ndarray, or neither A nor B is one when C is not provided
+                    - the stacks do not hold the same number of matrices
+                    - A, B, and C do not have the same dtype or that dtype is not supported
+                    - the matrices of A are not square
+                    - the dimensions of the matrices of A, B, and C do not conform
+                    - the matrices of A, B, or C are stored in neither row-major nor column-major
+                      order, or the matrices of C overlap in memory
+                    - 'side' is not equal to one of the following: 'l', 'L', 'r', 'R'
+                    - 'uplo' is not equal to one of the following: 'u', 'U', 'l', 'L'
+                    - 'num_threads' is not an integer >= 1
+    """
+
+    # convert to appropriate CBLAS value
+    cblas_side = convert_side(side)
+    cblas_uplo = convert_uplo(uplo)
+    side_is_left = cblas_side == LEFT
+
+    # get the dimensions of the parameters
+    batch_A, dim_A = get_square_stack_dimension('A', A)
+    batch_B, m_B, n_B = get_stack_dimensions('B', B)
+    m, n, k = (dim_A, n_B, m_B) if side_is_left else (m_B, dim_A, n_B)
+
+    # if C is not given, create a stack of matrices with same type as A, computed with beta 0
+    if C is None:
+        beta = 0.
+        C = create_empty_stack(get_batch_size('A', batch_A, 'B', batch_B), m, n, A.dtype)
+
+    # continue getting dimensions of the parameters
+    batch_C, m_C, n_C = get_stack_dimensions('C', C)
+    batch = get_batch_size('C', batch_C, 'A', batch_A, 'B', batch_B)
+
+    # ensure the matrix dimensions conform for the desired operation
+    check_equal_sizes('A', dim_A, 'B', k)
+    check_equal_sizes('A' if side_is_left else 'B', m, 'C', m_C)
+    check_equal_sizes('B' if side_is_left else 'A', n, 'C', n_C)
+
+    # determine which CBLAS subroutine to call and which ctypes data type to use
+    cblas_func, ctype_dtype = get_cblas_info('symm', (A.dtype, B.dtype, C.dtype))
+
+    if batch == 0:
+        return C
+
+    # determine the order of the operations from the order in which the matrices of C are stored,
+    # reference the opposite triangles of A if they are stored in the other order, and ensure the
+    # matrices of B are stored in the same order as C
+    order, ldc, stride_c = get_stack_layout('C', C)
+    check_unshared_output('C', C, batch, stride_c)
+    order_A, lda, stride_a = get_stack_layout('A', A, order)
+    if order_A != order:
+        cblas_uplo = flip_uplo(cblas_uplo)
+    B, ldb, stride_b = convert_stack_layout('B', B, order)
+
+    # call CBLAS using ctypes for every matrix of the stacks
+    call_cblas_batched('symm', C.dtype, cblas_func,
+                       [order, cblas_side, cblas_uplo, m, n, alpha,
+                        None, lda, None, ldb, beta, None, ldc],
+                       ((6, A.ctypes.data, stride_a), (8, B.ctypes.data, stride_b),
+                        (11, C.ctypes.data, stride_c)),
+                       batch, num_threads)
+
+    return C  # C is also overwritten
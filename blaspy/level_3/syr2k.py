@@ -10,9 +10,8 @@
 """
 
 from ..helpers import (get_matrix_dimensions, get_square_matrix_dimension, create_zero_matrix,
-                       check_equal_sizes, convert_uplo, convert_trans, get_cblas_info, ROW_MAJOR,
-                       TRANS)
-from ctypes import c_int, POINTER
+                       check_equal_sizes, convert_uplo, convert_sym_trans, get_cblas_info,
+                       get_matrix_layout, convert_matrix_layout, flip_trans, TRANS)
 
 
 def syr2k(A, B, C=None, uplo='u', trans='n', alpha=1.0, beta=1.0, lda=None, ldb=None, ldc=None):
@@ -33,6 +32,12 @@ def syr2k(A, B, C=None, uplo='u', trans='n', alpha=1.0, beta=1.0, lda=None, ldb=
     and returned. In such a case, 'ldc' is automatically set to the number of columns in the
     newly created matrix C.
 
+    Each of A, B, and C may be stored in either row-major or column-major order, such as a block
+    sliced out of a larger matrix or a transposed view of one. The operation proceeds in the order
+    in which C is stored, and A and B stored in the other order are treated as transposed. Neither A
+    nor B is copied unless they are stored in different orders, in which case B is copied into the
+    order of A.
+
     Args:
         A:        2D NumPy matrix or ndarray representing matrix A
         B:        2D NumPy matrix or ndarray representing matrix B
@@ -51,12 +56,15 @@ def syr2k(A, B, C=None, uplo='u', trans='n', alpha=1.0, beta=1.0, lda=None, ldb=
                       < default is 1.0 >
         beta:     scalar beta
                       < default is 1.0 >
-        lda:      leading dimension of A (must be >= # of cols in A)
-                      < default is the number of columns in A >
-        ldb:      leading dimension of B (must be >= # of cols in B)
-                      < default is the number of columns in B >
-        ldc:      leading dimension of C (must be >= # of cols in C)
-                      < default is the number of columns in C >
+        lda:      leading dimension of A (must be >= # of cols in A, or >= # of rows in A if A is
+                  stored in column-major order)
+                      < default is the spacing in memory of the rows (or columns) of A >
+        ldb:      leading dimension of B (must be >= # of cols in B, or >= # of rows in B if B is
+                  stored in column-major order)
+                      < default is the spacing in memory of the rows (or columns) of B >
+        ldc:      leading dimension of C (must be >= # of cols in C, or >= # of rows in C if C is
+                  stored in column-major order)
+                      < default is the spacing in memory of the rows (or columns) of C >
 
     Returns:
         matrix C (which is also overwritten)
@@ -73,7 +81,7 @@ def syr2k(A, B, C=None, uplo='u', trans='n', alpha=1.0, beta=1.0, lda=None, ldb=
 
     # convert to appropriate CBLAS value
     cblas_uplo = convert_uplo(uplo)
-    cblas_trans = convert_trans(trans)
+    cblas_trans = convert_sym_trans(trans)
     transpose = cblas_trans == TRANS
 
     # get the dimensions of the parameters
@@ -93,13 +101,23 @@ def syr2k(A, B, C=None, uplo='u', trans='n', alpha=1.0, beta=1.0, lda=None, ldb=
     # continue getting dimensions of the parameters
     dim_C = get_square_matrix_dimension('C', C)
 
-    # assign a default value to lda, ldb, and ldc if necessary (assumes row-major order)
+    # determine the order of the operation from the order in which C is stored, ensure B is stored
+    # in the same order as A, and treat both as transposed if they are stored in the other order
+    order, default_ldc = get_matrix_layout('C', C)
+    order_A, default_lda = get_matrix_layout('A', A, order)
+    order_B, default_ldb = get_matrix_layout('B', B, order_A)
+    if order_B != order_A:
+        B, ldb = convert_matrix_layout('B', B, order_A)
+    if order_A != order:
+        cblas_trans = flip_trans(cblas_trans)
+
+    # assign a default value to lda, ldb, and ldc if necessary
     if lda is None:
-        lda = n_A
+        lda = default_lda
     if ldb is None:
-        ldb = n_B
+        ldb = default_ldb
     if ldc is None:
-        ldc = dim_C
+        ldc = default_ldc
 
     # ensure the matrix dimensions conform for the desired operation
     check_equal_sizes('A', n, 'C', dim_C)
@@ -107,17 +125,9 @@ def syr2k(A, B, C=None, uplo='u', trans='n', alpha=1.0, beta=1.0, lda=None, ldb=
     # determine which CBLAS subroutine to call and which ctypes data type to use
     cblas_func, ctype_dtype = get_cblas_info('syr2k', (A.dtype, B.dtype, C.dtype))
 
-    # create a ctypes POINTER for each matrix
-    ctype_A = POINTER(ctype_dtype * n_A * m_A)
-    ctype_B = POINTER(ctype_dtype * n_B * m_B)
-    ctype_C = POINTER(ctype_dtype * dim_C * dim_C)
-
     # call CBLAS using ctypes
-    cblas_func.argtypes = [c_int, c_int, c_int, c_int, c_int, ctype_dtype,
-                           ctype_A, c_int, ctype_B, c_int, ctype_dtype, ctype_C, c_int]
-    cblas_func.restype = None
-    cblas_func(ROW_MAJOR, cblas_uplo, cblas_trans, n, k, alpha,
-               A.ctypes.data_as(ctype_A), lda, B.ctypes.data_as(ctype_B), ldb, beta,
-               C.ctypes.data_as(ctype_C), ldc)
+    cblas_func(order, cblas_uplo, cblas_trans, n, k, alpha,
+               A.ctypes.data, lda, B.ctypes.data, ldb, beta,
+               C.ctypes.data, ldc)
 
     return C  # C is also overwritten
\ No newline at end of file
@@ -10,9 +10,8 @@
 """
 
 from ..helpers import (get_matrix_dimensions, get_square_matrix_dimension, create_zero_matrix,
-                       check_equal_sizes, convert_uplo, convert_trans, get_cblas_info, ROW_MAJOR,
-                       TRANS)
-from ctypes import c_int, POINTER
+                       check_equal_sizes, convert_uplo, convert_sym_trans, get_cblas_info,
+                       get_matrix_layout, flip_trans, TRANS)
 
 
 def syrk(A, C=None, uplo='u', trans='n', alpha=1.0, beta=1.0, lda=None, ldc=None):
@@ -33,6 +32,10 @@ def syrk(A, C=None, uplo='u', trans='n', alpha=1.0, beta=1.0, lda=None, ldc=None
     and returned. In such a case, 'ldc' is automatically set to the number of columns in the
     newly created matrix C.
 
+    Both A and C may be stored in either row-major or column-major order, such as a block sliced out
+    of a larger matrix or a transposed view of one, and are never copied. The operation proceeds in
+    the order in which C is stored, and A stored in the other order is treated as transposed.
+
     Args:
         A:       2D numpy matrix or ndarray representing matrix A
 
@@ -50,10 +53,12 @@ def syrk(A, C=None, uplo='u', trans='n', alpha=1.0, beta=1.0, lda=None, ldc=None
                       < default is 1.0 >
         beta:     scalar beta
                       < default is 1.0 >
-        lda:      leading dimension of A (must be >= # of cols in A)
-                      < default is the number of columns in A >
-        ldc:      leading dimension of C (must be >= # of cols in C)
-                      < default is the number of columns in C >
+        lda:      leading dimension of A (must be >= # of cols in A, or >= # of rows in A if A is
+                  stored in column-major order)
+                      < default is the spacing in memory of the rows (or columns) of A >
+        ldc:      leading dimension of C (must be >= # of cols in C, or >= # of rows in C if C is
+                  stored in column-major order)
+                      < default is the spacing in memory of the rows (or columns) of C >
 
     Returns:
         matrix C (which is also overwritten)
@@ -70,7 +75,7 @@ def syrk(A, C=None, uplo='u', trans='n', alpha=1.0, beta=1.0, lda=None, ldc=None
 
     # convert to appropriate CBLAS value
     cblas_uplo = convert_uplo(uplo)
-    cblas_trans = convert_trans(trans)
+    cblas_trans = convert_sym_trans(trans)
     transpose_a = cblas_trans == TRANS
 
     # get the dimensions of the parameters
@@ -85,11 +90,18 @@ def syrk(A, C=None, uplo='u', trans='n', alpha=1.0, beta=1.0, lda=None, ldc=None
     # continue getting dimensions of the parameters
     dim_C = get_square_matrix_dimension('C', C)
 
-    # assign a default value to lda and ldc if necessary (assumes row-major order)
+    # determine the order of the operation from the order in which C is stored, and treat A as
+    # transposed if it is stored in the other order
+    order, default_ldc = get_matrix_layout('C', C)
+    order_A, default_lda = get_matrix_layout('A', A, order)
+    if order_A != order:
+        cblas_trans = flip_trans(cblas_trans)
+
+    # assign a default value to lda and ldc if necessary
     if lda is None:
-        lda = n_A
+        lda = default_lda
     if ldc is None:
-        ldc = dim_C
+        ldc = default_ldc
 
     # ensure the matrix dimensions conform for the desired operation
     check_equal_sizes('A', n, 'C', dim_C)
@@ -97,15 +109,8 @@ def syrk(A, C=None, uplo='u', trans='n', alpha=1.0, beta=1.0, lda=None, ldc=None
     # determine which CBLAS subroutine to call and which ctypes data type to use
     cblas_func, ctype_dtype = get_cblas_info('syrk', (A.dtype, C.dtype))
 
-    # create a ctypes POINTER for each matrix
-    ctype_A = POINTER(ctype_dtype * n_A * m_A)
-    ctype_C = POINTER(ctype_dtype * dim_C * dim_C)
-
     # call CBLAS using ctypes
-    cblas_func.argtypes = [c_int, c_int, c_int, c_int, c_int, ctype_dtype,
-                           ctype_A, c_int, ctype_dtype, ctype_C, c_int]
-    cblas_func.restype = None
-    cblas_func(ROW_MAJOR, cblas_uplo, cblas_trans, n, k, alpha,
-               A.ctypes.data_as(ctype_A), lda, beta, C.ctypes.data_as(ctype_C), ldc)
+    cblas_func(order, cblas_uplo, cblas_trans, n, k, alpha,
+               A.ctypes.data, lda, beta, C.ctypes.data, ldc)
 
     return C  # C is also overwritten
\ No newline at end of file
@@ -0,0 +1,121 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from ..helpers import (get_stack_dimensions, get_square_stack_dimension, get_batch_size,
+                       get_stack_layout, check_unshared_output, create_zero_stack,
+                       check_equal_sizes, convert_uplo, convert_sym_trans, flip_trans,
+                       get_cblas_info, call_cblas_batched, TRANS)
+
+
+def syrk_batched(A, C=None, uplo='u', trans='n', alpha=1.0, beta=1.0, num_threads=None):
+    """
+    Perform a batch of independent symmetric rank-k update operations.
+
+    C[i] := beta * C[i] + alpha * A[i] * A[i]_T  [trans='n']
+    or
+    C[i] := beta * C[i] + alpha * A[i]_T * A[i]  [trans='t']
+
+    for each i, where alpha and beta are scalars, A[i] is a general matrix, and C[i] is a
+    symmetric matrix.
+
+    A and C are stacks of matrices of the same size, i.e. 3D ndarrays indexed as (matrix, row,
+    column). A 2D ndarray or matrix may be passed for A instead if C is provided, in which case
+    that matrix is shared by every operation of the batch. The 'uplo' and 'trans' arguments have
+    the same meaning as for syrk.
+
+    If C is not provided, a stack of zero matrices of the appropriate size and type is created and
+    returned.
+
+    The matrices of each stack may be stored in either row-major or column-major order and are
+    never copied. If the BLAS library has a strided batched syrk (such as MKL), the whole batch is
+    performed by a single call to it. Otherwise, the batch is split among up to 'num_threads'
+    threads, each of which calls CBLAS once per operation.
+
+    Args:
+        A:              3D NumPy ndarray representing the stack of matrices A[i], or 2D NumPy
+                        ndarray or matrix shared by every operation
+
+        --optional arguments--
+
+        C:              3D NumPy ndarray representing the stack of matrices C[i]
+                            < default is a stack of zero matrices >
+        uplo:           'u'  if the upper triangular part of each C[i] is to be used/overwritten
+                        'l'  if the lower triangular part of each C[i] is to be used/overwritten
+                            < default is 'u' >
+        trans:          'n'  if the operation is to proceed as if each A[i] is not transposed
+                        't'  if the operation is to proceed as if each A[i] is transposed
+                            < default is 'n' >
+        alpha:          scalar alpha
+                            < default is 1.0 >
+        beta:           scalar beta
+                            < default is 1.0 >
+        num_threads:    largest number of threads among which to split the batch
+                            < default is the number of CPUs >
+
+    Returns:
+        Stack C (which is also overwritten)
+
+    Raises:
+        ValueError: if any of the following conditions occur:
+                    - A is not a 3D NumPy ndarray or a 2D NumPy ndarray or matrix
+                    - C is not a 3D NumPy ndarray, or A is not one when C is not provided
+                    - the stacks do not hold the same number of matrices
+                    - A and C do not have the same dtype or that dtype is not supported
+                    - the matrices of C are not square
+                    - the dimensions of the matrices of A and C do not conform
+                    - the matrices of A or C are stored in neither row-major nor column-major
+                      order, or the matrices of C overlap in memory
+                    - 'uplo' is not equal to one of the following: 'u', 'U', 'l', 'L'
+                    - 'trans' is not equal to one of the following: 'n', 'N', 't', 'T'
+                    - 'num_threads' is not an integer >= 1
+    """
+
+    # convert to appropriate CBLAS value
+    cblas_uplo = convert_uplo(uplo)
+    cblas_trans = convert_sym_trans(trans)
+    transpose_a = cblas_trans == TRANS
+
+    # get the dimensions of the parameters
+    batch_A, m_A, n_A = get_stack_dimensions('A', A)
+    n, k = (m_A, n_A) if not transpose_a else (n_A, m_A)
+
+    # if C is not given, create a stack of zero matrices with same type as A
+    if C is None:
+        C = create_zero_stack(get_batch_size('A', batch_A), n, n, A.dtype)
+
+    # continue getting dimensions of the parameters
+    batch_C, dim_C = get_square_stack_dimension('C', C)
+    batch = get_batch_size('C', batch_C, 'A', batch_A)
+
+    # ensure the matrix dimensions conform for the desired operation
+    check_equal_sizes('A', n, 'C', dim_C)
+
+    # determine which CBLAS subroutine to call and which ctypes data type to use
+    cblas_func, ctype_dtype = get_cblas_info('syrk', (A.dtype, C.dtype))
+
+    if batch == 0:
+        return C
+
+    # determine the order of the operations from the order in which the matrices of C are stored,
+    # and treat the matrices of A as transposed if they are stored in the other order
+    order, ldc, stride_c = get_stack_layout('C', C)
+    check_unshared_output('C', C, batch, stride_c)
+    order_A, lda, stride_a = get_stack_layout('A', A, order)
+    if order_A != order:
+        cblas_trans = flip_trans(cblas_trans)
+
+    # call CBLAS using ctypes for every matrix of the stacks
+    call_cblas_batched('syrk', C.dtype, cblas_func,
+                       [order, cblas_uplo, cblas_trans, n, k, alpha, None, lda, beta, None, ldc],
+                       ((6, A.ctypes.data, stride_a), (9, C.ctypes.data, stride_c)),
+                       batch, num_threads)
+
+    return C  # C is also overwritten
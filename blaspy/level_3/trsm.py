@@ -11,8 +11,7 @@
 
 from ..helpers import (get_matrix_dimensions, get_square_matrix_dimension, check_equal_sizes,
                        convert_side, convert_uplo, convert_trans, convert_diag, get_cblas_info,
-                       ROW_MAJOR, LEFT)
-from ctypes import c_int, POINTER
+                       get_matrix_layout, match_matrix_layout, flip_uplo, LEFT)
 
 
 def trsm(A, B, side='l', uplo='u', trans_a='n', diag='n', alpha=1.0, lda=None, ldb=None):
@@ -34,8 +33,14 @@ def trsm(A, B, side='l', uplo='u', trans_a='n', diag='n', alpha=1.0, lda=None, l
     The 'side' argument indicates whether the triangular matrix A is multiplied on the left side or
     the right side of X. The 'uplo' argument indicates whether the lower or upper triangle of A is
     referenced by the operation. The 'trans_a' argument indicates allows the computation to proceed
-    as if A is tranposed. The 'diag' argument indicates whether the diagonal of A is unit or
-    non-unit.
+    as if A is tranposed or conjugate transposed. The 'diag' argument indicates whether the
+    diagonal of A is unit or non-unit.
+
+    Both A and B may be stored in either row-major or column-major order, such as a block sliced out
+    of a larger matrix or a transposed view of one, and are never copied. The operation proceeds in
+    the order in which B is stored, and A stored in the other order is treated as transposed with
+    the opposite triangle referenced (except that a complex A which is to be conjugate transposed is
+    copied into the order of B).
 
     WARNING: This function does not test for singularity or near-singularity. Such tests should
              be performed prior to calling this function.
@@ -54,16 +59,19 @@ def trsm(A, B, side='l', uplo='u', trans_a='n', diag='n', alpha=1.0, lda=None, l
                         < default is 'u' >
         trans_a:    'n'  if the operation is to proceed as if A is not transposed
                     't'  if the operation is to proceed as if A is transposed
+                    'c'  if the operation is to proceed as if A is conjugate transposed
                         < default is 'n' >
         diag:       'n'  if the diagonal of A is non-unit
                     'u'  if the diagonal of A is unit
                         < default is 'n' >
         alpha:      scalar alpha
                         < default is 1.0 >
-        lda:        leading dimension of A (must be >= # of cols in A)
-                        < default is the number of columns in A >
-        ldb:        leading dimension of B (must be >= # of cols in B)
-                        < default is the number of columns in B >
+        lda:        leading dimension of A (must be >= # of cols in A, or >= # of rows in A if A is
+                    stored in column-major order)
+                        < default is the spacing in memory of the rows (or columns) of A >
+        ldb:        leading dimension of B (must be >= # of cols in B, or >= # of rows in B if B is
+                    stored in column-major order)
+                        < default is the spacing in memory of the rows (or columns) of B >
 
     Raises:
         ValueError: if any of the following conditions occur:
@@ -88,11 +96,15 @@ def trsm(A, B, side='l', uplo='u', trans_a='n', diag='n', alpha=1.0, lda=None, l
     dim_A = get_square_matrix_dimension('A', A)
     m_B, n_B = get_matrix_dimensions('B', B)
 
-    # assign a default value to lda, ldb, and ldc if necessary (assumes row-major order)
-    if lda is None:
-        lda = dim_A
+    # determine the order of the operation from the order in which B is stored, and treat A as
+    # transposed (with the opposite triangle referenced) if it is stored in the other order,
+    # assigning a default value to lda and ldb if necessary
+    order, default_ldb = get_matrix_layout('B', B)
+    A, lda, cblas_trans_flipped = match_matrix_layout('A', A, lda, order, cblas_trans_a)
+    if cblas_trans_flipped != cblas_trans_a:
+        cblas_trans_a, cblas_uplo = cblas_trans_flipped, flip_uplo(cblas_uplo)
     if ldb is None:
-        ldb = n_B
+        ldb = default_ldb
 
     # ensure the matrix dimensions conform for the desired operation
     if side_is_left:
@@ -103,13 +115,6 @@ def trsm(A, B, side='l', uplo='u', trans_a='n', diag='n', alpha=1.0, lda=None, l
     # determine which CBLAS subroutine to call and which ctypes data type to use
     cblas_func, ctype_dtype = get_cblas_info('trsm', (A.dtype, B.dtype))
 
-    # create a ctypes POINTER for each matrix
-    ctype_A = POINTER(ctype_dtype * dim_A * dim_A)
-    ctype_B = POINTER(ctype_dtype * n_B * m_B)
-
     # call CBLAS using ctypes
-    cblas_func.argtypes = [c_int, c_int, c_int, c_int, c_int, c_int, c_int, ctype_dtype,
-                           ctype_A, c_int, ctype_B, c_int]
-    cblas_func.restype = None
-    cblas_func(ROW_MAJOR, cblas_side, cblas_uplo, cblas_trans_a, cblas_diag, m_B, n_B, alpha,
-               A.ctypes.data_as(ctype_A), lda, B.ctypes.data_as(ctype_B), ldb)
\ No newline at end of file
+    cblas_func(order, cblas_side, cblas_uplo, cblas_trans_a, cblas_diag, m_B, n_B, alpha,
+               A.ctypes.data, lda, B.ctypes.data, ldb)
\ No newline at end of file
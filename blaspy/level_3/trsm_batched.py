@@ -0,0 +1,124 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from ..helpers import (get_stack_dimensions, get_square_stack_dimension, get_batch_size,
+                       get_stack_layout, convert_stack_layout, check_unshared_output,
+                       check_equal_sizes, convert_side, convert_uplo, convert_trans, convert_diag,
+                       flip_trans, flip_uplo, get_cblas_info, call_cblas_batched, LEFT, CONJ_TRANS)
+
+
+def trsm_batched(A, B, side='l', uplo='u', trans_a='n', diag='n', alpha=1.0, num_threads=None):
+    """
+    Perform a batch of independent triangular solves with multiple right-hand sides.
+
+    A[i] * X[i] = alpha * B[i]  [side='l']
+    or
+    X[i] * A[i] = alpha * B[i]  [side='r']
+
+    for each i, which is solved by overwriting B[i] with the solution matrix X[i], where alpha is a
+    scalar, A[i] is a triangular matrix, and X[i] and B[i] are general matrices.
+
+    A and B are stacks of matrices of the same size, i.e. 3D ndarrays indexed as (matrix, row,
+    column). A 2D ndarray or matrix may be passed for A instead, in which case that matrix is
+    shared by every operation of the batch. The 'side', 'uplo', 'trans_a', and 'diag' arguments
+    have the same meaning as for trsm.
+
+    The matrices of each stack may be stored in either row-major or column-major order and are
+    never copied, except that a complex stack A which is to be conjugate transposed is copied into
+    the order of B. If the BLAS library has a strided batched trsm (such as MKL), the whole batch is
+    performed by a single call to it. Otherwise, the batch is split among up to 'num_threads'
+    threads, each of which calls CBLAS once per operation.
+
+    WARNING: This function does not test for singularity or near-singularity. Such tests should
+             be performed prior to calling this function.
+
+    Args:
+        A:              3D NumPy ndarray representing the stack of matrices A[i], or 2D NumPy
+                        ndarray or matrix shared by every operation
+        B:              3D NumPy ndarray representing the stack of matrices B[i]
+
+        --optional arguments--
+
+        side:           'l'  if the operation is to proceed as if each A[i] is to the left of X[i]
+                        'r'  if the operation is to proceed as if each A[i] is to the right of X[i]
+                            < default is 'l' >
+        uplo:           'u'  if the upper triangular part of each A[i] is to be used
+                        'l'  if the lower triangular part of each A[i] is to be used
+                            < default is 'u' >
+        trans_a:        'n'  if the operation is to proceed as if each A[i] is not transposed
+                        't'  if the operation is to proceed as if each A[i] is transposed
+                        'c'  if the operation is to proceed as if each A[i] is conjugate transposed
+                            < default is 'n' >
+        diag:           'n'  if the diagonal of each A[i] is non-unit
+                        'u'  if the diagonal of each A[i] is unit
+                            < default is 'n' >
+        alpha:          scalar alpha
+                            < default is 1.0 >
+        num_threads:    largest number of threads among which to split the batch
+                            < default is the number of CPUs >
+
+    Raises:
+        ValueError: if any of the following conditions occur:
+                    - A is not a 3D NumPy ndarray or a 2D NumPy ndarray or matrix
+                    - B is not a 3D NumPy ndarray
+                    - the stacks do not hold the same number of matrices
+                    - A and B do not have the same dtype or that dtype is not supported
+                    - the matrices of A are not square
+                    - the dimensions of the matrices of A and B do not conform
+                    - the matrices of A or B are stored in neither row-major nor column-major
+                      order, or the matrices of B overlap in memory
+                    - 'side' is not equal to one of the following: 'l', 'L', 'r', 'R'
+                    - 'uplo' is not equal to one of the following: 'u', 'U', 'l', 'L'
+                    - 'trans_a' is not equal to one of the following: 'n', 'N', 't', 'T', 'c',
+                      'C'
+                    - 'diag' is not equal to one of the following: 'n', 'N', 'u', 'U'
+                    - 'num_threads' is not an integer >= 1
+    """
+
+    # convert to appropriate CBLAS value
+    cblas_side = convert_side(side)
+    cblas_uplo = convert_uplo(uplo)
+    cblas_trans_a = convert_trans(trans_a)
+    cblas_diag = convert_diag(diag)
+    side_is_left = cblas_side == LEFT
+
+    # get the dimensions of the parameters
+    batch_A, dim_A = get_square_stack_dimension('A', A)
+    batch_B, m_B, n_B = get_stack_dimensions('B', B)
+    batch = get_batch_size('B', batch_B, 'A', batch_A)
+
+    # ensure the matrix dimensions conform for the desired operation
+    check_equal_sizes('A', dim_A, 'B', m_B if side_is_left else n_B)
+
+    # determine which CBLAS subroutine to call and which ctypes data type to use
+    cblas_func, ctype_dtype = get_cblas_info('trsm', (A.dtype, B.dtype))
+
+    if batch == 0:
+        return
+
+    # determine the order of the operations from the order in which the matrices of B are stored,
+    # and treat the matrices of A as transposed (with the opposite triangle referenced) if they are
+    # stored in the other order
+    order, ldb, stride_b = get_stack_layout('B', B)
+    check_unshared_output('B', B, batch, stride_b)
+    order_A, lda, stride_a = get_stack_layout('A', A, order)
+    if order_A != order:
+        if cblas_trans_a == CONJ_TRANS:
+            A, lda, stride_a = convert_stack_layout('A', A, order)
+        else:
+            cblas_trans_a, cblas_uplo = flip_trans(cblas_trans_a), flip_uplo(cblas_uplo)
+
+    # call CBLAS using ctypes for every matrix of the stacks
+    call_cblas_batched('trsm', B.dtype, cblas_func,
+                       [order, cblas_side, cblas_uplo, cblas_trans_a, cblas_diag, m_B, n_B, alpha,
+                        None, lda, None, ldb],
+                       ((8, A.ctypes.data, stride_a), (10, B.ctypes.data, stride_b)),
+                       batch, num_threads)
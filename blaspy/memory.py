@@ -0,0 +1,185 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+    Allocation of NumPy arrays for BLAS operands: aligned to a cache line (or any other
+    boundary), optionally backed by huge pages, and zeroed by several threads at once.
+
+    BLAS kernels load and store whole cache lines, so an operand which starts on a cache line
+    boundary needs no partial loads. A large operand spans many pages, and each 4 KiB page takes
+    an entry of the TLB; backing it with 2 MiB huge pages (madvise(MADV_HUGEPAGE) on an mmap, on
+    Linux) lets far fewer entries cover it. The first write to each page of new memory is a page
+    fault, and on a machine with several memory nodes the page is placed on the node of the
+    thread which writes it, so a large array of zeros is written by several threads at once.
+
+"""
+
+from .errors import raise_invalid_alignment
+from concurrent.futures import ThreadPoolExecutor
+from numbers import Integral
+from numpy import dtype as np_dtype, empty as np_empty, frombuffer, uint8
+from os import cpu_count
+from threading import Lock
+import mmap
+
+# the default alignment in bytes of the arrays (a cache line)
+ALIGNMENT = 64
+
+# the size in bytes of the smallest array which the pool of BLASpy aligns (a smaller one has the
+# alignment NumPy gives it, since finding its address costs more than aligning it can save)
+ALIGNED_MIN_BYTES = 1 << 12
+
+# the size in bytes of a huge page, to which memory backed by huge pages is aligned
+HUGE_PAGE_SIZE = 1 << 21
+
+# the size in bytes of the smallest array which is backed by huge pages by default
+HUGE_PAGE_MIN_BYTES = 1 << 23
+
+# the size in bytes of the smallest array which is zeroed by several threads, and of the smallest
+# part zeroed by each
+FIRST_TOUCH_MIN_BYTES = 1 << 22
+
+# the madvise flag which asks for huge pages, or None if this system has none
+MADV_HUGEPAGE = getattr(mmap, 'MADV_HUGEPAGE', None)
+
+_TOUCH_EXECUTOR = None
+_TOUCH_EXECUTOR_LOCK = Lock()
+
+
+def empty(shape, dtype=float, order='C', alignment=ALIGNMENT, huge_pages=None):
+    """
+    Return a new array whose elements are not initialized, like numpy.empty, whose first element
+    is aligned to 'alignment' bytes.
+
+    Args:
+        shape:         shape of the array
+
+        --optional arguments--
+
+        dtype:         NumPy dtype of the elements
+                           < default is float >
+        order:         'C' for row-major or 'F' for column-major order
+                           < default is 'C' >
+        alignment:     alignment in bytes of the first element, a power of two
+                           < default is ALIGNMENT (64) >
+        huge_pages:    True to back the array with huge pages (where the system has them), False
+                       not to, or None to do so if it has at least HUGE_PAGE_MIN_BYTES (8 MiB)
+                           < default is None >
+
+    Returns:
+        A NumPy ndarray.
+
+    Raises:
+        ValueError: if 'alignment' is not a power of two
+    """
+
+    dtype = np_dtype(dtype)
+    shape = (shape,) if isinstance(shape, Integral) else tuple(shape)
+    nbytes = dtype.itemsize
+    for length in shape:
+        nbytes *= length
+
+    array = allocate(nbytes, alignment, huge_pages).view(dtype)
+    return array.reshape(shape[::-1]).T if order in ('F', 'f') else array.reshape(shape)
+
+
+def zeros(shape, dtype=float, order='C', alignment=ALIGNMENT, huge_pages=None, num_threads=None):
+    """
+    Return a new array of zeros, like numpy.zeros, whose first element is aligned to 'alignment'
+    bytes. An array of at least FIRST_TOUCH_MIN_BYTES (4 MiB) is zeroed by up to 'num_threads'
+    threads, each writing a contiguous part of it, so that its pages are first touched by the
+    threads in parallel.
+
+    Args:
+        shape:          shape of the array
+
+        --optional arguments--
+
+        dtype:          NumPy dtype of the elements
+                            < default is float >
+        order:          'C' for row-major or 'F' for column-major order
+                            < default is 'C' >
+        alignment:      alignment in bytes of the first element, a power of two
+                            < default is ALIGNMENT (64) >
+        huge_pages:     True to back the array with huge pages (where the system has them),
+                        False not to, or None to do so if it has at least HUGE_PAGE_MIN_BYTES
+                            < default is None >
+        num_threads:    largest number of threads among which to split the zeroing
+                            < default is the number of CPUs >
+
+    Returns:
+        A NumPy ndarray.
+
+    Raises:
+        ValueError: if 'alignment' is not a power of two
+    """
+
+    array = empty(shape, dtype, order, alignment, huge_pages)
+    fill_zeros(array.reshape(-1, order='A'), num_threads)
+    return array
+
+
+def is_aligned(array, alignment=ALIGNMENT):
+    """ Return True if the first element of an ndarray is aligned to 'alignment' bytes. """
+    return array.ctypes.data % alignment == 0
+
+
+def allocate(nbytes, alignment=ALIGNMENT, huge_pages=None):
+    """
+    Return a 1D uint8 ndarray of 'nbytes' bytes whose first element is aligned to 'alignment'
+    bytes, backed by huge pages if 'huge_pages' is True (or None and 'nbytes' is at least
+    HUGE_PAGE_MIN_BYTES) and the system has them.
+    """
+
+    if not isinstance(alignment, Integral) or alignment < 1 or alignment & (alignment - 1):
+        raise_invalid_alignment(alignment)
+
+    if huge_pages is None:
+        huge_pages = nbytes >= HUGE_PAGE_MIN_BYTES
+    if huge_pages and MADV_HUGEPAGE is not None and nbytes > 0:
+        # map whole huge pages, starting on a huge page boundary
+        alignment = max(alignment, HUGE_PAGE_SIZE)
+        mapping = mmap.mmap(-1, nbytes + alignment)
+        mapping.madvise(MADV_HUGEPAGE)
+        buffer = frombuffer(mapping, uint8)
+    else:
+        buffer = np_empty(nbytes + alignment - 1, uint8)
+
+    offset = -buffer.ctypes.data % alignment
+    return buffer[offset:offset + nbytes]
+
+
+def fill_zeros(vector, num_threads=None):
+    """
+    Set every element of a contiguous 1D ndarray to zero, splitting it among up to 'num_threads'
+    threads if it has at least FIRST_TOUCH_MIN_BYTES.
+    """
+
+    num_threads = min(num_threads or cpu_count() or 1, vector.nbytes // FIRST_TOUCH_MIN_BYTES)
+    if num_threads <= 1:
+        vector.fill(0)
+        return
+
+    # each thread zeroes a contiguous part, the first part zeroed by the calling thread
+    bounds = [len(vector) * part // num_threads for part in range(num_threads + 1)]
+    parts = [vector[bounds[part]:bounds[part + 1]] for part in range(num_threads)]
+    executor = get_touch_executor()
+    futures = [executor.submit(part.fill, 0) for part in parts[1:]]
+    parts[0].fill(0)
+    for future in futures:
+        future.result()
+
+
+def get_touch_executor():
+    """ Return the shared thread pool which zeroes parts of large arrays, creating it if needed. """
+
+    global _TOUCH_EXECUTOR
+    with _TOUCH_EXECUTOR_LOCK:
+        if _TOUCH_EXECUTOR is None:
+            _TOUCH_EXECUTOR = ThreadPoolExecutor(cpu_count() or 1, 'blaspy-first-touch')
+        return _TOUCH_EXECUTOR
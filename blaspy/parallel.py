@@ -0,0 +1,193 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+    An executor which runs many independent BLASpy calls at once on a fixed pool of worker threads.
+
+    Every CBLAS subroutine is called through ctypes, which releases the GIL for the duration of the
+    call, so the workers compute in parallel. To avoid oversubscribing the cores, the BLAS library
+    is run with (number of cores) // (number of workers) threads per call while an executor is open:
+    through a per-thread control such as mkl_set_num_threads_local in each worker if the library
+    has one, and otherwise through its process-wide control (see blaspy.set_num_threads), which is
+    restored when the last open executor is shut down.
+
+    Example:
+        with blaspy.parallel.Executor() as executor:
+            futures = executor.map(blaspy.gemm, A_list, B_list)
+        C_list = [future.result() for future in futures]
+
+"""
+
+from .backend import (get_num_threads, set_num_threads, get_local_thread_control,
+                      set_local_num_threads)
+from .config import get_libblas
+from .errors import raise_invalid_num_workers, raise_invalid_num_threads, raise_executor_shut_down
+from concurrent.futures import ThreadPoolExecutor
+from numbers import Integral
+from os import cpu_count
+from threading import Lock
+
+# the number of open executors which set the process-wide number of BLAS threads, and the number of
+# BLAS threads to restore when the last of them is shut down
+_OPEN_EXECUTORS = 0
+_PREVIOUS_NUM_THREADS = None
+_OPEN_EXECUTORS_LOCK = Lock()
+
+
+class Executor(object):
+    """
+    A fixed pool of worker threads which runs independent BLASpy calls (or any other callables)
+    and returns futures of their results.
+
+    Attributes:
+        max_workers:     number of worker threads
+        blas_threads:    number of threads the BLAS library runs each call with while the executor
+                         is open
+    """
+
+    def __init__(self, max_workers=None, blas_threads=None):
+        """
+        Create the worker threads and set the number of BLAS threads.
+
+        Args:
+            --optional arguments--
+
+            max_workers:     number of worker threads (must be >= 1)
+                                 < default is the number of CPUs >
+            blas_threads:    number of threads the BLAS library runs each call with (must be >= 1)
+                                 < default is the number of CPUs // max_workers, at least 1 >
+
+        Raises:
+            ValueError: if max_workers or blas_threads is not an integer >= 1
+        """
+
+        num_cpus = cpu_count() or 1
+        if max_workers is None:
+            max_workers = num_cpus
+        if not isinstance(max_workers, Integral) or max_workers < 1:
+            raise_invalid_num_workers(max_workers)
+        if blas_threads is None:
+            blas_threads = max(1, num_cpus // max_workers)
+        if not isinstance(blas_threads, Integral) or blas_threads < 1:
+            raise_invalid_num_threads(blas_threads)
+
+        self.max_workers = max_workers
+        self.blas_threads = blas_threads
+        self._lock = Lock()
+        self._sets_process_threads = (get_local_thread_control(get_libblas()) is None and
+                                      open_executor(blas_threads))
+        self._pool = ThreadPoolExecutor(max_workers, 'blaspy-parallel', set_local_num_threads,
+                                        (blas_threads,))
+
+    def submit(self, func, *args, **kwargs):
+        """
+        Schedule a call to run on a worker thread.
+
+        Args:
+            func:      the callable, such as a BLASpy function
+            args:      positional arguments of the call
+            kwargs:    keyword arguments of the call
+
+        Returns:
+            A concurrent.futures.Future of the result of the call.
+
+        Raises:
+            RuntimeError: if the executor has been shut down
+        """
+
+        with self._lock:
+            if self._pool is None:
+                raise_executor_shut_down()
+            return self._pool.submit(func, *args, **kwargs)
+
+    def map(self, func, *iterables):
+        """
+        Schedule one call per set of arguments taken in turn from each iterable, as for the built-in
+        map, to run on the worker threads.
+
+        Unlike concurrent.futures.Executor.map, the calls are all scheduled before this returns and
+        their futures (rather than their results) are returned, so that the results can be
+        collected in any order and an error in one call does not hide the results of the others.
+
+        Args:
+            func:         the callable, such as a BLASpy function
+            iterables:    iterables of the positional arguments of the calls
+
+        Returns:
+            A list of the concurrent.futures.Future of the result of each call, in order.
+
+        Raises:
+            RuntimeError: if the executor has been shut down
+        """
+
+        return [self.submit(func, *args) for args in zip(*iterables)]
+
+    def shutdown(self, wait=True):
+        """
+        Stop accepting calls, and restore the number of BLAS threads if this is the last open
+        executor. Calls already scheduled still run.
+
+        Args:
+            --optional arguments--
+
+            wait:    True if this is to return only after every scheduled call has finished
+                         < default is True >
+        """
+
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is None:
+            return
+
+        pool.shutdown(wait)
+        if self._sets_process_threads:
+            close_executor()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+        return False
+
+
+def open_executor(blas_threads):
+    """
+    Set the process-wide number of BLAS threads for an executor being opened, remembering the
+    previous number if no other executor is open.
+
+    Returns:
+        True if the number of threads was set, or False if the library has no thread control.
+    """
+
+    global _OPEN_EXECUTORS, _PREVIOUS_NUM_THREADS
+    with _OPEN_EXECUTORS_LOCK:
+        num_threads = get_num_threads()
+        if num_threads is None:
+            return False
+        if _OPEN_EXECUTORS == 0:
+            _PREVIOUS_NUM_THREADS = num_threads
+        _OPEN_EXECUTORS += 1
+        set_num_threads(blas_threads)
+        return True
+
+
+def close_executor():
+    """
+    Restore the process-wide number of BLAS threads if the executor being shut down is the last
+    open executor.
+    """
+
+    global _OPEN_EXECUTORS, _PREVIOUS_NUM_THREADS
+    with _OPEN_EXECUTORS_LOCK:
+        if _OPEN_EXECUTORS == 0:
+            return
+        _OPEN_EXECUTORS -= 1
+        if _OPEN_EXECUTORS == 0:
+            set_num_threads(_PREVIOUS_NUM_THREADS)
+            _PREVIOUS_NUM_THREADS = None
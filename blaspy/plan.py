@@ -0,0 +1,453 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from .errors import (raise_not_2d_numpy, raise_not_vector, raise_not_vector_numpy, raise_not_square,
+                     raise_invalid_parameter, raise_num_shapes_mismatch,
+                     raise_negative_plan_increment)
+from .helpers import (get_cblas_info, get_address, check_equal_sizes, convert_uplo, convert_trans,
+                      convert_sym_trans, convert_herm_trans, convert_diag, convert_side, ROW_MAJOR,
+                      NO_TRANS, LEFT)
+from numpy import dtype as np_dtype
+
+
+class Plan(object):
+    """
+    A BLASpy function call whose CBLAS subroutine, flags, dimensions, leading dimensions, strides,
+    and scalars have all been resolved ahead of time for operands of fixed shapes and dtype.
+
+    Calling the plan with the operands performs the operation without any further validation, so
+    the operands must have the shapes and dtype the plan was created with. Matrices are assumed to
+    be stored in row-major (C-contiguous) order.
+    """
+
+    def __init__(self, name, cblas_func, args, positions, output):
+        self.name = name
+        self._cblas_func = cblas_func
+        self._args = args
+        self._positions = positions
+        self._output = output
+
+    def __call__(self, *operands):
+        """
+        Perform the planned operation on the given NumPy matrices or ndarrays.
+
+        Args:
+            operands:   the matrices and vectors of the planned function, in the same order as
+                        the shapes given to plan()
+
+        Returns:
+            The same value the planned BLASpy function returns.
+        """
+
+        result = self.execute(*[get_address(operand) for operand in operands])
+        return result if self._output is None else operands[self._output]
+
+    def execute(self, *addresses):
+        """
+        Perform the planned operation on operands given by the addresses of their first elements.
+
+        Args:
+            addresses:  the integer address (e.g. A.ctypes.data) of each matrix and vector of the
+                        planned function, in the same order as the shapes given to plan()
+
+        Returns:
+            The return value of the CBLAS subroutine.
+        """
+
+        args = list(self._args)
+        for position, address in zip(self._positions, addresses):
+            args[position] = address
+        return self._cblas_func(*args)
+
+    def __repr__(self):
+        return "Plan(%r)" % (self.name,)
+
+
+def plan(name, shapes, dtype, **kwargs):
+    """
+    Create a reusable plan for calling a BLASpy function with operands of fixed shapes and dtype.
+
+    All of the validation normally performed by the BLASpy function is performed once, here, so
+    that executing the plan costs little more than the CBLAS call itself. For example,
+
+        gemm_plan = plan('gemm', (A.shape, B.shape, C.shape), 'float64', trans_a='t', beta=0.0)
+        gemm_plan(A, B, C)
+
+    is equivalent to gemm(A, B, C, trans_a='t', beta=0.0).
+
+    Args:
+        name:       name of the BLASpy function to plan (e.g. 'gemm')
+        shapes:     tuple of the shapes of every matrix and vector of the function, in the order
+                    of the function's parameters (all matrices and vectors are required, including
+                    those the function would otherwise create)
+        dtype:      NumPy dtype shared by all of the matrices and vectors
+
+        --optional arguments--
+
+        kwargs:     any other parameters of the BLASpy function (e.g. trans_a, alpha, lda, inc_x)
+                        < defaults are the defaults of the BLASpy function >
+
+    Returns:
+        A Plan which performs the operation when called with the matrices and vectors.
+
+    Raises:
+        ValueError: if any of the following conditions occur:
+                    - 'name' is not the name of a BLASpy function
+                    - the number of shapes is not the number of matrices and vectors of the function
+                    - the shapes do not conform for the function
+                    - the dtype is not supported by the function
+                    - any other parameter is not valid for the function
+    """
+
+    if name not in PLANNERS:
+        raise_invalid_parameter('name', tuple(sorted(PLANNERS)), name)
+
+    planner, names = PLANNERS[name]
+    if len(shapes) != len(names):
+        raise_num_shapes_mismatch(name, names, len(shapes))
+
+    cblas_name, args, positions, output = planner(*shapes, **kwargs)
+    cblas_func, ctype_dtype = get_cblas_info(cblas_name, (np_dtype(dtype),))
+
+    return Plan(name, cblas_func, args, positions, output)
+
+
+def matrix_dimensions(name, shape):
+    """ Return the number of rows and number of columns of a matrix with the given shape. """
+    if len(shape) != 2:
+        raise_not_2d_numpy(name)
+    return shape
+
+
+def square_matrix_dimension(name, shape):
+    """ Return the dimension of a square matrix with the given shape. """
+    rows, cols = matrix_dimensions(name, shape)
+    if rows != cols:
+        raise_not_square(name, rows, cols)
+    return rows
+
+
+def vector_length(name, shape, stride):
+    """
+    Return the length of a vector with the given shape after accounting for its stride. A vector
+    with a negative stride is passed to CBLAS by the address of its first element, which is the
+    lowest address of a contiguous vector, as CBLAS expects for a negative increment.
+    """
+    if len(shape) == 1:
+        rows, cols = shape[0], 1
+    elif len(shape) == 2:
+        rows, cols = shape
+    else:
+        raise_not_vector_numpy(name)
+    if not (rows == 1 or cols == 1):
+        raise_not_vector(name, rows, cols)
+    length = rows * cols  # the other dimension is 1, unless the vector is empty
+    return (length // abs(stride)) + (length % abs(stride) > 0) if abs(stride) > 1 else length
+
+
+#########################
+# LEVEL 1               #
+#########################
+
+def plan_amax(x, inc_x=1):
+    if inc_x <= 0:
+        raise_negative_plan_increment('amax', inc_x)
+    return 'amax', [vector_length('x', x, inc_x), None, inc_x], (1,), None
+
+
+def plan_asum(x, inc_x=1):
+    # CBLAS does not permit a negative increment here, but the result does not depend on the order
+    # of the elements
+    return 'asum', [vector_length('x', x, inc_x), None, abs(inc_x)], (1,), None
+
+
+def plan_axpy(x, y, alpha=1.0, inc_x=1, inc_y=1):
+    x_length = vector_length('x', x, inc_x)
+    check_equal_sizes('x', x_length, 'y', vector_length('y', y, inc_y))
+    return 'axpy', [x_length, alpha, None, inc_x, None, inc_y], (2, 4), 1
+
+
+def plan_copy(x, y, inc_x=1, inc_y=1):
+    x_length = vector_length('x', x, inc_x)
+    check_equal_sizes('x', x_length, 'y', vector_length('y', y, inc_y))
+    return 'copy', [x_length, None, inc_x, None, inc_y], (1, 3), 1
+
+
+def plan_dot(x, y, inc_x=1, inc_y=1):
+    x_length = vector_length('x', x, inc_x)
+    check_equal_sizes('x', x_length, 'y', vector_length('y', y, inc_y))
+    return 'dot', [x_length, None, inc_x, None, inc_y], (1, 3), None
+
+
+def plan_dotc(x, y, inc_x=1, inc_y=1):
+    x_length = vector_length('x', x, inc_x)
+    check_equal_sizes('x', x_length, 'y', vector_length('y', y, inc_y))
+    return 'dotc', [x_length, None, inc_x, None, inc_y], (1, 3), None
+
+
+def plan_nrm2(x, inc_x=1):
+    # CBLAS does not permit a negative increment here, but the result does not depend on the order
+    # of the elements
+    return 'nrm2', [vector_length('x', x, inc_x), None, abs(inc_x)], (1,), None
+
+
+def plan_scal(x, alpha=1.0, inc_x=1):
+    # CBLAS does not permit a negative increment here, but the result does not depend on the order
+    # of the elements
+    return 'scal', [vector_length('x', x, inc_x), alpha, None, abs(inc_x)], (2,), 0
+
+
+def plan_sdot(x, y, inc_x=1, inc_y=1, output='float64'):
+    x_length = vector_length('x', x, inc_x)
+    check_equal_sizes('x', x_length, 'y', vector_length('y', y, inc_y))
+    if output == 'float64':
+        return 'dsdot', [x_length, None, inc_x, None, inc_y], (1, 3), None
+    elif output == 'float32':
+        return 'sdsdot', [x_length, 0, None, inc_x, None, inc_y], (2, 4), None
+    else:
+        raise_invalid_parameter('output', ('float32', 'float64'), output)
+
+
+def plan_swap(x, y, inc_x=1, inc_y=1):
+    x_length = vector_length('x', x, inc_x)
+    check_equal_sizes('x', x_length, 'y', vector_length('y', y, inc_y))
+    return 'swap', [x_length, None, inc_x, None, inc_y], (1, 3), 1
+
+
+#########################
+# LEVEL 2               #
+#########################
+
+def plan_gemv(A, x, y, trans_a='n', alpha=1.0, beta=1.0, lda=None, inc_x=1, inc_y=1):
+    cblas_trans_a = convert_trans(trans_a)
+    m_A, n_A = matrix_dimensions('A', A)
+    x_check, y_check = (n_A, m_A) if cblas_trans_a == NO_TRANS else (m_A, n_A)
+    check_equal_sizes('A', x_check, 'x', vector_length('x', x, inc_x))
+    check_equal_sizes('A', y_check, 'y', vector_length('y', y, inc_y))
+    lda = n_A if lda is None else lda
+    return ('gemv', [ROW_MAJOR, cblas_trans_a, m_A, n_A, alpha, None, lda, None, inc_x, beta,
+                     None, inc_y], (5, 7, 10), 2)
+
+
+def plan_ger(x, y, A, alpha=1.0, lda=None, inc_x=1, inc_y=1):
+    m_A, n_A = matrix_dimensions('A', A)
+    check_equal_sizes('A', m_A, 'x', vector_length('x', x, inc_x))
+    check_equal_sizes('A', n_A, 'y', vector_length('y', y, inc_y))
+    lda = n_A if lda is None else lda
+    return 'ger', [ROW_MAJOR, m_A, n_A, alpha, None, inc_x, None, inc_y, None, lda], (4, 6, 8), 2
+
+
+def plan_hemv(A, x, y, uplo='u', alpha=1.0, beta=1.0, lda=None, inc_x=1, inc_y=1):
+    return ('hemv',) + plan_symv(A, x, y, uplo, alpha, beta, lda, inc_x, inc_y)[1:]
+
+
+def plan_her(x, A, uplo='u', alpha=1.0, lda=None, inc_x=1):
+    return ('her',) + plan_syr(x, A, uplo, alpha, lda, inc_x)[1:]
+
+
+def plan_her2(x, y, A, uplo='u', alpha=1.0, lda=None, inc_x=1, inc_y=1):
+    return ('her2',) + plan_syr2(x, y, A, uplo, alpha, lda, inc_x, inc_y)[1:]
+
+
+def plan_symv(A, x, y, uplo='u', alpha=1.0, beta=1.0, lda=None, inc_x=1, inc_y=1):
+    cblas_uplo = convert_uplo(uplo)
+    dim_A = square_matrix_dimension('A', A)
+    check_equal_sizes('A', dim_A, 'x', vector_length('x', x, inc_x))
+    check_equal_sizes('A', dim_A, 'y', vector_length('y', y, inc_y))
+    lda = dim_A if lda is None else lda
+    return ('symv', [ROW_MAJOR, cblas_uplo, dim_A, alpha, None, lda, None, inc_x, beta, None,
+                     inc_y], (4, 6, 9), 2)
+
+
+def plan_syr(x, A, uplo='u', alpha=1.0, lda=None, inc_x=1):
+    cblas_uplo = convert_uplo(uplo)
+    dim_A = square_matrix_dimension('A', A)
+    check_equal_sizes('A', dim_A, 'x', vector_length('x', x, inc_x))
+    lda = dim_A if lda is None else lda
+    return 'syr', [ROW_MAJOR, cblas_uplo, dim_A, alpha, None, inc_x, None, lda], (4, 6), 1
+
+
+def plan_syr2(x, y, A, uplo='u', alpha=1.0, lda=None, inc_x=1, inc_y=1):
+    cblas_uplo = convert_uplo(uplo)
+    dim_A = square_matrix_dimension('A', A)
+    check_equal_sizes('A', dim_A, 'x', vector_length('x', x, inc_x))
+    check_equal_sizes('A', dim_A, 'y', vector_length('y', y, inc_y))
+    lda = dim_A if lda is None else lda
+    return ('syr2', [ROW_MAJOR, cblas_uplo, dim_A, alpha, None, inc_x, None, inc_y, None, lda],
+            (4, 6, 8), 2)
+
+
+def plan_trmv(A, x, uplo='u', trans_a='n', diag='n', lda=None, inc_x=1):
+    cblas_uplo, cblas_trans_a = convert_uplo(uplo), convert_trans(trans_a)
+    cblas_diag = convert_diag(diag)
+    dim_A = square_matrix_dimension('A', A)
+    check_equal_sizes('A', dim_A, 'x', vector_length('x', x, inc_x))
+    lda = dim_A if lda is None else lda
+    return ('trmv', [ROW_MAJOR, cblas_uplo, cblas_trans_a, cblas_diag, dim_A, None, lda, None,
+                     inc_x], (5, 7), 1)
+
+
+def plan_trsv(A, b, uplo='u', trans_a='n', diag='n', lda=None, inc_b=1):
+    cblas_uplo, cblas_trans_a = convert_uplo(uplo), convert_trans(trans_a)
+    cblas_diag = convert_diag(diag)
+    dim_A = square_matrix_dimension('A', A)
+    check_equal_sizes('A', dim_A, 'b', vector_length('b', b, inc_b))
+    lda = dim_A if lda is None else lda
+    return ('trsv', [ROW_MAJOR, cblas_uplo, cblas_trans_a, cblas_diag, dim_A, None, lda, None,
+                     inc_b], (5, 7), 1)
+
+
+#########################
+# LEVEL 3               #
+#########################
+
+def plan_gemm(A, B, C, trans_a='n', trans_b='n', alpha=1.0, beta=1.0, lda=None, ldb=None,
+              ldc=None):
+    cblas_trans_a, cblas_trans_b = convert_trans(trans_a), convert_trans(trans_b)
+    m_A, n_A = matrix_dimensions('A', A)
+    m_B, n_B = matrix_dimensions('B', B)
+    m_C, n_C = matrix_dimensions('C', C)
+    m, k_A = (m_A, n_A) if cblas_trans_a == NO_TRANS else (n_A, m_A)
+    n, k_B = (n_B, m_B) if cblas_trans_b == NO_TRANS else (m_B, n_B)
+    check_equal_sizes('A', k_A, 'B', k_B)
+    check_equal_sizes('A', m, 'C', m_C)
+    check_equal_sizes('B', n, 'C', n_C)
+    lda, ldb, ldc = (n_A if lda is None else lda, n_B if ldb is None else ldb,
+                     n_C if ldc is None else ldc)
+    return ('gemm', [ROW_MAJOR, cblas_trans_a, cblas_trans_b, m, n, k_A, alpha, None, lda, None,
+                     ldb, beta, None, ldc], (7, 9, 12), 2)
+
+
+def plan_symm(A, B, C, side='l', uplo='u', alpha=1.0, beta=1.0, lda=None, ldb=None, ldc=None):
+    cblas_side, cblas_uplo = convert_side(side), convert_uplo(uplo)
+    side_is_left = cblas_side == LEFT
+    dim_A = square_matrix_dimension('A', A)
+    m_B, n_B = matrix_dimensions('B', B)
+    m_C, n_C = matrix_dimensions('C', C)
+    m, n, k = (dim_A, n_B, m_B) if side_is_left else (m_B, dim_A, n_B)
+    check_equal_sizes('A', dim_A, 'B', k)
+    check_equal_sizes('A' if side_is_left else 'B', m, 'C', m_C)
+    check_equal_sizes('B' if side_is_left else 'A', n, 'C', n_C)
+    lda, ldb, ldc = (dim_A if lda is None else lda, n_B if ldb is None else ldb,
+                     n_C if ldc is None else ldc)
+    return ('symm', [ROW_MAJOR, cblas_side, cblas_uplo, m, n, alpha, None, lda, None, ldb, beta,
+                     None, ldc], (6, 8, 11), 2)
+
+
+def plan_syrk(A, C, uplo='u', trans='n', alpha=1.0, beta=1.0, lda=None, ldc=None):
+    cblas_uplo, cblas_trans = convert_uplo(uplo), convert_sym_trans(trans)
+    m_A, n_A = matrix_dimensions('A', A)
+    dim_C = square_matrix_dimension('C', C)
+    n, k = (m_A, n_A) if cblas_trans == NO_TRANS else (n_A, m_A)
+    check_equal_sizes('A', n, 'C', dim_C)
+    lda, ldc = n_A if lda is None else lda, dim_C if ldc is None else ldc
+    return ('syrk', [ROW_MAJOR, cblas_uplo, cblas_trans, n, k, alpha, None, lda, beta, None, ldc],
+            (6, 9), 1)
+
+
+def plan_syr2k(A, B, C, uplo='u', trans='n', alpha=1.0, beta=1.0, lda=None, ldb=None, ldc=None):
+    cblas_uplo, cblas_trans = convert_uplo(uplo), convert_sym_trans(trans)
+    m_A, n_A = matrix_dimensions('A', A)
+    m_B, n_B = matrix_dimensions('B', B)
+    dim_C = square_matrix_dimension('C', C)
+    n, k = (m_A, n_A) if cblas_trans == NO_TRANS else (n_A, m_A)
+    check_equal_sizes('A', m_A, 'B', m_B)
+    check_equal_sizes('A', n_A, 'B', n_B)
+    check_equal_sizes('A', n, 'C', dim_C)
+    lda, ldb, ldc = (n_A if lda is None else lda, n_B if ldb is None else ldb,
+                     dim_C if ldc is None else ldc)
+    return ('syr2k', [ROW_MAJOR, cblas_uplo, cblas_trans, n, k, alpha, None, lda, None, ldb, beta,
+                      None, ldc], (6, 8, 11), 2)
+
+
+def plan_trmm(A, B, side='l', uplo='u', trans_a='n', diag='n', alpha=1.0, lda=None, ldb=None):
+    cblas_side, cblas_uplo = convert_side(side), convert_uplo(uplo)
+    cblas_trans_a, cblas_diag = convert_trans(trans_a), convert_diag(diag)
+    dim_A = square_matrix_dimension('A', A)
+    m_B, n_B = matrix_dimensions('B', B)
+    check_equal_sizes('A', dim_A, 'B', m_B if cblas_side == LEFT else n_B)
+    lda, ldb = dim_A if lda is None else lda, n_B if ldb is None else ldb
+    return ('trmm', [ROW_MAJOR, cblas_side, cblas_uplo, cblas_trans_a, cblas_diag, m_B, n_B, alpha,
+                     None, lda, None, ldb], (8, 10), None)
+
+
+def plan_trsm(A, B, side='l', uplo='u', trans_a='n', diag='n', alpha=1.0, lda=None, ldb=None):
+    cblas_side, cblas_uplo = convert_side(side), convert_uplo(uplo)
+    cblas_trans_a, cblas_diag = convert_trans(trans_a), convert_diag(diag)
+    dim_A = square_matrix_dimension('A', A)
+    m_B, n_B = matrix_dimensions('B', B)
+    check_equal_sizes('A', dim_A, 'B', m_B if cblas_side == LEFT else n_B)
+    lda, ldb = dim_A if lda is None else lda, n_B if ldb is None else ldb
+    return ('trsm', [ROW_MAJOR, cblas_side, cblas_uplo, cblas_trans_a, cblas_diag, m_B, n_B, alpha,
+                     None, lda, None, ldb], (8, 10), None)
+
+
+def plan_hemm(A, B, C, side='l', uplo='u', alpha=1.0, beta=1.0, lda=None, ldb=None, ldc=None):
+    return ('hemm',) + plan_symm(A, B, C, side, uplo, alpha, beta, lda, ldb, ldc)[1:]
+
+
+def plan_herk(A, C, uplo='u', trans='n', alpha=1.0, beta=1.0, lda=None, ldc=None):
+    cblas_uplo, cblas_trans = convert_uplo(uplo), convert_herm_trans(trans)
+    m_A, n_A = matrix_dimensions('A', A)
+    dim_C = square_matrix_dimension('C', C)
+    n, k = (m_A, n_A) if cblas_trans == NO_TRANS else (n_A, m_A)
+    check_equal_sizes('A', n, 'C', dim_C)
+    lda, ldc = n_A if lda is None else lda, dim_C if ldc is None else ldc
+    return ('herk', [ROW_MAJOR, cblas_uplo, cblas_trans, n, k, alpha, None, lda, beta, None, ldc],
+            (6, 9), 1)
+
+
+def plan_her2k(A, B, C, uplo='u', trans='n', alpha=1.0, beta=1.0, lda=None, ldb=None, ldc=None):
+    cblas_uplo, cblas_trans = convert_uplo(uplo), convert_herm_trans(trans)
+    m_A, n_A = matrix_dimensions('A', A)
+    m_B, n_B = matrix_dimensions('B', B)
+    dim_C = square_matrix_dimension('C', C)
+    n, k = (m_A, n_A) if cblas_trans == NO_TRANS else (n_A, m_A)
+    check_equal_sizes('A', m_A, 'B', m_B)
+    check_equal_sizes('A', n_A, 'B', n_B)
+    check_equal_sizes('A', n, 'C', dim_C)
+    lda, ldb, ldc = (n_A if lda is None else lda, n_B if ldb is None else ldb,
+                     dim_C if ldc is None else ldc)
+    return ('her2k', [ROW_MAJOR, cblas_uplo, cblas_trans, n, k, alpha, None, lda, None, ldb, beta,
+                      None, ldc], (6, 8, 11), 2)
+
+
+# dictionary of BLASpy functions mapping to their planners and the names of their operands
+PLANNERS = {'amax':  (plan_amax,  ('x',)),  # level 1
+            'asum':  (plan_asum,  ('x',)),
+            'axpy':  (plan_axpy,  ('x', 'y')),
+            'copy':  (plan_copy,  ('x', 'y')),
+            'dot':   (plan_dot,   ('x', 'y')),
+            'dotc':  (plan_dotc,  ('x', 'y')),
+            'nrm2':  (plan_nrm2,  ('x',)),
+            'scal':  (plan_scal,  ('x',)),
+            'sdot':  (plan_sdot,  ('x', 'y')),
+            'swap':  (plan_swap,  ('x', 'y')),
+            'gemv':  (plan_gemv,  ('A', 'x', 'y')),  # level 2
+            'ger':   (plan_ger,   ('x', 'y', 'A')),
+            'hemv':  (plan_hemv,  ('A', 'x', 'y')),
+            'her':   (plan_her,   ('x', 'A')),
+            'her2':  (plan_her2,  ('x', 'y', 'A')),
+            'symv':  (plan_symv,  ('A', 'x', 'y')),
+            'syr':   (plan_syr,   ('x', 'A')),
+            'syr2':  (plan_syr2,  ('x', 'y', 'A')),
+            'trmv':  (plan_trmv,  ('A', 'x')),
+            'trsv':  (plan_trsv,  ('A', 'b')),
+            'gemm':  (plan_gemm,  ('A', 'B', 'C')),  # level 3
+            'symm':  (plan_symm,  ('A', 'B', 'C')),
+            'syrk':  (plan_syrk,  ('A', 'C')),
+            'syr2k': (plan_syr2k, ('A', 'B', 'C')),
+            'trmm':  (plan_trmm,  ('A', 'B')),
+            'trsm':  (plan_trsm,  ('A', 'B')),
+            'hemm':  (plan_hemm,  ('A', 'B', 'C')),
+            'herk':  (plan_herk,  ('A', 'C')),
+            'her2k': (plan_her2k, ('A', 'B', 'C'))
+           }
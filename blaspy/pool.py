@@ -0,0 +1,295 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+    A pool of reusable memory for the matrices and vectors BLASpy creates, namely the outputs of
+    functions called without one (such as C in gemm(A, B)) and internal temporaries.
+
+    Allocating a large array takes fresh pages from the operating system, each of which faults the
+    first time it is written, and a new array is usually freed again soon after (such as an
+    intermediate result in a loop). The pool instead keeps the memory of the arrays it has handed
+    out, binned into size classes, and hands it out again once nothing refers to the array any
+    more. Memory which is not in use is evicted, least recently used first, whenever the pool would
+    hold more than its byte limit.
+
+    Arrays smaller than POOL_MIN_BYTES are not pooled, since NumPy allocates them quickly itself.
+    Every array of at least ALIGNED_MIN_BYTES is aligned to a cache line, and large blocks are
+    backed by huge pages, as for blaspy.memory.empty.
+
+"""
+
+from .errors import raise_invalid_memory
+from .memory import allocate, fill_zeros, ALIGNED_MIN_BYTES
+from collections import OrderedDict
+from numbers import Integral
+from numpy import dtype as np_dtype, empty as np_empty
+from sys import getrefcount
+from threading import Lock
+
+# the byte limit of the default pool
+POOL_MAX_BYTES = 1 << 28
+
+# the size in bytes of the smallest array which is pooled
+POOL_MIN_BYTES = 1 << 16
+
+# the number of size classes into which each power of two is divided
+POOL_CLASSES_PER_OCTAVE = 4
+
+# the number of references to the memory of an idle block (the ndarray or buffer from which the
+# aligned block is sliced, and to which every view of the block refers): the block's own and that
+# of the call to getrefcount
+IDLE_REFERENCES = 2
+
+
+class PoolStats(object):
+    """
+    A snapshot of the state of a BufferPool, as returned by BufferPool.stats().
+
+    Attributes:
+        hits:          number of arrays created from memory already in the pool
+        misses:        number of arrays for which new memory was allocated
+        evictions:     number of blocks of memory evicted from the pool
+        bytes:         number of bytes of memory held by the pool
+        idle_bytes:    number of bytes of memory held by the pool which are not in use
+        max_bytes:     byte limit of the pool
+    """
+
+    def __init__(self, hits, misses, evictions, bytes, idle_bytes, max_bytes):
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.bytes = bytes
+        self.idle_bytes = idle_bytes
+        self.max_bytes = max_bytes
+
+    def __repr__(self):
+        return ("PoolStats(hits=%d, misses=%d, evictions=%d, bytes=%d, idle_bytes=%d, "
+                "max_bytes=%d)" % (self.hits, self.misses, self.evictions, self.bytes,
+                                   self.idle_bytes, self.max_bytes))
+
+
+class BufferPool(object):
+    """
+    A pool of blocks of memory binned into size classes, from which arrays are created.
+
+    A block is in use while any array created from it (or any view of one) exists, and is reused
+    for a later array of its size class once none does. When holding a new block would take the
+    pool over its byte limit, the least recently used blocks which are not in use are evicted; a
+    block which still cannot be held is handed out without being pooled.
+
+    Example:
+        pool = blaspy.BufferPool(max_bytes=1 << 26)
+        C = pool.empty((1000, 1000))
+    """
+
+    def __init__(self, max_bytes=POOL_MAX_BYTES):
+        """
+        Args:
+            --optional arguments--
+
+            max_bytes:    most bytes of memory the pool holds at once (0 disables pooling)
+                              < default is POOL_MAX_BYTES (256 MiB) >
+
+        Raises:
+            ValueError: if 'max_bytes' is not an integer >= 0
+        """
+
+        if not isinstance(max_bytes, Integral) or max_bytes < 0:
+            raise_invalid_memory(max_bytes, 0)
+
+        self._max_bytes = max_bytes
+        self._blocks = OrderedDict()  # id of each block -> block, least recently used first
+        self._classes = {}            # size class -> ids of its blocks
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = Lock()
+
+    @property
+    def max_bytes(self):
+        """ Most bytes of memory the pool holds at once. Lowering it evicts idle blocks. """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes):
+        if not isinstance(max_bytes, Integral) or max_bytes < 0:
+            raise_invalid_memory(max_bytes, 0)
+        with self._lock:
+            self._max_bytes = max_bytes
+            self._evict(0)
+
+    def empty(self, shape, dtype=float, order='C'):
+        """
+        Return a new array whose elements are not initialized, like numpy.empty, using memory from
+        the pool.
+
+        Args:
+            shape:    shape of the array
+
+            --optional arguments--
+
+            dtype:    NumPy dtype of the elements
+                          < default is float >
+            order:    'C' for row-major or 'F' for column-major order
+                          < default is 'C' >
+
+        Returns:
+            A NumPy ndarray.
+        """
+
+        dtype = np_dtype(dtype)
+        shape = (shape,) if isinstance(shape, Integral) else tuple(shape)
+        nbytes = dtype.itemsize
+        for length in shape:
+            nbytes *= length
+        if nbytes < ALIGNED_MIN_BYTES:
+            return np_empty(shape, dtype, order)
+
+        block = self.take(nbytes)
+        array = block[:nbytes].view(dtype)
+        return array.reshape(shape[::-1]).T if order in ('F', 'f') else array.reshape(shape)
+
+    def zeros(self, shape, dtype=float, order='C'):
+        """
+        Return a new array of zeros, like numpy.zeros, using memory from the pool. A large array is
+        zeroed by several threads (see blaspy.memory.zeros).
+        """
+
+        array = self.empty(shape, dtype, order)
+        fill_zeros(array.reshape(-1, order='A'))
+        return array
+
+    def take(self, nbytes):
+        """
+        Return a block of memory (a 1D uint8 ndarray) of at least 'nbytes' bytes from the pool,
+        which is in use until it and every array created from it no longer exist.
+        """
+
+        if nbytes < POOL_MIN_BYTES or self._max_bytes == 0:
+            return allocate(nbytes)
+
+        size_class = get_size_class(nbytes)
+        with self._lock:
+            for block_id in self._classes.get(size_class, ()):
+                block = self._blocks[block_id]
+                if is_idle(block):
+                    self._blocks.move_to_end(block_id)
+                    self._hits += 1
+                    return block[:]  # a view, which refers to the memory of the block
+                del block
+
+            self._misses += 1
+            if not self._evict(size_class):
+                return allocate(nbytes)
+
+            block = allocate(size_class)
+            self._blocks[id(block)] = block
+            self._classes.setdefault(size_class, []).append(id(block))
+            self._bytes += size_class
+            return block[:]
+
+    def clear(self):
+        """ Evict every block which is not in use. """
+
+        with self._lock:
+            for block in self._idle_blocks():
+                self._remove(block)
+
+    def stats(self):
+        """ Return a PoolStats snapshot of the pool. """
+
+        with self._lock:
+            idle_bytes = sum(block.size for block in self._idle_blocks())
+            return PoolStats(self._hits, self._misses, self._evictions, self._bytes, idle_bytes,
+                             self._max_bytes)
+
+    def _idle_blocks(self):
+        """ Yield the blocks which are not in use, least recently used first. """
+
+        for block in list(self._blocks.values()):
+            if is_idle(block):
+                yield block
+
+    def _evict(self, nbytes):
+        """
+        Evict the least recently used idle blocks until 'nbytes' more bytes fit under the byte
+        limit, and return True if they fit.
+        """
+
+        if nbytes > self._max_bytes:
+            return False
+
+        for block in self._idle_blocks():
+            if self._bytes + nbytes <= self._max_bytes:
+                break
+            self._remove(block)
+
+        return self._bytes + nbytes <= self._max_bytes
+
+    def _remove(self, block):
+        """ Evict a block from the pool. """
+
+        self._blocks.pop(id(block))
+        self._classes[block.size].remove(id(block))
+        self._bytes -= block.size
+        self._evictions += 1
+
+
+def is_idle(block):
+    """ Return True if no array other than a pooled block refers to its memory. """
+    return getrefcount(block.base) <= IDLE_REFERENCES
+
+
+def get_size_class(nbytes):
+    """
+    Return the size class of an array of 'nbytes' bytes, which is 'nbytes' rounded up to one of
+    POOL_CLASSES_PER_OCTAVE evenly spaced sizes between consecutive powers of two.
+    """
+
+    step = max(1, (1 << (nbytes - 1).bit_length() - 1) // POOL_CLASSES_PER_OCTAVE)
+    return -(-nbytes // step) * step
+
+
+_POOL = BufferPool()
+_POOL_LOCK = Lock()
+
+
+def get_pool():
+    """ Return the BufferPool from which BLASpy creates its outputs and temporaries. """
+    return _POOL
+
+
+def set_pool(pool):
+    """
+    Create all subsequent outputs and temporaries of BLASpy from the given pool.
+
+    Example:
+        blaspy.set_pool(blaspy.BufferPool(max_bytes=0))  # disable pooling
+
+    Args:
+        pool:    a BufferPool
+
+    Returns:
+        The previous BufferPool.
+    """
+
+    global _POOL
+    with _POOL_LOCK:
+        previous, _POOL = _POOL, pool
+        return previous
+
+
+def empty(shape, dtype=float, order='C'):
+    """ Return a new uninitialized array from the pool of BLASpy (see BufferPool.empty). """
+    return _POOL.empty(shape, dtype, order)
+
+
+def zeros(shape, dtype=float, order='C'):
+    """ Return a new array of zeros from the pool of BLASpy (see BufferPool.zeros). """
+    return _POOL.zeros(shape, dtype, order)
@@ -0,0 +1,517 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+    A pool of worker processes which perform large gemm, gemv, and syrk operations together, with
+    every operand in shared memory. This module is not imported by 'import blaspy'.
+
+    Each operation is split into panels of rows (or columns) of its output, and each worker process
+    calls the ordinary BLASpy function on its panel. Operands are never pickled: a matrix or vector
+    in a shared memory segment of the pool (created with ProcessPool.empty, zeros, or share, or any
+    view of one) is sent to the workers as the name of its segment and its offset, shape, and
+    strides, and each worker maps the segment into its own memory once. Every worker writes its
+    panel of the result directly into the output in shared memory, so the result is assembled
+    without a copy.
+
+    Operands which are not in shared memory are copied into a temporary segment for the duration of
+    the operation (and an output which is not is copied back afterwards), so operands used more than
+    once should be created in shared memory to begin with. Each worker runs the BLAS library with
+    (number of cores) // (number of processes) threads, so that the workers do not oversubscribe
+    the cores.
+
+    Example:
+        with blaspy.process_pool.ProcessPool(4) as pool:
+            A = pool.share(A)
+            C = pool.gemm(A, B)
+
+"""
+
+from .backend import get_backend, set_backend, set_num_threads
+from .errors import raise_invalid_num_workers, raise_invalid_num_threads, raise_executor_shut_down
+from .helpers import (get_matrix_dimensions, get_square_matrix_dimension, get_vector_dimensions,
+                      check_equal_sizes, convert_trans, convert_sym_trans, convert_uplo,
+                      get_cblas_info, NO_TRANS, UPPER)
+from .level_2 import gemv
+from .level_3 import gemm, syrk
+from concurrent.futures import ProcessPoolExecutor
+from math import sqrt
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from numbers import Integral
+from numpy import asarray, asmatrix, copyto, dtype, ndarray
+from numpy import matrix as np_matrix
+from os import cpu_count
+from threading import Lock
+from weakref import finalize
+
+# the BLASpy functions the workers call on their panels
+PANEL_FUNCS = {'gemm': gemm, 'gemv': gemv, 'syrk': syrk}
+
+# the shared memory segments a worker process has mapped, keyed by name
+_WORKER_SEGMENTS = {}
+
+
+class ProcessPool(object):
+    """
+    A pool of worker processes which perform gemm, gemv, and syrk operations on operands in shared
+    memory.
+
+    Attributes:
+        processes:       number of worker processes
+        blas_threads:    number of threads the BLAS library runs each call with in each worker
+    """
+
+    def __init__(self, processes=None, blas_threads=None, context=None):
+        """
+        Create the pool. The worker processes are started on the first operation.
+
+        Args:
+            --optional arguments--
+
+            processes:       number of worker processes (must be >= 1)
+                                 < default is the number of CPUs >
+            blas_threads:    number of threads the BLAS library runs each call with in each worker
+                             (must be >= 1)
+                                 < default is the number of CPUs // processes, at least 1 >
+            context:         multiprocessing start method: 'fork', 'spawn', or 'forkserver'
+                                 < default is the default start method of the platform >
+
+        Raises:
+            ValueError: if processes or blas_threads is not an integer >= 1
+        """
+
+        num_cpus = cpu_count() or 1
+        if processes is None:
+            processes = num_cpus
+        if not isinstance(processes, Integral) or processes < 1:
+            raise_invalid_num_workers(processes)
+        if blas_threads is None:
+            blas_threads = max(1, num_cpus // processes)
+        if not isinstance(blas_threads, Integral) or blas_threads < 1:
+            raise_invalid_num_threads(blas_threads)
+
+        self.processes = processes
+        self.blas_threads = blas_threads
+        self._segments = {}  # (segment, address, size) of each segment of the pool, keyed by name
+        self._lock = Lock()
+        self._pool = ProcessPoolExecutor(processes, get_context(context), initialize_worker,
+                                         (get_backend(), blas_threads))
+
+    def empty(self, shape, dtype='float64', order='C'):
+        """
+        Create an uninitialized ndarray in a new shared memory segment of the pool. The segment is
+        freed once the ndarray and all of its views have been garbage collected.
+
+        Args:
+            shape:    shape of the ndarray
+
+            --optional arguments--
+
+            dtype:    dtype of the ndarray
+                          < default is 'float64' >
+            order:    'C' for row-major or 'F' for column-major order
+                          < default is 'C' >
+
+        Returns:
+            The ndarray.
+        """
+
+        np_dtype = get_dtype(dtype)
+        shape = (shape,) if isinstance(shape, Integral) else tuple(shape)
+        size = np_dtype.itemsize
+        for length in shape:
+            size *= length
+
+        segment = SharedMemory(create=True, size=max(1, size))
+        array = ndarray(shape, np_dtype, segment.buf, order=order)
+        with self._lock:
+            self._segments[segment.name] = (segment, array.ctypes.data, size)
+        finalize(array, release_segment, self._segments, self._lock, segment.name)
+        return array
+
+    def zeros(self, shape, dtype='float64', order='C'):
+        """
+        Create an ndarray of zeros in a new shared memory segment of the pool (see empty).
+        """
+
+        array = self.empty(shape, dtype, order)
+        array.fill(0)
+        return array
+
+    def share(self, array):
+        """
+        Return an ndarray or matrix itself if it is in a shared memory segment of the pool, and
+        otherwise a copy of it in a new segment (of the same type, and column-major if the original
+        is).
+
+        Args:
+            array:    NumPy ndarray or matrix
+
+        Returns:
+            The ndarray or matrix, or its copy.
+        """
+
+        if self.find_segment(array) is not None:
+            return array
+
+        copy = self.empty(array.shape, array.dtype,
+                          'F' if array.flags.f_contiguous and not array.flags.c_contiguous else 'C')
+        copy[...] = array
+        return asmatrix(copy) if type(array) is np_matrix else copy
+
+    def gemm(self, A, B, C=None, trans_a='n', trans_b='n', alpha=1.0, beta=1.0):
+        """
+        Perform a general matrix-matrix multiplication operation on the worker processes.
+
+        C := beta * C + alpha * op(A) * op(B)
+
+        The arguments are as for blaspy.gemm, without the leading dimensions. The rows of C (or its
+        columns, if C is wider than it is tall) are split evenly among the workers.
+
+        Returns:
+            Matrix C (which is also overwritten), created in a shared memory segment of the pool if
+            it is not provided.
+
+        Raises:
+            ValueError:   as for blaspy.gemm
+            RuntimeError: if the pool has been closed
+        """
+
+        # convert to appropriate CBLAS value
+        transpose_a = convert_trans(trans_a) != NO_TRANS
+        transpose_b = convert_trans(trans_b) != NO_TRANS
+
+        # get the dimensions of the parameters
+        m_A, n_A = get_matrix_dimensions('A', A)
+        m_B, n_B = get_matrix_dimensions('B', B)
+        m, k_A = (n_A, m_A) if transpose_a else (m_A, n_A)
+        k_B, n = (n_B, m_B) if transpose_b else (m_B, n_B)
+        check_equal_sizes('A', k_A, 'B', k_B)
+
+        # if C is not given, create a zero matrix in shared memory with the type of A
+        if C is None:
+            C = self.zeros((m, n), A.dtype)
+            C = asmatrix(C) if type(A) is np_matrix else C
+
+        m_C, n_C = get_matrix_dimensions('C', C)
+        check_equal_sizes('A', m, 'C', m_C)
+        check_equal_sizes('B', n, 'C', n_C)
+        get_cblas_info('gemm', (A.dtype, B.dtype, C.dtype))
+
+        (A, B, C_shared), temporary = self.share_operands(A, B, C)
+
+        # split the rows of op(A) and C, or the columns of op(B) and C, among the workers
+        kwargs = {'trans_a': trans_a, 'trans_b': trans_b, 'alpha': alpha, 'beta': beta}
+        panels = []
+        for start, stop in split_evenly(max(m, n), self.processes):
+            if m >= n:
+                A_panel = A[:, start:stop] if transpose_a else A[start:stop]
+                panels.append([('gemm', (A_panel, B, C_shared[start:stop]), kwargs)])
+            else:
+                B_panel = B[start:stop] if transpose_b else B[:, start:stop]
+                panels.append([('gemm', (A, B_panel, C_shared[:, start:stop]), kwargs)])
+
+        self.run(panels, temporary)
+
+        if C_shared is not C:
+            copyto(asarray(C), C_shared)
+        return C
+
+    def gemv(self, A, x, y=None, trans_a='n', alpha=1.0, beta=1.0):
+        """
+        Perform a general matrix-vector multiplication operation on the worker processes.
+
+        y := beta * y + alpha * op(A) * x
+
+        The arguments are as for blaspy.gemv, without the leading dimension and strides. The
+        elements of y (and the rows of op(A)) are split evenly among the workers.
+
+        Returns:
+            Vector y (which is also overwritten), created in a shared memory segment of the pool if
+            it is not provided.
+
+        Raises:
+            ValueError:   as for blaspy.gemv
+            RuntimeError: if the pool has been closed
+        """
+
+        # convert to appropriate CBLAS value
+        transpose_a = convert_trans(trans_a) != NO_TRANS
+
+        # get the dimensions of the parameters
+        m_A, n_A = get_matrix_dimensions('A', A)
+        m_x, n_x, x_length = get_vector_dimensions('x', x, 1)
+        y_length, k = (n_A, m_A) if transpose_a else (m_A, n_A)
+        check_equal_sizes('A', k, 'x', x_length)
+
+        # if y is not given, create a zero vector in shared memory with the orientation of x
+        if y is None:
+            y = self.zeros((y_length,) if x.ndim == 1 else
+                           (1, y_length) if m_x == 1 and n_x > 1 else (y_length, 1), x.dtype)
+            y = asmatrix(y) if type(x) is np_matrix else y
+
+        m_y, n_y, length = get_vector_dimensions('y', y, 1)
+        check_equal_sizes('A', y_length, 'y', length)
+        get_cblas_info('gemv', (A.dtype, x.dtype, y.dtype))
+
+        (A, x, y_shared), temporary = self.share_operands(A, x, y)
+
+        # split the elements of y and the rows of op(A) among the workers
+        kwargs = {'trans_a': trans_a, 'alpha': alpha, 'beta': beta}
+        panels = []
+        for start, stop in split_evenly(y_length, self.processes):
+            A_panel = A[:, start:stop] if transpose_a else A[start:stop]
+            y_panel = y_shared[:, start:stop] if y.ndim == 2 and m_y == 1 else y_shared[start:stop]
+            panels.append([('gemv', (A_panel, x, y_panel), kwargs)])
+
+        self.run(panels, temporary)
+
+        if y_shared is not y:
+            copyto(asarray(y), y_shared)
+        return y
+
+    def syrk(self, A, C=None, uplo='u', trans='n', alpha=1.0, beta=1.0):
+        """
+        Perform a symmetric rank-k update operation on the worker processes.
+
+        C := beta * C + alpha * A * A_T  [trans='n']
+        or
+        C := beta * C + alpha * A_T * A  [trans='t']
+
+        The arguments are as for blaspy.syrk, without the leading dimensions. The rows of the
+        referenced triangle of C are split among the workers so that each updates about the same
+        number of elements: with syrk on the block of its rows on the diagonal, and with gemm on
+        the rest of its rows.
+
+        Returns:
+            Matrix C (which is also overwritten), created in a shared memory segment of the pool if
+            it is not provided.
+
+        Raises:
+            ValueError:   as for blaspy.syrk
+            RuntimeError: if the pool has been closed
+        """
+
+        # convert to appropriate CBLAS value
+        upper = convert_uplo(uplo) == UPPER
+        transpose_a = convert_sym_trans(trans) != NO_TRANS
+
+        # get the dimensions of the parameters
+        m_A, n_A = get_matrix_dimensions('A', A)
+        n = n_A if transpose_a else m_A
+
+        # if C is not given, create a zero matrix in shared memory with the type of A
+        if C is None:
+            C = self.zeros((n, n), A.dtype)
+            C = asmatrix(C) if type(A) is np_matrix else C
+
+        dim_C = get_square_matrix_dimension('C', C)
+        check_equal_sizes('A', n, 'C', dim_C)
+        get_cblas_info('syrk', (A.dtype, C.dtype))
+
+        (A, C_shared), temporary = self.share_operands(A, C)
+
+        def rows(start, stop):
+            return A[:, start:stop] if transpose_a else A[start:stop]
+
+        # split the rows of the triangle of C among the workers
+        syrk_kwargs = {'uplo': uplo, 'trans': trans, 'alpha': alpha, 'beta': beta}
+        gemm_kwargs = {'trans_a': 't' if transpose_a else 'n',
+                       'trans_b': 'n' if transpose_a else 't', 'alpha': alpha, 'beta': beta}
+        panels = []
+        for start, stop in split_triangle(n, self.processes, upper):
+            panel = [('syrk', (rows(start, stop), C_shared[start:stop, start:stop]), syrk_kwargs)]
+            if upper and stop < n:
+                panel.append(('gemm', (rows(start, stop), rows(stop, n),
+                                       C_shared[start:stop, stop:]), gemm_kwargs))
+            elif not upper and start > 0:
+                panel.append(('gemm', (rows(start, stop), rows(0, start),
+                                       C_shared[start:stop, :start]), gemm_kwargs))
+            panels.append(panel)
+
+        self.run(panels, temporary)
+
+        if C_shared is not C:
+            copyto(asarray(C), C_shared)
+        return C
+
+    def share_operands(self, *operands):
+        """
+        Return each operand itself if it is in shared memory, and otherwise a copy of it in a
+        temporary segment, along with the set of names of the temporary segments.
+        """
+
+        shared = []
+        temporary = set()
+        for operand in operands:
+            if operand.size > 0 and self.find_segment(operand) is None:
+                operand = self.share(operand)
+                temporary.add(self.find_segment(operand)[0].name)
+            shared.append(operand)
+        return shared, temporary
+
+    def describe(self, operand):
+        """
+        Return the name of the segment holding an operand in shared memory, and the offset, shape,
+        strides, and dtype of the operand within it. An operand with no elements has no segment
+        (its name is None), since its address need not lie within one.
+        """
+
+        if operand.size == 0:
+            return None, 0, operand.shape, operand.strides, operand.dtype.str
+
+        segment, address, size = self.find_segment(operand)
+        return (segment.name, operand.ctypes.data - address, operand.shape, operand.strides,
+                operand.dtype.str)
+
+    def find_segment(self, array):
+        """
+        Return the (segment, address, size) of the shared memory segment of the pool which holds
+        an ndarray or matrix, or None if it is not in one.
+        """
+
+        if not isinstance(array, ndarray):
+            return None
+
+        start = array.ctypes.data
+        with self._lock:
+            for segment, address, size in self._segments.values():
+                if address <= start < address + max(1, size):
+                    return segment, address, size
+        return None
+
+    def run(self, panels, temporary):
+        """
+        Run the calls of each panel on a worker process, and wait for all of them.
+
+        Args:
+            panels:       list of the calls of each panel, each call a tuple of the name of a
+                          BLASpy function, the tuple of its operands in shared memory, and the dict
+                          of its other arguments
+            temporary:    set of names of the segments which workers should unmap afterwards
+
+        Raises:
+            RuntimeError: if the pool has been closed
+        """
+
+        with self._lock:
+            if self._pool is None:
+                raise_executor_shut_down()
+            kept = frozenset(name for name in self._segments if name not in temporary)
+
+        futures = []
+        for panel in panels:
+            calls = [(name, tuple(self.describe(operand) for operand in operands), kwargs)
+                     for name, operands, kwargs in panel]
+            futures.append(self._pool.submit(run_panel, calls, kept))
+
+        for future in futures:
+            future.result()
+
+    def close(self):
+        """
+        Stop the worker processes once the operations already started have finished. Arrays in
+        shared memory remain valid until they are garbage collected.
+        """
+
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+def get_dtype(np_dtype):
+    """ Return the NumPy dtype of the given name or type. """
+    return dtype(np_dtype)
+
+
+def split_evenly(length, parts):
+    """ Return the (start, stop) bounds of up to 'parts' non-empty panels of about equal length. """
+
+    bounds = [length * part // parts for part in range(parts + 1)]
+    return [(start, stop) for start, stop in zip(bounds[:-1], bounds[1:]) if start < stop]
+
+
+def split_triangle(n, parts, upper):
+    """
+    Return the (start, stop) bounds of up to 'parts' non-empty panels of rows of the upper (or
+    lower) triangle of an n by n matrix, each holding about the same number of elements.
+    """
+
+    if upper:
+        bounds = [int(round(n * (1 - sqrt(1 - part / float(parts))))) for part in range(parts + 1)]
+    else:
+        bounds = [int(round(n * sqrt(part / float(parts)))) for part in range(parts + 1)]
+    return [(start, stop) for start, stop in zip(bounds[:-1], bounds[1:]) if start < stop]
+
+
+def release_segment(segments, lock, name):
+    """ Unmap and free a shared memory segment of a pool once its ndarray has been collected. """
+
+    with lock:
+        segment = segments.pop(name)[0]
+    try:
+        segment.close()
+    except BufferError:
+        pass
+    segment.unlink()
+
+
+def initialize_worker(blas_path, blas_threads):
+    """ Load the BLAS library of the parent process and set its number of threads in a worker. """
+
+    if get_backend() != blas_path:
+        set_backend(blas_path)
+    try:
+        set_num_threads(blas_threads)
+    except RuntimeError:
+        pass  # the library has no thread control
+
+
+def attach(name, offset, shape, strides, dtype_str):
+    """ Return the operand with the given description, mapping its segment if needed. """
+
+    if name is None:
+        return ndarray(shape, dtype_str)
+
+    segment = _WORKER_SEGMENTS.get(name)
+    if segment is None:
+        segment = _WORKER_SEGMENTS[name] = SharedMemory(name)
+    return ndarray(shape, dtype_str, segment.buf, offset, strides)
+
+
+def release_worker_segments(kept):
+    """ Unmap every segment a worker has mapped which is not in the set 'kept'. """
+
+    for name in [name for name in _WORKER_SEGMENTS if name not in kept]:
+        try:
+            _WORKER_SEGMENTS[name].close()
+        except BufferError:
+            continue
+        del _WORKER_SEGMENTS[name]
+
+
+def run_panel(calls, kept):
+    """
+    Run the calls of one panel in a worker process, then unmap the segments which are no longer
+    needed (those of the parent's collected arrays and of temporary copies).
+    """
+
+    release_worker_segments(kept)
+    try:
+        for func_name, descriptors, kwargs in calls:
+            PANEL_FUNCS[func_name](*[attach(*descriptor) for descriptor in descriptors], **kwargs)
+    finally:
+        release_worker_segments(kept)
@@ -0,0 +1,303 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+    Unchecked versions of the BLASpy functions, for use in hot loops where the shapes and dtypes
+    of the operands are already known to be valid.
+
+    Each function takes the same arguments as the BLASpy function of the same name, except that
+    every matrix or vector that would be overwritten must be provided. No argument is validated:
+    the dimensions of the operation are taken from the shapes of the operands, the CBLAS
+    subroutine is chosen from the dtype of a single operand, and invalid arguments result in
+    undefined behavior (including incorrect results or a crash of the interpreter) rather than a
+    ValueError. Matrices are assumed to be stored in row-major (C-contiguous) order. Use the
+    checked functions in the blaspy namespace until the arguments are known to be correct.
+
+"""
+
+from .helpers import (get_unchecked_cblas_func, UPLO_DICT, TRANS_DICT, DIAG_DICT, SIDE_DICT,
+                      ROW_MAJOR, NO_TRANS)
+
+
+def effective_length(vector, stride):
+    """ Return the length of a vector after accounting for its stride. """
+    return (vector.size - 1) // stride + 1
+
+
+#########################
+# LEVEL 1               #
+#########################
+
+def amax(x, inc_x=1):
+    """ Unchecked version of blaspy.amax. """
+    cblas_func = get_unchecked_cblas_func('amax', x.dtype)
+    return cblas_func(effective_length(x, inc_x), x.ctypes.data, inc_x)
+
+
+def asum(x, inc_x=1):
+    """ Unchecked version of blaspy.asum. """
+    cblas_func = get_unchecked_cblas_func('asum', x.dtype)
+    return cblas_func(effective_length(x, inc_x), x.ctypes.data, inc_x)
+
+
+def axpy(alpha, x, y, inc_x=1, inc_y=1):
+    """ Unchecked version of blaspy.axpy. """
+    cblas_func = get_unchecked_cblas_func('axpy', x.dtype)
+    cblas_func(effective_length(x, inc_x), alpha, x.ctypes.data, inc_x, y.ctypes.data, inc_y)
+    return y
+
+
+def copy(x, y, inc_x=1, inc_y=1):
+    """ Unchecked version of blaspy.copy. Vector y must be provided. """
+    cblas_func = get_unchecked_cblas_func('copy', x.dtype)
+    cblas_func(effective_length(x, inc_x), x.ctypes.data, inc_x, y.ctypes.data, inc_y)
+    return y
+
+
+def dot(x, y, inc_x=1, inc_y=1):
+    """ Unchecked version of blaspy.dot. """
+    cblas_func = get_unchecked_cblas_func('dot', x.dtype)
+    return cblas_func(effective_length(x, inc_x), x.ctypes.data, inc_x, y.ctypes.data, inc_y)
+
+
+def dotc(x, y, inc_x=1, inc_y=1):
+    """ Unchecked version of blaspy.dotc. """
+    cblas_func = get_unchecked_cblas_func('dotc', x.dtype)
+    return cblas_func(effective_length(x, inc_x), x.ctypes.data, inc_x, y.ctypes.data, inc_y)
+
+
+def nrm2(x, inc_x=1):
+    """ Unchecked version of blaspy.nrm2. """
+    cblas_func = get_unchecked_cblas_func('nrm2', x.dtype)
+    return cblas_func(effective_length(x, inc_x), x.ctypes.data, inc_x)
+
+
+def scal(alpha, x, inc_x=1):
+    """ Unchecked version of blaspy.scal. """
+    cblas_func = get_unchecked_cblas_func('scal', x.dtype)
+    cblas_func(effective_length(x, inc_x), alpha, x.ctypes.data, inc_x)
+    return x
+
+
+def sdot(x, y, inc_x=1, inc_y=1, output='float64'):
+    """ Unchecked version of blaspy.sdot. """
+    if output == 'float64':
+        cblas_func = get_unchecked_cblas_func('dsdot', x.dtype)
+        return cblas_func(effective_length(x, inc_x), x.ctypes.data, inc_x, y.ctypes.data, inc_y)
+    else:
+        cblas_func = get_unchecked_cblas_func('sdsdot', x.dtype)
+        return cblas_func(effective_length(x, inc_x), 0, x.ctypes.data, inc_x,
+                          y.ctypes.data, inc_y)
+
+
+def swap(x, y, inc_x=1, inc_y=1):
+    """ Unchecked version of blaspy.swap. """
+    cblas_func = get_unchecked_cblas_func('swap', x.dtype)
+    cblas_func(effective_length(x, inc_x), x.ctypes.data, inc_x, y.ctypes.data, inc_y)
+    return y
+
+
+#########################
+# LEVEL 2               #
+#########################
+
+def gemv(A, x, y, trans_a='n', alpha=1.0, beta=1.0, lda=None, inc_x=1, inc_y=1):
+    """ Unchecked version of blaspy.gemv. Vector y must be provided. """
+    m_A, n_A = A.shape
+    cblas_func = get_unchecked_cblas_func('gemv', A.dtype)
+    cblas_func(ROW_MAJOR, TRANS_DICT[trans_a], m_A, n_A, alpha, A.ctypes.data,
+               n_A if lda is None else lda, x.ctypes.data, inc_x, beta, y.ctypes.data, inc_y)
+    return y
+
+
+def ger(x, y, A, alpha=1.0, lda=None, inc_x=1, inc_y=1):
+    """ Unchecked version of blaspy.ger. Matrix A must be provided. """
+    m_A, n_A = A.shape
+    cblas_func = get_unchecked_cblas_func('ger', A.dtype)
+    cblas_func(ROW_MAJOR, m_A, n_A, alpha, x.ctypes.data, inc_x, y.ctypes.data, inc_y,
+               A.ctypes.data, n_A if lda is None else lda)
+    return A
+
+
+def hemv(A, x, y, uplo='u', alpha=1.0, beta=1.0, lda=None, inc_x=1, inc_y=1):
+    """ Unchecked version of blaspy.hemv. Vector y must be provided. """
+    dim_A = A.shape[0]
+    cblas_func = get_unchecked_cblas_func('hemv', A.dtype)
+    cblas_func(ROW_MAJOR, UPLO_DICT[uplo], dim_A, alpha, A.ctypes.data,
+               dim_A if lda is None else lda, x.ctypes.data, inc_x, beta, y.ctypes.data, inc_y)
+    return y
+
+
+def her(x, A, uplo='u', alpha=1.0, lda=None, inc_x=1):
+    """ Unchecked version of blaspy.her. Matrix A must be provided. """
+    dim_A = A.shape[0]
+    cblas_func = get_unchecked_cblas_func('her', A.dtype)
+    cblas_func(ROW_MAJOR, UPLO_DICT[uplo], dim_A, alpha, x.ctypes.data, inc_x, A.ctypes.data,
+               dim_A if lda is None else lda)
+    return A
+
+
+def her2(x, y, A, uplo='u', alpha=1.0, lda=None, inc_x=1, inc_y=1):
+    """ Unchecked version of blaspy.her2. Matrix A must be provided. """
+    dim_A = A.shape[0]
+    cblas_func = get_unchecked_cblas_func('her2', A.dtype)
+    cblas_func(ROW_MAJOR, UPLO_DICT[uplo], dim_A, alpha, x.ctypes.data, inc_x,
+               y.ctypes.data, inc_y, A.ctypes.data, dim_A if lda is None else lda)
+    return A
+
+
+def symv(A, x, y, uplo='u', alpha=1.0, beta=1.0, lda=None, inc_x=1, inc_y=1):
+    """ Unchecked version of blaspy.symv. Vector y must be provided. """
+    dim_A = A.shape[0]
+    cblas_func = get_unchecked_cblas_func('symv', A.dtype)
+    cblas_func(ROW_MAJOR, UPLO_DICT[uplo], dim_A, alpha, A.ctypes.data,
+               dim_A if lda is None else lda, x.ctypes.data, inc_x, beta, y.ctypes.data, inc_y)
+    return y
+
+
+def syr(x, A, uplo='u', alpha=1.0, lda=None, inc_x=1):
+    """ Unchecked version of blaspy.syr. Matrix A must be provided. """
+    dim_A = A.shape[0]
+    cblas_func = get_unchecked_cblas_func('syr', A.dtype)
+    cblas_func(ROW_MAJOR, UPLO_DICT[uplo], dim_A, alpha, x.ctypes.data, inc_x, A.ctypes.data,
+               dim_A if lda is None else lda)
+    return A
+
+
+def syr2(x, y, A, uplo='u', alpha=1.0, lda=None, inc_x=1, inc_y=1):
+    """ Unchecked version of blaspy.syr2. Matrix A must be provided. """
+    dim_A = A.shape[0]
+    cblas_func = get_unchecked_cblas_func('syr2', A.dtype)
+    cblas_func(ROW_MAJOR, UPLO_DICT[uplo], dim_A, alpha, x.ctypes.data, inc_x,
+               y.ctypes.data, inc_y, A.ctypes.data, dim_A if lda is None else lda)
+    return A
+
+
+def trmv(A, x, uplo='u', trans_a='n', diag='n', lda=None, inc_x=1):
+    """ Unchecked version of blaspy.trmv. """
+    dim_A = A.shape[0]
+    cblas_func = get_unchecked_cblas_func('trmv', A.dtype)
+    cblas_func(ROW_MAJOR, UPLO_DICT[uplo], TRANS_DICT[trans_a], DIAG_DICT[diag], dim_A,
+               A.ctypes.data, dim_A if lda is None else lda, x.ctypes.data, inc_x)
+    return x
+
+
+def trsv(A, b, uplo='u', trans_a='n', diag='n', lda=None, inc_b=1):
+    """ Unchecked version of blaspy.trsv. """
+    dim_A = A.shape[0]
+    cblas_func = get_unchecked_cblas_func('trsv', A.dtype)
+    cblas_func(ROW_MAJOR, UPLO_DICT[uplo], TRANS_DICT[trans_a], DIAG_DICT[diag], dim_A,
+               A.ctypes.data, dim_A if lda is None else lda, b.ctypes.data, inc_b)
+    return b
+
+
+#########################
+# LEVEL 3               #
+#########################
+
+def gemm(A, B, C, trans_a='n', trans_b='n', alpha=1.0, beta=1.0, lda=None, ldb=None, ldc=None):
+    """ Unchecked version of blaspy.gemm. Matrix C must be provided. """
+    m, n = C.shape
+    cblas_trans_a = TRANS_DICT[trans_a]
+    k = A.shape[1] if cblas_trans_a == NO_TRANS else A.shape[0]
+    cblas_func = get_unchecked_cblas_func('gemm', A.dtype)
+    cblas_func(ROW_MAJOR, cblas_trans_a, TRANS_DICT[trans_b], m, n, k, alpha,
+               A.ctypes.data, A.shape[1] if lda is None else lda,
+               B.ctypes.data, B.shape[1] if ldb is None else ldb, beta,
+               C.ctypes.data, n if ldc is None else ldc)
+    return C
+
+
+def symm(A, B, C, side='l', uplo='u', alpha=1.0, beta=1.0, lda=None, ldb=None, ldc=None):
+    """ Unchecked version of blaspy.symm. Matrix C must be provided. """
+    m, n = C.shape
+    cblas_func = get_unchecked_cblas_func('symm', A.dtype)
+    cblas_func(ROW_MAJOR, SIDE_DICT[side], UPLO_DICT[uplo], m, n, alpha,
+               A.ctypes.data, A.shape[0] if lda is None else lda,
+               B.ctypes.data, n if ldb is None else ldb, beta,
+               C.ctypes.data, n if ldc is None else ldc)
+    return C
+
+
+def syrk(A, C, uplo='u', trans='n', alpha=1.0, beta=1.0, lda=None, ldc=None):
+    """ Unchecked version of blaspy.syrk. Matrix C must be provided. """
+    dim_C = C.shape[0]
+    cblas_trans = TRANS_DICT[trans]
+    k = A.shape[1] if cblas_trans == NO_TRANS else A.shape[0]
+    cblas_func = get_unchecked_cblas_func('syrk', A.dtype)
+    cblas_func(ROW_MAJOR, UPLO_DICT[uplo], cblas_trans, dim_C, k, alpha,
+               A.ctypes.data, A.shape[1] if lda is None else lda, beta,
+               C.ctypes.data, dim_C if ldc is None else ldc)
+    return C
+
+
+def syr2k(A, B, C, uplo='u', trans='n', alpha=1.0, beta=1.0, lda=None, ldb=None, ldc=None):
+    """ Unchecked version of blaspy.syr2k. Matrix C must be provided. """
+    dim_C = C.shape[0]
+    cblas_trans = TRANS_DICT[trans]
+    k = A.shape[1] if cblas_trans == NO_TRANS else A.shape[0]
+    cblas_func = get_unchecked_cblas_func('syr2k', A.dtype)
+    cblas_func(ROW_MAJOR, UPLO_DICT[uplo], cblas_trans, dim_C, k, alpha,
+               A.ctypes.data, A.shape[1] if lda is None else lda,
+               B.ctypes.data, B.shape[1] if ldb is None else ldb, beta,
+               C.ctypes.data, dim_C if ldc is None else ldc)
+    return C
+
+
+def trmm(A, B, side='l', uplo='u', trans_a='n', diag='n', alpha=1.0, lda=None, ldb=None):
+    """ Unchecked version of blaspy.trmm. """
+    m_B, n_B = B.shape
+    cblas_func = get_unchecked_cblas_func('trmm', A.dtype)
+    cblas_func(ROW_MAJOR, SIDE_DICT[side], UPLO_DICT[uplo], TRANS_DICT[trans_a], DIAG_DICT[diag],
+               m_B, n_B, alpha, A.ctypes.data, A.shape[0] if lda is None else lda,
+               B.ctypes.data, n_B if ldb is None else ldb)
+
+
+def trsm(A, B, side='l', uplo='u', trans_a='n', diag='n', alpha=1.0, lda=None, ldb=None):
+    """ Unchecked version of blaspy.trsm. """
+    m_B, n_B = B.shape
+    cblas_func = get_unchecked_cblas_func('trsm', A.dtype)
+    cblas_func(ROW_MAJOR, SIDE_DICT[side], UPLO_DICT[uplo], TRANS_DICT[trans_a], DIAG_DICT[diag],
+               m_B, n_B, alpha, A.ctypes.data, A.shape[0] if lda is None else lda,
+               B.ctypes.data, n_B if ldb is None else ldb)
+
+
+def hemm(A, B, C, side='l', uplo='u', alpha=1.0, beta=1.0, lda=None, ldb=None, ldc=None):
+    """ Unchecked version of blaspy.hemm. Matrix C must be provided. """
+    m, n = C.shape
+    cblas_func = get_unchecked_cblas_func('hemm', A.dtype)
+    cblas_func(ROW_MAJOR, SIDE_DICT[side], UPLO_DICT[uplo], m, n, alpha,
+               A.ctypes.data, A.shape[0] if lda is None else lda,
+               B.ctypes.data, n if ldb is None else ldb, beta,
+               C.ctypes.data, n if ldc is None else ldc)
+    return C
+
+
+def herk(A, C, uplo='u', trans='n', alpha=1.0, beta=1.0, lda=None, ldc=None):
+    """ Unchecked version of blaspy.herk. Matrix C must be provided. """
+    dim_C = C.shape[0]
+    cblas_trans = TRANS_DICT[trans]
+    k = A.shape[1] if cblas_trans == NO_TRANS else A.shape[0]
+    cblas_func = get_unchecked_cblas_func('herk', A.dtype)
+    cblas_func(ROW_MAJOR, UPLO_DICT[uplo], cblas_trans, dim_C, k, alpha,
+               A.ctypes.data, A.shape[1] if lda is None else lda, beta,
+               C.ctypes.data, dim_C if ldc is None else ldc)
+    return C
+
+
+def her2k(A, B, C, uplo='u', trans='n', alpha=1.0, beta=1.0, lda=None, ldb=None, ldc=None):
+    """ Unchecked version of blaspy.her2k. Matrix C must be provided. """
+    dim_C = C.shape[0]
+    cblas_trans = TRANS_DICT[trans]
+    k = A.shape[1] if cblas_trans == NO_TRANS else A.shape[0]
+    cblas_func = get_unchecked_cblas_func('her2k', A.dtype)
+    cblas_func(ROW_MAJOR, UPLO_DICT[uplo], cblas_trans, dim_C, k, alpha,
+               A.ctypes.data, A.shape[1] if lda is None else lda,
+               B.ctypes.data, B.shape[1] if ldb is None else ldb, beta,
+               C.ctypes.data, dim_C if ldc is None else ldc)
+    return C
@@ -10,23 +10,39 @@
 """
 
 from numpy import asmatrix, fill_diagonal, random, tril, triu
+from random import choice, randint
 
 # min and max values for elements of random matrices and vectors
 MIN = -1
 MAX = 1
 
-def random_vector(length, is_row, dtype, as_matrix):
-    """ Generate a random vector """
-    m, n = (1, length) if is_row else (length, 1)
-    vector = random.uniform(MIN, MAX, (m, n)).astype(dtype)
+# steps through the rows of a larger matrix from which vector views are sliced, and the number of
+# extra rows and columns in a larger matrix from which matrix views are sliced
+VIEW_STEPS = (-2, -1, 2)
+VIEW_PAD = 3
+
+def random_vector(length, is_row, dtype, as_matrix, as_view=False):
+    """ Generate a random vector, or a strided view of a column of a larger random matrix """
+    if as_view:
+        step = choice(VIEW_STEPS)
+        vector = random.uniform(MIN, MAX, (length * abs(step), 2)).astype(dtype)[::step, 1:]
+        vector = vector.T if is_row else vector
+    else:
+        m, n = (1, length) if is_row else (length, 1)
+        vector = random.uniform(MIN, MAX, (m, n)).astype(dtype)
     if as_matrix:
         vector = asmatrix(vector)
     return vector
 
 
-def random_matrix(m, n, dtype, as_matrix):
-    """ Generate a random matrix """
-    matrix = random.uniform(MIN, MAX, (m, n)).astype(dtype)
+def random_matrix(m, n, dtype, as_matrix, as_view=False):
+    """ Generate a random matrix, or a view of a block of a larger random matrix """
+    if as_view:
+        i, j = randint(0, VIEW_PAD), randint(0, VIEW_PAD)
+        matrix = random.uniform(MIN, MAX, (m + VIEW_PAD, n + VIEW_PAD)).astype(dtype)
+        matrix = matrix[i:i + m, j:j + n]
+    else:
+        matrix = random.uniform(MIN, MAX, (m, n)).astype(dtype)
     if as_matrix:
         matrix = asmatrix(matrix)
     return matrix
@@ -36,14 +36,15 @@ def acceptance_test_dot():
     strides = (1, None)  # None indicates random stride
 
     # test all combinations of all possible values
-    for (dtype, as_matrix, x_is_row, y_is_row, stride) \
-            in product(dtypes, bools, bools, bools, strides,):
+    for (dtype, as_matrix, as_view, x_is_row, y_is_row, stride) \
+            in product(dtypes, bools, bools, bools, bools, strides,):
 
         # if a test fails, create a string representation of its name and append it to the list
         # of failed tests
-        if not passed_test(dtype, as_matrix, x_is_row, y_is_row, stride):
+        if not passed_test(dtype, as_matrix, as_view, x_is_row, y_is_row, stride):
             variables = (dtype,
                          "_matrix" if as_matrix else "_ndarray",
+                         "_view" if as_view else "",
                          "_row" if x_is_row else "_col",
                          "_row" if y_is_row else "_col",
                          "_rand_stride" if stride is None else "")
@@ -53,13 +54,14 @@ def acceptance_test_dot():
     return tests_failed
 
 
-def passed_test(dtype, as_matrix, x_is_row, y_is_row, stride):
+def passed_test(dtype, as_matrix, as_view, x_is_row, y_is_row, stride):
     """
     Run one dot (inner) product test.
 
     Arguments:
         dtype:        either 'float64' or 'float32', the NumPy dtype to test
         as_matrix:    True to test a NumPy matrix, False to test a NumPy ndarray
+        as_view:      True to test views sliced out of larger arrays, False to test whole arrays
         x_is_row:     True to test a row vector as parameter x, False to test a column vector
         y_is_row:     True to test a row vector as parameter y, False to test a column vector
         stride:       stride of x and y to test; if None, a random stride is assigned
@@ -74,8 +76,8 @@ def passed_test(dtype, as_matrix, x_is_row, y_is_row, stride):
     stride = randint(N_MIN, STRIDE_MAX) if stride is None else stride
 
     # create random vectors to test
-    x = random_vector(length, x_is_row, dtype, as_matrix)
-    y = random_vector(length, y_is_row, dtype, as_matrix)
+    x = random_vector(length, x_is_row, dtype, as_matrix, as_view)
+    y = random_vector(length, y_is_row, dtype, as_matrix, as_view)
 
     # create views of x and y that can be used to calculate the expected result
     x_2 = x if x_is_row else x.T
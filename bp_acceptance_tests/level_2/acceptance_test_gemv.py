@@ -38,17 +38,19 @@ def acceptance_test_gemv():
     trans_tuple = ('n', 't')
 
     # test all combinations of all possible values
-    for (dtype, as_matrix, x_is_row, y_is_row, provide_y, stride, trans) \
-            in product(dtypes, bools, bools, bools, bools, strides, trans_tuple):
+    for (dtype, as_matrix, as_view, x_is_row, y_is_row, provide_y, stride, trans) \
+            in product(dtypes, bools, bools, bools, bools, bools, strides, trans_tuple):
 
         # avoid testing cases where y is not provided and stride != 1
         if provide_y or stride == 1:
 
             # if a test fails, create a string representation of its name and append it to the list
             # of failed tests
-            if not passed_test(dtype, as_matrix, x_is_row, y_is_row, provide_y, stride, trans):
+            if not passed_test(dtype, as_matrix, as_view, x_is_row, y_is_row, provide_y, stride,
+                               trans):
                 variables = (dtype,
                              "_matrix" if as_matrix else "_ndarray",
+                             "_view" if as_view else "",
                              "_row" if x_is_row else "_col",
                              "_row" if y_is_row else "_col",
                              "_rand_stride" if stride is None else "",
@@ -59,13 +61,14 @@ def acceptance_test_gemv():
 
     return tests_failed
 
-def passed_test(dtype, as_matrix, x_is_row, y_is_row, provide_y, stride, trans):
+def passed_test(dtype, as_matrix, as_view, x_is_row, y_is_row, provide_y, stride, trans):
     """
     Run one general matrix-vector multiplication test.
 
     Arguments:
         dtype:        either 'float64' or 'float32', the NumPy dtype to test
         as_matrix:    True to test a NumPy matrix, False to test a NumPy ndarray
+        as_view:      True to test views sliced out of larger arrays, False to test whole arrays
         x_is_row:     True to test a row vector as parameter x, False to test a column vector
         y_is_row:     True to test a row vector as parameter y, False to test a column vector
         provide_y:    True if y is to be provided to the BLASpy function, False otherwise
@@ -87,10 +90,10 @@ def passed_test(dtype, as_matrix, x_is_row, y_is_row, provide_y, stride, trans):
     # create random scalars, vectors, and matrices to test
     alpha = uniform(SCAL_MIN, SCAL_MAX)
     beta = uniform(SCAL_MIN, SCAL_MAX)
-    x = random_vector(x_length, x_is_row, dtype, as_matrix)
-    y = random_vector(y_length, y_is_row, dtype, as_matrix) if provide_y else None
+    x = random_vector(x_length, x_is_row, dtype, as_matrix, as_view)
+    y = random_vector(y_length, y_is_row, dtype, as_matrix, as_view) if provide_y else None
     A = random_matrix(m / stride + (m % stride > 0), n / stride + (n % stride > 0), dtype,
-                      as_matrix)
+                      as_matrix, as_view)
 
     # create copies/views of A, x, and y that can be used to calculate the expected result
     A_2 = A if trans == 'n' else A.T
@@ -37,14 +37,15 @@ def acceptance_test_gemm():
     trans_tuple = ('n', 't')
 
     # test all combinations of all possible values
-    for (dtype, as_matrix, provide_C, trans_a, trans_b) \
-            in product(dtypes, bools, bools, trans_tuple, trans_tuple):
+    for (dtype, as_matrix, as_view, provide_C, trans_a, trans_b) \
+            in product(dtypes, bools, bools, bools, trans_tuple, trans_tuple):
 
         # if a test fails, create a string representation of its name and append it to the list
         # of failed tests
-        if not passed_test(dtype, as_matrix, provide_C, trans_a, trans_b):
+        if not passed_test(dtype, as_matrix, as_view, provide_C, trans_a, trans_b):
             variables = (dtype,
                          "_matrix" if as_matrix else "_ndarray",
+                         "_view" if as_view else "",
                          "_" if provide_C else "_no_C_",
                          trans_a, "_",
                          trans_b)
@@ -53,13 +54,14 @@ def acceptance_test_gemm():
 
     return tests_failed
 
-def passed_test(dtype, as_matrix, provide_C, trans_a, trans_b):
+def passed_test(dtype, as_matrix, as_view, provide_C, trans_a, trans_b):
     """
     Run one general matrix-matrix multiplication test.
 
     Arguments:
         dtype:        either 'float64' or 'float32', the NumPy dtype to test
         as_matrix:    True to test a NumPy matrix, False to test a NumPy ndarray
+        as_view:      True to test views sliced out of larger arrays, False to test whole arrays
         provide_C:    True if C is to be provided to the BLASpy function, False otherwise
         trans_a:      BLASpy trans_a parameter to test
         trans_b:      BLASpy trans_b parameter to test
@@ -77,9 +79,11 @@ def passed_test(dtype, as_matrix, provide_C, trans_a, trans_b):
     # create random scalars and matrices to test
     alpha = uniform(SCAL_MIN, SCAL_MAX)
     beta = uniform(SCAL_MIN, SCAL_MAX)
-    A = random_matrix((m if trans_a == 'n' else k), (k if trans_a == 'n' else m), dtype, as_matrix)
-    B = random_matrix((k if trans_b == 'n' else n), (n if trans_b == 'n' else k), dtype, as_matrix)
-    C = random_matrix(m, n, dtype, as_matrix) if provide_C else None
+    A = random_matrix((m if trans_a == 'n' else k), (k if trans_a == 'n' else m), dtype, as_matrix,
+                      as_view)
+    B = random_matrix((k if trans_b == 'n' else n), (n if trans_b == 'n' else k), dtype, as_matrix,
+                      as_view)
+    C = random_matrix(m, n, dtype, as_matrix, as_view) if provide_C else None
 
     # create copies/views of A, B, and C that can be used to calculate the expected result
     A_2 = A if trans_a == 'n' else A.T
@@ -85,11 +85,12 @@ def passed_test(dtype, as_matrix, uplo, side, trans_a, diag):
 
     # create random scalars and matrices to test
     alpha = uniform(SCAL_MIN, SCAL_MAX)
-    A = random_triangular_matrix(k, dtype, as_matrix, uplo, diag, trans_a)
+    A = random_triangular_matrix(k, dtype, as_matrix, uplo, diag)
     B = random_matrix((k if side_is_left else m), (n if side_is_left else k), dtype, as_matrix)
 
     # compute the expected result
-    B_2 = alpha * (dot(A, B) if side_is_left else dot(B, A))
+    A_2 = A.T if transpose else A
+    B_2 = alpha * (dot(A_2, B) if side_is_left else dot(B, A_2))
 
     # get the actual result
     trmm(A, B, side, uplo, trans_a, diag, alpha)
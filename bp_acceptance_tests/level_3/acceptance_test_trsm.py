@@ -39,14 +39,15 @@ def acceptance_test_trsm():
     diags = ('n', 'u')
 
     # test all combinations of all possible values
-    for (dtype, as_matrix, side, uplo, trans_a, diag) \
-            in product(dtypes, bools, sides, uplos, trans_tuple, diags):
+    for (dtype, as_matrix, as_view, side, uplo, trans_a, diag) \
+            in product(dtypes, bools, bools, sides, uplos, trans_tuple, diags):
 
         # if a test fails, create a string representation of its name and append it to the list
         # of failed tests
-        if not passed_test(dtype, as_matrix, side, uplo, trans_a, diag):
+        if not passed_test(dtype, as_matrix, as_view, side, uplo, trans_a, diag):
             variables = (dtype,
                          "_matrix_" if as_matrix else "_ndarray_",
+                         "view_" if as_view else "",
                          side, "_",
                          uplo, "_",
                          trans_a, "_",
@@ -56,13 +57,14 @@ def acceptance_test_trsm():
 
     return tests_failed
 
-def passed_test(dtype, as_matrix, side, uplo, trans_a, diag):
+def passed_test(dtype, as_matrix, as_view, side, uplo, trans_a, diag):
     """
     Run one triangular solve with multiple right-hand sides test.
 
     Arguments:
         dtype:        either 'float64' or 'float32', the NumPy dtype to test
         as_matrix:    True to test a NumPy matrix, False to test a NumPy ndarray
+        as_view:      True to test views sliced out of larger arrays, False to test whole arrays
         side:         BLASpy 'side' parameter to test
         uplo:         BLASpy 'uplo' parameter to test
         trans_a:      BLASpy 'trans_a' parameter to test
@@ -84,7 +86,7 @@ def passed_test(dtype, as_matrix, side, uplo, trans_a, diag):
     # create random scalars and matrices to test
     alpha = uniform(SCAL_MIN, SCAL_MAX)
     A = random_triangular_matrix(dim_A, dtype, as_matrix, uplo, diag='n')
-    B = random_matrix(m, n, dtype, as_matrix)
+    B = random_matrix(m, n, dtype, as_matrix, as_view)
 
     # scale off-diagonals to avoid numerical issues
     A /= dim_A
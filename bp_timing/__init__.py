@@ -1 +1,18 @@
-from level_3 import *
\ No newline at end of file
+from .level_3 import *
+from .timing_overhead import timing_overhead
+from .timing_plan import timing_plan
+from .timing_import import timing_import
+from .timing_num_threads import timing_num_threads
+from .timing_batched import timing_batched
+from .timing_grouped import timing_grouped
+from .timing_columns import timing_columns
+from .timing_parallel import timing_parallel
+from .timing_aio import timing_aio
+from .timing_process_pool import timing_process_pool
+from .timing_out_of_core import timing_out_of_core
+from .timing_distributed import timing_distributed
+from .timing_lazy import timing_lazy
+from .timing_multi_gemm import timing_multi_gemm
+from .timing_structure import timing_structure
+from .timing_pool import timing_pool
+from .timing_memory import timing_memory
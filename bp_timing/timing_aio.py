@@ -0,0 +1,72 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from blaspy import aio, gemm
+from asyncio import gather, run, sleep
+from numpy import random
+import time
+
+SIZE = 1500        # size of the square matrices of each gemm call
+NUM_CALLS = 4      # number of gemm calls made by the request handler
+TICK = 0.001       # interval in seconds at which the other coroutine wakes up
+
+
+async def ticker(done):
+    """ Wake up every TICK seconds until done, and return the longest time between wake ups. """
+
+    longest = 0.
+    last = time.perf_counter()
+    while not done:
+        await sleep(TICK)
+        now = time.perf_counter()
+        longest, last = max(longest, now - last), now
+    return longest
+
+
+async def handler(awaitable, A, B, done):
+    """ Make NUM_CALLS gemm calls one after another, then stop the ticker. """
+
+    for i in range(NUM_CALLS):
+        if awaitable:
+            await aio.gemm(A, B)
+        else:
+            gemm(A, B)
+            await sleep(0)
+    done.append(True)
+
+
+async def serve(awaitable, A, B):
+    """ Run the handler alongside the ticker, and return the longest time between wake ups. """
+
+    done = []
+    return (await gather(handler(awaitable, A, B, done), ticker(done)))[1]
+
+
+def timing_aio(trials):
+    """
+    Test how long an event loop is stalled by gemm calls made directly from a coroutine and through
+    blaspy.aio.
+
+    Prints out the longest time between wake ups of another coroutine, and the total time, of each
+    way.
+    """
+
+    A = random.uniform(-1, 1, (SIZE, SIZE))
+    B = random.uniform(-1, 1, (SIZE, SIZE))
+
+    for name, awaitable in (('gemm', False), ('aio.gemm', True)):
+        stalls, totals = [], []
+        for i in range(trials):
+            start = time.perf_counter()
+            stalls.append(run(serve(awaitable, A, B)))
+            totals.append(time.perf_counter() - start)
+        print("%8s: longest event loop stall %.1fms, total %.1fms"
+              % (name, 1e3 * min(stalls), 1e3 * min(totals)))
@@ -0,0 +1,77 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from blaspy import (gemm, gemm_batched, syrk, syrk_batched, trsm, trsm_batched, gemv, gemv_batched,
+                    trsv, trsv_batched)
+from numpy import eye, matmul, random, triu
+import time
+
+BATCH = 1000              # number of problems in each batch
+SIZES = (4, 16, 64, 128)  # sizes of the square matrices of each problem
+
+
+def timing_test(call, trials):
+    """
+    Return the best time of a single call of 'call' over the given number of trials.
+    """
+
+    best = float('inf')
+
+    for i in range(trials):
+        start = time.time()
+        call()
+        best = min(best, time.time() - start)
+
+    return best
+
+
+def loop(func, *stacks, **kwargs):
+    """ Call a BLASpy function once per problem of a batch in a Python loop. """
+    for matrices in zip(*stacks):
+        func(*matrices, **kwargs)
+
+
+def timing_batched(trials):
+    """
+    Test the batched level 2 and level 3 functions against calling the regular BLASpy functions in
+    a Python loop, and gemm_batched against numpy.matmul.
+
+    Prints out, for each size n, the best time of a batch of gemm, syrk, trsm, gemv, and trsv
+    problems of that size in each way.
+    """
+
+    for n in SIZES:
+        A = random.uniform(-1, 1, (BATCH, n, n))
+        B = random.uniform(-1, 1, (BATCH, n, n))
+        C = random.uniform(-1, 1, (BATCH, n, n))
+        T = triu(A) + n * eye(n)
+        x = random.uniform(-1, 1, (BATCH, n))
+        y = random.uniform(-1, 1, (BATCH, n))
+
+        gemm_times = (timing_test(lambda: loop(gemm, A, B, C, beta=0.), trials),
+                      timing_test(lambda: gemm_batched(A, B, C, beta=0.), trials),
+                      timing_test(lambda: matmul(A, B, out=C), trials))
+        syrk_times = (timing_test(lambda: loop(syrk, A, C, beta=0.), trials),
+                      timing_test(lambda: syrk_batched(A, C, beta=0.), trials))
+        trsm_times = (timing_test(lambda: loop(trsm, T, B), trials),
+                      timing_test(lambda: trsm_batched(T, B), trials))
+
+        print("n: %3d, gemm: loop %.2fms, batched %.2fms, matmul %.2fms; "
+              "syrk: loop %.2fms, batched %.2fms; trsm: loop %.2fms, batched %.2fms"
+              % ((n,) + tuple(1e3 * t for t in gemm_times + syrk_times + trsm_times)))
+
+        gemv_times = (timing_test(lambda: loop(gemv, A, x, y, beta=0.), trials),
+                      timing_test(lambda: gemv_batched(A, x, y, beta=0.), trials))
+        trsv_times = (timing_test(lambda: loop(trsv, T, y), trials),
+                      timing_test(lambda: trsv_batched(T, y), trials))
+
+        print("n: %3d, gemv: loop %.2fms, batched %.2fms; trsv: loop %.2fms, batched %.2fms"
+              % ((n,) + tuple(1e3 * t for t in gemv_times + trsv_times)))
@@ -0,0 +1,36 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from .timing_batched import timing_test
+from blaspy import dot, dot_pairs, nrm2, nrm2_columns
+from numpy import asfortranarray, random
+
+SHAPES = ((16, 10000), (256, 1000), (4096, 100))  # numbers of rows and columns of the matrices
+
+
+def timing_columns(trials):
+    """
+    Test nrm2_columns and dot_pairs against calling nrm2 and dot once per column in a Python loop,
+    on matrices stored in row-major and in column-major order.
+
+    Prints out, for each shape, the best time of each way.
+    """
+
+    for m, n in SHAPES:
+        for order, A in (('C', random.uniform(-1, 1, (m, n))),
+                         ('F', asfortranarray(random.uniform(-1, 1, (m, n))))):
+            nrm2_times = (timing_test(lambda: [nrm2(A[:, j]) for j in range(n)], trials),
+                          timing_test(lambda: nrm2_columns(A), trials))
+            dot_times = (timing_test(lambda: [dot(A[:, j], A[:, j]) for j in range(n)], trials),
+                         timing_test(lambda: dot_pairs(A, A), trials))
+
+            print("%5d x %5d (%s), nrm2: loop %.2fms, columns %.2fms; dot: loop %.2fms, "
+                  "pairs %.2fms" % ((m, n, order) + tuple(1e3 * t for t in nrm2_times + dot_times)))
@@ -0,0 +1,46 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from .timing_batched import timing_test
+from blaspy import gemm
+from blaspy.distributed import LocalCluster
+from numpy import random
+from os import cpu_count
+
+SIZE = 2000    # size of the square matrices
+
+
+def timing_distributed(trials):
+    """
+    Test the SUMMA gemm of a blaspy.distributed.LocalCluster of 1, 2, 4, ... worker processes on
+    this machine against calling gemm directly.
+
+    Prints out the best time of each, and for each cluster the mean time its workers spent
+    computing, waiting for panels, and sending panels in the last trial.
+    """
+
+    A = random.uniform(-1, 1, (SIZE, SIZE))
+    B = random.uniform(-1, 1, (SIZE, SIZE))
+    print("n: %d, direct %.2fms" % (SIZE, 1e3 * timing_test(lambda: gemm(A, B), trials)))
+
+    num_cpus = cpu_count() or 1
+    for workers in [1 << i for i in range(num_cpus.bit_length()) if 1 << i <= num_cpus]:
+        with LocalCluster(workers) as cluster:
+            best = timing_test(lambda: cluster.gemm(A, B), trials)
+            timings = cluster.timings
+        print("%d workers (%d x %d grid): %.2fms, per worker compute %.2fms, wait %.2fms, "
+              "send %.2fms, scatter %.2fms, gather %.2fms"
+              % (workers, cluster.grid[0], cluster.grid[1], 1e3 * best,
+                 1e3 * sum(node.compute for node in timings) / workers,
+                 1e3 * sum(node.wait for node in timings) / workers,
+                 1e3 * sum(node.send for node in timings) / workers,
+                 1e3 * sum(node.scatter for node in timings) / workers,
+                 1e3 * sum(node.gather for node in timings) / workers))
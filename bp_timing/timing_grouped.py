@@ -0,0 +1,46 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from .timing_batched import timing_test
+from blaspy import gemm, gemm_grouped
+from numpy import random
+
+NUM_PROBLEMS = 1000          # number of problems in each list
+MAX_SIZES = (16, 64, 256)    # largest m, n, and k of the problems of each list
+
+
+def loop(A_list, B_list, C_list):
+    """ Call gemm once per problem in a Python loop. """
+    for A, B, C in zip(A_list, B_list, C_list):
+        gemm(A, B, C, beta=0.)
+
+
+def timing_grouped(trials):
+    """
+    Test gemm_grouped against calling gemm in a Python loop on lists of problems of random sizes.
+
+    Prints out, for each largest size, the best GFLOP/s achieved in each way.
+    """
+
+    rng = random.RandomState(0)
+
+    for max_size in MAX_SIZES:
+        shapes = [tuple(rng.randint(1, max_size + 1, 3)) for i in range(NUM_PROBLEMS)]
+        A_list = [rng.uniform(-1, 1, (m, k)) for m, n, k in shapes]
+        B_list = [rng.uniform(-1, 1, (k, n)) for m, n, k in shapes]
+        C_list = [rng.uniform(-1, 1, (m, n)) for m, n, k in shapes]
+        gflop = sum(2. * m * n * k for m, n, k in shapes) / 1e9
+
+        loop_time = timing_test(lambda: loop(A_list, B_list, C_list), trials)
+        grouped_time = timing_test(lambda: gemm_grouped(A_list, B_list, C_list, beta=0.), trials)
+
+        print("max size: %3d, loop: %.2f GFLOP/s, grouped: %.2f GFLOP/s (%.2fx)"
+              % (max_size, gflop / loop_time, gflop / grouped_time, loop_time / grouped_time))
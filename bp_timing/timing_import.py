@@ -0,0 +1,54 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from os import environ, path
+from subprocess import check_output
+from sys import executable
+
+ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+
+# code run in a fresh interpreter for each trial, printing the seconds taken by the timed statements
+# (NumPy is imported beforehand so that its import time is not included)
+SETUP = "import numpy, time; x = numpy.ones((4, 1)); start = time.time(); "
+REPORT = "; print(time.time() - start)"
+IMPORT_ONLY = SETUP + "import blaspy" + REPORT
+IMPORT_AND_LOAD = SETUP + "import blaspy, blaspy.config; blaspy.config.get_libblas()" + REPORT
+IMPORT_AND_CALL = SETUP + "import blaspy; blaspy.dot(x, x)" + REPORT
+
+
+def timing_import(trials):
+    """
+    Test the time taken to import BLASpy in a fresh interpreter.
+
+    Prints out the best time over the given number of trials to import BLASpy alone (which no longer
+    loads the BLAS library), to import BLASpy and load the BLAS library (the cost of every import
+    when the library was loaded eagerly), and to import BLASpy and make a first BLAS call.
+    """
+
+    import_only = timing_test(IMPORT_ONLY, trials)
+    import_and_load = timing_test(IMPORT_AND_LOAD, trials)
+    import_and_call = timing_test(IMPORT_AND_CALL, trials)
+
+    print("import: %.2fms, import and load BLAS: %.2fms, import and first call: %.2fms"
+          % (1e3 * import_only, 1e3 * import_and_load, 1e3 * import_and_call))
+    print("Import time saved by loading BLAS lazily: %.2fms"
+          % (1e3 * (import_and_load - import_only)))
+
+
+def timing_test(code, trials):
+    """
+    Return the best time printed by 'code' over the given number of trials, each in a fresh
+    interpreter.
+    """
+
+    environment = dict(environ, PYTHONPATH=ROOT)
+    return min(float(check_output([executable, "-c", code], env=environment))
+               for i in range(trials))
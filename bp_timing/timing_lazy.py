@@ -0,0 +1,40 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from .timing_batched import timing_test
+from blaspy import gemm
+from blaspy.lazy import array
+from numpy import dot, random
+
+SIZES = (64, 256, 1024)    # sizes of the square matrices
+
+
+def timing_lazy(trials):
+    """
+    Test beta * C + alpha * A * B computed by NumPy expressions (two temporary matrices), by a
+    lazy expression evaluated into C, and by a direct call to gemm.
+
+    Prints out the best time of each for each size.
+    """
+
+    alpha, beta = 1.5, 0.5
+    for n in SIZES:
+        A = random.uniform(-1, 1, (n, n))
+        B = random.uniform(-1, 1, (n, n))
+        C = random.uniform(-1, 1, (n, n))
+
+        numpy_time = timing_test(lambda: beta * C + alpha * dot(A, B), trials)
+        lazy_time = timing_test(
+            lambda: (beta * array(C) + alpha * (array(A) @ array(B))).evaluate(C), trials)
+        gemm_time = timing_test(lambda: gemm(A, B, C, alpha=alpha, beta=beta), trials)
+
+        print("n: %d, numpy: %.3fms, lazy: %.3fms, gemm: %.3fms"
+              % (n, 1e3 * numpy_time, 1e3 * lazy_time, 1e3 * gemm_time))
@@ -0,0 +1,44 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from .timing_batched import timing_test
+from blaspy import gemm, zeros
+from numpy import copyto, random, zeros as np_zeros
+
+SIZES = (256, 1024, 2048)    # sizes of the square matrices
+
+
+def timing_memory(trials):
+    """
+    Test creating matrices of zeros with numpy.zeros, and with blaspy.zeros with and without huge
+    pages and with one thread or all of them, and gemm on operands created each way.
+
+    Prints out the best time of each creation followed by a write to every element (since
+    numpy.zeros leaves the first touch of fresh memory to that write) and of each gemm call.
+    """
+
+    for n in SIZES:
+        source = random.uniform(-1, 1, (n, n))
+        creators = (('numpy', lambda: np_zeros((n, n))),
+                    ('aligned', lambda: zeros((n, n), huge_pages=False, num_threads=1)),
+                    ('huge pages', lambda: zeros((n, n), huge_pages=True, num_threads=1)),
+                    ('threads', lambda: zeros((n, n), huge_pages=True)))
+        results = []
+        for name, create in creators:
+            best_create = timing_test(lambda: create().fill(1.), trials)
+            A, B, C = create(), create(), create()
+            copyto(A, source)
+            copyto(B, source)
+            best_gemm = timing_test(lambda: gemm(A, B, C, beta=0.), trials)
+            results.append("%s zeros %.3fms gemm %.3fms" % (name, 1e3 * best_create,
+                                                           1e3 * best_gemm))
+
+        print("n: %d, %s" % (n, ", ".join(results)))
@@ -0,0 +1,40 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from .timing_batched import timing_test
+from blaspy import gemm, gemv, multi_gemm
+from numpy import random
+from numpy.linalg import multi_dot
+
+SIZE = 1000    # size of the square matrices
+
+
+def timing_multi_gemm(trials):
+    """
+    Test A * B * C * x and A * u * v^T * B computed left to right by gemm and gemv calls, by
+    multi_gemm, and by numpy.linalg.multi_dot.
+
+    Prints out the best time of each for each chain.
+    """
+
+    A, B, C = [random.uniform(-1, 1, (SIZE, SIZE)) for index in range(3)]
+    x = random.uniform(-1, 1, SIZE)
+    u = random.uniform(-1, 1, (SIZE, 1))
+    v = random.uniform(-1, 1, (1, SIZE))
+
+    chains = (('A*B*C*x', (A, B, C, x), lambda: gemv(gemm(gemm(A, B), C), x)),
+              ('A*u*v*B', (A, u, v, B), lambda: gemm(gemm(gemm(A, u), v), B)))
+    for name, operands, left_to_right in chains:
+        naive_time = timing_test(left_to_right, trials)
+        multi_time = timing_test(lambda: multi_gemm(*operands), trials)
+        numpy_time = timing_test(lambda: multi_dot(operands), trials)
+        print("n: %d, %s, left to right: %.3fms, multi_gemm: %.3fms, multi_dot: %.3fms"
+              % (SIZE, name, 1e3 * naive_time, 1e3 * multi_time, 1e3 * numpy_time))
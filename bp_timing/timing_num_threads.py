@@ -0,0 +1,68 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from .helpers import random_matrix, random_vector
+from blaspy import gemm, gemv, get_num_threads, threads
+from multiprocessing import cpu_count
+import time
+
+GEMM_SIZE = 1000  # size of the square gemm operands
+GEMV_SIZE = 4000  # size of the square gemv operand
+
+
+def timing_num_threads(trials):
+    """
+    Test how gemm and gemv scale with the number of threads the BLAS library uses.
+
+    Prints out, for 1, 2, 4, ... threads up to the number of cores (and the library's default), the
+    best GFLOP/s of gemm and gemv and their speedup over a single thread.
+    """
+
+    if get_num_threads() is None:
+        print("The BLAS library has no thread control; skipping.")
+        return
+
+    A = random_matrix(GEMM_SIZE, GEMM_SIZE, 'float64', False)
+    B = random_matrix(GEMM_SIZE, GEMM_SIZE, 'float64', False)
+    C = random_matrix(GEMM_SIZE, GEMM_SIZE, 'float64', False)
+    M = random_matrix(GEMV_SIZE, GEMV_SIZE, 'float64', False)
+    x = random_vector(GEMV_SIZE, False, 'float64', False)
+    y = random_vector(GEMV_SIZE, False, 'float64', False)
+
+    counts = sorted(set([2 ** i for i in range(cpu_count().bit_length()) if 2 ** i <= cpu_count()]
+                        + [cpu_count(), get_num_threads()]))
+    base = None
+
+    for num_threads in counts:
+        with threads(num_threads):
+            gemm_rate = 2e-9 * GEMM_SIZE ** 3 / timing_test(lambda: gemm(A, B, C), trials)
+            gemv_rate = 2e-9 * GEMV_SIZE ** 2 / timing_test(lambda: gemv(M, x, y), trials)
+
+        if base is None:
+            base = (gemm_rate, gemv_rate)
+
+        print("threads: %3d, gemm: %7.2f GFLOP/s (%.2fx), gemv: %6.2f GFLOP/s (%.2fx)"
+              % (num_threads, gemm_rate, gemm_rate / base[0], gemv_rate, gemv_rate / base[1]))
+
+
+def timing_test(call, trials):
+    """
+    Return the best time taken by a single call of 'call' over the given number of trials.
+    """
+
+    best = float('inf')
+
+    for i in range(trials):
+        start = time.time()
+        call()
+        best = min(best, time.time() - start)
+
+    return best
@@ -0,0 +1,53 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from .timing_batched import timing_test
+from blaspy import gemm, gemm_out_of_core
+from numpy import float32, load, random, save
+from os import path
+from shutil import rmtree
+from tempfile import mkdtemp
+
+SIZE = 3000                   # size of the square float32 matrices
+FRACTIONS = (1, 4, 16, 64)    # memory budgets, as fractions of the size of A, B, and C together
+
+
+def timing_out_of_core(trials):
+    """
+    Test gemm_out_of_core on .npy files with memory budgets of 1, 1/4, 1/16, ... of the size of the
+    operands against gemm on the whole matrices in memory. The files are likely to be in the page
+    cache, so this measures the cost of tiling rather than of the disk.
+
+    Prints out the best time and the rate in GFLOPS of each.
+    """
+
+    directory = mkdtemp()
+    try:
+        files = [path.join(directory, name + '.npy') for name in ('A', 'B', 'C')]
+        for file in files:
+            save(file, random.uniform(-1, 1, (SIZE, SIZE)).astype(float32))
+        A, B = load(files[0]), load(files[1])
+        flops = 2. * SIZE ** 3
+
+        best = timing_test(lambda: gemm(A, B), trials)
+        times = ["in memory %.2fms (%.1f GFLOPS)" % (1e3 * best, 1e-9 * flops / best)]
+
+        total = 3 * SIZE * SIZE * 4
+        for fraction in FRACTIONS:
+            best = timing_test(lambda: gemm_out_of_core(files[0], files[1], files[2], beta=0.,
+                                                        memory=total // fraction), trials)
+            times.append("1/%d budget %.2fms (%.1f GFLOPS)"
+                         % (fraction, 1e3 * best, 1e-9 * flops / best))
+
+        print("n: %d, %s" % (SIZE, ", ".join(times)))
+
+    finally:
+        rmtree(directory)
@@ -0,0 +1,132 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from .helpers import random_matrix, random_vector
+from blaspy import dot, gemv, gemm
+from blaspy.config import get_libblas
+from blaspy.helpers import (get_vector_dimensions, get_matrix_dimensions, check_equal_sizes,
+                            get_cblas_info, ROW_MAJOR, NO_TRANS)
+from ctypes import CDLL, c_int, POINTER
+import time
+
+SIZES = range(1, 65)    # operand sizes to test
+CALLS = 1000            # calls per trial
+
+
+def timing_overhead(trials):
+    """
+    Test the per-call overhead of BLASpy for small operands.
+
+    Prints out, for each size n, the average time per call of dot, gemv, and gemm when using the
+    CBLAS prototypes cached by BLASpy and when rebuilding the prototypes on every call.
+    """
+
+    # a separate handle to the BLAS library so that the prototypes set below do not affect BLASpy
+    lib = CDLL(get_libblas()._name)
+    cached_total = 0.0
+    rebuilt_total = 0.0
+
+    for n in SIZES:
+        x = random_vector(n, False, 'float64', False)
+        y = random_vector(n, False, 'float64', False)
+        A = random_matrix(n, n, 'float64', False)
+        B = random_matrix(n, n, 'float64', False)
+        C = random_matrix(n, n, 'float64', False)
+
+        cached = (timing_test(lambda: dot(x, y), trials),
+                  timing_test(lambda: gemv(A, x, y), trials),
+                  timing_test(lambda: gemm(A, B, C), trials))
+        rebuilt = (timing_test(lambda: rebuilt_dot(lib, x, y), trials),
+                   timing_test(lambda: rebuilt_gemv(lib, A, x, y), trials),
+                   timing_test(lambda: rebuilt_gemm(lib, A, B, C), trials))
+        cached_total += sum(cached)
+        rebuilt_total += sum(rebuilt)
+
+        print("n: %2d, dot: %.2fus -> %.2fus, gemv: %.2fus -> %.2fus, gemm: %.2fus -> %.2fus"
+              % ((n,) + tuple(1e6 * t for pair in zip(rebuilt, cached) for t in pair)))
+
+    print("\nAverage per call, rebuilt prototypes: %.2fus, cached prototypes: %.2fus"
+          % (1e6 * rebuilt_total / (3 * len(SIZES)), 1e6 * cached_total / (3 * len(SIZES))))
+
+
+def timing_test(call, trials):
+    """
+    Return the best average time per call of 'call' over the given number of trials.
+    """
+
+    best = float('inf')
+
+    for i in range(trials):
+        start = time.time()
+        for j in range(CALLS):
+            call()
+        end = time.time()
+        best = min(best, (end - start) / CALLS)
+
+    return best
+
+
+def rebuilt_dot(lib, x, y):
+    """ Compute a dot product, building the ctypes prototype for every call. """
+    m_x, n_x, x_length = get_vector_dimensions('x', x, 1)
+    m_y, n_y, y_length = get_vector_dimensions('y', y, 1)
+    check_equal_sizes('x', x_length, 'y', y_length)
+    ctype_dtype = get_cblas_info('dot', (x.dtype, y.dtype))[1]
+
+    cblas_func = lib.cblas_ddot
+    ctype_x = POINTER(ctype_dtype * n_x * m_x)
+    ctype_y = POINTER(ctype_dtype * n_y * m_y)
+    cblas_func.argtypes = [c_int, ctype_x, c_int, ctype_y, c_int]
+    cblas_func.restype = ctype_dtype
+    return cblas_func(x_length, x.ctypes.data_as(ctype_x), 1, y.ctypes.data_as(ctype_y), 1)
+
+
+def rebuilt_gemv(lib, A, x, y):
+    """ Perform a matrix-vector multiplication, building the ctypes prototype for every call. """
+    m_A, n_A = get_matrix_dimensions('A', A)
+    m_x, n_x, x_length = get_vector_dimensions('x', x, 1)
+    m_y, n_y, y_length = get_vector_dimensions('y', y, 1)
+    check_equal_sizes('A', n_A, 'x', x_length)
+    check_equal_sizes('A', m_A, 'y', y_length)
+    ctype_dtype = get_cblas_info('gemv', (A.dtype, x.dtype, y.dtype))[1]
+
+    cblas_func = lib.cblas_dgemv
+    ctype_x = POINTER(ctype_dtype * n_x * m_x)
+    ctype_y = POINTER(ctype_dtype * n_y * m_y)
+    ctype_A = POINTER(ctype_dtype * n_A * m_A)
+    cblas_func.argtypes = [c_int, c_int, c_int, c_int, ctype_dtype, ctype_A, c_int,
+                           ctype_x, c_int, ctype_dtype, ctype_y, c_int]
+    cblas_func.restype = None
+    cblas_func(ROW_MAJOR, NO_TRANS, m_A, n_A, 1.0, A.ctypes.data_as(ctype_A), n_A,
+               x.ctypes.data_as(ctype_x), 1, 1.0, y.ctypes.data_as(ctype_y), 1)
+    return y
+
+
+def rebuilt_gemm(lib, A, B, C):
+    """ Perform a matrix-matrix multiplication, building the ctypes prototype for every call. """
+    m_A, n_A = get_matrix_dimensions('A', A)
+    m_B, n_B = get_matrix_dimensions('B', B)
+    m_C, n_C = get_matrix_dimensions('C', C)
+    check_equal_sizes('A', n_A, 'B', m_B)
+    check_equal_sizes('A', m_A, 'C', m_C)
+    check_equal_sizes('B', n_B, 'C', n_C)
+    ctype_dtype = get_cblas_info('gemm', (A.dtype, B.dtype, C.dtype))[1]
+
+    cblas_func = lib.cblas_dgemm
+    ctype_A = POINTER(ctype_dtype * n_A * m_A)
+    ctype_B = POINTER(ctype_dtype * n_B * m_B)
+    ctype_C = POINTER(ctype_dtype * n_C * m_C)
+    cblas_func.argtypes = [c_int, c_int, c_int, c_int, c_int, c_int, ctype_dtype,
+                           ctype_A, c_int, ctype_B, c_int, ctype_dtype, ctype_C, c_int]
+    cblas_func.restype = None
+    cblas_func(ROW_MAJOR, NO_TRANS, NO_TRANS, m_A, n_B, n_A, 1.0, A.ctypes.data_as(ctype_A), n_A,
+               B.ctypes.data_as(ctype_B), n_B, 1.0, C.ctypes.data_as(ctype_C), n_C)
+    return C
@@ -0,0 +1,51 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from .timing_batched import timing_test
+from blaspy import gemm
+from blaspy.parallel import Executor
+from numpy import random
+from os import cpu_count
+
+NUM_CALLS = 64             # number of independent gemm calls
+SIZES = (64, 256, 512)     # sizes of the square matrices of each call
+
+
+def run_parallel(executor, A_list, B_list):
+    """ Run one gemm call per pair of matrices on an executor and wait for all of them. """
+    for future in executor.map(gemm, A_list, B_list):
+        future.result()
+
+
+def timing_parallel(trials):
+    """
+    Test running independent gemm calls on a blaspy.parallel.Executor with 1, 2, 4, ... workers
+    (each call using the remaining cores) against calling gemm in a Python loop.
+
+    Prints out, for each size n, the best time of each way.
+    """
+
+    num_cpus = cpu_count() or 1
+    worker_counts = [1 << i for i in range(num_cpus.bit_length()) if 1 << i <= num_cpus]
+
+    for n in SIZES:
+        A_list = [random.uniform(-1, 1, (n, n)) for i in range(NUM_CALLS)]
+        B_list = [random.uniform(-1, 1, (n, n)) for i in range(NUM_CALLS)]
+
+        times = ["loop %.2fms" % (1e3 * timing_test(lambda: [gemm(A, B) for A, B in
+                                                              zip(A_list, B_list)], trials))]
+        for max_workers in worker_counts:
+            with Executor(max_workers) as executor:
+                best = timing_test(lambda: run_parallel(executor, A_list, B_list), trials)
+            times.append("%d workers x %d BLAS threads %.2fms"
+                         % (max_workers, executor.blas_threads, 1e3 * best))
+
+        print("n: %3d, %s" % (n, ", ".join(times)))
@@ -0,0 +1,46 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from .helpers import random_matrix, random_vector
+from .timing_overhead import timing_test
+from blaspy import axpy, gemv, gemm, plan
+
+SIZES = (1, 4, 16, 64, 256)  # operand sizes to test
+
+
+def timing_plan(trials):
+    """
+    Test execution plans against the regular BLASpy functions.
+
+    Prints out, for each size n, the average time per call of axpy, gemv, and gemm when calling
+    the BLASpy function and when executing a plan created once for the same shapes.
+    """
+
+    for n in SIZES:
+        x = random_vector(n, False, 'float64', False)
+        y = random_vector(n, False, 'float64', False)
+        A = random_matrix(n, n, 'float64', False)
+        B = random_matrix(n, n, 'float64', False)
+        C = random_matrix(n, n, 'float64', False)
+
+        axpy_plan = plan('axpy', (x.shape, y.shape), 'float64', alpha=2.0)
+        gemv_plan = plan('gemv', (A.shape, x.shape, y.shape), 'float64', trans_a='t')
+        gemm_plan = plan('gemm', (A.shape, B.shape, C.shape), 'float64', trans_b='t')
+
+        function_times = (timing_test(lambda: axpy(2.0, x, y), trials),
+                          timing_test(lambda: gemv(A, x, y, 't'), trials),
+                          timing_test(lambda: gemm(A, B, C, 'n', 't'), trials))
+        plan_times = (timing_test(lambda: axpy_plan(x, y), trials),
+                      timing_test(lambda: gemv_plan(A, x, y), trials),
+                      timing_test(lambda: gemm_plan(A, B, C), trials))
+
+        print("n: %3d, axpy: %.2fus -> %.2fus, gemv: %.2fus -> %.2fus, gemm: %.2fus -> %.2fus"
+              % ((n,) + tuple(1e6 * t for pair in zip(function_times, plan_times) for t in pair)))
@@ -0,0 +1,60 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from .timing_batched import timing_test
+from blaspy import gemm, gemv, get_pool, multi_gemm
+from numpy import random
+from resource import RUSAGE_SELF, getrusage
+
+SIZES = (64, 512, 2048)    # sizes of the square matrices
+CALLS = 10                 # number of calls whose page faults are counted
+
+
+def timing_pool(trials):
+    """
+    Test gemm and gemv creating their outputs, and multi_gemm creating its intermediate results,
+    with the buffer pool of BLASpy and with pooling disabled.
+
+    Prints out the best time of each call and the number of page faults (first touches of fresh
+    memory) per call, and the number of bytes the pool holds.
+    """
+
+    pool = get_pool()
+    max_bytes = pool.max_bytes
+    try:
+        for n in SIZES:
+            A = random.uniform(-1, 1, (n, n))
+            B = random.uniform(-1, 1, (n, n // 4))
+            x = random.uniform(-1, 1, n)
+
+            calls = (('gemm', lambda: gemm(A, A)),
+                     ('gemv', lambda: gemv(A, x)),
+                     ('multi_gemm', lambda: multi_gemm(A, A, B)))
+            results = []
+            for name, call in calls:
+                times = []
+                for limit in (max_bytes, 0):
+                    pool.max_bytes = limit
+                    best = timing_test(call, trials)
+                    faults = getrusage(RUSAGE_SELF).ru_minflt
+                    for index in range(CALLS):
+                        call()
+                    faults = (getrusage(RUSAGE_SELF).ru_minflt - faults) / float(CALLS)
+                    times.append("%.3fms %.0f faults" % (1e3 * best, faults))
+                results.append("%s pooled %s, unpooled %s" % (name, times[0], times[1]))
+
+            pool.max_bytes = max_bytes
+            print("n: %d, %s" % (n, ", ".join(results)))
+
+    finally:
+        pool.max_bytes = max_bytes
+
+    print("pool: %r" % (pool.stats(),))
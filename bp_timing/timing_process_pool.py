@@ -0,0 +1,58 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from .timing_batched import timing_test
+from blaspy import gemm, gemv, syrk
+from blaspy.process_pool import ProcessPool
+from numpy import random
+from os import cpu_count
+
+GEMM_SIZE = 2000    # size of the square matrices of gemm and syrk
+GEMV_SIZE = 8000    # size of the square matrix of gemv
+
+
+def timing_process_pool(trials):
+    """
+    Test gemm, gemv, and syrk on a blaspy.process_pool.ProcessPool with 1, 2, 4, ... processes
+    (each running the BLAS library with the remaining cores), with every operand already in shared
+    memory, against calling each function directly.
+
+    Prints out, for each function, the best time of each way.
+    """
+
+    num_cpus = cpu_count() or 1
+    process_counts = [1 << i for i in range(num_cpus.bit_length()) if 1 << i <= num_cpus]
+
+    A = random.uniform(-1, 1, (GEMM_SIZE, GEMM_SIZE))
+    B = random.uniform(-1, 1, (GEMM_SIZE, GEMM_SIZE))
+    M = random.uniform(-1, 1, (GEMV_SIZE, GEMV_SIZE))
+    x = random.uniform(-1, 1, GEMV_SIZE)
+
+    times = {'gemm': ["direct %.2fms" % (1e3 * timing_test(lambda: gemm(A, B), trials))],
+             'gemv': ["direct %.2fms" % (1e3 * timing_test(lambda: gemv(M, x), trials))],
+             'syrk': ["direct %.2fms" % (1e3 * timing_test(lambda: syrk(A), trials))]}
+
+    for processes in process_counts:
+        with ProcessPool(processes) as pool:
+            A_shared, B_shared, M_shared, x_shared = [pool.share(operand)
+                                                      for operand in (A, B, M, x)]
+            C = pool.zeros((GEMM_SIZE, GEMM_SIZE))
+            y = pool.zeros(GEMV_SIZE)
+            for name, function in (('gemm', lambda: pool.gemm(A_shared, B_shared, C, beta=0.)),
+                                   ('gemv', lambda: pool.gemv(M_shared, x_shared, y, beta=0.)),
+                                   ('syrk', lambda: pool.syrk(A_shared, C, beta=0.))):
+                function()  # start the processes and map the operands
+                times[name].append("%d processes x %d BLAS threads %.2fms"
+                                   % (processes, pool.blas_threads,
+                                      1e3 * timing_test(function, trials)))
+
+    for name in ('gemm', 'gemv', 'syrk'):
+        print("%s: %s" % (name, ", ".join(times[name])))
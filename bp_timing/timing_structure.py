@@ -0,0 +1,47 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from .timing_batched import timing_test
+from blaspy import gemm
+from numpy import random, triu
+
+SIZES = (256, 1024, 2048)    # sizes of the square matrices
+
+
+def timing_structure(trials):
+    """
+    Test gemm computing A * A_T, S * B with a symmetric S, and U * B with an upper triangular U,
+    both as general products and routed to syrk, symm, and trmm by passing the same array twice
+    or declaring the structure.
+
+    Prints out the best time of each and the speedup of each routed product for each size.
+    """
+
+    for n in SIZES:
+        A = random.uniform(-1, 1, (n, n))
+        B = random.uniform(-1, 1, (n, n))
+        S = A + A.T
+        U = triu(A)
+        A_copy = A.copy()
+
+        products = (('A*A_T', lambda: gemm(A, A_copy, trans_b='t'),
+                     lambda: gemm(A, A, trans_b='t')),
+                    ('S*B', lambda: gemm(S, B), lambda: gemm(S, B, structure='symmetric')),
+                    ('U*B', lambda: gemm(U, B), lambda: gemm(U, B, structure='triangular')))
+        times = []
+        for name, general, routed in products:
+            general_time = timing_test(general, trials)
+            routed_time = timing_test(routed, trials)
+            times.append("%s gemm %.2fms, routed %.2fms (%.2fx)" % (name, 1e3 * general_time,
+                                                                   1e3 * routed_time,
+                                                                   general_time / routed_time))
+
+        print("n: %d, %s" % (n, ", ".join(times)))
@@ -10,4 +10,24 @@
 """
 
 from .level_1 import *
-from .level_2 import *
\ No newline at end of file
+from .level_2 import *
+from .unit_test_threads import TestThreads
+from .unit_test_raw import TestRaw
+from .unit_test_plan import TestPlan
+from .unit_test_layout import TestLayout
+from .unit_test_views import TestViews
+from .unit_test_complex import TestComplex
+from .unit_test_batched import TestBatched
+from .unit_test_columns import TestColumns
+from .unit_test_parallel import TestParallel
+from .unit_test_aio import TestAio
+from .unit_test_process_pool import TestProcessPool
+from .unit_test_out_of_core import TestOutOfCore
+from .unit_test_distributed import TestDistributed
+from .unit_test_lazy import TestLazy
+from .unit_test_multi_gemm import TestMultiGemm
+from .unit_test_structure import TestStructure
+from .unit_test_pool import TestPool
+from .unit_test_memory import TestMemory
+from .unit_test_backend import TestBackend
+from .unit_test_num_threads import TestNumThreads
@@ -74,9 +74,9 @@ class TestAmax(TestCase):
         x = 1.
         self.assertRaises(ValueError, amax, x)
 
-    def test_not_2d_numpy_with_1d_raises_ValueError(self):
+    def test_1d_ndarray(self):
         x = array([1., 2.])
-        self.assertRaises(ValueError, amax, x)
+        self.assertEqual(amax(x), 1)
 
     def test_not_2d_numpy_with_3d_raises_ValueError(self):
         x = array([[[1.], [2.]]], ndmin=3)
@@ -90,6 +90,10 @@ class TestAmax(TestCase):
         x = array([[1., 2.]], dtype='int')
         self.assertRaises(ValueError, amax, x)
 
-    def test_complex_dtype_raises_ValueError(self):
-        x = array([[1., 2.]], dtype='complex')
-        self.assertRaises(ValueError, amax, x)
\ No newline at end of file
+    def test_complex_dtype(self):
+        x = array([[1. + 2.j, -2. - 2.j, 3. + 0.j]], dtype='complex')
+        self.assertEqual(amax(x), 1)
+
+    def test_complex64_dtype(self):
+        x = array([[1. + 2.j, -2. - 2.j, 3. + 0.j]], dtype='complex64')
+        self.assertEqual(amax(x), 1)
\ No newline at end of file
@@ -162,15 +162,17 @@ class TestCopy(TestCase):
         y = 2.
         self.assertRaises(ValueError, copy, x, y)
 
-    def test_not_2d_numpy_with_1d_for_x_raises_ValueError(self):
+    def test_1d_ndarray_for_x(self):
         x = array([1., 2., 3.])
         y = array([[3., 2., 1.]])
-        self.assertRaises(ValueError, copy, x, y)
+        self.assertListEqual(copy(x, y).tolist(), [[1., 2., 3.]])
+        self.assertListEqual(copy(x).tolist(), [1., 2., 3.])
 
-    def test_not_2d_numpy_with_1d_for_y_raises_ValueError(self):
+    def test_1d_ndarray_for_y(self):
         x = array([[1., 2., 3.]])
         y = array([3., 2., 1.])
-        self.assertRaises(ValueError, copy, x, y)
+        self.assertListEqual(copy(x, y).tolist(), [1., 2., 3.])
+        self.assertListEqual(y.tolist(), [1., 2., 3.])
 
     def test_not_2d_numpy_with_3d_for_x_raises_ValueError(self):
         x = array([[[1.], [2.], [3.]]], ndmin=3)
@@ -225,12 +227,12 @@ class TestCopy(TestCase):
         self.assertEqual(y.dtype, 'int')
         self.assertRaises(ValueError, copy, x, y)
 
-    def test_complex_dtype_for_both_raises_ValueError(self):
-        x = array([[1., 2., 3.]], dtype='complex')
+    def test_complex_dtype_for_both(self):
+        x = array([[1., 2.j, 3. - 1.j]], dtype='complex')
         y = array([[3., 2., 1.]], dtype='complex')
         self.assertEqual(x.dtype, 'complex')
         self.assertEqual(y.dtype, 'complex')
-        self.assertRaises(ValueError, copy, x, y)
+        self.assertListEqual(copy(x, y).tolist(), x.tolist())
 
     def test_complex_dtype_for_x_raises_ValueError(self):
         x = array([[1., 2., 3.]], dtype='complex')
@@ -105,15 +105,15 @@ class TestDot(TestCase):
         y = 2.
         self.assertRaises(ValueError, dot, x, y)
 
-    def test_not_2d_numpy_with_1d_for_x_raises_ValueError(self):
+    def test_1d_ndarray_for_x(self):
         x = array([1., 2., 3.])
         y = array([[3., 2., 1.]])
-        self.assertRaises(ValueError, dot, x, y)
+        self.assertEqual(dot(x, y), 10)
 
-    def test_not_2d_numpy_with_1d_for_y_raises_ValueError(self):
+    def test_1d_ndarray_for_y(self):
         x = array([[1., 2., 3.]])
         y = array([3., 2., 1.])
-        self.assertRaises(ValueError, dot, x, y)
+        self.assertEqual(dot(x, y), 10)
 
     def test_not_2d_numpy_with_3d_for_x_raises_ValueError(self):
         x = array([[[1.], [2.], [3.]]], ndmin=3)
@@ -168,12 +168,17 @@ class TestDot(TestCase):
         self.assertEqual(y.dtype, 'int')
         self.assertRaises(ValueError, dot, x, y)
 
-    def test_complex_dtype_for_both_raises_ValueError(self):
-        x = array([[1., 2., 3.]], dtype='complex')
-        y = array([[3., 2., 1.]], dtype='complex')
+    def test_complex_dtype_for_both(self):
+        x = array([[1., 2.j, 3.]], dtype='complex')
+        y = array([[3., 2., 1.j]], dtype='complex')
         self.assertEqual(x.dtype, 'complex')
         self.assertEqual(y.dtype, 'complex')
-        self.assertRaises(ValueError, dot, x, y)
+        self.assertEqual(dot(x, y), 3. + 7.j)
+
+    def test_complex64_dtype_for_both(self):
+        x = array([[1., 2.j, 3.]], dtype='complex64')
+        y = array([[3., 2., 1.j]], dtype='complex64')
+        self.assertEqual(dot(x, y), 3. + 7.j)
 
     def test_complex_dtype_for_x_raises_ValueError(self):
         x = array([[1., 2., 3.]], dtype='complex')
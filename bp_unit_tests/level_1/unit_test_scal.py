@@ -104,9 +104,11 @@ class TestScal(TestCase):
         x = 1.
         self.assertRaises(ValueError, scal, 1, x)
 
-    def test_not_2d_numpy_with_1d__raises_ValueError(self):
+    def test_1d_ndarray(self):
         x = array([1., 2., 3.])
-        self.assertRaises(ValueError, scal, 1, x)
+        expected = [2., 4., 6.]
+        self.assertListEqual(scal(2, x).tolist(), expected)
+        self.assertListEqual(x.tolist(), expected)
 
     def test_not_2d_numpy_with_3d_raises_ValueError(self):
         x = array([[[1.], [2.], [3.]]], ndmin=3)
@@ -121,7 +123,7 @@ class TestScal(TestCase):
         self.assertEqual(x.dtype, 'int')
         self.assertRaises(ValueError, scal, 1, x)
 
-    def test_complex_dtype_raises_ValueError(self):
-        x = array([[1., 2., 3.]], dtype='complex')
+    def test_complex_dtype(self):
+        x = array([[1., 2.j, 3. - 1.j]], dtype='complex')
         self.assertEqual(x.dtype, 'complex')
-        self.assertRaises(ValueError, scal, 1, x)
\ No newline at end of file
+        self.assertListEqual(scal(2.j, x).tolist(), [[2.j, -4., 2. + 6.j]])
\ No newline at end of file
@@ -101,15 +101,15 @@ class TestSdot(TestCase):
         y = 2.
         self.assertRaises(ValueError, sdot, x, y)
 
-    def test_not_2d_numpy_with_1d_for_x_raises_ValueError(self):
+    def test_1d_ndarray_for_x(self):
         x = array([1., 2., 3.], dtype='float32')
         y = array([[3., 2., 1.]], dtype='float32')
-        self.assertRaises(ValueError, sdot, x, y)
+        self.assertEqual(sdot(x, y), 10)
 
-    def test_not_2d_numpy_with_1d_for_y_raises_ValueError(self):
+    def test_1d_ndarray_for_y(self):
         x = array([[1., 2., 3.]], dtype='float32')
         y = array([3., 2., 1.], dtype='float32')
-        self.assertRaises(ValueError, sdot, x, y)
+        self.assertEqual(sdot(x, y), 10)
 
     def test_not_2d_numpy_with_3d_for_x_raises_ValueError(self):
         x = array([[[1.], [2.], [3.]]], ndmin=3, dtype='float32')
@@ -170,15 +170,19 @@ class TestSwap(TestCase):
         y = 2.
         self.assertRaises(ValueError, swap, x, y)
 
-    def test_not_2d_numpy_with_1d_for_x_raises_ValueError(self):
+    def test_1d_ndarray_for_x(self):
         x = array([1., 2., 3.])
         y = array([[3., 2., 1.]])
-        self.assertRaises(ValueError, swap, x, y)
+        swap(x, y)
+        self.assertListEqual(x.tolist(), [3., 2., 1.])
+        self.assertListEqual(y.tolist(), [[1., 2., 3.]])
 
-    def test_not_2d_numpy_with_1d_for_y_raises_ValueError(self):
+    def test_1d_ndarray_for_y(self):
         x = array([[1., 2., 3.]])
         y = array([3., 2., 1.])
-        self.assertRaises(ValueError, swap, x, y)
+        swap(x, y)
+        self.assertListEqual(x.tolist(), [[3., 2., 1.]])
+        self.assertListEqual(y.tolist(), [1., 2., 3.])
 
     def test_not_2d_numpy_with_3d_for_x_raises_ValueError(self):
         x = array([[[1.], [2.], [3.]]], ndmin=3)
@@ -233,12 +237,14 @@ class TestSwap(TestCase):
         self.assertEqual(y.dtype, 'int')
         self.assertRaises(ValueError, swap, x, y)
 
-    def test_complex_dtype_for_both_raises_ValueError(self):
-        x = array([[1., 2., 3.]], dtype='complex')
-        y = array([[3., 2., 1.]], dtype='complex')
+    def test_complex_dtype_for_both(self):
+        x = array([[1., 2.j, 3.]], dtype='complex')
+        y = array([[3., 2., 1.j]], dtype='complex')
         self.assertEqual(x.dtype, 'complex')
         self.assertEqual(y.dtype, 'complex')
-        self.assertRaises(ValueError, swap, x, y)
+        swap(x, y)
+        self.assertListEqual(x.tolist(), [[3., 2., 1.j]])
+        self.assertListEqual(y.tolist(), [[1., 2.j, 3.]])
 
     def test_complex_dtype_for_x_raises_ValueError(self):
         x = array([[1., 2., 3.]], dtype='complex')
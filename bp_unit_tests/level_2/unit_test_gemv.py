@@ -324,17 +324,19 @@ class TestGemv(TestCase):
         y = array([[3.]])
         self.assertRaises(ValueError, gemv, A, x, y)
 
-    def test_not_2d_numpy_with_1d_for_x_raises_ValueError(self):
+    def test_1d_ndarray_for_x(self):
         A = array([[1., 2.], [3., 4.]])
         x = array([1., 2.])
         y = array([[3., 4.]])
-        self.assertRaises(ValueError, gemv, A, x, y)
+        self.assertListEqual(gemv(A, x, y).tolist(), [[8., 15.]])
+        self.assertListEqual(gemv(A, x).tolist(), [5., 11.])
 
-    def test_not_2d_numpy_with_1d_for_y_raises_ValueError(self):
+    def test_1d_ndarray_for_y(self):
         A = array([[1., 2.], [3., 4.]])
         x = array([[1., 2.]])
         y = array([3., 4.])
-        self.assertRaises(ValueError, gemv, A, x, y)
+        self.assertListEqual(gemv(A, x, y).tolist(), [8., 15.])
+        self.assertListEqual(y.tolist(), [8., 15.])
 
     def test_not_2d_numpy_with_3d_for_A_raises_ValueError(self):
         A = array([[[1., 2.]]])
@@ -441,14 +443,20 @@ class TestGemv(TestCase):
         self.assertEqual(y.dtype, 'int')
         self.assertRaises(ValueError, gemv, A, x, y)
 
-    def test_complex_dtype_for_all_raises_ValueError(self):
-        A = array([[1., 2.], [3., 4.]], dtype='complex')
+    def test_complex_dtype_for_all(self):
+        A = array([[1., 2.j], [3., 4.]], dtype='complex')
         x = array([[1.], [2.]], dtype='complex')
-        y = array([[3.], [4.]], dtype='complex')
+        y = array([[3.], [4.j]], dtype='complex')
         self.assertEqual(A.dtype, 'complex')
         self.assertEqual(x.dtype, 'complex')
         self.assertEqual(y.dtype, 'complex')
-        self.assertRaises(ValueError, gemv, A, x, y)
+        self.assertListEqual(gemv(A, x, y).tolist(), [[4. + 4.j], [11. + 4.j]])
+
+    def test_conjugate_transpose(self):
+        A = array([[1., 2.j], [3., 4.]], dtype='complex')
+        x = array([[1.], [1.j]], dtype='complex')
+        self.assertListEqual(gemv(A, x, trans_a='c').tolist(), [[1. + 3.j], [2.j]])
+        self.assertListEqual(gemv(A, x, trans_a='C').tolist(), [[1. + 3.j], [2.j]])
 
     def test_uppercase_trans_a(self):
         A = array([[1., 2.], [3., 4.]])
@@ -463,5 +471,5 @@ class TestGemv(TestCase):
         x = array([[1.], [2.]])
         y = array([[3.], [4.]])
         for char in ascii_letters:
-            if char not in ('n', 'N', 't', 'T'):
+            if char not in ('n', 'N', 't', 'T', 'c', 'C'):
                 self.assertRaises(ValueError, gemv, A, x, y, char)
\ No newline at end of file
@@ -280,15 +280,19 @@ class TestGer(TestCase):
         y = 2.
         self.assertRaises(ValueError, ger, x, y)
 
-    def test_not_2d_numpy_with_1d_for_x_raises_ValueError(self):
+    def test_1d_ndarray_for_x(self):
         x = array([1., 2., 3.])
         y = array([[3., 2., 1.]])
-        self.assertRaises(ValueError, ger, x, y)
+        self.assertListEqual(ger(x, y).tolist(), [[3., 2., 1.],
+                                                  [6., 4., 2.],
+                                                  [9., 6., 3.]])
 
-    def test_not_2d_numpy_with_1d_for_y_raises_ValueError(self):
+    def test_1d_ndarray_for_y(self):
         x = array([[1., 2., 3.]])
         y = array([3., 2., 1.])
-        self.assertRaises(ValueError, ger, x, y)
+        self.assertListEqual(ger(x, y).tolist(), [[3., 2., 1.],
+                                                  [6., 4., 2.],
+                                                  [9., 6., 3.]])
 
     def test_not_2d_numpy_with_3d_for_x_raises_ValueError(self):
         x = array([[[1.],
@@ -350,12 +354,12 @@ class TestGer(TestCase):
         self.assertEqual(y.dtype, 'float64')
         self.assertRaises(ValueError, ger, x, y, A)
 
-    def test_complex_dtype_for_both_raises_ValueError(self):
-        x = array([[1., 2., 3.]], dtype='complex')
-        y = array([[3., 2., 1.]], dtype='complex')
+    def test_complex_dtype_for_both(self):
+        x = array([[1., 2.j]], dtype='complex')
+        y = array([[3., 1.j]], dtype='complex')
         self.assertEqual(x.dtype, 'complex')
         self.assertEqual(y.dtype, 'complex')
-        self.assertRaises(ValueError, ger, x, y)
+        self.assertListEqual(ger(x, y).tolist(), [[3., 1.j], [6.j, -2.]])
 
     def test_complex_dtype_for_x_raises_ValueError(self):
         x = array([[1., 2., 3.]], dtype='complex')
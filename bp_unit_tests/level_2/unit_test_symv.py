@@ -403,19 +403,20 @@ class TestSymv(TestCase):
                    [4.]])
         self.assertRaises(ValueError, symv, A, x, y)
 
-    def test_not_2d_numpy_with_1d_for_x_raises_ValueError(self):
+    def test_1d_ndarray_for_x(self):
         A = array([[1., 2.],
                    [3., 4.]])
         x = array([1., 2.])
         y = array([[3., 4.]])
-        self.assertRaises(ValueError, symv, A, x, y)
+        self.assertListEqual(symv(A, x, y).tolist(), [[8., 14.]])
+        self.assertListEqual(symv(A, x).tolist(), [5., 10.])
 
-    def test_not_2d_numpy_with_1d_for_y_raises_ValueError(self):
+    def test_1d_ndarray_for_y(self):
         A = array([[1., 2.],
                    [3., 4.]])
         x = array([[1., 2.]])
         y = array([3., 4.])
-        self.assertRaises(ValueError, symv, A, x, y)
+        self.assertListEqual(symv(A, x, y).tolist(), [8., 14.])
 
     def test_not_2d_numpy_with_3d_for_A_raises_ValueError(self):
         A = array([[[1., 2.],
@@ -244,11 +244,12 @@ class TestSyr(TestCase):
                    [2.]])
         self.assertRaises(ValueError, syr, x, A)
 
-    def test_not_2d_numpy_with_1d_for_x_raises_ValueError(self):
+    def test_1d_ndarray_for_x(self):
         A = array([[1., 2.],
                    [3., 4.]])
         x = array([1., 2.])
-        self.assertRaises(ValueError, syr, x, A)
+        self.assertListEqual(syr(x, A).tolist(), [[2., 4.],
+                                                  [3., 8.]])
 
     def test_not_2d_numpy_with_3d_for_A_raises_ValueError(self):
         A = array([[[1., 2.],
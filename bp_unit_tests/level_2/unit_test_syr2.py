@@ -317,19 +317,21 @@ class TestSyr2(TestCase):
                    [4.]])
         self.assertRaises(ValueError, syr2, x, y, A)
 
-    def test_not_2d_numpy_with_1d_for_x_raises_ValueError(self):
+    def test_1d_ndarray_for_x(self):
         A = array([[1., 2.],
                    [3., 4.]])
         x = array([1., 2.])
         y = array([[3., 4.]])
-        self.assertRaises(ValueError, syr2, x, y, A)
+        self.assertListEqual(syr2(x, y, A).tolist(), [[7., 12.],
+                                                      [3., 20.]])
 
-    def test_not_2d_numpy_with_1d_for_y_raises_ValueError(self):
+    def test_1d_ndarray_for_y(self):
         A = array([[1., 2.],
                    [3., 4.]])
         x = array([[1., 2.]])
         y = array([3., 4.])
-        self.assertRaises(ValueError, syr2, x, y, A)
+        self.assertListEqual(syr2(x, y, A).tolist(), [[7., 12.],
+                                                      [3., 20.]])
 
     def test_not_2d_numpy_with_3d_for_A_raises_ValueError(self):
         A = array([[[1., 2.],
@@ -304,11 +304,12 @@ class TestTrsv(TestCase):
                    [2.]])
         self.assertRaises(ValueError, trsv, A, b)
 
-    def test_not_2d_numpy_with_1d_for_b_raises_ValueError(self):
+    def test_1d_ndarray_for_b(self):
         A = array([[1., 2.],
                    [3., 4.]])
         b = array([1., 2.])
-        self.assertRaises(ValueError, trsv, A, b)
+        self.assertListEqual(trsv(A, b).tolist(), [0., 0.5])
+        self.assertListEqual(b.tolist(), [0., 0.5])
 
     def test_not_2d_numpy_with_3d_for_A_raises_ValueError(self):
         A = array([[[1., 2.],
@@ -380,14 +381,21 @@ class TestTrsv(TestCase):
         self.assertEqual(b.dtype, 'int')
         self.assertRaises(ValueError, trsv, A, b)
 
-    def test_complex_dtype_for_all_raises_ValueError(self):
-        A = array([[1., 2.],
+    def test_complex_dtype_for_all(self):
+        A = array([[1., 2.j],
                    [3., 4.]], dtype='complex')
         b = array([[1.],
-                   [2.]], dtype='complex')
+                   [8.j]], dtype='complex')
         self.assertEqual(A.dtype, 'complex')
         self.assertEqual(b.dtype, 'complex')
-        self.assertRaises(ValueError, trsv, A, b)
+        self.assertListEqual(trsv(A, b).tolist(), [[5.], [2.j]])
+
+    def test_conjugate_transpose(self):
+        A = array([[1., 2.j],
+                   [3., 4.]], dtype='complex')
+        b = array([[1.],
+                   [2.]], dtype='complex')
+        self.assertListEqual(trsv(A, b, 'u', 'c').tolist(), [[1.], [0.5 + 0.5j]])
 
     def test_invalid_values_for_uplo_raises_ValueError(self):
         A = array([[1., 2.],
@@ -404,7 +412,7 @@ class TestTrsv(TestCase):
         b = array([[1.],
                    [2.]])
         for char in ascii_letters:
-            if char not in ('n', 'N', 't', 'T'):
+            if char not in ('n', 'N', 't', 'T', 'c', 'C'):
                 self.assertRaises(ValueError, trsv, A, b, 'u', char)
 
     def test_invalid_values_for_diag_raises_ValueError(self):
@@ -0,0 +1,134 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from blaspy import aio, get_num_threads, set_num_threads
+from blaspy.parallel import Executor
+from asyncio import CancelledError, ensure_future, gather, run, sleep
+from numpy import allclose, array, dot as np_dot, random
+from threading import Event
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+
+class TestAio(TestCase):
+
+    def setUp(self):
+        rng = random.RandomState(0)
+        self.A = rng.uniform(-1, 1, (40, 30))
+        self.B = rng.uniform(-1, 1, (30, 20))
+        self.executor = Executor(1)
+        self.previous = aio.set_executor(self.executor)
+        aio.reset_metrics()
+
+    def tearDown(self):
+        aio.set_executor(self.previous)
+        self.executor.shutdown()
+
+    def test_awaitable_functions(self):
+        A, B = self.A, self.B
+        x = array([1., 2., 3.] * 10)
+
+        async def compute():
+            return await gather(aio.gemm(A, B, trans_b='n'), aio.gemv(A, x), aio.syrk(A))
+
+        C, y, S = run(compute())
+        self.assertTrue(allclose(C, np_dot(A, B)))
+        self.assertTrue(allclose(y, np_dot(A, x)))
+        self.assertTrue(allclose(S[0, 1], np_dot(A[0], A[1])))
+        self.assertIn('Awaitable version of blaspy.gemm', aio.gemm.__doc__)
+
+    def test_errors_are_raised_by_the_await(self):
+        async def compute():
+            await aio.gemm(self.A, self.A)
+
+        self.assertRaises(ValueError, run, compute())
+        self.assertEqual(aio.get_metrics().failed, 1)
+
+    def test_event_loop_runs_during_calls(self):
+        started, release = Event(), Event()
+        ticks = []
+
+        def blocking():
+            started.set()
+            release.wait(5)
+            return 'done'
+
+        async def tick():
+            while not started.is_set():
+                await sleep(0.001)
+            for i in range(3):
+                ticks.append(i)
+                await sleep(0.001)
+            release.set()
+
+        async def compute():
+            return await gather(aio.run(blocking), tick())
+
+        self.assertEqual(run(compute())[0], 'done')
+        self.assertEqual(ticks, [0, 1, 2])
+
+    def test_cancelled_queued_call_never_runs(self):
+        release = Event()
+        calls = []
+
+        async def compute():
+            first = ensure_future(aio.run(release.wait, 5))
+            second = ensure_future(aio.run(calls.append, 'second'))
+            await sleep(0.01)
+            self.assertEqual(aio.get_metrics().queued, 1)
+            self.assertEqual(aio.get_metrics().running, 1)
+            second.cancel()
+            try:
+                await second
+            except CancelledError:
+                pass
+            release.set()
+            await first
+
+        run(compute())
+        self.executor.shutdown()
+        self.assertEqual(calls, [])
+        metrics = aio.get_metrics()
+        self.assertEqual((metrics.queued, metrics.running, metrics.completed, metrics.cancelled),
+                         (0, 0, 1, 1))
+
+    def test_metrics_record_latencies(self):
+        async def compute():
+            for i in range(3):
+                await aio.gemm(self.A, self.B)
+
+        run(compute())
+        metrics = aio.get_metrics()
+        self.assertEqual((metrics.queued, metrics.running, metrics.completed), (0, 0, 3))
+        self.assertGreater(metrics.total_run, 0)
+        self.assertGreaterEqual(metrics.max_run, metrics.mean_run)
+        self.assertGreaterEqual(metrics.max_wait, metrics.mean_wait)
+        self.assertIn('completed=3', repr(metrics))
+        aio.reset_metrics()
+        self.assertEqual(aio.get_metrics().completed, 0)
+
+    @skipIf(get_num_threads() is None, "the BLAS library has no thread control")
+    def test_default_executor_keeps_the_number_of_blas_threads(self):
+        previous = get_num_threads()
+        aio.set_executor(None)
+        try:
+            set_num_threads(2)
+            with patch('blaspy.parallel.cpu_count', return_value=8):
+                C = run(aio.gemm(self.A, self.B))
+                self.assertTrue(allclose(C, np_dot(self.A, self.B)))
+                self.assertEqual(get_num_threads(), 2)
+                self.assertEqual(aio.get_executor().blas_threads, 2)
+            aio.shutdown_executor()
+            self.assertEqual(get_num_threads(), 2)
+            run(aio.gemm(self.A, self.B))
+            aio.shutdown_executor()
+        finally:
+            set_num_threads(previous)
@@ -0,0 +1,105 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from blaspy import backends, calibrate, dot, gemm, get_backend, set_backend
+from blaspy.config import PREFERENCES_VARIABLE, read_preferences
+from ctypes.util import find_library
+from numpy import allclose, dot as np_dot, ones
+from os import close, environ, path, remove
+from subprocess import check_output
+from sys import executable
+from tempfile import gettempdir, mkstemp
+from unittest import TestCase, skipIf
+
+ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+
+
+def run_python(code, **extra_environment):
+    """ Run code in a fresh interpreter outside of the repository and return what it prints """
+    environment = dict(environ, PYTHONPATH=ROOT, **extra_environment)
+    output = check_output([executable, "-c", code], cwd=gettempdir(), env=environment)
+    return output.decode().strip()
+
+
+class TestBackend(TestCase):
+
+    def test_import_does_not_load_blas_or_change_directory(self):
+        output = run_python("import os, blaspy, blaspy.config as config; "
+                            "print(config._libblas is None, os.getcwd() == %r)" % gettempdir())
+        self.assertEqual(output, "True True")
+
+    def test_first_call_loads_blas(self):
+        output = run_python("import numpy, blaspy, blaspy.config as config; "
+                            "x = numpy.ones((3, 1)); "
+                            "print(blaspy.dot(x, x), config._libblas is None)")
+        self.assertEqual(output, "3.0 False")
+
+    def test_environment_variable_selects_backend(self):
+        backend = get_backend()
+        output = run_python("import blaspy; print(blaspy.get_backend())", BLASPY_BLAS=backend)
+        self.assertEqual(output, backend)
+
+    def test_set_backend(self):
+        backend = get_backend()
+        x = ones((4, 1))
+        A = ones((3, 4))
+        try:
+            set_backend(backend)
+            self.assertEqual(get_backend(), backend)
+            self.assertEqual(dot(x, x), 4.0)
+            self.assertTrue(allclose(gemm(A, A.T), np_dot(A, A.T)))
+        finally:
+            set_backend(backend)
+
+    def test_set_backend_with_missing_library_raises_os_error(self):
+        self.assertRaises(OSError, set_backend, path.join(ROOT, "no-such-blas.so"))
+
+    @skipIf(find_library("c") is None, "no C library to load")
+    def test_set_backend_without_cblas_raises_value_error(self):
+        backend = get_backend()
+        self.assertRaises(ValueError, set_backend, find_library("c"))
+        self.assertEqual(get_backend(), backend)
+
+    def test_backends_reports_active_library(self):
+        inventory = backends()
+        self.assertTrue(inventory[0].active)
+        self.assertEqual(inventory[0].path, get_backend())
+        self.assertEqual(sum(backend.active for backend in inventory), 1)
+        for backend in inventory:
+            self.assertTrue(backend.symbols > 0)
+            self.assertFalse('cblas_dgemm' in backend.missing)
+            if backend.vendor == 'OpenBLAS':
+                self.assertTrue(backend.version is not None)
+                self.assertTrue(backend.num_threads >= 1)
+
+    def test_calibrate_persists_fastest_backend(self):
+        backend = get_backend()
+        handle, preferences_path = mkstemp(suffix=".json")
+        close(handle)
+        environ[PREFERENCES_VARIABLE] = preferences_path
+        try:
+            results = calibrate(trials=1)
+            self.assertEqual(get_backend(), results[0][0])
+            self.assertEqual(read_preferences()["backend"], results[0][0])
+            self.assertEqual(len(read_preferences()["calibration"]), len(results))
+            for blas_path, gemm_rate, gemv_rate in results:
+                self.assertTrue(gemm_rate > 0 and gemv_rate > 0)
+
+            # the persisted choice is the default library of a fresh interpreter
+            output = run_python("import blaspy; print(blaspy.get_backend())")
+            self.assertEqual(output, results[0][0])
+        finally:
+            del environ[PREFERENCES_VARIABLE]
+            remove(preferences_path)
+            set_backend(backend)
+
+    def test_calibrate_without_backends_raises_value_error(self):
+        self.assertRaises(ValueError, calibrate, [], persist=False)
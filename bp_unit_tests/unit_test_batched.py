@@ -0,0 +1,330 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from blaspy import (gemm_batched, symm_batched, syrk_batched, trmm_batched, trsm_batched,
+                    gemm_grouped, gemv_batched, symv_batched, trmv_batched, trsv_batched)
+from blaspy.helpers import (_CBLAS_CACHE, BATCHED_SUFFIX, GROUPED_SUFFIX, DTYPE_INDEX,
+                            NUMPY_BATCHED_SIZES, schedule_problems)
+from numpy import (allclose, broadcast_to, dot as np_dot, eye, matmul, ones, random, tril, triu,
+                   zeros, dtype as np_dtype)
+from numpy.linalg import solve
+from contextlib import nullcontext
+from unittest import TestCase
+from unittest.mock import patch
+
+
+def fortran_stack(stack):
+    """ Return a copy of a stack whose matrices are stored in column-major order """
+    return stack.transpose(0, 2, 1).copy().transpose(0, 2, 1)
+
+
+def matvec(stack, vectors):
+    """ Return the stack of products of the matrices of a stack and a stack of vectors """
+    return matmul(stack, vectors[..., None])[..., 0]
+
+
+def without_numpy_batched():
+    """ Return a context in which the batched level 2 functions always call CBLAS """
+    return patch.dict(NUMPY_BATCHED_SIZES, dict((name, 0) for name in NUMPY_BATCHED_SIZES))
+
+
+class TestBatched(TestCase):
+
+    def setUp(self):
+        rng = random.RandomState(0)
+        self.A = rng.uniform(-1, 1, (7, 5, 5))
+        self.B = rng.uniform(-1, 1, (7, 5, 3))
+        self.C = rng.uniform(-1, 1, (7, 5, 3))
+        self.T = triu(self.A) + 5 * eye(5)
+
+    def test_gemm_batched(self):
+        A, B, C = self.A, self.B, self.C
+        self.assertTrue(allclose(gemm_batched(A, B), matmul(A, B)))
+        self.assertTrue(allclose(gemm_batched(A, B, C.copy(), alpha=2., beta=-1.),
+                                 2. * matmul(A, B) - C))
+        self.assertTrue(allclose(gemm_batched(fortran_stack(A), B, trans_a='t'),
+                                 matmul(A.transpose(0, 2, 1), B)))
+        self.assertTrue(allclose(gemm_batched(B, A.transpose(0, 2, 1), trans_a='t',
+                                              C=fortran_stack(zeros((7, 3, 5)))),
+                                 matmul(B.transpose(0, 2, 1), A.transpose(0, 2, 1))))
+        self.assertTrue(allclose(gemm_batched(A[0], B), matmul(A[0], B)))
+        self.assertTrue(allclose(gemm_batched(A[::2], B[::2]), matmul(A[::2], B[::2])))
+
+    def test_gemm_batched_with_conjugate_transpose(self):
+        A = (self.A + 1j * self.A[::-1]).astype('complex64')
+        B = (self.B - 2j * self.B).astype('complex64')
+        expected = matmul(A.conj().transpose(0, 2, 1), B)
+        self.assertTrue(allclose(gemm_batched(A, B, trans_a='c'), expected, 1e-4, 1e-4))
+        self.assertTrue(allclose(gemm_batched(fortran_stack(A), B, trans_a='c'), expected,
+                                 1e-4, 1e-4))
+
+    def test_symm_batched(self):
+        A, B = self.A, self.B
+        S = triu(A) + triu(A, 1).transpose(0, 2, 1)
+        self.assertTrue(allclose(symm_batched(A, B), matmul(S, B)))
+        self.assertTrue(allclose(symm_batched(fortran_stack(A), fortran_stack(B)), matmul(S, B)))
+        self.assertTrue(allclose(symm_batched(A, B.transpose(0, 2, 1), side='r', alpha=3.),
+                                 3. * matmul(B.transpose(0, 2, 1), S)))
+
+    def test_syrk_batched(self):
+        B = self.B
+        expected = matmul(B, B.transpose(0, 2, 1))
+        self.assertTrue(allclose(triu(syrk_batched(B)), triu(expected)))
+        self.assertTrue(allclose(tril(syrk_batched(fortran_stack(B), uplo='l')), tril(expected)))
+        self.assertTrue(allclose(triu(syrk_batched(B, trans='t')),
+                                 triu(matmul(B.transpose(0, 2, 1), B))))
+
+    def test_trmm_and_trsm_batched(self):
+        T, B = self.T, self.B
+        actual = B.copy()
+        trmm_batched(T, actual, alpha=2.)
+        self.assertTrue(allclose(actual, 2. * matmul(T, B)))
+        actual = fortran_stack(B)
+        trmm_batched(T, actual, trans_a='t')
+        self.assertTrue(allclose(actual, matmul(T.transpose(0, 2, 1), B)))
+        actual = B.copy()
+        trsm_batched(fortran_stack(T), actual)
+        self.assertTrue(allclose(actual, solve(T, B)))
+        actual = B.transpose(0, 2, 1).copy()
+        trsm_batched(T[0], actual, side='r', trans_a='t')
+        self.assertTrue(allclose(matmul(actual, T[0].T), B.transpose(0, 2, 1)))
+
+    def test_threads_and_empty_batches(self):
+        A, B = self.A, self.B
+        for num_threads in (1, 2, 3, 16):
+            self.assertTrue(allclose(gemm_batched(A, B, num_threads=num_threads), matmul(A, B)))
+        self.assertEqual(gemm_batched(A[:0], B[:0]).shape, (0, 5, 3))
+
+    def test_invalid_num_threads_raises_ValueError(self):
+        A, B, T = self.A, self.B, self.T
+        for num_threads in (0, -1, 2.5):
+            self.assertRaises(ValueError, gemm_batched, A, A, num_threads=num_threads)
+            self.assertRaises(ValueError, symm_batched, A, B, num_threads=num_threads)
+            self.assertRaises(ValueError, syrk_batched, B, num_threads=num_threads)
+            self.assertRaises(ValueError, trmm_batched, T, B.copy(), num_threads=num_threads)
+            self.assertRaises(ValueError, trsm_batched, T, B.copy(), num_threads=num_threads)
+
+    def test_problems_with_empty_outputs(self):
+        for context in (nullcontext(), without_numpy_batched()):
+            with context:
+                self.assertEqual(gemm_batched(ones((2, 0, 3)), ones((2, 3, 3))).shape, (2, 0, 3))
+                self.assertFalse(gemm_batched(ones((2, 3, 0)), ones((2, 0, 3))).any())
+                self.assertEqual(symm_batched(ones((2, 0, 0)), ones((2, 0, 3))).shape, (2, 0, 3))
+                self.assertEqual(syrk_batched(ones((2, 0, 3))).shape, (2, 0, 0))
+                trmm_batched(ones((2, 0, 0)), ones((2, 0, 3)))
+                trsm_batched(ones((2, 0, 0)), ones((2, 0, 3)))
+                self.assertEqual(gemv_batched(ones((2, 0, 3)), ones((2, 3))).shape, (2, 0))
+                self.assertFalse(gemv_batched(ones((2, 3, 0)), ones((2, 0))).any())
+                self.assertEqual(symv_batched(ones((2, 0, 0)), ones((2, 0))).shape, (2, 0))
+                self.assertEqual(trmv_batched(ones((2, 0, 0)), ones((2, 0))).shape, (2, 0))
+                self.assertEqual(trsv_batched(ones((2, 0, 0)), ones((2, 0))).shape, (2, 0))
+
+    def test_strided_batched_func_arguments(self):
+        # stand in for the cblas_dgemm_batch_strided of a BLAS library which has one
+        calls = []
+        key = ('gemm' + BATCHED_SUFFIX, DTYPE_INDEX[np_dtype('float64')])
+        _CBLAS_CACHE[key] = lambda *args: calls.append(args)
+        try:
+            C = gemm_batched(self.A, self.B, alpha=2.)
+        finally:
+            del _CBLAS_CACHE[key]
+        self.assertEqual(len(calls), 1)
+        (order, trans_a, trans_b, m, n, k, alpha, a, lda, stride_a, b, ldb, stride_b, beta, c, ldc,
+         stride_c, batch) = calls[0]
+        self.assertEqual((m, n, k, alpha, lda, stride_a, ldb, stride_b, ldc, stride_c, batch),
+                         (5, 3, 5, 2., 5, 25, 3, 15, 3, 15, 7))
+        self.assertEqual((a, c), (self.A.ctypes.data, C.ctypes.data))
+
+    def test_negative_strides_are_not_passed_to_strided_batched_func(self):
+        calls = []
+        key = ('gemm' + BATCHED_SUFFIX, DTYPE_INDEX[np_dtype('float64')])
+        _CBLAS_CACHE[key] = lambda *args: calls.append(args)
+        try:
+            C = gemm_batched(self.A[::-1], self.B)
+        finally:
+            del _CBLAS_CACHE[key]
+        self.assertEqual(calls, [])
+        self.assertTrue(allclose(C, matmul(self.A[::-1], self.B)))
+
+    def test_invalid_stacks_raise_ValueError(self):
+        A, B, C = self.A, self.B, self.C
+        self.assertRaises(ValueError, gemm_batched, A[0], B[0])
+        self.assertRaises(ValueError, gemm_batched, A[:3], B)
+        self.assertRaises(ValueError, gemm_batched, A, B, zeros((7, 5, 4)))
+        self.assertRaises(ValueError, gemm_batched, A, B.astype('float32'))
+        self.assertRaises(ValueError, gemm_batched, A, B, zeros((5, 3)))
+        self.assertRaises(ValueError, gemm_batched, A, B, broadcast_to(zeros((5, 3)), (7, 5, 3)))
+        self.assertRaises(ValueError, gemm_batched, A.reshape(7, 5, 5, 1), B)
+        self.assertRaises(ValueError, symm_batched, B, B)
+        self.assertRaises(ValueError, trsm_batched, A, B[0])
+        self.assertRaises(ValueError, syrk_batched, B, C)
+
+    def test_gemm_grouped(self):
+        rng = random.RandomState(1)
+        shapes = [tuple(rng.randint(1, 20, 3)) for i in range(40)]
+        A_list = [rng.uniform(-1, 1, (m, k)) for m, n, k in shapes]
+        B_list = [rng.uniform(-1, 1, (k, n)) for m, n, k in shapes]
+        expected = [np_dot(A, B) for A, B in zip(A_list, B_list)]
+        for num_threads in (1, 3, None):
+            C_list = gemm_grouped(A_list, B_list, num_threads=num_threads)
+            self.assertTrue(all(allclose(C, E) for C, E in zip(C_list, expected)))
+        C_list = [zeros((n, m)).T for m, n, k in shapes]
+        gemm_grouped(B_list, A_list, [C.T for C in C_list],
+                     trans_a='t', trans_b='t', alpha=2.)
+        self.assertTrue(all(allclose(C, 2. * E) for C, E in zip(C_list, expected)))
+        self.assertEqual(gemm_grouped([], []), [])
+
+    def test_gemm_grouped_with_conjugate_transpose(self):
+        A_list = [(self.A[i] + 1j * self.A[i + 1]).T for i in range(3)]
+        B_list = [self.B[i] * 1j for i in range(3)]
+        C_list = gemm_grouped(A_list, B_list, trans_a='c')
+        self.assertTrue(all(allclose(C, np_dot(A.conj().T, B))
+                            for A, B, C in zip(A_list, B_list, C_list)))
+
+    def test_grouped_func_arguments(self):
+        # stand in for the cblas_dgemm_batch of a BLAS library which has one
+        calls = []
+        key = ('gemm' + GROUPED_SUFFIX, DTYPE_INDEX[np_dtype('float64')])
+        _CBLAS_CACHE[key] = lambda *args: calls.append(args)
+        A_list = [self.A[0], self.B[0].T, self.A[1], self.B[1].T]
+        B_list = [self.B[0], self.A[0], self.B[1], self.A[1]]
+        try:
+            gemm_grouped(A_list, B_list)
+        finally:
+            del _CBLAS_CACHE[key]
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(calls[0]), 16)
+        self.assertEqual(calls[0][-2], 2)  # two groups of two problems of the same size
+
+    def test_schedule_problems_balances_costs(self):
+        costs = [8, 7, 6, 5, 4, 3, 2, 1]
+        assigned = schedule_problems(costs, costs, 3)
+        self.assertEqual(sorted(index for indices in assigned for index in indices),
+                         list(range(8)))
+        loads = [sum(costs[index] for index in indices) for indices in assigned]
+        self.assertLessEqual(max(loads), 13)  # within 4/3 of the best possible, 12
+        self.assertEqual(len(schedule_problems([0], [1], 4)), 1)
+
+    def test_invalid_groups_raise_ValueError(self):
+        A, B = self.A, self.B
+        self.assertRaises(ValueError, gemm_grouped, [A[0]], [B[0], B[1]])
+        self.assertRaises(ValueError, gemm_grouped, [A[0]], [B[0]], [])
+        self.assertRaises(ValueError, gemm_grouped, [A[0]], [B[0].T])
+        self.assertRaises(ValueError, gemm_grouped, [A[0], A[1]], [B[0], B[1].astype('float32')])
+        self.assertRaises(ValueError, gemm_grouped, [A], [B])
+        for num_threads in (0, -1, 2.5):
+            self.assertRaises(ValueError, gemm_grouped, [A[0]], [B[0]], num_threads=num_threads)
+
+    def test_gemv_batched(self):
+        A, x, y = self.A[:, :, :3], self.C[:, :, 0], self.C[:, 0, :]
+        for context in (nullcontext(), without_numpy_batched()):
+            with context:
+                self.assertTrue(allclose(gemv_batched(A, y), matvec(A, y)))
+                self.assertTrue(allclose(gemv_batched(A, y, x.copy(), alpha=2., beta=-1.),
+                                         2. * matvec(A, y) - x))
+                self.assertTrue(allclose(gemv_batched(fortran_stack(A), x, trans_a='t'),
+                                         matvec(A.transpose(0, 2, 1), x)))
+                self.assertTrue(allclose(gemv_batched(A[0], y), matvec(A[0], y)))
+                self.assertTrue(allclose(gemv_batched(A, y[0]), matvec(A, y[0])))
+                self.assertTrue(allclose(gemv_batched(A, self.C[:, 1, ::-1]),
+                                         matvec(A, self.C[:, 1, ::-1])))
+
+    def test_symv_batched(self):
+        A, x = self.A, self.C[:, :, 0]
+        for context in (nullcontext(), without_numpy_batched()):
+            with context:
+                self.assertTrue(allclose(symv_batched(A, x),
+                                         matvec(triu(A) + triu(A, 1).transpose(0, 2, 1), x)))
+                self.assertTrue(allclose(symv_batched(fortran_stack(A), x, x.copy(), uplo='l',
+                                                      beta=2.),
+                                         matvec(tril(A) + tril(A, -1).transpose(0, 2, 1), x)
+                                         + 2. * x))
+
+    def test_trmv_and_trsv_batched(self):
+        x = self.C[:, :, 0]
+        for context in (nullcontext(), without_numpy_batched()):
+            with context:
+                for uplo, T in (('u', self.T), ('l', fortran_stack(self.T.transpose(0, 2, 1)))):
+                    triangle = triu(T) if uplo == 'u' else tril(T)
+                    for diag in ('n', 'u'):
+                        if diag == 'u':
+                            triangle = triangle - triangle * eye(5) + eye(5)
+                        for trans_a in ('n', 't'):
+                            op = triangle if trans_a == 'n' else triangle.transpose(0, 2, 1)
+                            actual = x.copy()
+                            trmv_batched(T, actual, uplo, trans_a, diag)
+                            self.assertTrue(allclose(actual, matvec(op, x)))
+                            actual = x.copy()
+                            trsv_batched(T, actual, uplo, trans_a, diag)
+                            self.assertTrue(allclose(actual, solve(op, x[..., None])[..., 0]))
+
+    def test_trmv_and_trsv_batched_with_1d_vector(self):
+        T = self.T[:1]
+        b = self.C[0, :, 0]
+        for context in (nullcontext(), without_numpy_batched()):
+            with context:
+                for uplo, triangle in (('u', triu(T[0])), ('l', tril(T[0]))):
+                    actual = b.copy()
+                    trsv_batched(T, actual, uplo)
+                    self.assertTrue(allclose(actual, solve(triangle, b)))
+                    actual = b.copy()
+                    trmv_batched(T, actual, uplo)
+                    self.assertTrue(allclose(actual, np_dot(triangle, b)))
+
+    def test_trsv_batched_with_conjugate_transpose(self):
+        T = (self.T + 0.5j * self.T).astype('complex64')
+        b = (self.C[:, :, 0] - 1j * self.C[:, :, 1]).astype('complex64')
+        expected = solve(T.conj().transpose(0, 2, 1), b[..., None])[..., 0]
+        for context in (nullcontext(), without_numpy_batched()):
+            with context:
+                actual = b.copy()
+                trsv_batched(T, actual, trans_a='c')
+                self.assertTrue(allclose(actual, expected, 1e-4, 1e-4))
+
+    def test_strided_batched_gemv_func_arguments(self):
+        calls = []
+        key = ('gemv' + BATCHED_SUFFIX, DTYPE_INDEX[np_dtype('float64')])
+        _CBLAS_CACHE[key] = lambda *args: calls.append(args)
+        try:
+            with without_numpy_batched():
+                y = gemv_batched(self.A, self.C[:, :, 0])
+        finally:
+            del _CBLAS_CACHE[key]
+        self.assertEqual(len(calls), 1)
+        (order, trans_a, m, n, alpha, a, lda, stride_a, x, inc_x, stride_x, beta, y_address, inc_y,
+         stride_y, batch) = calls[0]
+        self.assertEqual((m, n, lda, stride_a, inc_x, stride_x, inc_y, stride_y, batch),
+                         (5, 5, 5, 25, 3, 15, 1, 5, 7))
+        self.assertEqual(y_address, y.ctypes.data)
+
+    def test_invalid_num_threads_of_vector_stacks_raises_ValueError(self):
+        A, T, x = self.A, self.T, self.C[:, :, 0]
+        for context in (nullcontext(), without_numpy_batched()):
+            with context:
+                for num_threads in (0, -1, 2.5):
+                    self.assertRaises(ValueError, gemv_batched, A, x, num_threads=num_threads)
+                    self.assertRaises(ValueError, symv_batched, A, x, num_threads=num_threads)
+                    self.assertRaises(ValueError, trmv_batched, T, x.copy(),
+                                      num_threads=num_threads)
+                    self.assertRaises(ValueError, trsv_batched, T, x.copy(),
+                                      num_threads=num_threads)
+
+    def test_invalid_vector_stacks_raise_ValueError(self):
+        A, x = self.A, self.C[:, :, 0]
+        self.assertRaises(ValueError, gemv_batched, A[0], x[0])
+        self.assertRaises(ValueError, gemv_batched, A[:3], x)
+        self.assertRaises(ValueError, gemv_batched, A, x[:, :3])
+        self.assertRaises(ValueError, gemv_batched, A, x, zeros(5))
+        self.assertRaises(ValueError, gemv_batched, A, x.astype('float32'))
+        self.assertRaises(ValueError, gemv_batched, A, x[..., None])
+        self.assertRaises(ValueError, symv_batched, self.B, x)
+        self.assertRaises(ValueError, trmv_batched, A, x[0])
+        self.assertRaises(ValueError, trsv_batched, A, broadcast_to(x[0], (7, 5)))
@@ -0,0 +1,86 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from blaspy import amax_columns, asum_columns, dot_pairs, nrm2_columns
+from blaspy.helpers import CBLAS_COLUMN_LENGTH
+from numpy import allclose, array, asfortranarray, asmatrix, full, random, zeros
+from numpy.linalg import norm
+from unittest import TestCase
+
+
+class TestColumns(TestCase):
+
+    def setUp(self):
+        rng = random.RandomState(0)
+        # matrices whose columns are reduced by NumPy, and by CBLAS (if stored in column-major order)
+        self.short = rng.uniform(-1, 1, (6, 5))
+        self.long = rng.uniform(-1, 1, (CBLAS_COLUMN_LENGTH, 5))
+        self.matrices = (self.short, asfortranarray(self.short), self.short[::-1, ::2],
+                         self.long, asfortranarray(self.long), asfortranarray(self.long)[:, ::-1])
+
+    def test_nrm2_columns(self):
+        for A in self.matrices:
+            self.assertTrue(allclose(nrm2_columns(A), norm(A, axis=0)))
+        for num_threads in (1, 2, 7):
+            A = asfortranarray(self.long)
+            self.assertTrue(allclose(nrm2_columns(A, num_threads), norm(A, axis=0)))
+
+    def test_nrm2_columns_does_not_overflow(self):
+        self.assertTrue(allclose(nrm2_columns(full((4, 3), 1e200)), 2e200))
+        self.assertTrue(allclose(nrm2_columns(full((4, 3), 1e-200)), 2e-200))
+
+    def test_asum_columns(self):
+        for A in self.matrices:
+            self.assertTrue(allclose(asum_columns(A), abs(A).sum(axis=0)))
+
+    def test_amax_columns(self):
+        for A in self.matrices:
+            self.assertEqual(list(amax_columns(A)), list(abs(A).argmax(axis=0)))
+        self.assertEqual(list(amax_columns(array([[1., -3.], [-3., 3.]]))), [1, 0])
+
+    def test_dot_pairs(self):
+        for X in self.matrices:
+            Y = X[::-1].copy()
+            self.assertTrue(allclose(dot_pairs(X, Y), (X * Y).sum(axis=0)))
+
+    def test_complex_columns(self):
+        for A in (self.short, asfortranarray(self.long)):
+            Z = asfortranarray(A + 2j * A[::-1]).astype('complex64')
+            magnitudes = abs(Z.real) + abs(Z.imag)
+            self.assertTrue(allclose(nrm2_columns(Z), norm(Z, axis=0), 1e-4))
+            self.assertEqual(nrm2_columns(Z).dtype, 'float32')
+            self.assertTrue(allclose(asum_columns(Z), magnitudes.sum(axis=0), 1e-4))
+            self.assertEqual(list(amax_columns(Z)), list(magnitudes.argmax(axis=0)))
+            self.assertTrue(allclose(dot_pairs(Z, Z), (Z * Z).sum(axis=0), 1e-4))
+
+    def test_matrix_and_empty_columns(self):
+        A = asmatrix(self.short)
+        self.assertTrue(allclose(nrm2_columns(A), norm(self.short, axis=0)))
+        self.assertEqual(list(nrm2_columns(zeros((0, 3)))), [0, 0, 0])
+        self.assertEqual(list(amax_columns(zeros((0, 3)))), [0, 0, 0])
+        self.assertEqual(dot_pairs(zeros((4, 0)), zeros((4, 0))).shape, (0,))
+
+    def test_invalid_matrices_raise_ValueError(self):
+        A = self.short
+        self.assertRaises(ValueError, nrm2_columns, A[:, 0])
+        self.assertRaises(ValueError, asum_columns, [[1., 2.]])
+        self.assertRaises(ValueError, amax_columns, A.astype('int64'))
+        self.assertRaises(ValueError, dot_pairs, A, A[:, :3])
+        self.assertRaises(ValueError, dot_pairs, A, A.astype('float32'))
+
+    def test_invalid_num_threads_raises_ValueError(self):
+        for A in (self.short, asfortranarray(self.long)):
+            for num_threads in (0, -1, 1.5, '2'):
+                self.assertRaises(ValueError, nrm2_columns, A, num_threads)
+                self.assertRaises(ValueError, asum_columns, A, num_threads)
+                self.assertRaises(ValueError, amax_columns, A, num_threads)
+                self.assertRaises(ValueError, dot_pairs, A, A, num_threads)
+        self.assertTrue(allclose(nrm2_columns(self.long, 2), norm(self.long, axis=0)))
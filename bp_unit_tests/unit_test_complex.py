@@ -0,0 +1,124 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from blaspy import (dot, dotc, gemv, hemv, her, her2, gemm, symm, syrk, syr2k, trmm, trsm, hemm,
+                    herk, her2k, symv, plan, raw)
+from numpy import allclose, asfortranarray, dot as np_dot, eye, random, triu, zeros
+from numpy.linalg import solve
+from unittest import TestCase
+
+DTYPES = ('complex128', 'complex64')
+
+
+def random_complex(rng, shape, dtype):
+    """ Generate a random complex matrix """
+    return (rng.uniform(-1, 1, shape) + 1j * rng.uniform(-1, 1, shape)).astype(dtype)
+
+
+def hermitian_part(A):
+    """ Return the Hermitian matrix whose upper triangle is the upper triangle of A """
+    U = triu(A, 1)
+    return (U + U.conj().T + eye(A.shape[0]) * A.diagonal().real).astype(A.dtype)
+
+
+class TestComplex(TestCase):
+
+    def setUp(self):
+        rng = random.RandomState(0)
+        self.operands = dict((dtype, (random_complex(rng, (6, 6), dtype),
+                                      random_complex(rng, (6, 4), dtype),
+                                      random_complex(rng, (6, 1), dtype),
+                                      random_complex(rng, (6, 1), dtype)))
+                             for dtype in DTYPES)
+
+    def assertClose(self, actual, expected):
+        self.assertTrue(allclose(actual, expected, 1e-4, 1e-4))
+
+    def test_dot_and_dotc(self):
+        for dtype in DTYPES:
+            A, B, x, y = self.operands[dtype]
+            self.assertClose(dot(x, y), np_dot(x.T, y)[0, 0])
+            self.assertClose(dotc(x, y), np_dot(x.conj().T, y)[0, 0])
+            self.assertClose(dotc(x.real.copy(), y.real.copy()), np_dot(x.real.T, y.real)[0, 0])
+
+    def test_hermitian_level_2(self):
+        for dtype in DTYPES:
+            A, B, x, y = self.operands[dtype]
+            H = hermitian_part(A)
+            self.assertClose(hemv(A, x), np_dot(H, x))
+            self.assertClose(hemv(H.T, x, uplo='l'), np_dot(H.conj(), x))
+            self.assertClose(triu(her(x, A.copy(), alpha=0.5)),
+                             triu(H + 0.5 * np_dot(x, x.conj().T)))
+            self.assertClose(triu(her2(x, y, A.copy(), alpha=2.j)),
+                             triu(H + 2.j * np_dot(x, y.conj().T) - 2.j * np_dot(y, x.conj().T)))
+
+    def test_hermitian_level_3(self):
+        for dtype in DTYPES:
+            A, B, x, y = self.operands[dtype]
+            H, F = hermitian_part(A), B[::-1].copy()
+            self.assertClose(hemm(A, B, alpha=1.j), 1.j * np_dot(H, B))
+            self.assertClose(hemm(asfortranarray(A), B), np_dot(H, B))
+            self.assertClose(hemm(A, B.T.copy(), side='r'), np_dot(B.T, H))
+            self.assertClose(triu(herk(B, alpha=2.)), triu(2. * np_dot(B, B.conj().T)))
+            self.assertClose(triu(herk(B, trans='c')), triu(np_dot(B.conj().T, B)))
+            self.assertClose(triu(herk(B.T, trans='c')), triu(np_dot(B.conj(), B.T)))
+            self.assertClose(triu(her2k(B, F, alpha=1.j)),
+                             triu(1.j * np_dot(B, F.conj().T)
+                                  - 1.j * np_dot(F, B.conj().T)))
+
+    def test_conjugate_transpose_in_both_orders(self):
+        for dtype in DTYPES:
+            A, B, x, y = self.operands[dtype]
+            T = (triu(A) + 6 * eye(6)).astype(dtype)
+            for A_2 in (A, asfortranarray(A), A.T.copy().T):
+                self.assertClose(gemm(A_2, B, trans_a='c'), np_dot(A.conj().T, B))
+                self.assertClose(gemm(B, A_2, trans_a='c', trans_b='c'),
+                                 np_dot(B.conj().T, A.conj().T))
+                self.assertClose(gemv(A_2, x, trans_a='c'), np_dot(A.conj().T, x))
+            for T_2 in (T, asfortranarray(T)):
+                for trans_a, op_T in (('t', T.T), ('c', T.conj().T)):
+                    actual = B.copy()
+                    trmm(T_2, actual, trans_a=trans_a, alpha=1.j)
+                    self.assertClose(actual, 1.j * np_dot(op_T, B))
+                    actual = B.copy()
+                    trsm(T_2, actual, trans_a=trans_a)
+                    self.assertClose(actual, solve(op_T, B))
+
+    def test_complex_symmetric_level_3(self):
+        for dtype in DTYPES:
+            A, B, x, y = self.operands[dtype]
+            S, F = triu(A) + triu(A, 1).T, B[::-1].copy()
+            self.assertClose(symm(asfortranarray(A), B), np_dot(S, B))
+            self.assertClose(triu(syrk(B)), triu(np_dot(B, B.T)))
+            self.assertClose(triu(syr2k(B, F, trans='t')),
+                             triu(np_dot(B.T, F) + np_dot(F.T, B)))
+
+    def test_plan_and_raw(self):
+        A, B, x, y = self.operands['complex128']
+        gemm_plan = plan('gemm', (A.shape, B.shape, B.shape), 'complex128', trans_a='c',
+                         alpha=1.j, beta=0.)
+        self.assertClose(gemm_plan(A, B, zeros(B.shape, 'complex128')),
+                         1.j * np_dot(A.conj().T, B))
+        self.assertClose(plan('dotc', (x.shape, y.shape), 'complex128')(x, y),
+                         np_dot(x.conj().T, y)[0, 0])
+        self.assertClose(raw.dotc(x, y), np_dot(x.conj().T, y)[0, 0])
+        self.assertClose(triu(raw.herk(B, zeros((6, 6), 'complex128'))),
+                         triu(np_dot(B, B.conj().T)))
+
+    def test_unsupported_combinations_raise_value_error(self):
+        A, B, x, y = self.operands['complex128']
+        self.assertRaises(ValueError, symv, A, x)
+        self.assertRaises(ValueError, syrk, B, trans='c')
+        self.assertRaises(ValueError, herk, B, trans='t')
+        self.assertRaises(ValueError, hemm, A.real.copy(), B.real.copy())
+        self.assertRaises(ValueError, herk, B.real.copy())
+        self.assertRaises(ValueError, gemm, A, B.astype('complex64'))
+        self.assertRaises(ValueError, gemm, A, B.real.copy())
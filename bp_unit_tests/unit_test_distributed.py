@@ -0,0 +1,90 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from blaspy.distributed import Cluster, LocalCluster, get_grid, get_panels, split_evenly
+from numpy import allclose, dot as np_dot, ones, random
+from unittest import TestCase
+
+
+class TestDistributed(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.cluster = LocalCluster(4, blas_threads=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.cluster.close()
+
+    def setUp(self):
+        rng = random.RandomState(0)
+        self.A = rng.uniform(-1, 1, (60, 45))
+        self.B = rng.uniform(-1, 1, (45, 30))
+        self.C = rng.uniform(-1, 1, (60, 30))
+
+    def test_gemm_with_small_panels(self):
+        self.assertEqual(self.cluster.grid, (2, 2))
+        for panel_size in (1, 7, 256):
+            C = self.cluster.gemm(self.A, self.B, panel_size=panel_size)
+            self.assertTrue(allclose(C, np_dot(self.A, self.B)))
+
+    def test_gemm_with_transposes_and_scalars(self):
+        C = self.C.copy()
+        self.cluster.gemm(self.A.T, self.B.T.copy(), C, trans_a='t', trans_b='t', alpha=2.,
+                          beta=-1., panel_size=10)
+        self.assertTrue(allclose(C, 2. * np_dot(self.A, self.B) - self.C))
+
+    def test_gemm_complex_conjugate_transpose(self):
+        A = self.A[:5, :4] + 1j * self.A[5:10, :4]
+        B = self.B[:5, :3] - 1j * self.B[5:10, :3]
+        C = self.cluster.gemm(A, B, trans_a='c', alpha=1j)
+        self.assertTrue(allclose(C, 1j * np_dot(A.conj().T, B)))
+
+    def test_gemm_with_fewer_rows_than_workers(self):
+        C = self.cluster.gemm(self.A[:1], self.B[:, :1])
+        self.assertTrue(allclose(C, np_dot(self.A[:1], self.B[:, :1])))
+        C = self.cluster.gemm(self.A[:, :0], self.B[:0], ones((60, 30)), beta=2.)
+        self.assertTrue(allclose(C, 2.))
+
+    def test_timings_of_every_node(self):
+        self.cluster.gemm(self.A, self.B, panel_size=5)
+        timings = self.cluster.timings
+        self.assertEqual([node.rank for node in timings], [0, 1, 2, 3])
+        for node in timings:
+            self.assertGreater(node.compute, 0)
+            self.assertGreaterEqual(node.wait, 0)
+            self.assertGreater(node.bytes_sent, 0)
+            self.assertGreater(node.bytes_received, 0)
+            self.assertIn('compute=', repr(node))
+
+    def test_other_grid_on_the_same_workers(self):
+        with Cluster(self.cluster.addresses, (1, 4)) as cluster:
+            C = cluster.gemm(self.A, self.B, panel_size=4)
+        self.assertTrue(allclose(C, np_dot(self.A, self.B)))
+        self.assertTrue(allclose(self.cluster.gemm(self.A, self.B), np_dot(self.A, self.B)))
+
+    def test_panels_lie_within_blocks(self):
+        A_depths, B_depths = split_evenly(45, 3), split_evenly(45, 2)
+        panels = get_panels(A_depths, B_depths, 8)
+        self.assertEqual([start for start, stop, A_owner, B_owner in panels][0], 0)
+        self.assertEqual(panels[-1][1], 45)
+        for start, stop, A_owner, B_owner in panels:
+            self.assertLessEqual(stop - start, 8)
+            self.assertTrue(A_depths[A_owner][0] <= start < stop <= A_depths[A_owner][1])
+            self.assertTrue(B_depths[B_owner][0] <= start < stop <= B_depths[B_owner][1])
+        self.assertEqual([get_grid(count) for count in (1, 4, 6, 7)],
+                         [(1, 1), (2, 2), (2, 3), (1, 7)])
+
+    def test_invalid_arguments_raise_ValueError(self):
+        self.assertRaises(ValueError, Cluster, [])
+        self.assertRaises(ValueError, Cluster, self.cluster.addresses, (3, 1))
+        self.assertRaises(ValueError, self.cluster.gemm, self.A, self.A)
+        self.assertRaises(ValueError, self.cluster.gemm, self.A, self.B, panel_size=0)
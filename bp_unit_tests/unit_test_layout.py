@@ -0,0 +1,121 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from blaspy import (gemv, ger, symv, syr, syr2, trmv, trsv, gemm, symm, syrk, syr2k, trmm, trsm)
+from numpy import allclose, asfortranarray, dot, eye, random, tril, triu, zeros
+from unittest import TestCase
+
+
+class TestLayout(TestCase):
+
+    def setUp(self):
+        rng = random.RandomState(0)
+        self.x = rng.uniform(-1, 1, (5, 1))
+        self.y = rng.uniform(-1, 1, (5, 1))
+        self.A = rng.uniform(-1, 1, (5, 5))
+        self.B = rng.uniform(-1, 1, (5, 3))
+        self.G = rng.uniform(-1, 1, (4, 5))
+        self.S = self.A + self.A.T
+        self.U = triu(self.A) + 5 * eye(5)
+
+    def test_gemv_with_transposed_view(self):
+        A, x, y = self.A, self.x, self.y
+        for trans_a in ('n', 't'):
+            expected = dot(A.T if trans_a == 'n' else A, x)
+            self.assertTrue(allclose(gemv(A.T, x, trans_a=trans_a), expected))
+
+    def test_ger_with_fortran_matrix(self):
+        x, y = self.x, self.y
+        A = asfortranarray(zeros((5, 5)))
+        ger(x, y.T, A, alpha=2.)
+        self.assertTrue(allclose(A, 2. * dot(x, y.T)))
+        self.assertTrue(A.flags.f_contiguous)
+
+    def test_symmetric_level_2_with_fortran_matrix(self):
+        x, y, S = self.x, self.y, self.S
+        for uplo in ('u', 'l'):
+            S_F = asfortranarray(triu(S) if uplo == 'u' else tril(S))
+            self.assertTrue(allclose(symv(S_F, x, uplo=uplo), dot(S, x)))
+            A = asfortranarray(zeros((5, 5)))
+            syr(x, A, uplo=uplo)
+            part = triu if uplo == 'u' else tril
+            self.assertTrue(allclose(part(A), part(dot(x, x.T))))
+            A = asfortranarray(zeros((5, 5)))
+            syr2(x, y, A, uplo=uplo)
+            self.assertTrue(allclose(part(A), part(dot(x, y.T) + dot(y, x.T))))
+
+    def test_triangular_level_2_with_transposed_view(self):
+        x, U = self.x, self.U
+        for trans_a in ('n', 't'):
+            L_2 = U if trans_a == 't' else U.T
+            self.assertTrue(allclose(trmv(U.T, x.copy(), 'l', trans_a), dot(L_2, x)))
+            self.assertTrue(allclose(dot(L_2, trsv(U.T, x.copy(), 'l', trans_a)), x))
+
+    def test_gemm_with_mixed_layouts(self):
+        G, B = self.G, self.B
+        expected = dot(G, B)
+        for A_2 in (G, asfortranarray(G), G.T.T):
+            for B_2 in (B, asfortranarray(B)):
+                for C in (zeros((4, 3)), asfortranarray(zeros((4, 3)))):
+                    self.assertTrue(allclose(gemm(A_2, B_2, C), expected))
+        C = gemm(G.T, B.T, trans_a='t', trans_b='t', C=asfortranarray(zeros((3, 4))).T)
+        self.assertTrue(allclose(C, expected))
+
+    def test_gemm_does_not_copy_transposed_views(self):
+        G, B = self.G, self.B
+        C = zeros((3, 4)).T
+        gemm(G.T, B, C, trans_a='t')
+        self.assertTrue(allclose(C, dot(G, B)))
+        self.assertFalse(C.flags.c_contiguous)
+
+    def test_symm_with_mixed_layouts(self):
+        S, B = self.S, self.B
+        for uplo in ('u', 'l'):
+            S_2 = triu(S) if uplo == 'u' else tril(S)
+            for A in (S_2, asfortranarray(S_2)):
+                for B_2 in (B, asfortranarray(B)):
+                    for C in (zeros((5, 3)), asfortranarray(zeros((5, 3)))):
+                        actual = symm(A, B_2, C, 'l', uplo)
+                        self.assertTrue(allclose(actual, dot(S, B)))
+                    C = asfortranarray(zeros((3, 5)))
+                    actual = symm(A, B_2.T, C, 'r', uplo)
+                    self.assertTrue(allclose(actual, dot(B.T, S)))
+
+    def test_syrk_and_syr2k_with_mixed_layouts(self):
+        G, A = self.G, self.A[:4]
+        for uplo in ('u', 'l'):
+            part = triu if uplo == 'u' else tril
+            for G_2 in (G, asfortranarray(G)):
+                for C in (zeros((4, 4)), asfortranarray(zeros((4, 4)))):
+                    syrk(G_2, C, uplo, 'n')
+                    self.assertTrue(allclose(part(C), part(dot(G, G.T))))
+                    C[:] = 0
+                    syrk(G_2.T, C, uplo, 't')
+                    self.assertTrue(allclose(part(C), part(dot(G, G.T))))
+                for A_2 in (A, asfortranarray(A)):
+                    C = asfortranarray(zeros((4, 4)))
+                    syr2k(G_2, A_2, C, uplo, 'n')
+                    expected = dot(G, A.T) + dot(A, G.T)
+                    self.assertTrue(allclose(part(C), part(expected)))
+
+    def test_triangular_level_3_with_mixed_layouts(self):
+        U, B = self.U, self.B
+        for A in (U, asfortranarray(U)):
+            for trans_a in ('n', 't'):
+                A_2 = U.T if trans_a == 't' else U
+                for B_2 in (B.copy(), asfortranarray(B)):
+                    trmm(A, B_2, 'l', 'u', trans_a)
+                    self.assertTrue(allclose(B_2, dot(A_2, B)))
+                    trsm(A, B_2, 'l', 'u', trans_a)
+                    self.assertTrue(allclose(B_2, B))
+                B_T = B.T.copy(order='F')
+                trmm(A, B_T, 'r', 'u', trans_a)
+                self.assertTrue(allclose(B_T, dot(B.T, A_2)))
@@ -0,0 +1,98 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from blaspy.lazy import array, dot, evaluate
+from numpy import allclose, dot as np_dot, eye, ones, random, tril, triu
+from unittest import TestCase
+
+
+class TestLazy(TestCase):
+
+    def setUp(self):
+        rng = random.RandomState(0)
+        self.A = rng.uniform(-1, 1, (40, 30))
+        self.B = rng.uniform(-1, 1, (30, 20))
+        self.C = rng.uniform(-1, 1, (40, 20))
+        self.S = rng.uniform(-1, 1, (40, 40))
+        self.x = rng.uniform(-1, 1, 30)
+        self.y = rng.uniform(-1, 1, 40)
+
+    def check(self, expression, expected, calls, out=None):
+        made = []
+        result = evaluate(expression, out, made)
+        self.assertTrue(allclose(result, expected))
+        self.assertEqual(made, calls)
+        if out is not None:
+            self.assertIs(result, out)
+        return result
+
+    def test_scaled_product_plus_scaled_output_is_one_gemm(self):
+        A, B, C = self.A, self.B, self.C.copy()
+        expected = 0.5 * C + 2. * np_dot(A, B)
+        self.check(0.5 * array(C) + 2. * (array(A) @ array(B)), expected, ['gemm'], C)
+        self.check(2. * dot(array(A), array(B)) - array(expected), -0.5 * self.C,
+                   ['gemm', 'axpy'])
+
+    def test_transposes_fold_into_gemm(self):
+        A, B, C = self.A, self.B, self.C.T.copy()
+        expected = np_dot(B.T, A.T)
+        self.check((array(A) @ array(B)).T, expected, ['gemm'])
+        self.check(array(B.T.copy()).T.T @ array(A).T - array(C), expected - self.C.T, ['gemm'],
+                   C)
+        self.check(array(A.T.copy()).T @ array(B) / 4, np_dot(A, B) / 4, ['gemm'])
+
+    def test_matrix_vector_products_are_gemv(self):
+        A, x, y = self.A, self.x, self.y
+        self.check(3. * (array(A) @ array(x)) + array(y), 3. * np_dot(A, x) + y, ['gemv'], y)
+        self.check(array(y) @ array(A), np_dot(y, A), ['gemv'])
+
+    def test_vector_dot_is_a_scalar(self):
+        self.assertAlmostEqual(evaluate(array(self.x) @ array(self.x)), np_dot(self.x, self.x))
+
+    def test_product_with_own_transpose_is_syrk(self):
+        A = self.A
+        self.check(array(A) @ array(A).T, np_dot(A, A.T), ['syrk'])
+        self.check(2. * (array(A).T @ array(A)), 2. * np_dot(A.T, A), ['syrk'])
+
+    def test_declared_structures_use_symm_and_trmm(self):
+        S = self.S + self.S.T
+        U = triu(self.S)
+        C = self.C.copy()
+        self.check(array(S, 'symmetric') @ array(self.C) + array(C), np_dot(S, self.C) + C,
+                   ['symm'], C)
+        self.check(array(U, 'triangular') @ array(self.C), np_dot(U, self.C), ['trmm'])
+        self.check(array(self.C).T @ array(U, 'triangular'), np_dot(self.C.T, U), ['trmm'])
+        L = tril(self.S, -1)
+        self.check(array(L + 5. * eye(40), 'triangular', 'l', 'u') @ array(self.C),
+                   np_dot(L + eye(40), self.C), ['trmm'])
+
+    def test_nested_operands_are_computed_into_temporaries(self):
+        A, B, C = self.A, self.B, self.C
+        expected = np_dot(np_dot(A, B) + np_dot(A, B), C.T)
+        self.check((array(A) @ array(B) + array(A) @ array(B)) @ array(C).T, expected,
+                   ['gemm', 'gemm', 'gemm'])
+
+    def test_repeated_operands_are_merged(self):
+        A, B, C = self.A, self.B, self.C.copy()
+        self.check((array(A) + array(A)) @ array(B), 2. * np_dot(A, B), ['gemm'])
+        self.check(array(C) + array(C.T).T, 2. * self.C, ['scal'], C)
+
+    def test_output_aliasing_an_operand_of_a_product(self):
+        S = self.S.copy()
+        expected = np_dot(self.S, self.S) + self.S
+        self.check(array(S) @ array(S) + array(S), expected, ['gemm', 'axpy', 'copy'], S)
+
+    def test_invalid_expressions(self):
+        self.assertRaises(ValueError, array, ones((2, 2, 2)))
+        self.assertRaises(ValueError, array, self.A, 'diagonal')
+        self.assertRaises(ValueError, array, self.A, 'symmetric')
+        self.assertRaises(ValueError, lambda: array(self.A) + array(self.B))
+        self.assertRaises(ValueError, lambda: array(self.A) @ array(self.C))
@@ -0,0 +1,55 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from blaspy import empty, gemm, is_aligned, zeros
+from blaspy.helpers import create_zero_matrix, create_similar_zero_vector
+from blaspy.memory import fill_zeros, FIRST_TOUCH_MIN_BYTES, HUGE_PAGE_SIZE, MADV_HUGEPAGE
+from numpy import allclose, complex64, dot as np_dot, float32, ndarray, ones, random
+from unittest import TestCase, skipIf
+
+
+class TestMemory(TestCase):
+
+    def test_alignment(self):
+        for alignment in (16, 64, 256, 4096):
+            for dtype in (float32, complex64, float):
+                for shape in (1, 7, (3, 5)):
+                    array = empty(shape, dtype, alignment=alignment)
+                    self.assertTrue(is_aligned(array, alignment))
+                    self.assertEqual(array.dtype, dtype)
+        self.assertEqual(empty((0, 4), alignment=4096).shape, (0, 4))
+        array = empty((5, 3), order='F')
+        self.assertTrue(array.flags.f_contiguous and is_aligned(array))
+        self.assertRaises(ValueError, empty, 4, alignment=48)
+        self.assertRaises(ValueError, empty, 4, alignment=0)
+
+    def test_zeros(self):
+        self.assertFalse(zeros((31, 17), complex64, 'F').any())
+        large = zeros(4 * FIRST_TOUCH_MIN_BYTES // 8, huge_pages=False, num_threads=3)
+        self.assertFalse(large.any())
+        vector = ones(4 * FIRST_TOUCH_MIN_BYTES // 8 + 5)
+        fill_zeros(vector[1:], num_threads=4)
+        self.assertEqual((vector[0], vector[1:].any()), (1, False))
+
+    @skipIf(MADV_HUGEPAGE is None, "huge pages are not available")
+    def test_huge_pages(self):
+        array = zeros((256, 1024), huge_pages=True)
+        self.assertTrue(is_aligned(array, HUGE_PAGE_SIZE))
+        self.assertFalse(array.any())
+        array[...] = 2.
+        self.assertTrue((array == 2.).all())
+
+    def test_helpers_create_aligned_operands(self):
+        A = random.uniform(-1, 1, (100, 60))
+        for matrix in (create_zero_matrix(100, 60, float, ndarray), gemm(A, A.T)):
+            self.assertTrue(is_aligned(matrix))
+        self.assertTrue(is_aligned(create_similar_zero_vector(ones(1000))))
+        self.assertTrue(allclose(gemm(A, A.T), np_dot(A, A.T)))
@@ -0,0 +1,83 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from blaspy import multi_gemm
+from blaspy.level_3.multi_gemm import get_chain_order
+from numpy import allclose, asmatrix, dot as np_dot, empty, float32, matrix, ones, random
+from sys import modules
+from unittest import TestCase
+from unittest.mock import patch
+
+
+class TestMultiGemm(TestCase):
+
+    def setUp(self):
+        rng = random.RandomState(0)
+        self.A = rng.uniform(-1, 1, (60, 8))
+        self.B = rng.uniform(-1, 1, (8, 50))
+        self.C = rng.uniform(-1, 1, (50, 7))
+        self.x = rng.uniform(-1, 1, 7)
+        self.y = rng.uniform(-1, 1, 60)
+
+    def test_matrix_chains(self):
+        A, B, C = self.A, self.B, self.C
+        self.assertTrue(allclose(multi_gemm(A, B), np_dot(A, B)))
+        self.assertTrue(allclose(multi_gemm(A, B, C), np_dot(np_dot(A, B), C)))
+        self.assertTrue(allclose(multi_gemm(C.T, B.T, A.T), np_dot(np_dot(C.T, B.T), A.T)))
+
+    def test_matrix_operands(self):
+        A, B, C = asmatrix(self.A), asmatrix(self.B), asmatrix(self.C)
+        result = multi_gemm(A, B, C)
+        self.assertIsInstance(result, matrix)
+        self.assertTrue(allclose(result, np_dot(np_dot(self.A, self.B), self.C)))
+        self.assertNotIsInstance(multi_gemm(self.A, B, C), matrix)
+
+    def test_vector_ends(self):
+        A, B, C, x, y = self.A, self.B, self.C, self.x, self.y
+        expected = np_dot(A, np_dot(B, np_dot(C, x)))
+        result = multi_gemm(A, B, C, x)
+        self.assertEqual(result.shape, (60,))
+        self.assertTrue(allclose(result, expected))
+
+        result = multi_gemm(y, A, B, C)
+        self.assertEqual(result.shape, (7,))
+        self.assertTrue(allclose(result, np_dot(np_dot(np_dot(y, A), B), C)))
+
+        self.assertAlmostEqual(multi_gemm(y, A, B, C, x), np_dot(y, expected))
+        self.assertTrue(allclose(multi_gemm(y.reshape(1, -1), A, B, C, x.reshape(-1, 1)),
+                                 np_dot(y, expected)))
+
+    def test_chain_order(self):
+        # (A * B) * x costs 2 * 10000 * 100 + 10000 multiply-adds, A * (B * x) costs 200
+        self.assertEqual(get_chain_order([100, 1, 100, 1])[0][2], 0)
+        self.assertEqual(get_chain_order([1, 100, 1, 100])[0][2], 1)
+        self.assertEqual(get_chain_order([60, 8, 50, 7])[0][2], 0)
+
+    def test_out(self):
+        out = empty((60, 7))
+        self.assertIs(multi_gemm(self.A, self.B, self.C, out=out), out)
+        self.assertTrue(allclose(out, np_dot(np_dot(self.A, self.B), self.C)))
+        self.assertRaises(ValueError, multi_gemm, self.A, self.B, self.C, out=empty((7, 60)))
+
+    def test_intermediate_buffers_are_reused(self):
+        chain = [ones((20, 20)) / 20 for index in range(8)]
+        with patch.object(modules['blaspy.level_3.multi_gemm'], 'empty', wraps=empty) as allocate:
+            result = multi_gemm(*chain)
+        self.assertTrue(allclose(result, chain[0]))
+        self.assertEqual(allocate.call_count, 2)  # two intermediate buffers
+
+    def test_invalid_operands(self):
+        A, B = self.A, self.B
+        self.assertRaises(ValueError, multi_gemm, A)
+        self.assertRaises(ValueError, multi_gemm, A, B, A)
+        self.assertRaises(ValueError, multi_gemm, A, self.x, self.C)
+        self.assertRaises(ValueError, multi_gemm, A, B.astype(float32))
+        self.assertRaises(ValueError, multi_gemm, A, ones((8, 2, 2)))
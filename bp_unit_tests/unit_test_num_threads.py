@@ -0,0 +1,60 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from blaspy import gemm, get_num_threads, set_num_threads, threads
+from numpy import allclose, dot as np_dot, random
+from unittest import TestCase, skipIf
+
+HAS_THREAD_CONTROL = get_num_threads() is not None
+
+
+@skipIf(not HAS_THREAD_CONTROL, "the BLAS library has no thread control")
+class TestNumThreads(TestCase):
+
+    def setUp(self):
+        self.num_threads = get_num_threads()
+
+    def tearDown(self):
+        set_num_threads(self.num_threads)
+
+    def test_set_num_threads(self):
+        set_num_threads(2)
+        self.assertEqual(get_num_threads(), 2)
+        set_num_threads(1)
+        self.assertEqual(get_num_threads(), 1)
+
+    def test_threads_restores_previous_value(self):
+        set_num_threads(1)
+        with threads(2):
+            self.assertEqual(get_num_threads(), 2)
+        self.assertEqual(get_num_threads(), 1)
+
+    def test_threads_restores_previous_value_on_error(self):
+        set_num_threads(1)
+        try:
+            with threads(2):
+                raise KeyError()
+        except KeyError:
+            pass
+        self.assertEqual(get_num_threads(), 1)
+
+    def test_results_do_not_depend_on_num_threads(self):
+        rng = random.RandomState(0)
+        A, B = rng.uniform(-1, 1, (300, 200)), rng.uniform(-1, 1, (200, 250))
+        for num_threads in (1, 2, 4):
+            with threads(num_threads):
+                self.assertTrue(allclose(gemm(A, B), np_dot(A, B)))
+
+    def test_invalid_num_threads_raises_value_error(self):
+        self.assertRaises(ValueError, set_num_threads, 0)
+        self.assertRaises(ValueError, set_num_threads, 1.5)
+        self.assertRaises(ValueError, threads(-1).__enter__)
+        self.assertEqual(get_num_threads(), self.num_threads)
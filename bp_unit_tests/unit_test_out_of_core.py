@@ -0,0 +1,74 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from blaspy import gemm_out_of_core
+from blaspy.level_3.gemm_out_of_core import get_tile_sizes
+from numpy import allclose, dot as np_dot, load, memmap, random, save
+from os import path
+from shutil import rmtree
+from tempfile import mkdtemp
+from unittest import TestCase
+
+
+class TestOutOfCore(TestCase):
+
+    def setUp(self):
+        rng = random.RandomState(0)
+        self.A = rng.uniform(-1, 1, (70, 45))
+        self.B = rng.uniform(-1, 1, (45, 33))
+        self.C = rng.uniform(-1, 1, (70, 33))
+        self.directory = mkdtemp()
+        for name in ('A', 'B', 'C'):
+            save(self.file(name), getattr(self, name))
+
+    def tearDown(self):
+        rmtree(self.directory)
+
+    def file(self, name):
+        return path.join(self.directory, name + '.npy')
+
+    def test_paths_with_budgets_from_single_elements_to_whole_matrices(self):
+        for memory in (48, 1000, 24000, 1 << 20):
+            C = gemm_out_of_core(self.file('A'), self.file('B'), memory=memory)
+            self.assertTrue(allclose(C, np_dot(self.A, self.B)))
+
+    def test_output_file_is_updated(self):
+        C = gemm_out_of_core(self.file('A'), self.file('B'), self.file('C'), alpha=2., beta=3.,
+                             memory=5000)
+        self.assertIsInstance(C, memmap)
+        expected = 2. * np_dot(self.A, self.B) + 3. * self.C
+        self.assertTrue(allclose(load(self.file('C')), expected))
+
+    def test_output_file_is_created(self):
+        gemm_out_of_core(self.A, self.B, self.file('D'), beta=3., memory=5000)
+        self.assertTrue(allclose(load(self.file('D')), np_dot(self.A, self.B)))
+
+    def test_transposed_memmaps(self):
+        A = load(self.file('A'), mmap_mode='r').T
+        B = load(self.file('B'), mmap_mode='r').T
+        C = self.C.copy()
+        gemm_out_of_core(A, B, C, trans_a='t', trans_b='t', beta=0.5, memory=3000)
+        self.assertTrue(allclose(C, np_dot(self.A, self.B) + 0.5 * self.C))
+
+    def test_tiles_fit_the_budget(self):
+        for m, n, k in ((10 ** 5, 10 ** 5, 10 ** 5), (10 ** 5, 10 ** 5, 50), (10, 10, 10 ** 5)):
+            m_tile, n_tile, k_tile = get_tile_sizes(m, n, k, 1 << 20)
+            self.assertLessEqual(m_tile * n_tile + (m_tile + n_tile) * k_tile, 1 << 20)
+            self.assertGreater(m_tile * n_tile + (m_tile + n_tile) * k_tile, 0.9 * min(
+                1 << 20, m * n + (m + n) * k))
+
+    def test_mismatched_sizes_raise_ValueError(self):
+        self.assertRaises(ValueError, gemm_out_of_core, self.file('A'), self.file('A'))
+        self.assertRaises(ValueError, gemm_out_of_core, self.A, self.B, self.file('B'))
+
+    def test_invalid_memory_raises_ValueError(self):
+        self.assertRaises(ValueError, gemm_out_of_core, self.A, self.B, memory=47)
+        self.assertRaises(ValueError, gemm_out_of_core, self.A, self.B, memory=1e6)
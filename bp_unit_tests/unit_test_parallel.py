@@ -0,0 +1,86 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from blaspy import gemm, trsm, get_num_threads, set_num_threads
+from blaspy.parallel import Executor
+from concurrent.futures import Future
+from numpy import allclose, dot as np_dot, eye, random, triu
+from threading import current_thread
+from unittest import TestCase, skipIf
+
+HAS_THREAD_CONTROL = get_num_threads() is not None
+
+
+class TestParallel(TestCase):
+
+    def setUp(self):
+        rng = random.RandomState(0)
+        self.A_list = [rng.uniform(-1, 1, (30, 20)) for i in range(12)]
+        self.B_list = [rng.uniform(-1, 1, (20, 10)) for i in range(12)]
+
+    def test_map_returns_futures_of_results_in_order(self):
+        with Executor(4) as executor:
+            futures = executor.map(gemm, self.A_list, self.B_list)
+        self.assertTrue(all(isinstance(future, Future) for future in futures))
+        for future, A, B in zip(futures, self.A_list, self.B_list):
+            self.assertTrue(allclose(future.result(), np_dot(A, B)))
+
+    def test_submit_with_keyword_arguments(self):
+        T = triu(self.A_list[0][:20]) + 20 * eye(20)
+        B = self.B_list[0].copy()
+        with Executor(2) as executor:
+            future = executor.submit(trsm, T, B, side='l', alpha=2.)
+            self.assertIsNone(future.result())
+        self.assertTrue(allclose(np_dot(T, B), 2. * self.B_list[0]))
+
+    def test_calls_run_on_worker_threads(self):
+        with Executor(3) as executor:
+            names = [future.result() for future in
+                     [executor.submit(lambda: current_thread().name) for i in range(6)]]
+        self.assertTrue(all(name.startswith('blaspy-parallel') for name in names))
+
+    def test_errors_are_raised_by_their_futures(self):
+        with Executor(2) as executor:
+            futures = executor.map(gemm, self.A_list[:2], [self.B_list[0], self.A_list[0]])
+        self.assertTrue(allclose(futures[0].result(), np_dot(self.A_list[0], self.B_list[0])))
+        self.assertRaises(ValueError, futures[1].result)
+
+    def test_submit_after_shutdown_raises_RuntimeError(self):
+        executor = Executor(1)
+        executor.shutdown()
+        executor.shutdown()
+        self.assertRaises(RuntimeError, executor.submit, gemm, self.A_list[0], self.B_list[0])
+
+    def test_default_blas_threads_fill_the_cores(self):
+        with Executor(1) as executor:
+            self.assertGreaterEqual(executor.blas_threads, 1)
+        with Executor(10 ** 6) as executor:
+            self.assertEqual(executor.blas_threads, 1)
+
+    def test_invalid_arguments_raise_ValueError(self):
+        self.assertRaises(ValueError, Executor, 0)
+        self.assertRaises(ValueError, Executor, 2.5)
+        self.assertRaises(ValueError, Executor, 2, 0)
+
+    @skipIf(not HAS_THREAD_CONTROL, "the BLAS library has no thread control")
+    def test_blas_threads_are_restored_by_the_last_executor(self):
+        previous = get_num_threads()
+        set_num_threads(3)
+        try:
+            first, second = Executor(2, blas_threads=1), Executor(2, blas_threads=2)
+            if first._sets_process_threads:
+                self.assertEqual(get_num_threads(), 2)
+                first.shutdown()
+                self.assertEqual(get_num_threads(), 2)
+            second.shutdown()
+            self.assertEqual(get_num_threads(), 3)
+        finally:
+            set_num_threads(previous)
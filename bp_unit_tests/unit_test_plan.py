@@ -0,0 +1,125 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+import blaspy
+from blaspy import plan
+from numpy import arange, array, array_equal, eye, random, triu, zeros
+from unittest import TestCase
+
+
+class TestPlan(TestCase):
+
+    def setUp(self):
+        rng = random.RandomState(0)
+        self.x = rng.uniform(-1, 1, (6, 1))
+        self.y = rng.uniform(-1, 1, (1, 6))
+        self.A = rng.uniform(-1, 1, (6, 6))
+        self.B = rng.uniform(-1, 1, (6, 4))
+        self.T = triu(self.A) + 6 * eye(6)
+
+    def assertPlanMatches(self, name, operands, **kwargs):
+        """ Assert that a plan gives the same result as the BLASpy function it was created for """
+        expected_operands = [operand.copy() for operand in operands]
+        actual_operands = [operand.copy() for operand in operands]
+        expected = getattr(blaspy, name)(*expected_operands, **kwargs)
+        operation = plan(name, [operand.shape for operand in operands], operands[0].dtype,
+                         **kwargs)
+        for i in range(2):  # a plan can be executed more than once
+            actual = operation(*actual_operands)
+        if name not in ('amax', 'asum', 'dot', 'nrm2', 'sdot'):
+            expected = getattr(blaspy, name)(*expected_operands, **kwargs)
+            self.assertTrue(all(array_equal(a, e)
+                                for a, e in zip(actual_operands, expected_operands)))
+        self.assertTrue(array_equal(array(actual), array(expected)))
+
+    def test_level_1(self):
+        x, y = self.x, self.y
+        self.assertPlanMatches('amax', (x,))
+        self.assertPlanMatches('asum', (x,), inc_x=2)
+        self.assertPlanMatches('copy', (x, y), inc_x=3, inc_y=3)
+        self.assertPlanMatches('dot', (x, y))
+        self.assertPlanMatches('nrm2', (y,))
+        self.assertPlanMatches('sdot', (x.astype('float32'), y.astype('float32')))
+        self.assertPlanMatches('sdot', (x.astype('float32'), y.astype('float32')),
+                               output='float32')
+        self.assertPlanMatches('swap', (x, y))
+
+    def test_level_2(self):
+        x, y, A, T = self.x, self.y, self.A, self.T
+        self.assertPlanMatches('gemv', (A, x, y), trans_a='t', alpha=2., beta=.5)
+        self.assertPlanMatches('ger', (x, y, A), alpha=2.)
+        self.assertPlanMatches('symv', (A, x, y), uplo='l')
+        self.assertPlanMatches('syr', (x, A))
+        self.assertPlanMatches('syr2', (x, y, A))
+        self.assertPlanMatches('trmv', (T, x), trans_a='t')
+        self.assertPlanMatches('trsv', (T, y), uplo='l', diag='u')
+
+    def test_level_3(self):
+        A, B, T = self.A, self.B, self.T
+        self.assertPlanMatches('gemm', (A, B, zeros((6, 4))), alpha=2.)
+        self.assertPlanMatches('gemm', (B, A, zeros((4, 6))), trans_a='t', beta=0.)
+        self.assertPlanMatches('symm', (A, B.T.copy(), zeros((4, 6))), side='r')
+        self.assertPlanMatches('syrk', (B, zeros((4, 4))), trans='t')
+        self.assertPlanMatches('syr2k', (B, B, A), uplo='l')
+        self.assertPlanMatches('trmm', (T, B))
+        self.assertPlanMatches('trsm', (T, B.T.copy()), side='r', trans_a='t')
+
+    def test_negative_increments(self):
+        x, y = self.x, self.y
+        self.assertPlanMatches('copy', (x, y), inc_x=-2, inc_y=-2)
+        self.assertPlanMatches('swap', (x, y), inc_x=-3, inc_y=3)
+        self.assertPlanMatches('asum', (y,), inc_x=-4)
+        self.assertPlanMatches('nrm2', (x,), inc_x=-2)
+        self.assertRaises(ValueError, plan, 'amax', (x.shape,), x.dtype, inc_x=-2)
+        x, y = arange(8.), zeros(8)
+        plan('copy', (x.shape, y.shape), x.dtype, inc_x=-2, inc_y=-2)(x, y)
+        self.assertListEqual(y.tolist(), [0., 0., 2., 0., 4., 0., 6., 0.])
+        plan('scal', (x.shape,), x.dtype, alpha=2., inc_x=-5)(x)
+        self.assertListEqual(x.tolist(), [0., 1., 2., 3., 4., 10., 6., 7.])
+
+    def test_scal(self):
+        x = array([[1., 2., 3.]])
+        plan('scal', (x.shape,), x.dtype, alpha=2.)(x)
+        self.assertListEqual(x.tolist(), [[2., 4., 6.]])
+
+    def test_axpy(self):
+        x = array([[1., 2., 3.]])
+        y = array([[3., 2., 1.]])
+        plan('axpy', (x.shape, y.shape), x.dtype, alpha=2.)(x, y)
+        self.assertListEqual(y.tolist(), [[5., 6., 7.]])
+
+    def test_axpy_with_1d_ndarrays(self):
+        x = array([1., 2., 3.])
+        y = array([3., 2., 1.])
+        plan('axpy', (x.shape, y.shape), x.dtype, alpha=2.)(x, y)
+        self.assertListEqual(y.tolist(), [5., 6., 7.])
+
+    def test_invalid_name_raises_ValueError(self):
+        self.assertRaises(ValueError, plan, 'gemn', ((2, 2), (2, 2), (2, 2)), 'float64')
+
+    def test_wrong_number_of_shapes_raises_ValueError(self):
+        self.assertRaises(ValueError, plan, 'gemm', ((2, 2), (2, 2)), 'float64')
+
+    def test_nonconforming_shapes_raises_ValueError(self):
+        self.assertRaises(ValueError, plan, 'gemm', ((2, 3), (2, 2), (2, 2)), 'float64')
+
+    def test_not_vector_raises_ValueError(self):
+        self.assertRaises(ValueError, plan, 'dot', ((2, 2), (2, 2)), 'float64')
+
+    def test_not_2d_raises_ValueError(self):
+        self.assertRaises(ValueError, plan, 'trsv', ((2, 2, 2), (2, 1)), 'float64')
+
+    def test_unsupported_dtype_raises_ValueError(self):
+        self.assertRaises(ValueError, plan, 'gemm', ((2, 2), (2, 2), (2, 2)), 'int')
+
+    def test_invalid_trans_raises_ValueError(self):
+        self.assertRaises(ValueError, plan, 'gemm', ((2, 2), (2, 2), (2, 2)), 'float64',
+                          trans_a='x')
@@ -0,0 +1,104 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from blaspy import BufferPool, gemm, gemv, get_pool, set_pool, symm
+from blaspy.pool import get_size_class, POOL_MIN_BYTES
+from numpy import allclose, dot as np_dot, isfinite, nan, may_share_memory, random
+from unittest import TestCase
+
+# a number of float64 elements large enough to be pooled
+N = 2 * POOL_MIN_BYTES // 8
+
+
+class TestPool(TestCase):
+
+    def setUp(self):
+        self.pool = BufferPool(max_bytes=8 * POOL_MIN_BYTES)
+
+    def test_size_classes(self):
+        self.assertEqual(get_size_class(POOL_MIN_BYTES), POOL_MIN_BYTES)
+        self.assertEqual(get_size_class(POOL_MIN_BYTES + 1), POOL_MIN_BYTES * 5 // 4)
+        self.assertEqual(get_size_class(POOL_MIN_BYTES * 7 // 4 + 1), POOL_MIN_BYTES * 2)
+        for nbytes in range(POOL_MIN_BYTES, 4 * POOL_MIN_BYTES, 999):
+            self.assertTrue(nbytes <= get_size_class(nbytes) < nbytes * 5 // 4 + 1)
+
+    def test_memory_is_reused_once_unreferenced(self):
+        A = self.pool.empty((N // 4, 4))
+        B = self.pool.empty(N)
+        self.assertFalse(may_share_memory(A, B))
+        view = A[1:, ::2]
+        del A
+        C = self.pool.empty(N)
+        self.assertFalse(may_share_memory(view, C))
+        del view
+        D = self.pool.zeros((N // 2, 2), order='F')
+        self.assertTrue(D.flags.f_contiguous)
+        self.assertFalse(D.any())
+        stats = self.pool.stats()
+        self.assertEqual((stats.hits, stats.misses), (1, 3))
+        self.assertEqual(stats.bytes, 3 * 2 * POOL_MIN_BYTES)
+
+    def test_small_arrays_are_not_pooled(self):
+        self.pool.empty(POOL_MIN_BYTES // 8 - 1)
+        self.assertEqual(self.pool.stats().misses, 0)
+
+    def test_least_recently_used_idle_memory_is_evicted(self):
+        self.pool.max_bytes = 9 * POOL_MIN_BYTES
+        first, second, third, fourth = [self.pool.empty(N) for index in range(4)]
+        del second, first
+        larger = self.pool.empty(N * 5 // 4)
+        stats = self.pool.stats()
+        self.assertEqual((stats.misses, stats.evictions), (5, 1))
+        larger_bytes = 2 * POOL_MIN_BYTES * 5 // 4
+        self.assertEqual(stats.bytes, larger_bytes + 3 * 2 * POOL_MIN_BYTES)
+        self.pool.empty(N)
+        self.assertEqual(self.pool.stats().hits, 1)
+
+        self.pool.max_bytes = 6 * POOL_MIN_BYTES
+        self.assertEqual(self.pool.stats().bytes, larger_bytes + 2 * 2 * POOL_MIN_BYTES)
+        del third, fourth, larger
+        self.pool.max_bytes = 6 * POOL_MIN_BYTES
+        self.assertEqual(self.pool.stats().bytes, larger_bytes + 2 * POOL_MIN_BYTES)
+        self.pool.clear()
+        self.assertEqual(self.pool.stats().bytes, 0)
+
+    def test_memory_over_the_limit_is_not_pooled(self):
+        big = self.pool.empty(8 * N)
+        self.assertEqual(self.pool.stats().bytes, 0)
+        self.pool.max_bytes = 0
+        self.pool.empty(N)
+        self.assertEqual(self.pool.stats().bytes, 0)
+        self.assertRaises(ValueError, BufferPool, -1)
+        del big
+
+    def test_outputs_are_computed_with_beta_zero(self):
+        previous = set_pool(self.pool)
+        try:
+            rng = random.RandomState(0)
+            A = rng.uniform(-1, 1, (N // 64, 64))
+            B = rng.uniform(-1, 1, (64, 64))
+            S = B + B.T
+            x = rng.uniform(-1, 1, 64)
+            for index in range(2):
+                garbage = self.pool.empty(N)
+                garbage.fill(nan)
+                del garbage
+                C = gemm(A, B)
+                self.assertTrue(isfinite(C).all() and allclose(C, np_dot(A, B)))
+                del C
+                C = symm(S, A.T, side='l')
+                self.assertTrue(allclose(C, np_dot(S, A.T)))
+                del C
+            self.assertTrue(self.pool.stats().hits > 0)
+            self.assertTrue(allclose(gemv(A, x), np_dot(A, x)))
+        finally:
+            self.assertIs(set_pool(previous), self.pool)
+        self.assertIs(get_pool(), previous)
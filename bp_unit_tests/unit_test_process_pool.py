@@ -0,0 +1,122 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from blaspy.process_pool import ProcessPool, split_triangle
+from gc import collect
+from numpy import allclose, asmatrix, dot as np_dot, matrix as np_matrix, ones, random, tril, triu
+from unittest import TestCase
+
+
+class TestProcessPool(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = ProcessPool(3)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.close()
+
+    def setUp(self):
+        rng = random.RandomState(0)
+        self.A = rng.uniform(-1, 1, (50, 30))
+        self.B = rng.uniform(-1, 1, (30, 40))
+        self.x = rng.uniform(-1, 1, 30)
+
+    def test_gemm_split_by_rows_and_by_columns(self):
+        self.assertTrue(allclose(self.pool.gemm(self.A, self.B), np_dot(self.A, self.B)))
+        self.assertTrue(allclose(self.pool.gemm(self.B.T, self.A.T, trans_a='n'),
+                                 np_dot(self.B.T, self.A.T)))
+        self.assertTrue(allclose(self.pool.gemm(self.A.T.copy(), self.B.T.copy(), trans_a='t',
+                                                trans_b='t'), np_dot(self.A, self.B)))
+
+    def test_gemm_overwrites_an_unshared_output(self):
+        C = ones((50, 40))
+        result = self.pool.gemm(self.A, self.B, C, alpha=2., beta=3.)
+        self.assertIs(result, C)
+        self.assertTrue(allclose(C, 2. * np_dot(self.A, self.B) + 3.))
+
+    def test_gemm_writes_into_a_shared_view(self):
+        C = self.pool.zeros((60, 50))
+        self.pool.gemm(self.pool.share(self.A), self.B, C[5:55, 5:45])
+        self.assertTrue(allclose(C[5:55, 5:45], np_dot(self.A, self.B)))
+        self.assertEqual(abs(C).sum() - abs(C[5:55, 5:45]).sum(), 0)
+
+    def test_gemv(self):
+        self.assertTrue(allclose(self.pool.gemv(self.A, self.x), np_dot(self.A, self.x)))
+        y = self.pool.gemv(self.A, self.A[:, :1], trans_a='t')
+        self.assertEqual(y.shape, (30, 1))
+        self.assertTrue(allclose(y, np_dot(self.A.T, self.A[:, :1])))
+        y = self.pool.gemv(self.A, self.x.reshape(1, 30))
+        self.assertEqual(y.shape, (1, 50))
+        self.assertTrue(allclose(y, np_dot(self.A, self.x)))
+
+    def test_syrk(self):
+        C = self.pool.syrk(self.A)
+        self.assertTrue(allclose(triu(C), triu(np_dot(self.A, self.A.T))))
+        self.assertEqual(abs(tril(C, -1)).sum(), 0)
+        C = self.pool.syrk(self.A, uplo='l', trans='t', alpha=2.)
+        self.assertTrue(allclose(tril(C), tril(2. * np_dot(self.A.T, self.A))))
+        self.assertEqual(abs(triu(C, 1)).sum(), 0)
+
+    def test_empty_dimensions(self):
+        pool = self.pool
+        C = pool.gemm(ones((4, 0)), ones((0, 9)))
+        self.assertTrue(C.shape == (4, 9) and not C.any())
+        C = ones((4, 9))
+        pool.gemm(ones((4, 0)), ones((0, 9)), C, beta=2.)
+        self.assertTrue((C == 2.).all())
+        self.assertEqual(pool.gemm(ones((0, 3)), ones((3, 5))).shape, (0, 5))
+        self.assertEqual(pool.gemm(ones((3, 3)), ones((3, 0))).shape, (3, 0))
+        y = pool.gemv(ones((6, 0)), ones(0))
+        self.assertTrue(y.shape == (6,) and not y.any())
+        self.assertEqual(pool.gemv(ones((0, 6)), ones(6)).shape, (0,))
+        C = pool.syrk(ones((6, 0)))
+        self.assertTrue(C.shape == (6, 6) and not C.any())
+        self.assertEqual(pool.syrk(ones((0, 6))).shape, (0, 0))
+
+    def test_results_keep_the_matrix_type(self):
+        C = self.pool.gemm(asmatrix(self.A), asmatrix(self.B))
+        self.assertIs(type(C), np_matrix)
+        self.assertTrue(allclose(C, np_dot(self.A, self.B)))
+
+    def test_segments_are_freed_with_their_arrays(self):
+        A = self.pool.share(self.A)
+        self.assertIs(self.pool.share(A), A)
+        view = A[1:, ::2]
+        self.assertIs(self.pool.share(view), view)
+        count = len(self.pool._segments)
+        self.pool.gemm(A, self.B, self.pool.zeros((50, 40)))
+        collect()
+        self.assertEqual(len(self.pool._segments), count)
+        del A, view
+        collect()
+        self.assertEqual(len(self.pool._segments), count - 1)
+
+    def test_triangle_panels_hold_equal_elements(self):
+        for upper in (True, False):
+            panels = split_triangle(1000, 4, upper)
+            self.assertEqual(panels[0][0], 0)
+            self.assertEqual(panels[-1][1], 1000)
+            sizes = [sum(1000 - i if upper else i + 1 for i in range(start, stop))
+                     for start, stop in panels]
+            self.assertLess(max(sizes) - min(sizes), 0.01 * sum(sizes))
+
+    def test_invalid_arguments_raise_ValueError(self):
+        self.assertRaises(ValueError, ProcessPool, 0)
+        self.assertRaises(ValueError, ProcessPool, 2, 0)
+        self.assertRaises(ValueError, self.pool.gemm, self.A, self.A)
+        self.assertRaises(ValueError, self.pool.gemv, self.A, self.A)
+
+    def test_operations_after_close_raise_RuntimeError(self):
+        pool = ProcessPool(1)
+        pool.close()
+        self.assertRaises(RuntimeError, pool.gemm, self.A, self.B)
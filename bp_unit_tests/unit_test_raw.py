@@ -0,0 +1,75 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+import blaspy
+from blaspy import raw
+from numpy import array, eye, random, triu, zeros
+from unittest import TestCase
+
+
+class TestRaw(TestCase):
+
+    def setUp(self):
+        rng = random.RandomState(0)
+        self.x = rng.uniform(-1, 1, (6, 1))
+        self.y = rng.uniform(-1, 1, (6, 1))
+        self.A = rng.uniform(-1, 1, (6, 6))
+        self.B = rng.uniform(-1, 1, (6, 4))
+        self.T = triu(self.A) + 6 * eye(6)
+
+    def assertSameResult(self, name, checked_args, raw_args=None, compare=None):
+        """ Assert that the checked and raw versions of a function give the same result """
+        checked_args = tuple(a.copy() if hasattr(a, 'copy') else a for a in checked_args)
+        raw_args = checked_args if raw_args is None else raw_args
+        raw_args = tuple(a.copy() if hasattr(a, 'copy') else a for a in raw_args)
+        expected = getattr(blaspy, name)(*checked_args)
+        actual = getattr(raw, name)(*raw_args)
+        if compare is not None:
+            expected, actual = checked_args[compare], raw_args[compare]
+        self.assertTrue(array(expected == actual).all())
+
+    def test_level_1(self):
+        x, y = self.x, self.y
+        self.assertSameResult('amax', (x,))
+        self.assertSameResult('asum', (x, 2))
+        self.assertSameResult('axpy', (2., x, y))
+        self.assertSameResult('copy', (x,), (x, zeros((6, 1))))
+        self.assertSameResult('dot', (x, y, 3, 3))
+        self.assertSameResult('nrm2', (x,))
+        self.assertSameResult('scal', (2., x))
+        self.assertSameResult('sdot', (x.astype('float32'), y.astype('float32')))
+        self.assertSameResult('sdot', (x.astype('float32'), y.astype('float32'), 1, 1, 'float32'))
+        self.assertSameResult('swap', (x, y))
+
+    def test_level_2(self):
+        x, y, A, T = self.x, self.y, self.A, self.T
+        self.assertSameResult('gemv', (A, x, y, 't', 2., 3.))
+        self.assertSameResult('ger', (x, y), (x, y, zeros((6, 6))))
+        self.assertSameResult('symv', (A, x, y, 'l'))
+        self.assertSameResult('syr', (x,), (x, zeros((6, 6))))
+        self.assertSameResult('syr2', (x, y), (x, y, zeros((6, 6))))
+        self.assertSameResult('trmv', (T, x, 'u', 't'))
+        self.assertSameResult('trsv', (T, x, 'l', 'n', 'u'))
+
+    def test_level_3(self):
+        A, B, T = self.A, self.B, self.T
+        self.assertSameResult('gemm', (A, B), (A, B, zeros((6, 4))))
+        self.assertSameResult('gemm', (B, A, None, 't', 'n'), (B, A, zeros((4, 6)), 't', 'n'))
+        self.assertSameResult('symm', (A, B), (A, B, zeros((6, 4))))
+        self.assertSameResult('symm', (A, B.T, None, 'r'), (A, B.T.copy(), zeros((4, 6)), 'r'))
+        self.assertSameResult('syrk', (B, None, 'l'), (B, zeros((6, 6)), 'l'))
+        self.assertSameResult('syrk', (B, None, 'u', 't'), (B, zeros((4, 4)), 'u', 't'))
+        self.assertSameResult('syr2k', (B, B), (B, B, zeros((6, 6))))
+        self.assertSameResult('trmm', (T, B), compare=1)
+        self.assertSameResult('trsm', (T, B.T.copy(), 'r', 'u', 't'), compare=1)
+
+    def test_matrix_must_be_provided(self):
+        self.assertRaises(AttributeError, raw.gemm, self.A, self.A, None)
@@ -0,0 +1,87 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from blaspy import gemm
+from numpy import allclose, asfortranarray, dot as np_dot, random, tril, triu
+from sys import modules
+from unittest import TestCase
+from unittest.mock import patch
+
+
+class TestStructure(TestCase):
+
+    def setUp(self):
+        rng = random.RandomState(0)
+        self.A = rng.uniform(-1, 1, (40, 25))
+        self.B = rng.uniform(-1, 1, (40, 30))
+        self.C = rng.uniform(-1, 1, (40, 40))
+        self.S = self.C + self.C.T
+        self.gemm_module = modules['blaspy.level_3.gemm']
+
+    def routed(self, name):
+        return patch.object(self.gemm_module, name, wraps=getattr(self.gemm_module, name))
+
+    def test_product_with_own_transpose_uses_syrk(self):
+        A = self.A
+        with self.routed('syrk') as syrk:
+            self.assertTrue(allclose(gemm(A, A, trans_b='t'), np_dot(A, A.T)))
+            self.assertTrue(allclose(gemm(A, A, trans_a='t', alpha=2.), 2. * np_dot(A.T, A)))
+            F = asfortranarray(A)
+            self.assertTrue(allclose(gemm(F, F, self.C.copy(), 'n', 't', beta=0.),
+                                     np_dot(A, A.T)))
+        self.assertEqual(syrk.call_count, 3)
+
+    def test_other_products_with_same_matrix_use_gemm(self):
+        A, C = self.A, self.C
+        with self.routed('syrk') as syrk:
+            self.assertTrue(allclose(gemm(A, A, C.copy(), 'n', 't', beta=0.5),
+                                     0.5 * C + np_dot(A, A.T)))
+            self.assertTrue(allclose(gemm(A, A.copy(), trans_b='t'), np_dot(A, A.T)))
+            self.assertTrue(allclose(gemm(A, A, trans_b='t', lda=25, ldb=25), np_dot(A, A.T)))
+            self.assertTrue(allclose(gemm(C, C), np_dot(C, C)))
+        self.assertEqual(syrk.call_count, 0)
+
+    def test_symmetric_structure_uses_symm(self):
+        S, B, C = self.S, self.B, self.C
+        with self.routed('symm') as symm:
+            self.assertTrue(allclose(gemm(S, B, structure='symmetric'), np_dot(S, B)))
+            self.assertTrue(allclose(gemm(B, S, trans_a='t', structure='symmetric', side='r',
+                                          uplo='l'), np_dot(B.T, S)))
+            self.assertTrue(allclose(gemm(S, C, C.copy(), 't', 't', 2., 0.5, structure='symmetric'),
+                                     0.5 * C + 2. * np_dot(S, C.T)))
+        self.assertEqual(symm.call_count, 3)
+
+    def test_triangular_structure_uses_trmm(self):
+        U, L, B, C = triu(self.C), tril(self.C), self.B, self.C
+        with self.routed('trmm') as trmm:
+            self.assertTrue(allclose(gemm(U, B, structure='triangular'), np_dot(U, B)))
+            self.assertTrue(allclose(gemm(L, B, trans_a='t', structure='triangular', uplo='l'),
+                                     np_dot(L.T, B)))
+            self.assertTrue(allclose(gemm(B, U, trans_a='t', structure='triangular', side='r'),
+                                     np_dot(B.T, U)))
+            D = C.copy()
+            self.assertTrue(allclose(gemm(C, L, D, 'n', 't', 2., 0.5, structure='triangular',
+                                          side='r', uplo='l'), 0.5 * C + 2. * np_dot(C, L.T)))
+        self.assertEqual(trmm.call_count, 4)
+
+    def test_conjugated_complex_products_use_gemm(self):
+        rng = random.RandomState(1)
+        Z = rng.uniform(-1, 1, (20, 10)) + 1j * rng.uniform(-1, 1, (20, 10))
+        with self.routed('syrk') as syrk:
+            self.assertTrue(allclose(gemm(Z, Z, trans_b='c'), np_dot(Z, Z.conj().T)))
+            self.assertTrue(allclose(gemm(Z, Z, trans_b='t'), np_dot(Z, Z.T)))
+        self.assertEqual(syrk.call_count, 1)
+
+    def test_invalid_structure(self):
+        self.assertRaises(ValueError, gemm, self.S, self.B, structure='diagonal')
+        self.assertRaises(ValueError, gemm, self.S, self.B, structure='symmetric', side='x')
+        self.assertRaises(ValueError, gemm, self.S, self.B, structure='triangular', uplo='x')
+        self.assertRaises(ValueError, gemm, self.B.T, self.B, structure='symmetric')
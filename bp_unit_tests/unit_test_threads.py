@@ -0,0 +1,133 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from blaspy import (amax, asum, axpy, copy, dot, nrm2, scal, sdot, swap, gemv, ger, symv, syr,
+                    syr2, trmv, trsv, gemm, symm, syrk, syr2k, trmm, trsm)
+from concurrent.futures import ThreadPoolExecutor
+from numpy import allclose, argmax, eye, outer, random, sum, triu
+from numpy import dot as np_dot
+from numpy.linalg import norm, solve
+from unittest import TestCase
+
+NUM_THREADS = 16
+NUM_CALLS = 2000
+
+
+def random_operands(seed):
+    """ Generate a random size, dtype, and operands from a seed """
+    rng = random.RandomState(seed)
+    n = rng.randint(1, 40)
+    dtype = 'float64' if rng.randint(2) else 'float32'
+    x = rng.uniform(-1, 1, (n, 1)).astype(dtype)
+    y = rng.uniform(-1, 1, (n, 1)).astype(dtype)
+    A = rng.uniform(-1, 1, (n, n)).astype(dtype)
+    B = rng.uniform(-1, 1, (n, n)).astype(dtype)
+    T = (triu(A) + n * eye(n)).astype(dtype)  # well conditioned upper triangular matrix
+    S = ((A + A.T) / 2).astype(dtype)
+    return x, y, A, B, T, S
+
+
+# each case returns the actual and expected results for the operands generated from a seed
+def case_amax(x, y, A, B, T, S):
+    return amax(x), argmax(abs(x))
+
+def case_asum(x, y, A, B, T, S):
+    return asum(x), sum(abs(x))
+
+def case_axpy(x, y, A, B, T, S):
+    return axpy(2., x, y.copy()), y + 2. * x
+
+def case_copy(x, y, A, B, T, S):
+    return copy(x), x
+
+def case_dot(x, y, A, B, T, S):
+    return dot(x, y), np_dot(x.T, y)
+
+def case_nrm2(x, y, A, B, T, S):
+    return nrm2(x), norm(x)
+
+def case_scal(x, y, A, B, T, S):
+    return scal(2., x.copy()), 2. * x
+
+def case_sdot(x, y, A, B, T, S):
+    x, y = x.astype('float32'), y.astype('float32')
+    return sdot(x, y), np_dot(x.T, y)
+
+def case_swap(x, y, A, B, T, S):
+    return swap(x.copy(), y.copy()), x
+
+def case_gemv(x, y, A, B, T, S):
+    return gemv(A, x), np_dot(A, x)
+
+def case_ger(x, y, A, B, T, S):
+    return ger(x, y), outer(x, y)
+
+def case_symv(x, y, A, B, T, S):
+    return symv(S, x), np_dot(S, x)
+
+def case_syr(x, y, A, B, T, S):
+    return syr(x), triu(outer(x, x))
+
+def case_syr2(x, y, A, B, T, S):
+    return syr2(x, y), triu(outer(x, y) + outer(y, x))
+
+def case_trmv(x, y, A, B, T, S):
+    return trmv(T, x.copy()), np_dot(T, x)
+
+def case_trsv(x, y, A, B, T, S):
+    return trsv(T, x.copy()), solve(T, x)
+
+def case_gemm(x, y, A, B, T, S):
+    return gemm(A, B), np_dot(A, B)
+
+def case_symm(x, y, A, B, T, S):
+    return symm(S, B), np_dot(S, B)
+
+def case_syrk(x, y, A, B, T, S):
+    return syrk(A), triu(np_dot(A, A.T))
+
+def case_syr2k(x, y, A, B, T, S):
+    return syr2k(A, B), triu(np_dot(A, B.T) + np_dot(B, A.T))
+
+def case_trmm(x, y, A, B, T, S):
+    actual = B.copy()
+    trmm(T, actual)
+    return actual, np_dot(T, B)
+
+def case_trsm(x, y, A, B, T, S):
+    actual = B.copy()
+    trsm(T, actual)
+    return actual, solve(T, B)
+
+CASES = (case_amax, case_asum, case_axpy, case_copy, case_dot, case_nrm2, case_scal, case_sdot,
+         case_swap, case_gemv, case_ger, case_symv, case_syr, case_syr2, case_trmv, case_trsv,
+         case_gemm, case_symm, case_syrk, case_syr2k, case_trmm, case_trsm)
+
+
+def run_case(seed):
+    """ Run one case chosen by the seed and return True if its result is correct """
+    case = CASES[seed % len(CASES)]
+    actual, expected = case(*random_operands(seed))
+    return allclose(actual, expected, 1e-3, 1e-3)
+
+
+class TestThreads(TestCase):
+
+    def test_all_functions_from_many_threads(self):
+        with ThreadPoolExecutor(NUM_THREADS) as executor:
+            results = list(executor.map(run_case, range(NUM_CALLS)))
+        self.assertTrue(all(results))
+
+    def test_same_function_with_different_shapes_from_many_threads(self):
+        seeds = range(CASES.index(case_gemm), NUM_CALLS, len(CASES))
+        with ThreadPoolExecutor(NUM_THREADS) as executor:
+            results = list(executor.map(run_case, seeds))
+        self.assertTrue(all(results))
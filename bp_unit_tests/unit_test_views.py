@@ -0,0 +1,141 @@
+"""
+
+    Copyright (c) 2014-2015, The University of Texas at Austin.
+    All rights reserved.
+
+    This file is part of BLASpy and is available under the 3-Clause
+    BSD License, which can be found in the LICENSE file at the top-level
+    directory or at http://opensource.org/licenses/BSD-3-Clause
+
+"""
+
+from blaspy import (amax, asum, axpy, copy, dot, nrm2, scal, swap, gemv, ger, trsv, gemm, symm,
+                    syrk, trsm, gemm_grouped, gemv_batched)
+from numpy import allclose, argmax, broadcast_to, dot as np_dot, eye, ones, random, triu, zeros
+from unittest import TestCase
+
+
+class TestViews(TestCase):
+
+    def setUp(self):
+        rng = random.RandomState(0)
+        self.M = rng.uniform(-1, 1, (12, 10))
+        self.big = rng.uniform(-1, 1, (20, 30))
+
+    def test_level_1_with_column_views(self):
+        M = self.M
+        x, y = M[:, 3:4], M[:, 7:8]
+        self.assertAlmostEqual(dot(x, y), np_dot(x.T, y)[0, 0])
+        self.assertAlmostEqual(dot(x, y.T), np_dot(x.T, y)[0, 0])
+        self.assertAlmostEqual(asum(x), abs(x).sum())
+        self.assertAlmostEqual(nrm2(x), (x ** 2).sum() ** 0.5)
+        self.assertEqual(amax(x), argmax(abs(x)))
+
+    def test_level_1_with_reversed_views(self):
+        M = self.M
+        x, y = M[::-1, 3:4], M[::-2, 7:8]
+        self.assertAlmostEqual(dot(x[:6], y), np_dot(x[:6].T, y)[0, 0])
+        self.assertAlmostEqual(dot(x, x, 2, 2), (x[::2] ** 2).sum())
+        self.assertAlmostEqual(asum(y), abs(y).sum())
+        self.assertAlmostEqual(nrm2(y), (y ** 2).sum() ** 0.5)
+        self.assertEqual(amax(x), argmax(abs(x)))
+        self.assertEqual(amax(y.T), argmax(abs(y)))
+
+    def test_level_1_writes_into_views(self):
+        M, expected = self.M, self.M.copy()
+        axpy(2., M[::-1, 0:1], M[:, 1:2])
+        expected[:, 1] += 2. * expected[::-1, 0]
+        scal(3., M[2:3, ::2])
+        expected[2, ::2] *= 3.
+        swap(M[::2, 4:5], M[-1::-2, 5:6])
+        expected[::2, 4], expected[::-2, 5] = expected[::-2, 5].copy(), expected[::2, 4].copy()
+        copy(M[0:1, 1::3], M[::-4, 9:10])
+        expected[::-4, 9] = expected[0, 1::3]
+        self.assertTrue(allclose(M, expected))
+
+    def test_1d_views_are_not_copied(self):
+        M, expected = self.M, self.M.copy()
+        x, y = M[:, 3], M[::-2, 7]
+        self.assertAlmostEqual(dot(x[::2], y), np_dot(x[::2], y))
+        scal(2., x)
+        expected[:, 3] *= 2.
+        self.assertTrue(allclose(M, expected))
+        A, y = self.big[:10, :12], self.big[-1, ::-3]
+        gemv(A, x, y, beta=0.)
+        self.assertTrue(allclose(self.big[-1, ::-3], np_dot(A, expected[:, 3])))
+        self.assertEqual(gemv(A, x).shape, (10,))
+
+    def test_level_2_with_views(self):
+        big, M = self.big, self.M
+        A, x = big[2:8, 5:15], M[:, 2:3][:10]
+        expected = np_dot(A.T, np_dot(A, x))
+        y = zeros((6, 6))[::-1, 4:5]
+        gemv(A, x, y)
+        self.assertTrue(allclose(y, np_dot(A, x)))
+        gemv(A.T, y, x, beta=0.)
+        self.assertTrue(allclose(M[:10, 2:3], expected))
+
+        block = big[10:16, 3:13]
+        expected = block + np_dot(M[:6, 0:1], M[::-1, 1:2][:10].T)
+        ger(M[:6, 0:1], M[::-1, 1:2][:10], block)
+        self.assertTrue(allclose(big[10:16, 3:13], expected))
+
+    def test_trsv_with_views(self):
+        U = zeros((8, 8))
+        U[1:7, 1:7] = triu(self.M[:6, :6]) + 6 * eye(6)
+        b = self.M[::-2, 8:9]
+        expected = b.copy()
+        trsv(U[1:7, 1:7], b)
+        self.assertTrue(allclose(np_dot(U[1:7, 1:7], b), expected))
+
+    def test_gemm_with_views(self):
+        big = self.big
+        A, B = big[1:5, 2:8], big[6:12, 20:27]
+        expected = np_dot(A, B)
+        for C in (zeros((9, 12))[3:7, 4:11], zeros((12, 9)).T[3:7, 4:11]):
+            gemm(A, B, C, beta=0.)
+            self.assertTrue(allclose(C, expected))
+        gemm(B.T, A.T, trans_a='n', trans_b='n', C=big[13:20, 0:4], beta=0.)
+        self.assertTrue(allclose(big[13:20, 0:4], expected.T))
+
+    def test_level_3_with_views(self):
+        big, M = self.big, self.M
+        S = big[0:6, 0:6] + big[0:6, 0:6].T
+        C = zeros((10, 10))
+        symm(S, M[2:8, 1:5], C[1:7, 2:6], beta=0.)
+        self.assertTrue(allclose(C[1:7, 2:6], np_dot(S, M[2:8, 1:5])))
+        syrk(M[:5, 1:9], C[3:8, 3:8], beta=0.)
+        self.assertTrue(allclose(triu(C[3:8, 3:8]), triu(np_dot(M[:5, 1:9], M[:5, 1:9].T))))
+
+        T = triu(big[5:11, 5:11]) + 6 * eye(6)
+        block = big[10:16, 20:24]
+        expected = block.copy()
+        trsm(T.T, block, uplo='l')
+        self.assertTrue(allclose(np_dot(T.T, big[10:16, 20:24]), expected))
+
+    def test_empty_dimensions(self):
+        M = self.M
+        C = ones((3, 3))
+        gemm(zeros((3, 0)), zeros((0, 3)), C, beta=0.)
+        self.assertTrue((C == 0).all())
+        self.assertEqual(gemm(M[:0, :4], M[:4, :5]).shape, (0, 5))
+        self.assertEqual(gemm(M[:4, :0], M[:0, :5], trans_a='n').shape, (4, 5))
+        self.assertEqual(gemm(M[:0, :4], M[:0, :5], trans_a='t').shape, (4, 5))
+        self.assertEqual(gemv(M[:0, :4], M[:4, :1]).shape, (0, 1))
+        for trans_a, A in (('n', M[:3, :0]), ('t', M[:0, :3])):
+            y = gemv(A, zeros(0), trans_a=trans_a)
+            self.assertTrue(y.shape == (3,) and not y.any())
+        self.assertFalse(gemv_batched(zeros((2, 3, 0)), zeros((2, 0))).any())
+        C = syrk(M[:3, :0])
+        self.assertTrue(C.shape == (3, 3) and not C.any())
+        C_list = gemm_grouped([M[:2, :3], M[:0, :3]], [M[:3, :4], M[:3, :2]])
+        self.assertEqual([C.shape for C in C_list], [(2, 4), (0, 2)])
+        self.assertTrue(allclose(C_list[0], np_dot(M[:2, :3], M[:3, :4])))
+
+    def test_uneven_views_raise_value_error(self):
+        M = self.M
+        self.assertRaises(ValueError, gemm, M[::2, ::2], M[::2, ::2])
+        self.assertRaises(ValueError, gemm, M[::-1, :], M[:10, :])
+        self.assertRaises(ValueError, dot, broadcast_to(M[:1, :1], (3, 1)), M[:3, :1])
+        records = zeros((4, 1), dtype=[('x', 'float64'), ('flag', 'float32')])
+        self.assertRaises(ValueError, nrm2, records['x'])
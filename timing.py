@@ -9,13 +9,34 @@
 
 """
 
-from bp_timing import timing_gemm
+from bp_timing import (timing_aio, timing_batched, timing_columns, timing_distributed, timing_gemm,
+                       timing_grouped, timing_import, timing_lazy, timing_memory,
+                       timing_multi_gemm, timing_num_threads, timing_out_of_core, timing_overhead,
+                       timing_parallel, timing_plan, timing_pool, timing_process_pool,
+                       timing_structure)
 
 TRIALS = 10
 K = 1500
-TEST_DICT = {'gemm': timing_gemm}
+TEST_DICT = {'aio':          (timing_aio, (TRIALS,)),
+             'batched':      (timing_batched, (TRIALS,)),
+             'columns':      (timing_columns, (TRIALS,)),
+             'distributed':  (timing_distributed, (TRIALS,)),
+             'gemm':         (timing_gemm, (TRIALS, K)),
+             'grouped':      (timing_grouped, (TRIALS,)),
+             'import':       (timing_import, (TRIALS,)),
+             'lazy':         (timing_lazy, (TRIALS,)),
+             'memory':       (timing_memory, (TRIALS,)),
+             'multi_gemm':   (timing_multi_gemm, (TRIALS,)),
+             'num_threads':  (timing_num_threads, (TRIALS,)),
+             'out_of_core':  (timing_out_of_core, (TRIALS,)),
+             'overhead':     (timing_overhead, (TRIALS,)),
+             'parallel':     (timing_parallel, (TRIALS,)),
+             'plan':         (timing_plan, (TRIALS,)),
+             'pool':         (timing_pool, (TRIALS,)),
+             'process_pool': (timing_process_pool, (TRIALS,)),
+             'structure':    (timing_structure, (TRIALS,))}
 
 
-for name, function in sorted(TEST_DICT.iteritems()):
+for name, (function, args) in sorted(TEST_DICT.items()):
     print("Testing " + name)
-    function(TRIALS, K)
\ No newline at end of file
+    function(*args)
\ No newline at end of file
@@ -26,7 +26,27 @@ TEST_CASES = (TestAmax,  # level 1
               TestSymv,
               TestSyr,
               TestSyr2,
-              TestTrsv)
+              TestTrsv,
+              TestBackend,  # BLAS library loading
+              TestNumThreads,  # BLAS threading
+              TestLayout,  # memory layouts
+              TestViews,  # strided views
+              TestComplex,  # complex dtypes
+              TestBatched,  # batched functions
+              TestColumns,  # multi-vector functions
+              TestOutOfCore,  # out-of-core gemm
+              TestParallel,  # parallel executor
+              TestAio,  # asyncio interface
+              TestProcessPool,  # process pool
+              TestDistributed,  # distributed gemm
+              TestLazy,  # lazy expressions
+              TestMultiGemm,  # matrix chains
+              TestStructure,  # structured gemm
+              TestPool,  # buffer pool
+              TestMemory,  # aligned allocation
+              TestPlan,  # plans
+              TestRaw,  # unchecked functions
+              TestThreads)  # concurrency
 
 suite = TestSuite()
 